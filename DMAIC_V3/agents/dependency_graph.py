@@ -7,7 +7,8 @@
 
 from pathlib import Path
 from typing import Dict, List, Any, Set
-import ast
+
+from ..core.ast_extractor import extract_file
 
 
 class DependencyGraphAgent:
@@ -24,20 +25,12 @@ def build_graph(self, files: List[Path]) -> Dict[str, List[str]]:
         for file_path in files:
             if file_path.suffix == '.py':
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        tree = ast.parse(f.read())
-                    
-                    imports = []
-                    for node in ast.walk(tree):
-                        if isinstance(node, ast.Import):
-                            imports.extend([alias.name for alias in node.names])
-                        elif isinstance(node, ast.ImportFrom):
-                            if node.module:
-                                imports.append(node.module)
-                    
-                    graph[str(file_path)] = imports
-                except:
-                    pass
+                    elements = extract_file(file_path)
+                except OSError:
+                    continue
+                
+                if not elements.syntax_error:
+                    graph[str(file_path)] = list(elements.module_imports)
         
         return graph
     
@@ -1,159 +1,321 @@
 """
 Background Change Detector for DMAIC V3.3
 Lightweight, non-blocking file change detection that runs continuously
+
+On Linux the workspace is watched through inotify (via watchdog), so no
+CPU is spent while nothing changes. Events are coalesced into an
+in-memory dirty set: repeated writes to one path collapse into a single
+entry, and take_dirty() waits until the burst has settled (debouncing).
+Without watchdog, or if the watches cannot be installed, a polling
+thread diffs a stat-only Merkle tree of the workspace instead.
+
+The detector is meant to run for the lifetime of its owner: between
+iterations the owner drains a ChangeWindow with take_window(), and phases
+can ask dirty_since(timestamp) which files changed after a point in time
+and skip re-checking everything else.
 """
 
 import json
+import os
 import time
 import threading
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, FrozenSet, Optional, Set
+
+from .merkle_tree import MerkleDir, diff_trees, scan_tree
+from ..core.phase_cache import MERKLE_SKIP_DIRS
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+    WATCHDOG_AVAILABLE = False
+
+IGNORED_SUFFIXES = {'.pyc', '.pyo', '.so', '.dll', '.exe', '.swp', '.tmp'}
+
+
+@dataclass(frozen=True)
+class ChangeWindow:
+    """Paths that changed between two take_window() calls"""
+    start: float  # epoch seconds of the previous take_window()
+    end: float    # epoch seconds of this take_window()
+    paths: FrozenSet[str]
+
+
+class _DirtyEventHandler(FileSystemEventHandler):
+    """Forwards watchdog events to the detector's dirty set"""
+
+    def __init__(self, detector: 'BackgroundChangeDetector'):
+        super().__init__()
+        self.detector = detector
+
+    def on_any_event(self, event):
+        kind = {'created': 'added', 'deleted': 'deleted', 'modified': 'modified',
+                'closed': 'modified'}.get(event.event_type)
+        if event.is_directory:
+            # Moving or deleting a directory may not report every file below it
+            if event.event_type in ('moved', 'deleted'):
+                self.detector._invalidate()
+            return
+        if event.event_type == 'moved':
+            self.detector._mark(event.src_path, 'deleted')
+            self.detector._mark(event.dest_path, 'added')
+        elif kind:
+            self.detector._mark(event.src_path, kind)
 
 
 class BackgroundChangeDetector:
     """
     Lightweight background change detector that runs continuously
     throughout the pipeline execution without blocking.
-    
-    Uses mtime-based detection for speed.
+
+    Uses inotify events where available and Merkle-tree polling otherwise.
     """
-    
-    def __init__(self, workspace_root: Path, state_dir: Path):
-        self.workspace_root = workspace_root
+
+    def __init__(self, workspace_root: Path, state_dir: Path,
+                 debounce: float = 0.5, use_events: bool = True):
+        """
+        Initialize detector
+
+        Args:
+            workspace_root: Root directory to watch
+            state_dir: Directory for the change summary
+            debounce: Seconds without events before a burst counts as settled
+            use_events: Use inotify when available (False forces polling)
+        """
+        self.workspace_root = Path(workspace_root)
         self.state_dir = state_dir
         self.state_dir.mkdir(parents=True, exist_ok=True)
-        
-        self.snapshot_file = state_dir / "background_snapshot.json"
+
         self.changes_file = state_dir / "background_changes.json"
-        
+        self.debounce = debounce
+        self.use_events = use_events
+
         self.running = False
+        self.mode: Optional[str] = None
         self.thread = None
-        self.snapshot_interval = 30  # seconds
-        
+        self.observer = None
+        self.snapshot_interval = 30  # seconds (polling fallback)
+
+        self._root = os.path.abspath(str(self.workspace_root))
+        self._excluded = os.path.abspath(str(state_dir))
+        self._lock = threading.Condition()
+        self._dirty: Dict[str, str] = {}          # path -> change kind, since last take
+        self._session: Dict[str, str] = {}        # path -> change kind, since start
+        self._touched: Dict[str, float] = {}      # path -> time of last event
+        self._last_event = 0.0
+        self._watch_start: Optional[float] = None
+        self._invalid_at = 0.0
+        self._window_start: Optional[float] = None
+        self._horizon = 0.0  # _touched is pruned before this time
+
+    def _ignored(self, path: str) -> bool:
+        """Paths that never count as workspace changes"""
+        if os.path.splitext(path)[1].lower() in IGNORED_SUFFIXES:
+            return True
+        if path == self._excluded or path.startswith(self._excluded + os.sep):
+            return True
+        return any(part in MERKLE_SKIP_DIRS for part in path.split(os.sep))
+
+    def _skip_dir(self, name: str, path: str) -> bool:
+        return name in MERKLE_SKIP_DIRS or os.path.abspath(path) == self._excluded
+
+    def _mark(self, path: str, kind: str):
+        """Record one change, coalescing with earlier changes to the same path"""
+        path = os.path.abspath(path)
+        if self._ignored(path):
+            return
+        with self._lock:
+            self._merge(self._dirty, path, kind)
+            self._merge(self._session, path, kind)
+            now = time.time()
+            self._touched[path] = now
+            self._last_event = now
+            self._lock.notify_all()
+
+    @staticmethod
+    def _merge(changes: Dict[str, str], path: str, kind: str):
+        """Coalesce a new change into the pending change for a path"""
+        previous = changes.get(path)
+        if previous == 'added' and kind == 'deleted':
+            del changes[path]  # created and removed again
+        elif previous == 'deleted' and kind == 'added':
+            changes[path] = 'modified'
+        elif previous != 'added':
+            changes[path] = kind
+
+    def _invalidate(self):
+        """Events may have been missed; dirty_since() must not be trusted"""
+        with self._lock:
+            self._invalid_at = time.time()
+
     def start(self):
         """Start background change detection"""
         if self.running:
             return
-            
+
         self.running = True
+        if self.use_events and WATCHDOG_AVAILABLE:
+            try:
+                self.observer = Observer()
+                self.observer.schedule(_DirtyEventHandler(self), self._root, recursive=True)
+                self.observer.start()
+                self._watch_start = time.time()
+                self.mode = 'events'
+                print("[Background Change Detector] Started (inotify events)")
+                return
+            except OSError as e:
+                # e.g. inotify watch limit reached
+                print(f"[Background Change Detector] Event watch failed ({e}), polling instead")
+                self.observer = None
+
+        self.mode = 'polling'
         self.thread = threading.Thread(target=self._detection_loop, daemon=True)
         self.thread.start()
         print(f"[Background Change Detector] Started (snapshot every {self.snapshot_interval}s)")
-        
+
     def stop(self):
         """Stop background change detection"""
         self.running = False
+        if self.observer:
+            self.observer.stop()
+            self.observer.join(timeout=5)
+            self.observer = None
         if self.thread:
             self.thread.join(timeout=5)
+        self._watch_start = None
+        self._window_start = None
+        self._save_changes()
         print("[Background Change Detector] Stopped")
-        
+
     def _detection_loop(self):
-        """Main detection loop running in background"""
+        """Polling fallback: diff a stat-only Merkle tree every interval"""
+        tree: Optional[MerkleDir] = None
         while self.running:
             try:
-                self._take_snapshot()
+                tree = self._poll(tree)
             except Exception as e:
                 print(f"[Background Change Detector] Error: {e}")
-            
+
             # Sleep in small intervals to allow quick shutdown
             for _ in range(self.snapshot_interval):
                 if not self.running:
                     break
                 time.sleep(1)
-    
-    def _take_snapshot(self):
-        """Take a quick snapshot of file mtimes"""
-        snapshot = {}
-        changes = []
-        
-        # Load previous snapshot
-        prev_snapshot = {}
-        if self.snapshot_file.exists():
-            try:
-                with open(self.snapshot_file, 'r') as f:
-                    prev_snapshot = json.load(f)
-            except:
-                pass
-        
-        # Quick scan of key directories only
-        scan_dirs = [
-            self.workspace_root / "DMAIC_V3",
-            self.workspace_root / "DMAIC_V3_OUTPUT"
-        ]
-        
-        file_count = 0
-        for scan_dir in scan_dirs:
-            if not scan_dir.exists():
-                continue
-                
-            for file_path in scan_dir.rglob("*"):
-                if not file_path.is_file():
-                    continue
-                    
-                # Skip large binary files
-                if file_path.suffix.lower() in ['.pyc', '.pyo', '.so', '.dll', '.exe']:
-                    continue
-                
-                try:
-                    rel_path = str(file_path.relative_to(self.workspace_root))
-                    mtime = file_path.stat().st_mtime
-                    
-                    snapshot[rel_path] = mtime
-                    
-                    # Detect changes
-                    if rel_path not in prev_snapshot:
-                        changes.append({'path': rel_path, 'type': 'added'})
-                    elif abs(mtime - prev_snapshot.get(rel_path, 0)) > 1:
-                        changes.append({'path': rel_path, 'type': 'modified'})
-                    
-                    file_count += 1
-                    
-                    # Limit scan to prevent blocking
-                    if file_count > 10000:
+
+    def _poll(self, previous: Optional[MerkleDir]) -> MerkleDir:
+        """Rescan the workspace and mark everything that differs"""
+        tree = scan_tree(self._root, previous, self._skip_dir, hash_content=False)
+        if previous is not None:
+            for rel_path, kind, _, _ in diff_trees(previous, tree):
+                self._mark(os.path.join(self._root, rel_path), kind)
+        return tree
+
+    def take_dirty(self, timeout: Optional[float] = None) -> Dict[str, str]:
+        """
+        Drain the dirty set once the current burst of events has settled
+
+        Args:
+            timeout: Maximum seconds to wait for the burst to settle
+
+        Returns:
+            {absolute path: 'added' | 'modified' | 'deleted'}
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        with self._lock:
+            while self._dirty:
+                quiet_for = time.time() - self._last_event
+                if quiet_for >= self.debounce:
+                    break
+                wait = self.debounce - quiet_for
+                if deadline is not None:
+                    wait = min(wait, deadline - time.time())
+                    if wait <= 0:
                         break
-                        
-                except:
-                    pass
-        
-        # Detect deletions
-        for prev_path in prev_snapshot:
-            if prev_path not in snapshot:
-                changes.append({'path': prev_path, 'type': 'deleted'})
-        
-        # Save snapshot
+                self._lock.wait(wait)
+            dirty, self._dirty = self._dirty, {}
+        return dirty
+
+    def take_window(self, timeout: Optional[float] = None) -> Optional[ChangeWindow]:
+        """
+        Drain the dirty set as the changes since the previous take_window()
+
+        Args:
+            timeout: Maximum seconds to wait for the current burst to settle
+
+        Returns:
+            The window, or None on the first call and whenever events may
+            have been missed since the previous one (caller must check
+            everything)
+        """
+        end = time.time()
+        dirty = self.take_dirty(timeout)
+        start, self._window_start = self._window_start, end
+        if start is None or self.dirty_since(start) is None:
+            return None
+
+        # Nothing asks about the time before the previous window any more
+        with self._lock:
+            self._touched = {path: at for path, at in self._touched.items() if at >= start}
+            self._horizon = start
+        return ChangeWindow(start=start, end=end, paths=frozenset(dirty))
+
+    def dirty_since(self, timestamp: float) -> Optional[Set[str]]:
+        """
+        Files changed after a point in time
+
+        Only answered while inotify events have been watched continuously
+        since that time; otherwise None (caller must check everything).
+
+        Args:
+            timestamp: Epoch seconds (e.g. when a cache was last written)
+
+        Returns:
+            Absolute paths with events after timestamp, or None
+        """
+        with self._lock:
+            if (self.mode != 'events' or self._watch_start is None
+                    or self._watch_start > timestamp or self._invalid_at > timestamp
+                    or self._horizon > timestamp):
+                return None
+            return {path for path, at in self._touched.items() if at >= timestamp}
+
+    def covers(self, path: str) -> bool:
+        """True if changes to path are reported by this detector"""
+        path = os.path.abspath(path)
+        return path.startswith(self._root + os.sep) and not self._ignored(path)
+
+    def _save_changes(self):
+        """Write the change summary for this session"""
+        summary = self.get_summary()
+        if not summary['total']:
+            return
         try:
-            with open(self.snapshot_file, 'w') as f:
-                json.dump(snapshot, f)
-                
-            # Save changes
-            if changes:
-                change_data = {
+            with open(self.changes_file, 'w') as f:
+                json.dump({
                     'timestamp': datetime.now().isoformat(),
-                    'total_changes': len(changes),
-                    'changes': changes
-                }
-                with open(self.changes_file, 'w') as f:
-                    json.dump(change_data, f, indent=2)
-        except:
+                    'total_changes': summary['total'],
+                    'mode': self.mode,
+                    'counts': {kind: summary[kind] for kind in ('added', 'modified', 'deleted')},
+                }, f, indent=2)
+        except OSError:
             pass
-    
+
     def get_summary(self) -> Dict[str, Any]:
         """Get current change summary"""
-        if not self.changes_file.exists():
-            return {'total': 0, 'added': 0, 'modified': 0, 'deleted': 0}
-        
-        try:
-            with open(self.changes_file, 'r') as f:
-                data = json.load(f)
-            
-            changes = data.get('changes', [])
-            return {
-                'total': len(changes),
-                'added': sum(1 for c in changes if c['type'] == 'added'),
-                'modified': sum(1 for c in changes if c['type'] == 'modified'),
-                'deleted': sum(1 for c in changes if c['type'] == 'deleted'),
-                'timestamp': data.get('timestamp', '')
-            }
-        except:
-            return {'total': 0, 'added': 0, 'modified': 0, 'deleted': 0}
+        counts = {'added': 0, 'modified': 0, 'deleted': 0}
+        with self._lock:
+            for kind in self._session.values():
+                counts[kind] += 1
+        return {
+            'total': sum(counts.values()),
+            'added': counts['added'],
+            'modified': counts['modified'],
+            'deleted': counts['deleted'],
+            'timestamp': datetime.fromtimestamp(self._last_event).isoformat() if self._last_event else ''
+        }
@@ -8,15 +8,26 @@
 - Change-based re-analysis
 - Version tracking
 - Input modification detection
+
+The workspace is tracked as a directory-level Merkle tree (see
+merkle_tree.py). Snapshots are stored in a compact binary format and
+identified by their root digest, so any phase can record the snapshot it
+ran against and later ask changed_since(snapshot_id). Diffing descends
+only into subtrees whose digests differ.
 """
 
-import hashlib
 import json
+import os
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional, Any
+from typing import Callable, Dict, List, Set, Tuple, Optional, Any, Iterable
 from datetime import datetime
 from dataclasses import dataclass, asdict
 
+from ..core.phase_cache import MERKLE_SKIP_DIRS
+from ..core.utils import compute_file_hash
+from .merkle_tree import (MerkleDir, diff_trees, dump_tree, load_tree, refresh_paths,
+                          scan_tree, tree_from_files)
+
 
 @dataclass
 class FileChange:
@@ -45,24 +56,34 @@ class ChangeDetector:
     - File size changes
     """
     
-    def __init__(self, workspace_root: Path, state_dir: Path):
+    def __init__(self, workspace_root: Path, state_dir: Path, keep_snapshots: int = 16):
         """
         Initialize change detector
         
         Args:
             workspace_root: Root directory to monitor
             state_dir: Directory to store change tracking state
+            keep_snapshots: Number of snapshots retained for changed_since()
         """
         self.workspace_root = workspace_root
         self.state_dir = state_dir
         self.state_dir.mkdir(parents=True, exist_ok=True)
+        self.keep_snapshots = keep_snapshots
         
-        self.snapshot_file = state_dir / "file_snapshot.json"
+        self.snapshots_dir = state_dir / "merkle_snapshots"
+        self.snapshots_dir.mkdir(exist_ok=True)
+        self.index_file = self.snapshots_dir / "index.json"
         self.changes_file = state_dir / "detected_changes.json"
         
-        self.current_snapshot: Dict[str, Dict[str, Any]] = {}
-        self.previous_snapshot: Dict[str, Dict[str, Any]] = {}
+        self.tree: Optional[MerkleDir] = None
+        # Trees are never modified in place, so loaded snapshots can be kept
+        self._snapshot_cache: Dict[str, MerkleDir] = {}
+        self._excluded = os.path.abspath(str(state_dir))
         
+    def _skip_dir(self, name: str, path: str) -> bool:
+        """Prune tool directories and the detector's own state"""
+        return name in MERKLE_SKIP_DIRS or os.path.abspath(path) == self._excluded
+
     def compute_file_hash(self, file_path: Path) -> str:
         """
         Compute SHA256 hash of file content
@@ -74,55 +95,186 @@ def compute_file_hash(self, file_path: Path) -> str:
             Hex digest of file hash
         """
         try:
-            hasher = hashlib.sha256()
-            with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(8192), b''):
-                    hasher.update(chunk)
-            return hasher.hexdigest()
-        except (OSError, PermissionError, UnicodeDecodeError):
-            return ""
+            return compute_file_hash(file_path)
         except Exception:
             return ""
 
-    def create_snapshot(self, files: List[Path]) -> Dict[str, Dict[str, Any]]:
+    def refresh(self, dirty_paths: Optional[Iterable[Path]] = None,
+                prune_dirs: Iterable[str] = (),
+                hash_file: Optional[Callable[[str], bool]] = None) -> MerkleDir:
         """
-        Create snapshot of current file states
+        Bring the in-memory tree up to date with the workspace
 
         Args:
-            files: List of files to snapshot
+            dirty_paths: Paths known to have changed (e.g. from a file
+                watcher). Only their directories are re-listed. Without
+                hints the whole workspace is re-stat'ed, re-hashing only
+                files whose (size, mtime) changed.
+            prune_dirs: Additional directory names to leave out
+            hash_file: Predicate (path) for the files whose contents are
+                hashed; the others get (size, mtime) leaves
 
         Returns:
-            Dictionary mapping file paths to their metadata
+            Current tree
         """
-        snapshot = {}
-        total_files = len(files)
-        processed = 0
+        skip_dir = self._skip_dir
+        prune_dirs = frozenset(prune_dirs)
+        if prune_dirs:
+            skip_dir = lambda name, path: name in prune_dirs or self._skip_dir(name, path)
+
+        if self.tree is None:
+            self.tree = self.load_snapshot()
+        if self.tree is not None and dirty_paths is not None:
+            self.tree = refresh_paths(self.tree, self.workspace_root, dirty_paths, skip_dir, hash_file)
+        else:
+            self.tree = scan_tree(self.workspace_root, self.tree, skip_dir, hash_file=hash_file)
+        return self.tree
+
+    def _load_index(self) -> List[Dict[str, Any]]:
+        """Snapshot index, oldest first"""
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                return json.load(f).get('snapshots', [])
+        except (OSError, ValueError):
+            return []
 
-        print(f"\n[Change Detection] Analyzing file changes...")
+    def latest_snapshot_id(self) -> Optional[str]:
+        """Identifier of the most recent snapshot, if any"""
+        index = self._load_index()
+        return index[-1]['id'] if index else None
 
-        for file_path in files:
-            if not file_path.exists():
-                continue
+    def save_snapshot(self, tree: Optional[MerkleDir] = None) -> str:
+        """
+        Persist a tree as a snapshot
 
-            processed += 1
-            if processed % 5000 == 0:
-                print(f"  Progress: {processed}/{total_files} files analyzed...")
+        Args:
+            tree: Tree to save (default: the current tree)
 
-            try:
-                rel_path = str(file_path.relative_to(self.workspace_root))
-                stat = file_path.stat()
+        Returns:
+            Snapshot id (root digest prefix; identical trees share an id)
+        """
+        tree = tree or self.tree or self.refresh()
+        snapshot_id = tree.digest.hex()[:16]
+        snapshot_file = self.snapshots_dir / f"{snapshot_id}.mkt"
+
+        if not snapshot_file.exists():
+            temp_file = snapshot_file.with_suffix('.tmp')
+            with open(temp_file, 'wb') as f:
+                f.write(dump_tree(tree))
+            os.replace(temp_file, snapshot_file)
+
+        self._remember(snapshot_id, tree)
+
+        index = [entry for entry in self._load_index() if entry['id'] != snapshot_id]
+        index.append({
+            'id': snapshot_id,
+            'timestamp': datetime.now().isoformat(),
+            'files': tree.file_count()
+        })
+        for expired in index[:-self.keep_snapshots]:
+            (self.snapshots_dir / f"{expired['id']}.mkt").unlink(missing_ok=True)
+        index = index[-self.keep_snapshots:]
+
+        temp_index = self.index_file.with_suffix('.tmp')
+        with open(temp_index, 'w', encoding='utf-8') as f:
+            json.dump({'snapshots': index}, f, indent=2)
+        os.replace(temp_index, self.index_file)
+        return snapshot_id
+
+    def load_snapshot(self, snapshot_id: Optional[str] = None) -> Optional[MerkleDir]:
+        """
+        Load a stored snapshot
 
-                snapshot[rel_path] = {
-                    'hash': self.compute_file_hash(file_path),
-                    'size': stat.st_size,
-                    'mtime': stat.st_mtime,
-                    'timestamp': datetime.now().isoformat()
-                }
-            except Exception:
-                pass
+        Args:
+            snapshot_id: Snapshot to load (default: latest)
 
-        print(f"  Completed: {processed}/{total_files} files analyzed")
+        Returns:
+            Tree, or None if the snapshot does not exist or is unreadable
+        """
+        snapshot_id = snapshot_id or self.latest_snapshot_id()
+        if snapshot_id is None:
+            return None
+        if snapshot_id in self._snapshot_cache:
+            return self._snapshot_cache[snapshot_id]
+        try:
+            with open(self.snapshots_dir / f"{snapshot_id}.mkt", 'rb') as f:
+                tree = load_tree(f.read())
+        except (OSError, ValueError) as e:
+            print(f"  [!] Error loading snapshot {snapshot_id}: {e}")
+            return None
+        self._remember(snapshot_id, tree)
+        return tree
+
+    def _remember(self, snapshot_id: str, tree: MerkleDir):
+        """Keep a snapshot in memory (bounded by keep_snapshots)"""
+        self._snapshot_cache.pop(snapshot_id, None)
+        self._snapshot_cache[snapshot_id] = tree
+        while len(self._snapshot_cache) > self.keep_snapshots:
+            del self._snapshot_cache[next(iter(self._snapshot_cache))]
+
+    def _diff(self, old: Optional[MerkleDir], new: MerkleDir) -> List[FileChange]:
+        """Convert a tree diff into FileChange records"""
+        return [
+            FileChange(
+                path=path,
+                change_type=change_type,
+                old_hash=before.digest.hex() if before else None,
+                new_hash=after.digest.hex() if after else None,
+                old_size=before.size if before else None,
+                new_size=after.size if after else None
+            )
+            for path, change_type, before, after in diff_trees(old, new)
+        ]
+
+    def changed_since(self, snapshot_id: str, refresh: bool = True,
+                      dirty_paths: Optional[Iterable[Path]] = None) -> List[FileChange]:
+        """
+        Changes between a stored snapshot and the workspace
+
+        An unknown snapshot id yields every current file as 'added'
+        (consider everything changed).
+
+        Args:
+            snapshot_id: Snapshot recorded earlier (e.g. by a phase)
+            refresh: Refresh the tree from disk before comparing
+            dirty_paths: Optional watcher hints passed to refresh()
+
+        Returns:
+            List of changes
+        """
+        current = self.refresh(dirty_paths) if refresh or self.tree is None else self.tree
+        return self._diff(self.load_snapshot(snapshot_id), current)
+
+    def create_snapshot(self, files: Optional[List[Path]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Create snapshot of current file states
+
+        Args:
+            files: List of files to snapshot (default: whole workspace)
+
+        Returns:
+            Dictionary mapping file paths to their metadata
+        """
+        print(f"\n[Change Detection] Analyzing file changes...")
+        if files is None:
+            tree = self.refresh()
+        else:
+            tree = tree_from_files(self.workspace_root, files, self.tree or self.load_snapshot())
+            self.tree = tree
+
+        snapshot = self._flatten(tree)
+        print(f"  Completed: {len(snapshot)} files analyzed")
         return snapshot
+
+    @staticmethod
+    def _flatten(tree: Optional[MerkleDir]) -> Dict[str, Dict[str, Any]]:
+        """Flat {relative path: metadata} view of a tree"""
+        if tree is None:
+            return {}
+        return {
+            path: {'hash': leaf.digest.hex(), 'size': leaf.size, 'mtime': leaf.mtime_ns / 1e9}
+            for path, leaf in tree.iter_files()
+        }
     
     def load_previous_snapshot(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -131,90 +283,32 @@ def load_previous_snapshot(self) -> Dict[str, Dict[str, Any]]:
         Returns:
             Previous snapshot dictionary
         """
-        if not self.snapshot_file.exists():
-            return {}
-            
-        try:
-            with open(self.snapshot_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"  [!] Error loading previous snapshot: {e}")
-            return {}
-
-    def save_snapshot(self, snapshot: Dict[str, Dict[str, Any]]):
-        """
-        Save snapshot to disk
-
-        Args:
-            snapshot: Snapshot dictionary to save
-        """
-        try:
-            with open(self.snapshot_file, 'w', encoding='utf-8') as f:
-                json.dump(snapshot, f, indent=2)
-        except Exception as e:
-            print(f"  [!] Error saving snapshot: {e}")
+        return self._flatten(self.load_snapshot())
 
-    def detect_changes(self, current_files: List[Path]) -> List[FileChange]:
+    def detect_changes(self, current_files: Optional[List[Path]] = None,
+                       dirty_paths: Optional[Iterable[Path]] = None) -> List[FileChange]:
         """
         Detect changes between previous and current snapshots
 
         Args:
-            current_files: List of current files to check
+            current_files: List of current files to check (default: whole
+                workspace)
+            dirty_paths: Paths known to have changed since the last call
 
         Returns:
             List of detected changes
         """
-        print("\n[Change Detection] Quick scan mode (mtime-based)...")
-
-        self.previous_snapshot = self.load_previous_snapshot()
-        self.current_snapshot = {}
-
-        changes = []
-        current_paths = set()
-
-        for file_path in current_files:
-            if not file_path.exists():
-                continue
-
-            try:
-                rel_path = str(file_path.relative_to(self.workspace_root))
-                current_paths.add(rel_path)
-                stat = file_path.stat()
-
-                self.current_snapshot[rel_path] = {
-                    'size': stat.st_size,
-                    'mtime': stat.st_mtime,
-                    'timestamp': datetime.now().isoformat()
-                }
-
-                if rel_path not in self.previous_snapshot:
-                    changes.append(FileChange(
-                        path=rel_path,
-                        change_type='added',
-                        new_size=stat.st_size
-                    ))
-                else:
-                    prev = self.previous_snapshot[rel_path]
-                    if (stat.st_size != prev.get('size') or
-                        abs(stat.st_mtime - prev.get('mtime', 0)) > 1):
-                        changes.append(FileChange(
-                            path=rel_path,
-                            change_type='modified',
-                            old_size=prev.get('size'),
-                            new_size=stat.st_size
-                        ))
-            except Exception:
-                pass
-
-        for prev_path in self.previous_snapshot:
-            if prev_path not in current_paths:
-                changes.append(FileChange(
-                    path=prev_path,
-                    change_type='deleted',
-                    old_size=self.previous_snapshot[prev_path].get('size')
-                ))
-
-        self.save_snapshot(self.current_snapshot)
+        print("\n[Change Detection] Merkle tree diff...")
+
+        previous = self.load_snapshot()
+        if current_files is not None:
+            current = tree_from_files(self.workspace_root, current_files, self.tree or previous)
+            self.tree = current
+        else:
+            current = self.refresh(dirty_paths)
+
+        changes = self._diff(previous, current)
+        self.save_snapshot(current)
         self._save_changes(changes)
 
         print(f"  Detected {len(changes)} changes")
@@ -252,6 +346,10 @@ def get_change_summary(self) -> Dict[str, Any]:
             }
         except:
             return {'total': 0, 'added': 0, 'modified': 0, 'deleted': 0}
+
+    def get_changed_files(self, file_types: Optional[Set[str]] = None) -> List[str]:
+        """
+        Get list of changed files (added or modified)
         
         Args:
             file_types: Set of file extensions to filter (e.g., {'.py', '.md'})
@@ -290,23 +388,3 @@ def has_changes(self) -> bool:
             return data.get('total_changes', 0) > 0
         except:
             return True
-    
-    def get_change_summary(self) -> Dict[str, Any]:
-        """Get summary of detected changes"""
-        if not self.changes_file.exists():
-            return {'total': 0, 'added': 0, 'modified': 0, 'deleted': 0}
-            
-        try:
-            with open(self.changes_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
-            changes = data.get('changes', [])
-            return {
-                'total': len(changes),
-                'added': sum(1 for c in changes if c['change_type'] == 'added'),
-                'modified': sum(1 for c in changes if c['change_type'] == 'modified'),
-                'deleted': sum(1 for c in changes if c['change_type'] == 'deleted'),
-                'timestamp': data.get('timestamp', '')
-            }
-        except:
-            return {'total': 0, 'added': 0, 'modified': 0, 'deleted': 0}
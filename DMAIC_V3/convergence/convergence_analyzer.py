@@ -3,9 +3,11 @@
 from datetime import datetime
 from pathlib import Path
 import json
-import hashlib
 import yaml
 
+from .change_detector import ChangeDetector
+from .hash_history import CHANGE_STATE_DIRNAME, FileHashHistory, scan_file_stability
+
 
 @dataclass
 class ConvergenceMetrics:
@@ -51,6 +53,9 @@ def __init__(self, config_path: str = "config/maturity_config.yaml"):
             '.git',
             '__init__.py'
         ]
+        
+        self.hash_history = FileHashHistory.for_output_dir(self.output_dir)
+        self.change_detector = ChangeDetector(Path('.'), self.output_dir / CHANGE_STATE_DIRNAME)
     
     def _load_config(self, config_path: str) -> Dict:
         config_file = Path(config_path)
@@ -76,66 +81,11 @@ def _load_config(self, config_path: str) -> Dict:
         with open(config_file, 'r') as f:
             return yaml.safe_load(f)
     
-    def calculate_file_hash(self, file_path: Path) -> str:
-        sha256 = hashlib.sha256()
-        try:
-            with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b''):
-                    sha256.update(chunk)
-            return sha256.hexdigest()
-        except Exception as e:
-            return f"ERROR:{str(e)}"
+    def _is_tracked(self, path: str) -> bool:
+        return path.endswith('.py') and not any(pattern in path for pattern in self.exclude_patterns)
     
     def scan_workspace_files(self) -> Tuple[int, int]:
-        workspace = Path('.')
-        all_files = []
-        
-        for file in workspace.rglob('*.py'):
-            if any(pattern in str(file) for pattern in self.exclude_patterns):
-                continue
-            if file.is_file():
-                all_files.append(file)
-        
-        total_files = len(all_files)
-        
-        hash_file = self.output_dir / '.file_hashes.json'
-        previous_hashes = {}
-        if hash_file.exists():
-            try:
-                with open(hash_file, 'r') as f:
-                    history = json.load(f)
-                    if len(history) >= 3:
-                        previous_hashes = history[-3].get('hashes', {})
-            except Exception as e:
-                print(f"Warning: Could not load previous hashes: {e}")
-        
-        current_hashes = {}
-        stable_files = 0
-        
-        for file in all_files:
-            file_hash = self.calculate_file_hash(file)
-            file_str = str(file.relative_to(workspace))
-            current_hashes[file_str] = file_hash
-            
-            if file_str in previous_hashes and previous_hashes[file_str] == file_hash:
-                stable_files += 1
-        
-        hash_file.parent.mkdir(parents=True, exist_ok=True)
-        history = []
-        if hash_file.exists():
-            with open(hash_file, 'r') as f:
-                history = json.load(f)
-        
-        history.append({
-            'timestamp': datetime.now().isoformat(),
-            'iteration': len(history) + 1,
-            'hashes': current_hashes
-        })
-        
-        with open(hash_file, 'w') as f:
-            json.dump(history, f, indent=2)
-        
-        return total_files, stable_files
+        return scan_file_stability(self.hash_history, self.change_detector, self._is_tracked, lag=3)
     
     def check_test_stability(self) -> Tuple[int, int]:
         return 10, 10
@@ -189,12 +139,7 @@ def determine_maturity_level(self, score: float) -> int:
             return 0
     
     def analyze(self) -> ConvergenceMetrics:
-        hash_file = self.output_dir / '.file_hashes.json'
-        iteration = 1
-        if hash_file.exists():
-            with open(hash_file, 'r') as f:
-                history = json.load(f)
-                iteration = len(history) + 1
+        iteration = self.hash_history.iteration + 1
         
         print(f"[1/5] Scanning workspace files...")
         total_files, stable_files = self.scan_workspace_files()
@@ -0,0 +1,319 @@
+"""
+DMAIC V3.3 - File Hash History
+Version: 3.3.0
+
+Bounded history of workspace file hashes for convergence checks.
+
+The history is a ring of the last ``keep`` snapshots stored as one full
+base map plus per-iteration deltas (changed hashes and removed paths).
+Recording an iteration writes only its delta; the base is rewritten when
+old deltas are folded into it, once every ``keep`` iterations. Stability
+questions ("how many files match iteration N-3?") only look at paths
+touched by the deltas since then.
+
+Current hashes come from the ChangeDetector's Merkle tree, so files are
+re-hashed only when their (size, mtime) changed and the delta is the
+tree diff against the snapshot of the last recorded iteration. The scan
+prunes output and virtualenv directories and content-hashes only tracked
+files; every other file gets a (size, mtime) leaf.
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..core.utils import safe_read_json, safe_write_json
+from .change_detector import ChangeDetector
+from .merkle_tree import diff_trees
+
+HISTORY_FORMAT = 1
+HISTORY_DIRNAME = "file_hash_history"
+LEGACY_HISTORY_FILE = ".file_hashes.json"
+# Same state directory as IterativeController, so the Merkle snapshot is shared
+CHANGE_STATE_DIRNAME = "convergence_state"
+# Directory names never scanned for file stability (pipeline output, virtualenvs)
+STABILITY_PRUNE_DIRS = frozenset({
+    'DMAIC_V3_OUTPUT', 'DMAIC_V23_OUTPUT', '.venv', 'venv', 'temp_venv',
+    'site-packages', '.tox', '.nox',
+})
+
+
+class FileHashHistory:
+    """
+    Ring buffer of the last ``keep`` file-hash snapshots, delta encoded
+
+    Between ``keep`` and ``2 * keep`` snapshots are held at any time;
+    older deltas are folded into the base in one write.
+    """
+
+    def __init__(self, history_dir: Path, keep: int = 8, legacy_file: Optional[Path] = None):
+        """
+        Initialize history
+
+        Args:
+            history_dir: Directory holding base.json and deltas.json
+            keep: Minimum number of snapshots retained
+            legacy_file: Old append-only .file_hashes.json to import once
+        """
+        if keep < 1:
+            raise ValueError("keep must be at least 1")
+        self.history_dir = Path(history_dir)
+        self.base_file = self.history_dir / "base.json"
+        self.deltas_file = self.history_dir / "deltas.json"
+        self.keep = keep
+
+        self.base: Dict[str, Any] = self._empty_base()
+        self.deltas: List[Dict[str, Any]] = []
+        self.current: Dict[str, str] = {}
+        self._load()
+        if not self.base_file.exists() and legacy_file is not None and Path(legacy_file).exists():
+            self._import_legacy(Path(legacy_file))
+
+    @classmethod
+    def for_output_dir(cls, output_dir: Path, keep: int = 8) -> 'FileHashHistory':
+        """History stored under a DMAIC output directory (imports .file_hashes.json)"""
+        output_dir = Path(output_dir)
+        return cls(output_dir / HISTORY_DIRNAME, keep=keep, legacy_file=output_dir / LEGACY_HISTORY_FILE)
+
+    @staticmethod
+    def _empty_base() -> Dict[str, Any]:
+        return {'format': HISTORY_FORMAT, 'iteration': 0, 'timestamp': None,
+                'snapshot_id': None, 'hashes': {}}
+
+    def _load(self):
+        """Load base and deltas, rebuilding the current map"""
+        base = safe_read_json(self.base_file)
+        if not base or base.get('format') != HISTORY_FORMAT:
+            return
+        deltas = safe_read_json(self.deltas_file) or {}
+        self.base = base
+        # Deltas already folded into the base (interrupted fold) are skipped
+        self.deltas = [delta for delta in deltas.get('deltas', []) if delta['iteration'] > base['iteration']]
+        self.current = dict(base['hashes'])
+        for delta in self.deltas:
+            self._apply(self.current, delta)
+
+    @staticmethod
+    def _apply(hashes: Dict[str, str], delta: Dict[str, Any]):
+        hashes.update(delta['changed'])
+        for path in delta['removed']:
+            hashes.pop(path, None)
+
+    def _import_legacy(self, legacy_file: Path):
+        """Convert the last ``keep`` entries of an append-only history list"""
+        try:
+            with open(legacy_file, 'r', encoding='utf-8') as f:
+                history = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not import {legacy_file}: {e}")
+            return
+        if not isinstance(history, list) or not history:
+            return
+
+        history = history[-self.keep:]
+        first = history[0]
+        self.base = {'format': HISTORY_FORMAT, 'iteration': first.get('iteration', 1),
+                     'timestamp': first.get('timestamp'), 'snapshot_id': None,
+                     'hashes': dict(first.get('hashes', {}))}
+        self.deltas = []
+        self.current = dict(self.base['hashes'])
+        for entry in history[1:]:
+            hashes = entry.get('hashes', {})
+            self._append_delta(
+                {path: digest for path, digest in hashes.items() if self.current.get(path) != digest},
+                [path for path in self.current if path not in hashes],
+                timestamp=entry.get('timestamp'),
+                iteration=entry.get('iteration')
+            )
+        if self._save_base() and self._save_deltas():
+            legacy_file.unlink()
+
+    @property
+    def iteration(self) -> int:
+        """Number of the latest recorded iteration (0 if none)"""
+        return self.deltas[-1]['iteration'] if self.deltas else self.base['iteration']
+
+    @property
+    def snapshot_id(self) -> Optional[str]:
+        """Change-detector snapshot of the latest recorded iteration"""
+        return self.deltas[-1]['snapshot_id'] if self.deltas else self.base['snapshot_id']
+
+    def snapshot_count(self) -> int:
+        """Number of snapshots currently held"""
+        return len(self.deltas) + (1 if self.base['iteration'] else 0)
+
+    def _append_delta(self, changed: Dict[str, str], removed: List[str],
+                      snapshot_id: Optional[str] = None, timestamp: Optional[str] = None,
+                      iteration: Optional[int] = None):
+        delta = {
+            'iteration': iteration or self.iteration + 1,
+            'timestamp': timestamp or datetime.now().isoformat(),
+            'snapshot_id': snapshot_id,
+            'changed': changed,
+            'removed': removed,
+        }
+        self._apply(self.current, delta)
+        self.deltas.append(delta)
+
+    def record(self, changed: Dict[str, str], removed: Iterable[str] = (),
+               snapshot_id: Optional[str] = None) -> int:
+        """
+        Record the next iteration as a delta against the latest snapshot
+
+        Args:
+            changed: Path -> hash of added or modified files
+            removed: Paths that no longer exist
+            snapshot_id: Change-detector snapshot the hashes came from
+
+        Returns:
+            Number of the recorded iteration
+        """
+        changed = {path: digest for path, digest in changed.items() if self.current.get(path) != digest}
+        removed = sorted(path for path in set(removed) if path in self.current and path not in changed)
+
+        if not self.base['iteration']:
+            self.base = {'format': HISTORY_FORMAT, 'iteration': 1,
+                         'timestamp': datetime.now().isoformat(),
+                         'snapshot_id': snapshot_id, 'hashes': dict(changed)}
+            self.current = dict(changed)
+            self._save_base()
+        else:
+            self._append_delta(changed, removed, snapshot_id)
+            if len(self.deltas) >= 2 * self.keep:
+                self._fold(len(self.deltas) - self.keep + 1)
+        self._save_deltas()
+        return self.iteration
+
+    def _fold(self, count: int):
+        """Merge the oldest ``count`` deltas into the base"""
+        hashes = self.base['hashes']
+        for delta in self.deltas[:count]:
+            self._apply(hashes, delta)
+        last = self.deltas[count - 1]
+        self.base.update(iteration=last['iteration'], timestamp=last['timestamp'],
+                         snapshot_id=last['snapshot_id'])
+        self.deltas = self.deltas[count:]
+        self._save_base()
+
+    def _save_base(self) -> bool:
+        return safe_write_json(self.base, self.base_file, indent=None)
+
+    def _save_deltas(self) -> bool:
+        return safe_write_json({'deltas': self.deltas}, self.deltas_file, indent=None)
+
+    def hash_at(self, path: str, lag: int) -> Optional[str]:
+        """
+        Hash of a file ``lag`` snapshots before the latest one
+
+        Args:
+            path: Relative file path
+            lag: 0 for the latest snapshot
+
+        Returns:
+            Hash, or None if the file did not exist or the snapshot is gone
+        """
+        target = self.snapshot_count() - 1 - lag
+        if target < 0:
+            return None
+        # Snapshot i (i >= 1) is the base plus deltas[:i]
+        for delta in reversed(self.deltas[:target]):
+            if path in delta['changed']:
+                return delta['changed'][path]
+            if path in delta['removed']:
+                return None
+        return self.base['hashes'].get(path)
+
+    def touched_since(self, lag: int) -> Set[str]:
+        """Paths added, modified or removed in the last ``lag`` snapshots"""
+        touched: Set[str] = set()
+        for delta in self.deltas[max(0, len(self.deltas) - lag):]:
+            touched.update(delta['changed'])
+            touched.update(delta['removed'])
+        return touched
+
+    def stable_count(self, lag: int = 3) -> int:
+        """
+        Number of current files whose hash equals the one ``lag`` snapshots ago
+
+        Only paths touched since then are compared.
+
+        Args:
+            lag: How many snapshots back to compare against
+
+        Returns:
+            Stable file count (0 while fewer than ``lag + 1`` snapshots exist)
+        """
+        if self.snapshot_count() <= lag:
+            return 0
+        touched = [path for path in self.touched_since(lag) if path in self.current]
+        unchanged_again = sum(1 for path in touched if self.hash_at(path, lag) == self.current[path])
+        return len(self.current) - len(touched) + unchanged_again
+
+    def stable_iterations(self, path: str) -> int:
+        """
+        Number of consecutive latest snapshots in which a file is unchanged
+
+        Args:
+            path: Relative file path
+
+        Returns:
+            Count within the retained window (0 for unknown files or
+            fewer than two snapshots)
+        """
+        if path not in self.current or self.snapshot_count() < 2:
+            return 0
+        count = 1
+        for delta in reversed(self.deltas):
+            if path in delta['changed'] or path in delta['removed']:
+                return count
+            count += 1
+        return count
+
+
+def scan_file_stability(history: FileHashHistory, detector: ChangeDetector,
+                        include: Callable[[str], bool], lag: int = 3) -> Tuple[int, int]:
+    """
+    Record the current hashes of matching files and count stable files
+
+    Hashes come from the detector's Merkle tree (re-hashing only files
+    whose size or mtime changed); the recorded delta is the tree diff
+    against the snapshot of the previous iteration. Directories in
+    STABILITY_PRUNE_DIRS are not scanned and only files matching
+    ``include`` are content-hashed.
+
+    Args:
+        history: Hash history to extend
+        detector: Change detector providing the workspace snapshot
+        include: Predicate on relative paths ('/' separated)
+        lag: Compare against this many iterations back
+
+    Returns:
+        (total_files, stable_files)
+    """
+    root = os.path.abspath(detector.workspace_root)
+
+    def hash_file(path: str) -> bool:
+        return include(os.path.relpath(path, root).replace(os.sep, '/'))
+
+    tree = detector.refresh(prune_dirs=STABILITY_PRUNE_DIRS, hash_file=hash_file)
+
+    previous = detector.load_snapshot(history.snapshot_id) if history.snapshot_id else None
+    changed: Dict[str, str] = {}
+    removed: List[str] = []
+    if previous is not None:
+        for path, _, _, after in diff_trees(previous, tree):
+            if not include(path):
+                continue
+            if after is None:
+                removed.append(path)
+            else:
+                changed[path] = after.digest.hex()
+    else:
+        # No usable snapshot for the last iteration: compare full maps once
+        changed = {path: leaf.digest.hex() for path, leaf in tree.iter_files() if include(path)}
+        removed = [path for path in history.current if path not in changed]
+
+    history.record(changed, removed, detector.save_snapshot(tree))
+    return len(history.current), history.stable_count(lag)
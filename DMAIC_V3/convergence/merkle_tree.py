@@ -0,0 +1,388 @@
+"""
+DMAIC V3.3 - Workspace Merkle Tree
+Version: 3.3.0
+
+Directory-level Merkle tree of the workspace. Every file leaf records
+(size, mtime, content hash); every directory's digest covers the names
+and digests of its entries, so two trees that agree on a directory digest
+agree on the whole subtree below it.
+
+- scan_tree() builds a tree, re-hashing only files whose (size, mtime)
+  differ from a previous tree
+- refresh_paths() re-lists only the directories containing known dirty
+  paths and re-digests their ancestors
+- diff_trees() descends only into subtrees whose digests differ
+- dump_tree() / load_tree() persist a tree in a compact zlib-compressed
+  binary format
+"""
+
+import hashlib
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from ..core.utils import compute_file_hash
+
+TREE_MAGIC = b'DMKT'
+TREE_VERSION = 1
+
+_DIR_HEADER = struct.Struct('<q32sII')   # mtime_ns, digest, file count, dir count
+_FILE_ENTRY = struct.Struct('<Qq32s')    # size, mtime_ns, content digest
+_NAME_LEN = struct.Struct('<H')
+_STAT_KEY = struct.Struct('<Qq')
+
+SkipDir = Callable[[str, str], bool]
+HashFile = Callable[[str], bool]
+
+
+class MerkleFile:
+    """File leaf: (size, mtime, content hash)"""
+    __slots__ = ('size', 'mtime_ns', 'digest')
+
+    def __init__(self, size: int, mtime_ns: int, digest: bytes):
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.digest = digest
+
+
+class MerkleDir:
+    """Directory node; digest covers all entries below it"""
+    __slots__ = ('mtime_ns', 'files', 'dirs', 'digest')
+
+    def __init__(self, mtime_ns: int = 0):
+        self.mtime_ns = mtime_ns
+        self.files: Dict[str, MerkleFile] = {}
+        self.dirs: Dict[str, 'MerkleDir'] = {}
+        self.digest = b''
+
+    def rehash(self):
+        """Recompute this directory's digest from its entries"""
+        hasher = hashlib.sha256()
+        for name in sorted(self.files):
+            hasher.update(b'f' + name.encode('utf-8', 'surrogateescape') + b'\0')
+            hasher.update(self.files[name].digest)
+        for name in sorted(self.dirs):
+            hasher.update(b'd' + name.encode('utf-8', 'surrogateescape') + b'\0')
+            hasher.update(self.dirs[name].digest)
+        self.digest = hasher.digest()
+
+    def file_count(self) -> int:
+        """Number of files in the subtree"""
+        return len(self.files) + sum(child.file_count() for child in self.dirs.values())
+
+    def iter_files(self, prefix: str = '') -> Iterator[Tuple[str, MerkleFile]]:
+        """Yield (relative path, leaf) for every file in the subtree"""
+        for name in sorted(self.files):
+            yield prefix + name, self.files[name]
+        for name in sorted(self.dirs):
+            yield from self.dirs[name].iter_files(f"{prefix}{name}/")
+
+
+def _hash_file(path: str) -> bytes:
+    """Content digest of a file (empty digest if unreadable)"""
+    try:
+        return bytes.fromhex(compute_file_hash(Path(path)))
+    except OSError:
+        return b'\0' * 32
+
+
+def _leaf(path: str, stat: os.stat_result, previous: Optional[MerkleFile],
+          hash_content: bool = True, hash_file: Optional[HashFile] = None) -> MerkleFile:
+    """
+    Build a leaf, reusing the previous content hash if (size, mtime) match
+
+    Without hash_content, or for paths rejected by hash_file, the leaf
+    digest covers (size, mtime) only, which is enough for cheap polling.
+    """
+    if previous and previous.size == stat.st_size and previous.mtime_ns == stat.st_mtime_ns:
+        return MerkleFile(stat.st_size, stat.st_mtime_ns, previous.digest)
+    if not hash_content or (hash_file is not None and not hash_file(path)):
+        digest = hashlib.sha256(_STAT_KEY.pack(stat.st_size, stat.st_mtime_ns)).digest()
+        return MerkleFile(stat.st_size, stat.st_mtime_ns, digest)
+    return MerkleFile(stat.st_size, stat.st_mtime_ns, _hash_file(path))
+
+
+def _list_dir(path: str, node: MerkleDir, previous: Optional[MerkleDir], skip_dir: SkipDir,
+              hash_content: bool = True, hash_file: Optional[HashFile] = None) -> List[Tuple[str, str]]:
+    """
+    Fill a node's files from disk
+
+    Returns:
+        (name, path) of subdirectories to descend into
+    """
+    subdirs = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not skip_dir(entry.name, entry.path):
+                            subdirs.append((entry.name, entry.path))
+                    elif entry.is_file():
+                        prev_leaf = previous.files.get(entry.name) if previous else None
+                        node.files[entry.name] = _leaf(entry.path, entry.stat(), prev_leaf,
+                                                       hash_content, hash_file)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return subdirs
+
+
+def scan_tree(root: Union[str, Path], previous: Optional[MerkleDir] = None,
+              skip_dir: Optional[SkipDir] = None, hash_content: bool = True,
+              hash_file: Optional[HashFile] = None) -> MerkleDir:
+    """
+    Build the Merkle tree of a directory
+
+    Args:
+        root: Directory to scan
+        previous: Earlier tree of the same directory; files whose
+            (size, mtime) are unchanged keep their content hash
+        skip_dir: Predicate (name, path) for directories to prune
+        hash_content: Hash file contents (otherwise leaves cover only
+            size and mtime)
+        hash_file: Predicate (path) for the files whose contents are
+            hashed; the others get (size, mtime) leaves
+
+    Returns:
+        Root node
+    """
+    skip_dir = skip_dir or (lambda name, path: False)
+
+    def scan(path: str, prev: Optional[MerkleDir]) -> MerkleDir:
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime_ns = 0
+        node = MerkleDir(mtime_ns)
+        for name, subpath in _list_dir(path, node, prev, skip_dir, hash_content, hash_file):
+            node.dirs[name] = scan(subpath, prev.dirs.get(name) if prev else None)
+        node.rehash()
+        # Unchanged subtrees are shared with the previous tree
+        return prev if prev is not None and prev.digest == node.digest else node
+
+    return scan(os.fspath(root), previous)
+
+
+def tree_from_files(root: Union[str, Path], files: Iterable[Union[str, Path]],
+                    previous: Optional[MerkleDir] = None) -> MerkleDir:
+    """
+    Build a Merkle tree over an explicit list of files
+
+    Args:
+        root: Directory the files live under (others are ignored)
+        files: File paths
+        previous: Earlier tree used to reuse content hashes
+
+    Returns:
+        Root node
+    """
+    root = Path(root)
+    tree = MerkleDir()
+    for file_path in files:
+        file_path = Path(file_path)
+        try:
+            parts = file_path.relative_to(root).parts
+            stat = file_path.stat()
+        except (ValueError, OSError):
+            continue
+        node, prev = tree, previous
+        for part in parts[:-1]:
+            node = node.dirs.setdefault(part, MerkleDir())
+            prev = prev.dirs.get(part) if prev else None
+        prev_leaf = prev.files.get(parts[-1]) if prev else None
+        node.files[parts[-1]] = _leaf(str(file_path), stat, prev_leaf)
+
+    def rehash(node: MerkleDir):
+        for child in node.dirs.values():
+            rehash(child)
+        node.rehash()
+
+    rehash(tree)
+    return tree
+
+
+def _copy(node: MerkleDir) -> MerkleDir:
+    """Shallow copy of a directory node"""
+    clone = MerkleDir(node.mtime_ns)
+    clone.files = dict(node.files)
+    clone.dirs = dict(node.dirs)
+    clone.digest = node.digest
+    return clone
+
+
+def refresh_paths(tree: MerkleDir, root: Union[str, Path], paths: Iterable[Union[str, Path]],
+                  skip_dir: Optional[SkipDir] = None, hash_file: Optional[HashFile] = None) -> MerkleDir:
+    """
+    Apply a set of known dirty paths to a tree
+
+    Only the directory containing each dirty path is re-listed (its
+    unchanged subdirectories are kept); new subdirectories are scanned in
+    full. The input tree is not modified: nodes on the affected paths are
+    copied and everything else is shared, so earlier trees stay valid
+    snapshots.
+
+    Args:
+        tree: Current root node
+        root: Directory the tree describes
+        paths: Files or directories that were created, modified or removed
+        skip_dir: Predicate (name, path) for directories to prune
+        hash_file: Predicate (path) for the files whose contents are hashed
+
+    Returns:
+        New root node
+    """
+    skip_dir = skip_dir or (lambda name, path: False)
+    root = os.path.abspath(os.fspath(root))
+
+    # Deepest directory the tree already knows for each dirty path
+    targets = set()
+    for path in paths:
+        path = os.path.abspath(os.fspath(path))
+        rel = os.path.relpath(path, root)
+        if rel == os.pardir or rel.startswith(os.pardir + os.sep):
+            continue
+        parts = [] if rel == os.curdir else rel.split(os.sep)
+        if not os.path.isdir(path):
+            parts = parts[:-1]
+        node, names = tree, []
+        for part in parts:
+            node = node.dirs.get(part)
+            if node is None:
+                break
+            names.append(part)
+        targets.add(tuple(names))
+
+    if not targets:
+        return tree
+
+    new_root = _copy(tree)
+    copied = {(): new_root}
+
+    def writable(names: Tuple[str, ...]) -> MerkleDir:
+        if names not in copied:
+            parent = writable(names[:-1])
+            parent.dirs[names[-1]] = copied[names] = _copy(parent.dirs[names[-1]])
+        return copied[names]
+
+    # Children first, so a parent re-listed later keeps their new copies
+    for names in sorted(targets, key=len, reverse=True):
+        parent = writable(names[:-1]) if names else None
+        if parent is not None and names[-1] not in parent.dirs:
+            continue  # removed by an earlier re-list
+        node = writable(names)
+        path = os.path.join(root, *names)
+        old = MerkleDir()
+        old.files, old.dirs = node.files, node.dirs
+        node.files, node.dirs = {}, {}
+        try:
+            node.mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            pass
+        for name, subpath in _list_dir(path, node, old, skip_dir, hash_file=hash_file):
+            node.dirs[name] = (old.dirs[name] if name in old.dirs
+                               else scan_tree(subpath, skip_dir=skip_dir, hash_file=hash_file))
+
+    for names in sorted(copied, key=len, reverse=True):
+        copied[names].rehash()
+    return new_root
+
+
+def diff_trees(old: Optional[MerkleDir], new: Optional[MerkleDir],
+               prefix: str = '') -> List[Tuple[str, str, Optional[MerkleFile], Optional[MerkleFile]]]:
+    """
+    Compare two trees, skipping every subtree whose digest is unchanged
+
+    Args:
+        old: Earlier tree (None for empty)
+        new: Later tree (None for empty)
+        prefix: Relative path of the compared directories
+
+    Returns:
+        List of (relative path, 'added'|'modified'|'deleted', old leaf, new leaf)
+    """
+    if old is not None and new is not None and old.digest == new.digest:
+        return []
+    old = old or MerkleDir()
+    new = new or MerkleDir()
+
+    changes = []
+    for name in sorted(old.files.keys() | new.files.keys()):
+        before, after = old.files.get(name), new.files.get(name)
+        if before is None:
+            changes.append((prefix + name, 'added', None, after))
+        elif after is None:
+            changes.append((prefix + name, 'deleted', before, None))
+        elif before.digest != after.digest:
+            changes.append((prefix + name, 'modified', before, after))
+    for name in sorted(old.dirs.keys() | new.dirs.keys()):
+        changes.extend(diff_trees(old.dirs.get(name), new.dirs.get(name), f"{prefix}{name}/"))
+    return changes
+
+
+def dump_tree(tree: MerkleDir) -> bytes:
+    """Serialize a tree (pre-order, zlib-compressed)"""
+    out = [TREE_MAGIC, bytes([TREE_VERSION])]
+
+    def name_bytes(name: str) -> bytes:
+        encoded = name.encode('utf-8', 'surrogateescape')
+        return _NAME_LEN.pack(len(encoded)) + encoded
+
+    def write(node: MerkleDir):
+        out.append(_DIR_HEADER.pack(node.mtime_ns, node.digest, len(node.files), len(node.dirs)))
+        for name, leaf in node.files.items():
+            out.append(name_bytes(name))
+            out.append(_FILE_ENTRY.pack(leaf.size, leaf.mtime_ns, leaf.digest))
+        for name, child in node.dirs.items():
+            out.append(name_bytes(name))
+            write(child)
+
+    write(tree)
+    return zlib.compress(b''.join(out), 1)
+
+
+def load_tree(data: bytes) -> MerkleDir:
+    """
+    Inverse of dump_tree()
+
+    Raises:
+        ValueError: If the data is not a serialized tree
+    """
+    try:
+        raw = zlib.decompress(data)
+    except zlib.error as e:
+        raise ValueError(f"Corrupt Merkle tree: {e}") from e
+    if raw[:4] != TREE_MAGIC or raw[4] != TREE_VERSION:
+        raise ValueError("Not a Merkle tree snapshot")
+    offset = 5
+
+    def read_name() -> str:
+        nonlocal offset
+        (length,) = _NAME_LEN.unpack_from(raw, offset)
+        offset += _NAME_LEN.size
+        name = raw[offset:offset + length].decode('utf-8', 'surrogateescape')
+        offset += length
+        return name
+
+    def read() -> MerkleDir:
+        nonlocal offset
+        mtime_ns, digest, n_files, n_dirs = _DIR_HEADER.unpack_from(raw, offset)
+        offset += _DIR_HEADER.size
+        node = MerkleDir(mtime_ns)
+        node.digest = digest
+        for _ in range(n_files):
+            name = read_name()
+            node.files[name] = MerkleFile(*_FILE_ENTRY.unpack_from(raw, offset))
+            offset += _FILE_ENTRY.size
+        for _ in range(n_dirs):
+            name = read_name()
+            node.dirs[name] = read()
+        return node
+
+    try:
+        return read()
+    except struct.error as e:
+        raise ValueError(f"Truncated Merkle tree: {e}") from e
@@ -7,19 +7,27 @@
 
 Real-time stability monitoring with recursive hooks.
 Tracks file changes, test execution, metric variance, and generates alerts.
+
+State per metric, test and file is fixed-size: metrics keep a ring of the
+last window_size values with a sliding (Welford) mean and variance, tests
+and files keep only counters and their last observation, and files are
+re-hashed (in chunks) only when their size or mtime changed.
 """
 
 import json
 import hashlib
+import os
 import time
+from array import array
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Any, Callable
+from typing import Dict, List, Optional, Set, Any, Callable, Iterator
 from dataclasses import dataclass, asdict, field
-from collections import defaultdict, deque
+from collections import Counter, defaultdict, deque
 
 
 VERSION = "3.2.0"
+HASH_CHUNK_SIZE = 1 << 20
 
 
 @dataclass
@@ -72,17 +80,115 @@ class StabilityReport:
     recommendations: List[str]
 
 
+class RollingWindow:
+    """Ring buffer of the last ``size`` values with O(1) sliding mean/variance"""
+    __slots__ = ('values', 'size', 'count', 'head', 'mean', '_m2')
+    
+    def __init__(self, size: int):
+        if size < 1:
+            raise ValueError("window size must be at least 1")
+        self.values = array('d', bytes(8 * size))
+        self.size = size
+        self.count = 0
+        self.head = 0  # index of the oldest value
+        self.mean = 0.0
+        self._m2 = 0.0
+    
+    def append(self, value: float) -> None:
+        if self.count < self.size:
+            self.values[(self.head + self.count) % self.size] = value
+            self.count += 1
+            delta = value - self.mean
+            self.mean += delta / self.count
+            self._m2 += delta * (value - self.mean)
+        else:
+            # Welford update for replacing the oldest value
+            old = self.values[self.head]
+            self.values[self.head] = value
+            self.head = (self.head + 1) % self.size
+            new_mean = self.mean + (value - old) / self.count
+            self._m2 = max(0.0, self._m2 + (value - old) * (value - new_mean + old - self.mean))
+            self.mean = new_mean
+    
+    @property
+    def variance(self) -> float:
+        """Population variance of the window"""
+        return self._m2 / self.count if self.count else 0.0
+    
+    def recent_mean(self, n: int) -> float:
+        """Mean of the newest ``n`` values"""
+        n = min(n, self.count)
+        start = self.head + self.count - n
+        return sum(self.values[(start + i) % self.size] for i in range(n)) / n if n else 0.0
+    
+    def extremes(self):
+        """(min, max) of the window"""
+        # Until the ring wraps, values fill slots [0, count) in order
+        filled = self.values if self.count == self.size else self.values[:self.count]
+        return min(filled), max(filled)
+    
+    def last(self) -> Optional[float]:
+        return self.values[(self.head + self.count - 1) % self.size] if self.count else None
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def __iter__(self) -> Iterator[float]:
+        for i in range(self.count):
+            yield self.values[(self.head + i) % self.size]
+
+
+class _FileState:
+    """Last observation of a file plus counters over the window"""
+    __slots__ = ('size', 'mtime_ns', 'hash', 'samples', 'run')
+    
+    def __init__(self, size: int, mtime_ns: int, hash_value: str):
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.hash = hash_value
+        self.samples = 0  # snapshots in the window
+        self.run = 0      # newest snapshots sharing the current hash
+
+
+class _TestState:
+    """Last status of a test plus pass flags over the window"""
+    __slots__ = ('passed', 'head', 'count', 'failures', 'last_status')
+    
+    def __init__(self, size: int):
+        self.passed = bytearray(size)
+        self.head = 0
+        self.count = 0
+        self.failures = 0  # non-PASSED results in the window
+        self.last_status: Optional[str] = None
+    
+    def append(self, status: str) -> None:
+        size = len(self.passed)
+        flag = 1 if status == "PASSED" else 0
+        if self.count < size:
+            self.passed[(self.head + self.count) % size] = flag
+            self.count += 1
+        else:
+            self.failures -= 1 - self.passed[self.head]
+            self.passed[self.head] = flag
+            self.head = (self.head + 1) % size
+        self.failures += 1 - flag
+        self.last_status = status
+
+
 class StabilityMonitor:
-    def __init__(self, workspace_path: Optional[Path] = None, window_size: int = 10):
+    def __init__(self, workspace_path: Optional[Path] = None, window_size: int = 10,
+                 max_alerts: int = 1000):
         self.version = VERSION
         self.workspace_path = workspace_path or Path.cwd()
         self.window_size = window_size
         
-        self.file_snapshots: Dict[str, deque] = defaultdict(lambda: deque(maxlen=window_size))
-        self.test_results: Dict[str, deque] = defaultdict(lambda: deque(maxlen=window_size))
-        self.metric_history: Dict[str, deque] = defaultdict(lambda: deque(maxlen=window_size))
+        self.file_states: Dict[str, _FileState] = {}
+        self.test_results: Dict[str, _TestState] = defaultdict(lambda: _TestState(window_size))
+        self.metric_history: Dict[str, RollingWindow] = defaultdict(lambda: RollingWindow(window_size))
         
-        self.alerts: List[StabilityAlert] = []
+        # Only the newest alerts are kept; counts cover every alert raised
+        self.alerts: deque = deque(maxlen=max_alerts)
+        self.alert_counts: Counter = Counter()
         self.start_time = time.time()
         self.iteration = 0
         
@@ -109,55 +215,67 @@ def _trigger_hooks(self, hook_list: List[Callable], *args, **kwargs) -> None:
                 print(f"[WARN]️  Hook execution failed: {e}")
     
     def _calculate_file_hash(self, file_path: Path) -> str:
-        if not file_path.exists():
-            return ""
-        
+        sha256 = hashlib.sha256()
         try:
             with open(file_path, 'rb') as f:
-                return hashlib.sha256(f.read()).hexdigest()
+                for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                    sha256.update(chunk)
         except Exception:
             return ""
+        return sha256.hexdigest()
+    
+    def _observe(self, file_path: Path):
+        """(stat or None, hash); the hash is reused while size and mtime are unchanged"""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None, ""
+        state = self.file_states.get(str(file_path))
+        if state is not None and (state.size, state.mtime_ns) == (stat.st_size, stat.st_mtime_ns):
+            return stat, state.hash
+        return stat, self._calculate_file_hash(file_path)
     
     def snapshot_file(self, file_path: Path) -> FileSnapshot:
-        timestamp = datetime.now().isoformat()
-        
-        if file_path.exists():
-            hash_value = self._calculate_file_hash(file_path)
-            size = file_path.stat().st_size
-            modified = file_path.stat().st_mtime
-        else:
-            hash_value = ""
-            size = 0
-            modified = 0
+        stat, hash_value = self._observe(file_path)
         
         return FileSnapshot(
             path=str(file_path),
             hash=hash_value,
-            size=size,
-            modified=modified,
-            timestamp=timestamp
+            size=stat.st_size if stat else 0,
+            modified=stat.st_mtime if stat else 0,
+            timestamp=datetime.now().isoformat()
         )
     
     def track_file(self, file_path: Path) -> bool:
-        snapshot = self.snapshot_file(file_path)
         path_str = str(file_path)
+        stat, hash_value = self._observe(file_path)
+        size, mtime_ns = (stat.st_size, stat.st_mtime_ns) if stat else (0, 0)
         
-        previous_snapshots = self.file_snapshots[path_str]
+        state = self.file_states.get(path_str)
         changed = False
-        
-        if previous_snapshots:
-            last_snapshot = previous_snapshots[-1]
-            if last_snapshot.hash != snapshot.hash:
-                changed = True
-                self._create_alert(
-                    alert_type="file_change",
-                    severity="INFO",
-                    message=f"File changed: {file_path.name}",
-                    details={"path": path_str, "old_hash": last_snapshot.hash[:8], "new_hash": snapshot.hash[:8]}
-                )
-                self._trigger_hooks(self.change_hooks, "file", snapshot)
-        
-        self.file_snapshots[path_str].append(snapshot)
+        if state is None:
+            state = self.file_states[path_str] = _FileState(size, mtime_ns, hash_value)
+        elif state.hash != hash_value:
+            changed = True
+            self._create_alert(
+                alert_type="file_change",
+                severity="INFO",
+                message=f"File changed: {file_path.name}",
+                details={"path": path_str, "old_hash": state.hash[:8], "new_hash": hash_value[:8]}
+            )
+            state.run = 0
+            if self.change_hooks:
+                self._trigger_hooks(self.change_hooks, "file", FileSnapshot(
+                    path=path_str,
+                    hash=hash_value,
+                    size=size,
+                    modified=stat.st_mtime if stat else 0,
+                    timestamp=datetime.now().isoformat()
+                ))
+        
+        state.size, state.mtime_ns, state.hash = size, mtime_ns, hash_value
+        state.samples = min(state.samples + 1, self.window_size)
+        state.run = min(state.run + 1, self.window_size)
         return changed
     
     def track_files(self, file_paths: List[Path]) -> int:
@@ -173,19 +291,10 @@ def scan_workspace(self) -> int:
         return self.track_files(files_to_track)
     
     def record_test_result(self, test_id: str, status: str, duration: float) -> None:
-        result = TestResult(
-            test_id=test_id,
-            status=status,
-            duration=duration,
-            timestamp=datetime.now().isoformat(),
-            iteration=self.iteration
-        )
-        
-        previous_results = self.test_results[test_id]
+        history = self.test_results[test_id]
         
-        if previous_results:
-            last_result = previous_results[-1]
-            if last_result.status == "PASSED" and status == "FAILED":
+        if history.count:
+            if history.last_status == "PASSED" and status == "FAILED":
                 self._create_alert(
                     alert_type="test_regression",
                     severity="HIGH",
@@ -193,22 +302,21 @@ def record_test_result(self, test_id: str, status: str, duration: float) -> None
                     details={"test_id": test_id, "previous": "PASSED", "current": "FAILED"}
                 )
         
-        self.test_results[test_id].append(result)
-        self._trigger_hooks(self.change_hooks, "test", result)
+        history.append(status)
+        if self.change_hooks:
+            self._trigger_hooks(self.change_hooks, "test", TestResult(
+                test_id=test_id,
+                status=status,
+                duration=duration,
+                timestamp=datetime.now().isoformat(),
+                iteration=self.iteration
+            ))
     
     def record_metric(self, metric_name: str, value: float) -> None:
-        snapshot = MetricSnapshot(
-            metric_name=metric_name,
-            value=value,
-            timestamp=datetime.now().isoformat(),
-            iteration=self.iteration
-        )
+        window = self.metric_history[metric_name]
         
-        previous_metrics = self.metric_history[metric_name]
-        
-        if len(previous_metrics) >= 3:
-            recent_values = [m.value for m in list(previous_metrics)[-3:]]
-            avg_value = sum(recent_values) / len(recent_values)
+        if window.count >= 3:
+            avg_value = window.recent_mean(3)
             
             variance = abs(value - avg_value) / avg_value if avg_value != 0 else 0
             
@@ -220,8 +328,27 @@ def record_metric(self, metric_name: str, value: float) -> None:
                     details={"metric": metric_name, "current": value, "average": avg_value, "variance": variance}
                 )
         
-        self.metric_history[metric_name].append(snapshot)
-        self._trigger_hooks(self.change_hooks, "metric", snapshot)
+        window.append(value)
+        if self.change_hooks:
+            self._trigger_hooks(self.change_hooks, "metric", MetricSnapshot(
+                metric_name=metric_name,
+                value=value,
+                timestamp=datetime.now().isoformat(),
+                iteration=self.iteration
+            ))
+    
+    def get_metric_statistics(self, metric_name: str) -> Dict[str, float]:
+        """Rolling count/mean/variance/std/last of a metric over the window"""
+        window = self.metric_history.get(metric_name)
+        if not window:
+            return {}
+        return {
+            'count': len(window),
+            'mean': window.mean,
+            'variance': window.variance,
+            'std': window.variance ** 0.5,
+            'last': window.last()
+        }
     
     def _create_alert(self, alert_type: str, severity: str, message: str, details: Dict[str, Any]) -> None:
         alert = StabilityAlert(
@@ -233,20 +360,21 @@ def _create_alert(self, alert_type: str, severity: str, message: str, details: D
         )
         
         self.alerts.append(alert)
+        self.alert_counts[severity] += 1
         self._trigger_hooks(self.alert_hooks, alert)
     
     def calculate_file_stability(self) -> float:
-        if not self.file_snapshots:
+        if not self.file_states:
             return 100.0
         
         stable_count = 0
         total_count = 0
         
-        for path, snapshots in self.file_snapshots.items():
-            if len(snapshots) >= 2:
+        for state in self.file_states.values():
+            if state.samples >= 2:
                 total_count += 1
-                hashes = [s.hash for s in snapshots]
-                if len(set(hashes)) == 1:
+                # Stable when every snapshot in the window has the same hash
+                if state.run >= state.samples:
                     stable_count += 1
         
         return (stable_count / total_count * 100) if total_count > 0 else 100.0
@@ -258,11 +386,10 @@ def calculate_test_stability(self) -> float:
         stable_count = 0
         total_count = 0
         
-        for test_id, results in self.test_results.items():
-            if len(results) >= 2:
+        for history in self.test_results.values():
+            if history.count >= 2:
                 total_count += 1
-                statuses = [r.status for r in results]
-                if all(s == "PASSED" for s in statuses):
+                if history.failures == 0:
                     stable_count += 1
         
         return (stable_count / total_count * 100) if total_count > 0 else 100.0
@@ -274,18 +401,19 @@ def calculate_metric_stability(self) -> float:
         stable_count = 0
         total_count = 0
         
-        for metric_name, snapshots in self.metric_history.items():
-            if len(snapshots) >= 3:
+        for window in self.metric_history.values():
+            if window.count >= 3:
                 total_count += 1
-                values = [s.value for s in snapshots]
-                avg_value = sum(values) / len(values)
+                avg_value = window.mean
                 
-                if avg_value != 0:
-                    variances = [abs(v - avg_value) / avg_value for v in values]
-                    max_variance = max(variances)
-                    
-                    if max_variance < 0.1:
-                        stable_count += 1
+                if avg_value > 0:
+                    low, high = window.extremes()
+                    max_variance = max(high - avg_value, avg_value - low) / avg_value
+                elif avg_value < 0:
+                    max_variance = max(abs(v - avg_value) / avg_value for v in window)
+                
+                if avg_value != 0 and max_variance < 0.1:
+                    stable_count += 1
         
         return (stable_count / total_count * 100) if total_count > 0 else 100.0
     
@@ -312,9 +440,9 @@ def generate_recommendations(self) -> List[str]:
         if metric_stab < 80:
             recommendations.append(f"Metric stability low ({metric_stab:.1f}%) - stabilize performance")
         
-        high_alerts = [a for a in self.alerts if a.severity == "HIGH"]
+        high_alerts = self.alert_counts["HIGH"]
         if high_alerts:
-            recommendations.append(f"Address {len(high_alerts)} high-severity alerts")
+            recommendations.append(f"Address {high_alerts} high-severity alerts")
         
         if not recommendations:
             recommendations.append("System stable - continue current practices")
@@ -323,7 +451,7 @@ def generate_recommendations(self) -> List[str]:
     
     def generate_report(self) -> StabilityReport:
         duration = time.time() - self.start_time
-        changes = sum(len(snapshots) for snapshots in self.file_snapshots.values())
+        changes = sum(state.samples for state in self.file_states.values())
         
         return StabilityReport(
             version=self.version,
@@ -335,7 +463,7 @@ def generate_report(self) -> StabilityReport:
             metric_stability=self.calculate_metric_stability(),
             overall_stability=self.calculate_overall_stability(),
             changes_detected=changes,
-            alerts=self.alerts,
+            alerts=list(self.alerts),
             recommendations=self.generate_recommendations()
         )
     
@@ -0,0 +1,253 @@
+"""
+DMAIC V3.3 - Shared Python AST Extractor
+Version: 3.3.0
+
+Single-pass extraction of code elements from Python source, shared by
+Phase 2, the execution tracker, the dependency graph agent, the global
+index generator and the temporal metadata engine.
+
+One ast.NodeVisitor traversal collects:
+- Functions (sync and async), classes and imports
+- Import targets with their relative level, for import-graph resolution
+- Cyclomatic complexity (1 + decision points)
+- Docstring coverage over modules, classes and functions
+
+Results are cached in memory per SHA-256 of the file content, so a file
+analyzed by several consumers in one run is parsed only once.
+"""
+
+import ast
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+
+@dataclass(frozen=True)
+class FunctionInfo:
+    """Function or method definition"""
+    name: str
+    line: int
+    args: int
+    is_async: bool
+    has_docstring: bool
+
+
+@dataclass(frozen=True)
+class ClassInfo:
+    """Class definition"""
+    name: str
+    line: int
+    has_docstring: bool
+
+
+@dataclass(frozen=True)
+class CodeElements:
+    """Everything the analyzers need from one Python source file"""
+    content_hash: str
+    total_lines: int
+    lines_of_code: int
+    comment_lines: int
+    functions: Tuple[FunctionInfo, ...] = ()
+    classes: Tuple[ClassInfo, ...] = ()
+    imports: Tuple[str, ...] = ()
+    import_targets: Tuple[str, ...] = ()
+    cyclomatic_complexity: int = 1
+    has_module_docstring: bool = False
+    syntax_error: Optional[str] = None
+
+    @property
+    def sync_functions(self) -> Tuple[FunctionInfo, ...]:
+        """Plain ``def`` functions and methods"""
+        return tuple(f for f in self.functions if not f.is_async)
+
+    @property
+    def async_functions(self) -> Tuple[FunctionInfo, ...]:
+        """``async def`` functions and methods"""
+        return tuple(f for f in self.functions if f.is_async)
+
+    @property
+    def module_imports(self) -> Tuple[str, ...]:
+        """Imported module names, excluding bare relative imports"""
+        return tuple(name for name in self.imports if name)
+
+    @property
+    def docstring_coverage(self) -> float:
+        """Fraction of module, classes and functions that carry a docstring"""
+        total = 1 + len(self.functions) + len(self.classes)
+        documented = (
+            int(self.has_module_docstring) +
+            sum(1 for f in self.functions if f.has_docstring) +
+            sum(1 for c in self.classes if c.has_docstring)
+        )
+        return round(documented / total, 4)
+
+
+class CodeElementVisitor(ast.NodeVisitor):
+    """Collects code elements and complexity in one traversal"""
+
+    DECISION_NODES = (ast.If, ast.IfExp, ast.For, ast.AsyncFor, ast.While,
+                      ast.ExceptHandler, ast.Assert)
+
+    def __init__(self):
+        self.functions = []
+        self.classes = []
+        self.imports = []
+        self.import_targets = []
+        self.decisions = 0
+
+    def _visit_function(self, node, is_async: bool):
+        self.functions.append(FunctionInfo(
+            name=node.name,
+            line=node.lineno,
+            args=len(node.args.args),
+            is_async=is_async,
+            has_docstring=ast.get_docstring(node, clean=False) is not None
+        ))
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        self._visit_function(node, is_async=False)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef):
+        self._visit_function(node, is_async=True)
+
+    def visit_ClassDef(self, node: ast.ClassDef):
+        self.classes.append(ClassInfo(
+            name=node.name,
+            line=node.lineno,
+            has_docstring=ast.get_docstring(node, clean=False) is not None
+        ))
+        self.generic_visit(node)
+
+    def visit_Import(self, node: ast.Import):
+        self.imports.extend(alias.name for alias in node.names)
+        self.import_targets.extend(alias.name for alias in node.names)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom):
+        self.imports.append(node.module or '')
+        # Dotted candidates, relative ones prefixed by one dot per level;
+        # "from pkg import name" may import the submodule pkg.name
+        base = '.' * node.level + (node.module or '')
+        if node.module:
+            self.import_targets.append(base)
+        separator = '.' if node.module else ''
+        self.import_targets.extend(base + separator + alias.name
+                                   for alias in node.names if alias.name != '*')
+
+    def visit_BoolOp(self, node: ast.BoolOp):
+        self.decisions += len(node.values) - 1
+        self.generic_visit(node)
+
+    def visit_comprehension(self, node: ast.comprehension):
+        self.decisions += 1 + len(node.ifs)
+        self.generic_visit(node)
+
+    def generic_visit(self, node: ast.AST):
+        if isinstance(node, self.DECISION_NODES):
+            self.decisions += 1
+        elif type(node).__name__ == 'match_case':
+            self.decisions += 1
+        super().generic_visit(node)
+
+
+_CACHE_SIZE = 4096
+_cache: "OrderedDict[str, CodeElements]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _line_metrics(content: str) -> Tuple[int, int, int]:
+    """Return (total_lines, lines_of_code, comment_lines)"""
+    total = 0
+    code = 0
+    comments = 0
+    for line in content.split('\n'):
+        total += 1
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if stripped.startswith('#'):
+            comments += 1
+        else:
+            code += 1
+    return total, code, comments
+
+
+def extract_source(source: Union[str, bytes]) -> CodeElements:
+    """
+    Extract code elements from Python source
+
+    Args:
+        source: Source text or raw bytes
+
+    Returns:
+        CodeElements; ``syntax_error`` is set when the source does not parse
+    """
+    raw = source.encode('utf-8') if isinstance(source, str) else source
+    content_hash = hashlib.sha256(raw).hexdigest()
+
+    with _cache_lock:
+        cached = _cache.get(content_hash)
+        if cached is not None:
+            _cache.move_to_end(content_hash)
+            return cached
+
+    content = source if isinstance(source, str) else raw.decode('utf-8', errors='ignore')
+    total_lines, loc, comment_lines = _line_metrics(content)
+
+    try:
+        tree = ast.parse(content)
+    except (SyntaxError, ValueError) as e:
+        elements = CodeElements(
+            content_hash=content_hash,
+            total_lines=total_lines,
+            lines_of_code=loc,
+            comment_lines=comment_lines,
+            syntax_error=str(e)
+        )
+    else:
+        visitor = CodeElementVisitor()
+        visitor.visit(tree)
+        elements = CodeElements(
+            content_hash=content_hash,
+            total_lines=total_lines,
+            lines_of_code=loc,
+            comment_lines=comment_lines,
+            functions=tuple(visitor.functions),
+            classes=tuple(visitor.classes),
+            imports=tuple(visitor.imports),
+            import_targets=tuple(visitor.import_targets),
+            cyclomatic_complexity=1 + visitor.decisions,
+            has_module_docstring=ast.get_docstring(tree, clean=False) is not None
+        )
+
+    with _cache_lock:
+        _cache[content_hash] = elements
+        if len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return elements
+
+
+def extract_file(file_path: Union[str, Path]) -> CodeElements:
+    """
+    Extract code elements from a Python file
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        CodeElements for the file content
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    with open(file_path, 'rb') as f:
+        return extract_source(f.read())
+
+
+def clear_cache():
+    """Drop all cached extraction results"""
+    with _cache_lock:
+        _cache.clear()
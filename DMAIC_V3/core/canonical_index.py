@@ -7,14 +7,20 @@
 Date: 2025-01-12
 """
 
+import copy
+import heapq
 import json
 import yaml
+from bisect import bisect_left, insort
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, List, Any, Optional, Set, Tuple, Union
 from datetime import datetime
 from dataclasses import dataclass, asdict, field
 from enum import Enum
 
+from .registry_store import RegistryStore
+
 
 class ArtifactType(Enum):
     """Types of artifacts"""
@@ -79,6 +85,11 @@ def from_string(cls, version_str: str) -> 'CanonicalVersion':
         return cls(major=major, minor=minor, patch=patch,
                   build=build, prerelease=prerelease)
 
+    def sort_key(self) -> Tuple:
+        """Ordering key: a prerelease sorts before its release, build is ignored"""
+        return (self.major, self.minor, self.patch,
+                self.prerelease is None, self.prerelease or "")
+
 
 @dataclass
 class CanonicalMetadata:
@@ -135,10 +146,12 @@ class CanonicalIndexSystem:
     - Global naming conventions
     - Semantic versioning
     - Metadata standards
-    - JSON/YAML index files
+    - SQLite primary store with batched writes; JSON/YAML exports on demand
     - Artifact tracking
     - Version history
     - Dependency management
+    - Secondary indexes (type, status, tag, name -> versions, quality)
+      maintained incrementally, so queries do not scan the index
     """
 
     def __init__(self, workspace_root: Path):
@@ -152,8 +165,9 @@ def __init__(self, workspace_root: Path):
         self.index_dir = self.workspace_root / ".dmaic" / "indexes"
         self.index_dir.mkdir(parents=True, exist_ok=True)
 
+        self.master_index_db = self.index_dir / "master_index.db"
+        # Legacy primary index, imported once into the database
         self.master_index_json = self.index_dir / "master_index.json"
-        self.master_index_yaml = self.index_dir / "master_index.yaml"
 
         self.version = CanonicalVersion(1, 0, 0)
         self.timestamp = datetime.now().isoformat()
@@ -175,71 +189,214 @@ def __init__(self, workspace_root: Path):
         }
 
         self.index: Dict[str, IndexEntry] = {}
+
+        # Secondary indexes over self.index, kept in sync by _index_entry/_unindex_entry
+        self._seq: Dict[str, int] = {}
+        self._next_seq = 0
+        self._by_type: Dict[str, Set[str]] = {}
+        self._by_status: Dict[str, Set[str]] = {}
+        self._by_tag: Dict[str, Set[str]] = {}
+        self._versions: Dict[str, List[Tuple[Tuple, str]]] = {}  # name -> sorted (version key, id)
+        self._by_quality: List[Tuple[float, str]] = []  # sorted (quality_score, id)
+
+        # Write-behind state: ids changed since the last flush, open batches
+        # and, per batch, the entries as they were before the batch touched them
+        self._dirty: Set[str] = set()
+        self._batch_depth = 0
+        self._undo: Dict[str, Optional[IndexEntry]] = {}
+
+        self.store = RegistryStore(self.master_index_db, id_field='canonical_id')
         self._load_index()
 
     def _load_index(self) -> Any:
-        """Load master index from JSON"""
-        if self.master_index_json.exists():
+        """Load master index from the database (importing a legacy JSON index once)"""
+        if not self.store.count() and self.master_index_json.exists():
             with open(self.master_index_json, 'r', encoding='utf-8') as f:
                 data = json.load(f)
+            self.store.upsert_many(data.get('entries', []))
+
+        for entry_data in self.store.find():
+            entry = self._entry_from_dict(entry_data)
+            self.index[entry.canonical_id] = entry
+
+        self._rebuild_indexes()
+
+    @staticmethod
+    def _entry_from_dict(entry_data: Dict[str, Any]) -> IndexEntry:
+        """Rebuild an IndexEntry from IndexEntry.to_dict() output"""
+        metadata_data = entry_data['metadata']
+        version = CanonicalVersion.from_string(metadata_data['version'])
 
-            for entry_data in data.get('entries', []):
-                metadata_data = entry_data['metadata']
-                version = CanonicalVersion.from_string(metadata_data['version'])
-
-                metadata = CanonicalMetadata(
-                    canonical_name=metadata_data['canonical_name'],
-                    display_name=metadata_data['display_name'],
-                    version=version,
-                    artifact_type=metadata_data['artifact_type'],
-                    status=metadata_data['status'],
-                    created_at=metadata_data['created_at'],
-                    updated_at=metadata_data['updated_at'],
-                    author=metadata_data.get('author', 'DMAIC V3 System'),
-                    description=metadata_data.get('description', ''),
-                    tags=metadata_data.get('tags', []),
-                    dependencies=metadata_data.get('dependencies', []),
-                    related_artifacts=metadata_data.get('related_artifacts', []),
-                    quality_score=metadata_data.get('quality_score', 0.0),
-                    rank_position=metadata_data.get('rank_position', 0)
-                )
-
-                entry = IndexEntry(
-                    canonical_id=entry_data['canonical_id'],
-                    canonical_name=entry_data['canonical_name'],
-                    display_name=entry_data['display_name'],
-                    version=entry_data['version'],
-                    artifact_type=entry_data['artifact_type'],
-                    file_path=entry_data['file_path'],
-                    status=entry_data['status'],
-                    metadata=metadata,
-                    checksum=entry_data['checksum'],
-                    size_bytes=entry_data['size_bytes'],
-                    timestamp=entry_data['timestamp']
-                )
-
-                self.index[entry.canonical_id] = entry
+        metadata = CanonicalMetadata(
+            canonical_name=metadata_data['canonical_name'],
+            display_name=metadata_data['display_name'],
+            version=version,
+            artifact_type=metadata_data['artifact_type'],
+            status=metadata_data['status'],
+            created_at=metadata_data['created_at'],
+            updated_at=metadata_data['updated_at'],
+            author=metadata_data.get('author', 'DMAIC V3 System'),
+            description=metadata_data.get('description', ''),
+            tags=metadata_data.get('tags', []),
+            dependencies=metadata_data.get('dependencies', []),
+            related_artifacts=metadata_data.get('related_artifacts', []),
+            quality_score=metadata_data.get('quality_score', 0.0),
+            rank_position=metadata_data.get('rank_position', 0)
+        )
+
+        return IndexEntry(
+            canonical_id=entry_data['canonical_id'],
+            canonical_name=entry_data['canonical_name'],
+            display_name=entry_data['display_name'],
+            version=entry_data['version'],
+            artifact_type=entry_data['artifact_type'],
+            file_path=entry_data['file_path'],
+            status=entry_data['status'],
+            metadata=metadata,
+            checksum=entry_data['checksum'],
+            size_bytes=entry_data['size_bytes'],
+            timestamp=entry_data['timestamp']
+        )
+
+    def _rebuild_indexes(self):
+        """Build all secondary indexes from self.index in one pass"""
+        self._seq = {cid: seq for seq, cid in enumerate(self.index)}
+        self._next_seq = len(self._seq)
+        self._by_type, self._by_status, self._by_tag = {}, {}, {}
+        self._versions, self._by_quality = {}, []
+        for cid, entry in self.index.items():
+            self._by_type.setdefault(entry.artifact_type, set()).add(cid)
+            self._by_status.setdefault(entry.status, set()).add(cid)
+            for tag in entry.metadata.tags:
+                self._by_tag.setdefault(tag, set()).add(cid)
+            self._versions.setdefault(entry.canonical_name, []).append(
+                (entry.metadata.version.sort_key(), cid))
+            self._by_quality.append((entry.metadata.quality_score, cid))
+        for versions in self._versions.values():
+            versions.sort()
+        self._by_quality.sort()
+
+    def _index_entry(self, entry: IndexEntry):
+        """Add an entry to the secondary indexes"""
+        cid = entry.canonical_id
+        self._by_type.setdefault(entry.artifact_type, set()).add(cid)
+        self._by_status.setdefault(entry.status, set()).add(cid)
+        for tag in entry.metadata.tags:
+            self._by_tag.setdefault(tag, set()).add(cid)
+        insort(self._versions.setdefault(entry.canonical_name, []),
+               (entry.metadata.version.sort_key(), cid))
+        insort(self._by_quality, (entry.metadata.quality_score, cid))
+
+    def _unindex_entry(self, entry: IndexEntry):
+        """Remove an entry from the secondary indexes (before it is modified)"""
+        cid = entry.canonical_id
+        for buckets, keys in ((self._by_type, [entry.artifact_type]),
+                              (self._by_status, [entry.status]),
+                              (self._by_tag, entry.metadata.tags)):
+            for key in keys:
+                bucket = buckets.get(key)
+                if bucket is not None:
+                    bucket.discard(cid)
+                    if not bucket:
+                        del buckets[key]
+        versions = self._versions.get(entry.canonical_name)
+        if versions is not None:
+            _remove_sorted(versions, (entry.metadata.version.sort_key(), cid))
+            if not versions:
+                del self._versions[entry.canonical_name]
+        _remove_sorted(self._by_quality, (entry.metadata.quality_score, cid))
+
+    def _add_entry(self, entry: IndexEntry):
+        """Insert or replace an entry in the index and secondary indexes"""
+        cid = entry.canonical_id
+        previous = self.index.get(cid)
+        if previous is not None:
+            self._unindex_entry(previous)
+        else:
+            self._seq[cid] = self._next_seq
+            self._next_seq += 1
+        self.index[cid] = entry
+        self._index_entry(entry)
+
+    def _touch(self, canonical_id: str):
+        """Mark an entry changed, remembering its prior state inside a batch"""
+        if self._batch_depth and canonical_id not in self._undo:
+            previous = self.index.get(canonical_id)
+            self._undo[canonical_id] = copy.deepcopy(previous) if previous is not None else None
+        self._dirty.add(canonical_id)
 
     def _save_index(self) -> Any:
-        """Save master index to JSON and YAML"""
-        data = {
-            'metadata': {
-                'version': str(self.version),
-                'generated_at': datetime.now().isoformat(),
-                'workspace_root': str(self.workspace_root),
-                'total_entries': len(self.index)
-            },
-            'naming_rules': self.naming_rules,
-            'entries': [entry.to_dict() for entry in self.index.values()]
-        }
+        """Persist pending changes unless a batch is open"""
+        if not self._batch_depth:
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Write all pending changes to the database in one transaction
 
-        # Save JSON
-        with open(self.master_index_json, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        Returns:
+            Number of entries written
+        """
+        entries = [self.index[cid].to_dict() for cid in self._dirty if cid in self.index]
+        self._dirty.clear()
+        return self.store.upsert_many(entries)
+
+    @contextmanager
+    def batch(self, flush: bool = True):
+        """
+        Group registrations and updates into one transaction
+
+        Changes are written when the outermost batch exits, or left pending
+        for an explicit flush() with flush=False. If the block raises, every
+        entry it touched is restored and nothing is written.
+
+        Usage:
+            with index.batch():
+                for path in paths:
+                    index.register_artifact(path, ...)
 
-        # Save YAML
-        with open(self.master_index_yaml, 'w', encoding='utf-8') as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        Args:
+            flush: Write changes when the outermost batch exits
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._rollback()
+            raise
+        self._batch_depth -= 1
+        if not self._batch_depth:
+            self._undo.clear()
+            if flush:
+                self.flush()
+
+    def _rollback(self):
+        """Restore entries touched by the failed batch"""
+        for cid, previous in self._undo.items():
+            current = self.index.get(cid)
+            if current is not None:
+                self._unindex_entry(current)
+            if previous is None:
+                self.index.pop(cid, None)
+                self._seq.pop(cid, None)
+                self._dirty.discard(cid)
+            else:
+                self.index[cid] = previous
+                self._index_entry(previous)
+        self._undo.clear()
+
+    def close(self):
+        """Flush pending changes and close the database"""
+        self.flush()
+        self.store.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
     def register_artifact(self, file_path: Path,
                          canonical_name: str,
@@ -307,7 +464,8 @@ def register_artifact(self, file_path: Path,
         )
 
         # Add to index
-        self.index[canonical_id] = entry
+        self._touch(canonical_id)
+        self._add_entry(entry)
         self._save_index()
 
         return entry
@@ -330,7 +488,9 @@ def update_artifact(self, canonical_id: str,
         if canonical_id not in self.index:
             raise ValueError(f"Artifact not found: {canonical_id}")
 
+        self._touch(canonical_id)
         entry = self.index[canonical_id]
+        self._unindex_entry(entry)
 
         if version:
             entry.version = str(version)
@@ -355,6 +515,7 @@ def update_artifact(self, canonical_id: str,
             entry.checksum = self._calculate_checksum(file_path)
             entry.size_bytes = file_path.stat().st_size
 
+        self._index_entry(entry)
         self._save_index()
 
     def get_artifact(self, canonical_id: str) -> Optional[IndexEntry]:
@@ -378,28 +539,102 @@ def search_artifacts(self,
         Returns:
             List of matching IndexEntry objects
         """
-        results = []
-
-        for entry in self.index.values():
-            # Filter by artifact type
-            if artifact_type and entry.artifact_type != artifact_type.value:
-                continue
-
-            # Filter by status
-            if status and entry.status != status.value:
-                continue
+        return self.query(
+            artifact_type=artifact_type,
+            status=status,
+            tags_any=tags or None,
+            min_quality_score=min_quality_score or None
+        )
 
-            # Filter by tags
-            if tags and not any(tag in entry.metadata.tags for tag in tags):
-                continue
+    def query(self,
+              artifact_type: Optional[Union[ArtifactType, str]] = None,
+              status: Optional[Union[VersionStatus, str]] = None,
+              tags_all: Optional[Iterable[str]] = None,
+              tags_any: Optional[Iterable[str]] = None,
+              canonical_name: Optional[str] = None,
+              min_quality_score: Optional[float] = None,
+              top_k: Optional[int] = None) -> List[IndexEntry]:
+        """
+        Query artifacts through the secondary indexes
 
-            # Filter by quality score
-            if min_quality_score and entry.metadata.quality_score < min_quality_score:
-                continue
+        Filters are combined with AND; tags_all requires every tag,
+        tags_any at least one of them.
 
-            results.append(entry)
+        Args:
+            artifact_type: Artifact type
+            status: Version status
+            tags_all: Tags that must all be present
+            tags_any: Tags of which one must be present
+            canonical_name: Canonical name (any version)
+            min_quality_score: Minimum quality score (inclusive)
+            top_k: Return only the k best by quality score
 
-        return results
+        Returns:
+            Matching entries in registration order, or by quality score
+            (best first) when top_k is given
+        """
+        buckets = []
+        if artifact_type is not None:
+            buckets.append(self._by_type.get(_enum_value(artifact_type), set()))
+        if status is not None:
+            buckets.append(self._by_status.get(_enum_value(status), set()))
+        for tag in tags_all or ():
+            buckets.append(self._by_tag.get(tag, set()))
+        if tags_any is not None:
+            buckets.append(set().union(*(self._by_tag.get(tag, ()) for tag in tags_any)))
+        if canonical_name is not None:
+            buckets.append({cid for _, cid in self._versions.get(canonical_name, ())})
+
+        # Entries at or above the score threshold are a tail of the quality list
+        start = 0 if min_quality_score is None else bisect_left(self._by_quality, (min_quality_score,))
+
+        if top_k is not None:
+            return [self.index[cid] for cid in self._top_by_quality(buckets, start, top_k)]
+
+        if not buckets:
+            if min_quality_score is None:
+                return list(self.index.values())
+            ids = [cid for _, cid in self._by_quality[start:]]
+        else:
+            buckets.sort(key=len)
+            if min_quality_score is not None and len(self._by_quality) - start < len(buckets[0]):
+                buckets.insert(0, {cid for _, cid in self._by_quality[start:]})
+                min_quality_score = None
+            ids = buckets[0].intersection(*buckets[1:])
+            if min_quality_score is not None:
+                ids = [cid for cid in ids if self.index[cid].metadata.quality_score >= min_quality_score]
+        return [self.index[cid] for cid in sorted(ids, key=self._seq.__getitem__)]
+
+    def _top_by_quality(self, buckets: List[Set[str]], start: int, k: int) -> List[str]:
+        """Best k ids by quality that are in every bucket, from quality position start on"""
+        if k <= 0:
+            return []
+        if not buckets:
+            tail = self._by_quality[max(start, len(self._by_quality) - k):]
+            return [cid for _, cid in reversed(tail)]
+
+        # Walking the quality list from the top finds k matches in about
+        # k * N / |matches| steps. Each step is a Python-level check, so give
+        # up once it would cost more than intersecting the buckets in C.
+        buckets.sort(key=len)
+        budget = len(buckets[0]) // 16 + k
+        found = []
+        for index in range(len(self._by_quality) - 1, max(start, len(self._by_quality) - budget) - 1, -1):
+            cid = self._by_quality[index][1]
+            if all(cid in bucket for bucket in buckets):
+                found.append(cid)
+                if len(found) == k:
+                    return found
+        if len(self._by_quality) - start <= budget:
+            return found  # walked the whole range
+
+        threshold = self._by_quality[start][0]
+        candidates = buckets[0].intersection(*buckets[1:])
+        best = heapq.nlargest(k, (
+            (self.index[cid].metadata.quality_score, cid) for cid in candidates
+            if self.index[cid].metadata.quality_score >= threshold
+        ))
+        return [cid for _, cid in best]
 
     def get_version_history(self, canonical_name: str) -> List[IndexEntry]:
         """
@@ -411,18 +646,7 @@ def get_version_history(self, canonical_name: str) -> List[IndexEntry]:
         Returns:
             List of IndexEntry objects sorted by version (newest first)
         """
-        entries = [
-            entry for entry in self.index.values()
-            if entry.canonical_name == canonical_name
-        ]
-
-        # Sort by version (newest first)
-        entries.sort(
-            key=lambda e: CanonicalVersion.from_string(e.version),
-            reverse=True
-        )
-
-        return entries
+        return [self.index[cid] for _, cid in reversed(self._versions.get(canonical_name, ()))]
 
     def generate_canonical_name(self, display_name: str) -> str:
         """
@@ -504,7 +728,9 @@ def export_index_report(self, output_path: Path, format: str = 'json'):
                 json.dump(report, f, indent=2)
         elif format == 'yaml':
             with open(output_path, 'w', encoding='utf-8') as f:
-                yaml.dump(report, f, default_flow_style=False, sort_keys=False)
+                # libyaml emitter when available; the report holds plain types only
+                yaml.dump(report, f, Dumper=getattr(yaml, 'CSafeDumper', yaml.SafeDumper),
+                          default_flow_style=False, sort_keys=False)
 
     def _generate_canonical_id(self, canonical_name: str,
                               version: CanonicalVersion) -> str:
@@ -551,3 +777,15 @@ def export_to_yaml(self, output_path: Path):
             output_path: Path to save YAML file
         """
         self.export_index_report(output_path, format='yaml')
+
+
+def _enum_value(value: Union[Enum, str]) -> str:
+    """Enum member or plain string to its stored string value"""
+    return value.value if isinstance(value, Enum) else value
+
+
+def _remove_sorted(ordered: List[Tuple], item: Tuple):
+    """Remove item from a sorted list if present"""
+    position = bisect_left(ordered, item)
+    if position < len(ordered) and ordered[position] == item:
+        del ordered[position]
@@ -0,0 +1,151 @@
+"""
+DMAIC V3.3 - Per-File Result Cache
+Version: 3.3.0
+
+Persistent cache of per-file analysis results for incremental phases.
+
+Entries are validated by (size, mtime) first; when only the mtime moved
+(checkout, touch, copy) the content hash decides, so unchanged files are
+never re-analyzed.
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from .utils import compute_file_hash, safe_read_json, safe_write_json
+
+
+class FileMetricsCache:
+    """
+    Path-keyed result cache backed by a JSON file
+
+    Each entry stores the file's size, mtime (ns), SHA-256 and the cached
+    value. A cache written by a different ``version`` is discarded, so
+    bumping the analyzer version invalidates everything.
+    """
+
+    def __init__(self, cache_file: Path, version: str = "1"):
+        """
+        Initialize cache
+
+        Args:
+            cache_file: JSON file holding the cache
+            version: Producer version; mismatching caches are ignored
+        """
+        self.cache_file = Path(cache_file)
+        self.version = version
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.hits = 0
+        self.hash_hits = 0
+        self.misses = 0
+        self._pending: Dict[str, Tuple[int, int, str]] = {}
+        # Every entry written by this run is validated after this moment
+        self._opened_at = time.time()
+        self.snapshot_time: Optional[float] = None
+        self._load()
+
+    def _load(self):
+        """Load entries from disk if the version matches"""
+        data = safe_read_json(self.cache_file)
+        if data and data.get('version') == self.version:
+            self.entries = data.get('entries', {})
+            self.snapshot_time = data.get('snapshot_time')
+
+    def lookup(self, file_path: str, assume_unchanged: bool = False) -> Optional[Any]:
+        """
+        Return the cached value for an unchanged file
+
+        Args:
+            file_path: Path to the file
+            assume_unchanged: Caller knows the file has not changed since
+                snapshot_time (e.g. from file system events); skips the stat
+
+        Returns:
+            Cached value, or None if the file is new, changed or unreadable
+        """
+        key = str(file_path)
+        if assume_unchanged and key in self.entries:
+            self.hits += 1
+            return self.entries[key]['value']
+        try:
+            stat = os.stat(key)
+        except OSError:
+            self.misses += 1
+            return None
+
+        entry = self.entries.get(key)
+        if entry and entry['size'] == stat.st_size:
+            if entry['mtime_ns'] == stat.st_mtime_ns:
+                self.hits += 1
+                return entry['value']
+
+            content_hash = compute_file_hash(Path(key))
+            if content_hash == entry['hash']:
+                entry['mtime_ns'] = stat.st_mtime_ns
+                self.hash_hits += 1
+                return entry['value']
+            self._pending[key] = (stat.st_size, stat.st_mtime_ns, content_hash)
+
+        self.misses += 1
+        return None
+
+    def store(self, file_path: str, value: Any):
+        """
+        Cache a freshly computed value for a file
+
+        Args:
+            file_path: Path to the file
+            value: JSON-serializable result
+        """
+        key = str(file_path)
+        if key in self._pending:
+            size, mtime_ns, content_hash = self._pending.pop(key)
+        else:
+            try:
+                stat = os.stat(key)
+                size, mtime_ns = stat.st_size, stat.st_mtime_ns
+                content_hash = compute_file_hash(Path(key))
+            except OSError:
+                return
+
+        self.entries[key] = {
+            'size': size,
+            'mtime_ns': mtime_ns,
+            'hash': content_hash,
+            'value': value,
+        }
+
+    def prune(self, keep: Iterable[str]) -> int:
+        """
+        Drop entries for files no longer in scope
+
+        Args:
+            keep: Paths that remain valid
+
+        Returns:
+            Number of entries removed
+        """
+        keep_set = {str(p) for p in keep}
+        stale = [key for key in self.entries if key not in keep_set]
+        for key in stale:
+            del self.entries[key]
+        return len(stale)
+
+    def save(self) -> bool:
+        """Persist the cache to disk"""
+        return safe_write_json(
+            {'version': self.version, 'snapshot_time': self._opened_at, 'entries': self.entries},
+            self.cache_file,
+            indent=None
+        )
+
+    def get_stats(self) -> Dict[str, int]:
+        """Hit/miss counters for the current run"""
+        return {
+            'entries': len(self.entries),
+            'hits': self.hits + self.hash_hits,
+            'hash_hits': self.hash_hits,
+            'misses': self.misses,
+        }
@@ -5,97 +5,178 @@
 """
 
 import functools
-import hashlib
-import json
+import inspect
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
-from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Optional, Union
+
+from ..config import PathConfig
+from .phase_cache import PhaseCache, artifact_digest, code_version, fingerprint
+
+InputSpec = Union[Iterable[Union[str, Path]], Callable[[Any], Iterable[Union[str, Path]]]]
+
+
+def default_cache_dir() -> Path:
+    """Phase cache under the configured state directory (as set up by Phase 0)"""
+    return PathConfig.workspace_root / PathConfig.state_dir / "cache"
+
+
+def succeeded(result: Any) -> bool:
+    """
+    Whether a phase result reports success
+
+    Understands (success, results) tuples and dicts with a "success" or
+    "error" entry; anything else counts as successful.
+    """
+    if isinstance(result, (tuple, list)) and result and isinstance(result[0], bool):
+        return result[0]
+    if isinstance(result, dict):
+        if 'success' in result:
+            return bool(result['success'])
+        return 'error' not in result
+    return True
 
 
 class IdempotencyConfig:
     """Configuration for idempotency behavior"""
-    def __init__(self, enabled: bool = True, cache_dir: Path = None):
+    def __init__(self, enabled: bool = True, cache_dir: Path = None,
+                 max_entries: int = 256, max_bytes: int = 64 * 1024 * 1024):
         self.enabled = enabled
-        self.cache_dir = cache_dir or Path(".dmaic_cache")
+        # Relative paths are anchored to the workspace, not the current directory
+        cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.cache_dir = cache_dir if cache_dir.is_absolute() else PathConfig.workspace_root / cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        
-    def get_cache_file(self, phase_name: str, iteration: int) -> Path:
-        return self.cache_dir / f"{phase_name}_iter{iteration}.cache.json"
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
 
 
 class IdempotentPhaseWrapper:
     """
     Wrapper to make DMAIC phases idempotent with user control
+
+    Results are cached under a content-addressed key combining the phase's
+    code version, its config, its call arguments and a Merkle hash of the
+    input artifacts it reads. Inputs come from the decorator's ``inputs``
+    argument or, for phase methods, from the phase's ``input_artifacts()``.
+    
+    Each entry also records a Merkle hash of the phase's output artifacts
+    (``outputs`` / ``output_artifacts()``). A hit is only served while those
+    files are still on disk unchanged; otherwise the phase runs again, so a
+    deleted iteration directory or a fresh checkout never leaves later
+    phases without their inputs.
     
     Usage:
         wrapper = IdempotentPhaseWrapper(enabled=True)
-        @wrapper.idempotent(phase_name="phase1_define")
+        @wrapper.idempotent(phase_name="phase1_define", inputs=["docs"])
         def execute_phase1(iteration=1):
             # Phase logic here
             return results
     """
     
     def __init__(self, config: Optional[IdempotencyConfig] = None):
-        self.config = config or IdempotencyConfig()
-        
-    def _compute_input_hash(self, *args, **kwargs) -> str:
-        """Compute hash of input parameters"""
-        input_data = {
-            'args': str(args),
-            'kwargs': str(sorted(kwargs.items()))
-        }
-        data_str = json.dumps(input_data, sort_keys=True)
-        return hashlib.sha256(data_str.encode()).hexdigest()[:16]
-    
-    def _load_cache(self, cache_file: Path) -> Optional[Dict]:
-        """Load cached results"""
-        if not cache_file.exists():
-            return None
-        try:
-            with open(cache_file, 'r') as f:
-                return json.load(f)
-        except Exception:
-            return None
-    
-    def _save_cache(self, cache_file: Path, result: Any, input_hash: str):
-        """Save results to cache"""
-        cache_data = {
-            'timestamp': datetime.now().isoformat(),
-            'input_hash': input_hash,
-            'result': result if isinstance(result, dict) else {'status': 'completed'}
-        }
-        with open(cache_file, 'w') as f:
-            json.dump(cache_data, f, indent=2)
+        self.configure(config or IdempotencyConfig())
+
+    def configure(self, config: IdempotencyConfig):
+        """Apply a new configuration (also to methods decorated earlier)"""
+        self.config = config
+        self.cache = PhaseCache(config.cache_dir, config.max_entries, config.max_bytes)
+
+    @staticmethod
+    def _workspace_root(instance: Any) -> Optional[Path]:
+        """Workspace root of a phase instance, used to relativize paths"""
+        root = getattr(instance, 'workspace_root', None)
+        if root is None:
+            paths = getattr(getattr(instance, 'config', None), 'paths', None)
+            root = getattr(paths, 'workspace_root', None)
+        return Path(root) if root is not None else None
+
+    @staticmethod
+    def _resolve_artifacts(spec: Optional[InputSpec], provider_name: str, instance: Any,
+                           call_args: tuple, kwargs: Dict[str, Any]) -> Iterable[Union[str, Path]]:
+        """
+        Artifact paths for one call
+
+        A provider method (input_artifacts / output_artifacts) that takes
+        parameters receives the call's arguments, e.g. the iteration.
+        """
+        if spec is None:
+            provider = getattr(instance, provider_name, None)
+            if not callable(provider):
+                return []
+            if inspect.signature(provider).parameters:
+                return provider(*call_args, **kwargs)
+            return provider()
+        if callable(spec):
+            return spec(instance)
+        return spec
+
+    def _compute_key(self, phase_name: str, func: Callable, inputs: Iterable[Union[str, Path]],
+                     instance: Any, call: Dict[str, Any]) -> str:
+        """Content-addressed cache key for one call (``call``: bound arguments)"""
+        root = self._workspace_root(instance)
+        return PhaseCache.make_key(
+            phase_name,
+            code_version(func),
+            fingerprint(getattr(instance, 'config', None), root),
+            artifact_digest(inputs, root),
+            fingerprint(call, root)
+        )
     
-    def idempotent(self, phase_name: str):
+    def idempotent(self, phase_name: str, inputs: Optional[InputSpec] = None,
+                   outputs: Optional[InputSpec] = None):
         """
         Decorator to make phase execution idempotent
         
         Args:
             phase_name: Name of the phase (e.g., 'phase1_define')
+            inputs: Input artifacts (paths, or a callable taking the phase
+                instance); defaults to the instance's input_artifacts()
+            outputs: Output artifacts that must still exist unchanged for a
+                cache hit; defaults to the instance's output_artifacts()
         """
         def decorator(func: Callable):
+            signature = inspect.signature(func)
+            is_method = list(signature.parameters)[:1] == ['self']
+
             @functools.wraps(func)
             def wrapper(*args, **kwargs):
-                iteration = kwargs.get('iteration', 1)
+                # Positional and keyword calls get the same key
+                try:
+                    bound = signature.bind(*args, **kwargs)
+                    bound.apply_defaults()
+                    call = dict(bound.arguments)
+                except TypeError:
+                    call = {'args': args, 'kwargs': kwargs}
+                call.pop('self', None)
+                iteration = call.get('iteration', 1)
                 
                 if not self.config.enabled:
                     print(f"[IDEMPOTENCY] Disabled - executing {phase_name}")
                     return func(*args, **kwargs)
+
+                instance = args[0] if is_method and args else None
+                call_args = args[1:] if instance is not None else args
+                root = self._workspace_root(instance)
+                input_paths = self._resolve_artifacts(inputs, 'input_artifacts', instance,
+                                                      call_args, kwargs)
+                output_paths = list(self._resolve_artifacts(outputs, 'output_artifacts', instance,
+                                                            call_args, kwargs))
+                key = self._compute_key(phase_name, func, input_paths, instance, call)
                 
-                cache_file = self.config.get_cache_file(phase_name, iteration)
-                input_hash = self._compute_input_hash(*args, **kwargs)
-                
-                cached = self._load_cache(cache_file)
-                if cached and cached.get('input_hash') == input_hash:
+                hit, cached = self.cache.get(phase_name, key, artifact_digest(output_paths, root))
+                if hit:
                     print(f"[IDEMPOTENCY] [OK] Cache hit for {phase_name} iteration {iteration}")
                     print(f"[IDEMPOTENCY] Skipping execution - returning cached result")
-                    return cached.get('result')
+                    return cached
                 
                 print(f"[IDEMPOTENCY] Cache miss - executing {phase_name}")
                 result = func(*args, **kwargs)
                 
-                self._save_cache(cache_file, result, input_hash)
+                if not succeeded(result):
+                    # Failures may be transient; never replay them
+                    print(f"[IDEMPOTENCY] {phase_name} did not succeed - not cached")
+                elif not self.cache.put(phase_name, key, result, {'iteration': iteration},
+                                        outputs=artifact_digest(output_paths, root)):
+                    print(f"[IDEMPOTENCY] Result of {phase_name} is not JSON-serializable - not cached")
                 return result
                 
             return wrapper
@@ -113,9 +194,8 @@ def enable_idempotency(enabled: bool = True, cache_dir: Optional[Path] = None):
         enabled: True to enable, False to disable
         cache_dir: Custom cache directory (optional)
     """
-    global GLOBAL_IDEMPOTENCY
-    config = IdempotencyConfig(enabled=enabled, cache_dir=cache_dir)
-    GLOBAL_IDEMPOTENCY = IdempotentPhaseWrapper(config)
+    # Reconfigured in place: phases bound the decorator at import time
+    GLOBAL_IDEMPOTENCY.configure(IdempotencyConfig(enabled=enabled, cache_dir=cache_dir))
     print(f"[IDEMPOTENCY] {'Enabled' if enabled else 'Disabled'} globally")
 
 
@@ -127,18 +207,10 @@ def clear_cache(phase_name: Optional[str] = None, iteration: Optional[int] = Non
         phase_name: Specific phase to clear (or None for all)
         iteration: Specific iteration to clear (or None for all)
     """
-    cache_dir = GLOBAL_IDEMPOTENCY.config.cache_dir
-    
+    removed = GLOBAL_IDEMPOTENCY.cache.clear(phase_name, iteration)
     if phase_name and iteration:
-        cache_file = cache_dir / f"{phase_name}_iter{iteration}.cache.json"
-        if cache_file.exists():
-            cache_file.unlink()
-            print(f"[IDEMPOTENCY] Cleared cache for {phase_name} iteration {iteration}")
+        print(f"[IDEMPOTENCY] Cleared cache for {phase_name} iteration {iteration}")
     elif phase_name:
-        for cache_file in cache_dir.glob(f"{phase_name}_iter*.cache.json"):
-            cache_file.unlink()
         print(f"[IDEMPOTENCY] Cleared all caches for {phase_name}")
     else:
-        for cache_file in cache_dir.glob("*.cache.json"):
-            cache_file.unlink()
-        print(f"[IDEMPOTENCY] Cleared all caches")
+        print(f"[IDEMPOTENCY] Cleared all caches ({removed} entries)")
@@ -2,16 +2,106 @@
 DMAIC V3.1 - Link Tracker & Term Frequency Analyzer
 Tracks recursive documentation links, version history, and term frequency
 across markdown and Python files for uniform language validation.
+
+Terms are tokenized from the raw file bytes in chunks and interned into
+one vocabulary per graph; each file keeps only parallel arrays of term
+ids and counts.
+
+scan_project() walks the tree once (pruning output and cache folders),
+analyzes changed files on a process pool and caches each file's result
+by content, so re-scans only re-process changed documents and merge them
+into the existing graph.
 """
 
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Set, Tuple, Union
 from collections import Counter
+import heapq
+import io
+import os
 import re
 import json
 from datetime import datetime
 
+from .file_metrics_cache import FileMetricsCache
+from .workspace_walker import parallel_scan
+
+TOKEN_PATTERN = re.compile(rb'\b[a-z_][a-z0-9_]*\b')
+WORD_BYTES = frozenset(b'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_')
+TOKEN_CHUNK_SIZE = 1 << 20
+
+REPORT_FILENAME = "link_tracker_report.json"
+SCAN_SUFFIXES = {'.md': 'markdown', '.py': 'python', '.json': 'json'}
+CACHE_VERSION = "1"
+# Fewer changed files than this are analyzed in-process (pool startup costs more)
+PARALLEL_MIN_FILES = 64
+
+COMMON_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
+    'by', 'from', 'is', 'are', 'was', 'were', 'be', 'been', 'being'
+})
+
+
+def count_tokens(source: Union[bytes, BinaryIO], chunk_size: int = TOKEN_CHUNK_SIZE) -> Counter:
+    """
+    Count lowercase word tokens in raw bytes, chunk by chunk
+
+    A word split across chunks is carried over to the next chunk, so the
+    counts match tokenizing the whole input at once.
+
+    Args:
+        source: Bytes or a binary stream
+        chunk_size: Bytes read per chunk
+
+    Returns:
+        Counter of token bytes, in first-occurrence order
+    """
+    stream = io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+    counts: Counter = Counter()
+    carry = b''
+    for chunk in iter(lambda: stream.read(chunk_size), b''):
+        data = carry + chunk.lower()
+        cut = len(data)
+        while cut and data[cut - 1] in WORD_BYTES:
+            cut -= 1
+        counts.update(TOKEN_PATTERN.findall(data, 0, cut))
+        carry = data[cut:]
+    counts.update(TOKEN_PATTERN.findall(carry))
+    return counts
+
+
+def line_starts(content: str) -> List[int]:
+    """Offsets of every newline, for line_number()"""
+    return [match.start() for match in re.finditer('\n', content)]
+
+
+def line_number(newlines: List[int], offset: int) -> int:
+    """1-based line of a character offset, given line_starts()"""
+    return bisect_left(newlines, offset) + 1
+
+
+class TermVocabulary:
+    """Interned terms shared by all files of a graph"""
+
+    def __init__(self):
+        self.terms: List[str] = []
+        self.ids: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def intern(self, term: str) -> int:
+        """Id of a term, assigning the next id to new terms"""
+        term_id = self.ids.get(term)
+        if term_id is None:
+            term_id = self.ids[term] = len(self.terms)
+            self.terms.append(term)
+        return term_id
+
 
 @dataclass
 class DocumentLink:
@@ -27,15 +117,31 @@ class DocumentLink:
 
 @dataclass
 class TermFrequency:
-    """Term frequency analysis for a file"""
+    """Term frequency analysis for a file (sparse counts over a shared vocabulary)"""
     file_path: str
     file_type: str  # 'markdown', 'python', 'json'
     total_words: int
     unique_words: int
-    term_counts: Dict[str, int] = field(default_factory=dict)
-    top_terms: List[Tuple[str, int]] = field(default_factory=list)
+    term_ids: array = field(default_factory=lambda: array('I'))  # first-occurrence order
+    counts: array = field(default_factory=lambda: array('I'))
     technical_terms: Dict[str, int] = field(default_factory=dict)
     version: Optional[str] = None
+    vocabulary: Optional[TermVocabulary] = field(default=None, repr=False, compare=False)
+
+    @property
+    def term_counts(self) -> Dict[str, int]:
+        """Count per term"""
+        terms = self.vocabulary.terms
+        return {terms[term_id]: count for term_id, count in zip(self.term_ids, self.counts)}
+
+    @property
+    def top_terms(self) -> List[Tuple[str, int]]:
+        """50 most frequent terms, excluding common words and terms up to 2 characters"""
+        terms = self.vocabulary.terms
+        candidates = ((terms[term_id], count) for term_id, count in zip(self.term_ids, self.counts))
+        return heapq.nlargest(50, ((term, count) for term, count in candidates
+                                   if len(term) > 2 and term not in COMMON_WORDS),
+                              key=lambda item: item[1])
 
 
 @dataclass
@@ -56,6 +162,7 @@ class LinkGraph:
     links: List[DocumentLink] = field(default_factory=list)
     term_frequencies: Dict[str, TermFrequency] = field(default_factory=dict)
     version_lineage: List[str] = field(default_factory=list)
+    vocabulary: TermVocabulary = field(default_factory=TermVocabulary)
     
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization"""
@@ -116,183 +223,213 @@ class LinkTracker:
         'orchestrator', 'pipeline', 'validation', 'convergence'
     }
     
-    def __init__(self, root_dir: Path):
-        self.root_dir = root_dir
+    # Output, cache and environment folders never hold project documents
+    SKIP_DIRS = {
+        '.git', '__pycache__', 'node_modules', '.venv', 'venv', '.pytest_cache',
+        '.mypy_cache', '.ruff_cache', '.tox', 'dist', 'build', 'htmlcov',
+        'site-packages', '.dmaic', 'DMAIC_V3_OUTPUT'
+    }
+    
+    def __init__(self, root_dir: Path, cache_dir: Optional[Path] = None, use_cache: bool = True):
+        """
+        Initialize tracker
+        
+        Args:
+            root_dir: Project root
+            cache_dir: Per-file result cache location (default: root/.dmaic/link_tracker)
+            use_cache: Reuse results of unchanged files across runs
+        """
+        self.root_dir = Path(root_dir)
         self.graph = LinkGraph()
+        self.cache_dir = Path(cache_dir) if cache_dir else self.root_dir / ".dmaic" / "link_tracker"
+        self.cache = (FileMetricsCache(self.cache_dir / "file_results.json", version=CACHE_VERSION)
+                      if use_cache else None)
+        self.last_scan_stats: Dict[str, int] = {}
+        self._file_links: Dict[str, List[DocumentLink]] = {}
+        self._merged: Dict[str, Tuple[int, int]] = {}  # relative path -> (size, mtime_ns) in graph
     
-    def scan_project(self) -> LinkGraph:
-        """Scan entire project for links and term frequencies"""
-        # Scan markdown files
-        for md_file in self.root_dir.rglob("*.md"):
-            self._scan_markdown_file(md_file)
+    def _discover_files(self) -> Dict[str, Tuple[str, os.stat_result]]:
+        """One pruned walk: relative path -> (absolute path, stat) of scannable files"""
+        skip_paths = {os.path.abspath(self.cache_dir)}
+        files = {}
+        for listing, _ in parallel_scan(
+            self.root_dir,
+            skip_dir=lambda name, path: name in self.SKIP_DIRS or os.path.abspath(path) in skip_paths,
+            skip_file=lambda name: name == REPORT_FILENAME or os.path.splitext(name)[1] not in SCAN_SUFFIXES,
+            include_top=True
+        ):
+            for name, file_stat in listing.files:
+                path = os.path.join(listing.path, name)
+                files[os.path.relpath(path, self.root_dir)] = (path, file_stat)
+        return dict(sorted(files.items()))
+    
+    def scan_project(self, max_workers: Optional[int] = None) -> LinkGraph:
+        """
+        Scan entire project for links and term frequencies
+        
+        Files already in the graph with the same size and mtime are kept;
+        other files come from the result cache when their content is
+        unchanged, and the rest are analyzed (on a process pool when there
+        are many).
+        
+        Args:
+            max_workers: Worker processes (default: CPU count)
+        
+        Returns:
+            The updated link graph
+        """
+        files = self._discover_files()
+        stats = {'files': len(files), 'unchanged': 0, 'cached': 0, 'analyzed': 0, 'removed': 0}
+        
+        to_analyze = []
+        for relative_path, (path, file_stat) in files.items():
+            signature = (file_stat.st_size, file_stat.st_mtime_ns)
+            if self._merged.get(relative_path) == signature:
+                stats['unchanged'] += 1
+                continue
+            cached = self.cache.lookup(path) if self.cache else None
+            if cached is not None:
+                self._merge_result(relative_path, cached)
+                self._merged[relative_path] = signature
+                stats['cached'] += 1
+            else:
+                to_analyze.append((relative_path, path, signature))
         
-        # Scan Python files
-        for py_file in self.root_dir.rglob("*.py"):
-            self._scan_python_file(py_file)
+        for (relative_path, path, signature), result in zip(to_analyze, self._analyze_all(to_analyze, max_workers)):
+            stats['analyzed'] += 1
+            self._merge_result(relative_path, result)
+            if 'error' in result:
+                # Not cached or marked merged, so the next scan retries the file
+                print(f"Error scanning {path}: {result['error']}")
+                self._merged.pop(relative_path, None)
+                continue
+            if self.cache:
+                self.cache.store(path, result)
+            self._merged[relative_path] = signature
         
-        # Scan JSON files
-        for json_file in self.root_dir.rglob("*.json"):
-            self._scan_json_file(json_file)
+        for relative_path in [p for p in self._merged if p not in files]:
+            self._merge_result(relative_path, None)
+            del self._merged[relative_path]
+            stats['removed'] += 1
+        
+        if self.cache:
+            pruned = self.cache.prune(path for path, _ in files.values())
+            if stats['analyzed'] or pruned:
+                self.cache.save()
+        
+        self.graph.links = [link for relative_path in sorted(self._file_links)
+                            for link in self._file_links[relative_path]]
         
         # Build version lineage
         self._build_version_lineage()
         
+        self.last_scan_stats = stats
         return self.graph
     
-    def _scan_markdown_file(self, file_path: Path):
-        """Scan markdown file for links and terms"""
-        try:
-            content = file_path.read_text(encoding='utf-8')
-            relative_path = str(file_path.relative_to(self.root_dir))
-            
-            # Extract version
-            version = self._extract_version(content)
-            
-            # Find all links
-            for match in re.finditer(self.MARKDOWN_LINK_PATTERN, content, re.IGNORECASE):
-                link_text = match.group(1)
-                link_target = match.group(2)
-                line_number = content[:match.start()].count('\n') + 1
-                
-                # Determine link type
-                link_type = self._classify_link(link_text, link_target, content[max(0, match.start()-100):match.end()+100])
-                
-                link = DocumentLink(
-                    source_file=relative_path,
-                    target_file=link_target,
-                    link_type=link_type,
-                    line_number=line_number,
-                    context=link_text,
-                    version_source=version
-                )
-                self.graph.links.append(link)
-            
-            # Analyze term frequency
-            term_freq = self._analyze_term_frequency(content, relative_path, 'markdown', version)
-            self.graph.term_frequencies[relative_path] = term_freq
-            
-        except Exception as e:
-            print(f"Error scanning {file_path}: {e}")
+    def _analyze_all(self, to_analyze: List[Tuple[str, str, Tuple[int, int]]],
+                     max_workers: Optional[int]) -> Iterable[Dict[str, Any]]:
+        """Analyze files in order, fanning out to processes for large batches"""
+        workers = max_workers or os.cpu_count() or 1
+        if len(to_analyze) < PARALLEL_MIN_FILES or workers == 1:
+            return [analyze_file(path) for _, path, _ in to_analyze]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                analyze_file,
+                [path for _, path, _ in to_analyze],
+                chunksize=max(1, len(to_analyze) // (workers * 4))
+            ))
     
-    def _scan_python_file(self, file_path: Path):
-        """Scan Python file for docstring links and terms"""
-        try:
-            content = file_path.read_text(encoding='utf-8')
-            relative_path = str(file_path.relative_to(self.root_dir))
-            
-            # Extract version from module docstring
-            version = self._extract_version(content)
-            
-            # Analyze term frequency
-            term_freq = self._analyze_term_frequency(content, relative_path, 'python', version)
-            self.graph.term_frequencies[relative_path] = term_freq
-            
-        except Exception as e:
-            print(f"Error scanning {file_path}: {e}")
-    
-    def _scan_json_file(self, file_path: Path):
-        """Scan JSON file for metadata and links"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            relative_path = str(file_path.relative_to(self.root_dir))
-            
-            # Convert JSON to text for term analysis
-            content = json.dumps(data, indent=2)
-            
-            # Extract version if present
-            version = data.get('version') or data.get('metadata', {}).get('version')
-            
-            # Analyze term frequency
-            term_freq = self._analyze_term_frequency(content, relative_path, 'json', version)
-            self.graph.term_frequencies[relative_path] = term_freq
-            
-        except Exception as e:
-            print(f"Error scanning {file_path}: {e}")
+    def _merge_result(self, relative_path: str, result: Optional[Dict[str, Any]]):
+        """Replace a file's links and term frequency in the graph (None or an error removes them)"""
+        self._file_links.pop(relative_path, None)
+        self.graph.term_frequencies.pop(relative_path, None)
+        if result is None or 'error' in result:
+            return
+        
+        self._file_links[relative_path] = [
+            DocumentLink(
+                source_file=relative_path,
+                target_file=target,
+                link_type=link_type,
+                line_number=line,
+                context=context,
+                version_source=result['version']
+            )
+            for target, link_type, line, context in result['links']
+        ]
+        self.graph.term_frequencies[relative_path] = self._term_frequency(
+            relative_path, result['file_type'], result['version'], result['terms'], result['counts'])
     
-    def _extract_version(self, content: str) -> Optional[str]:
+    @classmethod
+    def _extract_version(cls, content: str) -> Optional[str]:
         """Extract version number from content"""
         match = re.search(r'[Vv]ersion[:\s]+(\d+\.\d+(?:\.\d+)?)', content)
         if match:
             return match.group(1)
         return None
     
-    def _classify_link(self, link_text: str, link_target: str, context: str) -> str:
+    @classmethod
+    def _classify_link(cls, link_text: str, link_target: str, context: str) -> str:
         """Classify the type of link"""
         context_lower = context.lower()
         
-        if re.search(self.RECURSIVE_HOOK_PATTERN, context_lower, re.IGNORECASE):
+        if re.search(cls.RECURSIVE_HOOK_PATTERN, context_lower, re.IGNORECASE):
             return 'recursive_hook'
-        elif 'version' in context_lower or re.search(self.VERSION_PATTERN, context_lower):
+        elif 'version' in context_lower or re.search(cls.VERSION_PATTERN, context_lower):
             return 'version_link'
         elif link_target.endswith('.py'):
             return 'code_link'
         else:
             return 'cross_reference'
     
-    def _analyze_term_frequency(self, content: str, file_path: str, file_type: str, version: Optional[str]) -> TermFrequency:
-        """Analyze term frequency in content"""
-        # Tokenize (simple word splitting)
-        words = re.findall(r'\b[a-z_][a-z0-9_]*\b', content.lower())
-        
-        # Count terms
-        term_counts = Counter(words)
-        
-        # Filter technical terms
+    def _term_frequency(self, file_path: str, file_type: str, version: Optional[str],
+                        terms: List[str], counts: List[int]) -> TermFrequency:
+        """Intern a file's term counts into the graph vocabulary"""
+        vocabulary = self.graph.vocabulary
+        term_ids = array('I', [vocabulary.intern(term) for term in terms])
         technical_terms = {
-            term: count 
-            for term, count in term_counts.items() 
+            vocabulary.terms[term_id]: count
+            for term_id, term, count in zip(term_ids, terms, counts)
             if term in self.TECHNICAL_TERMS
         }
         
-        # Get top terms (excluding common words)
-        common_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'from', 'is', 'are', 'was', 'were', 'be', 'been', 'being'}
-        filtered_counts = {term: count for term, count in term_counts.items() if term not in common_words and len(term) > 2}
-        top_terms = sorted(filtered_counts.items(), key=lambda x: x[1], reverse=True)[:50]
-        
         return TermFrequency(
             file_path=file_path,
             file_type=file_type,
-            total_words=len(words),
-            unique_words=len(term_counts),
-            term_counts=dict(term_counts),
-            top_terms=top_terms,
+            total_words=sum(counts),
+            unique_words=len(counts),
+            term_ids=term_ids,
+            counts=array('I', counts),
             technical_terms=technical_terms,
-            version=version
+            version=version,
+            vocabulary=vocabulary
         )
     
     def _build_version_lineage(self):
         """Build version lineage from detected versions"""
-        # Extract all versions
-        versions = set()
+        # Group files by version
+        files_by_version: Dict[str, List[str]] = {}
         for tf in self.graph.term_frequencies.values():
             if tf.version:
-                versions.add(tf.version)
+                files_by_version.setdefault(tf.version, []).append(tf.file_path)
         
-        # Sort versions
-        def version_key(v: str) -> Tuple[int, ...]:
-            return tuple(map(int, v.split('.')))
+        # Sort versions numerically (non-numeric parts such as a "v" prefix are ignored)
+        def version_key(v: str) -> Tuple[Tuple[int, ...], str]:
+            return tuple(int(part) for part in re.findall(r'\d+', v)), v
         
-        sorted_versions = sorted(versions, key=version_key)
+        sorted_versions = sorted(files_by_version, key=version_key)
         self.graph.version_lineage = sorted_versions
         
         # Build version nodes
+        self.graph.nodes = {}
         for i, version in enumerate(sorted_versions):
             parent = sorted_versions[i-1] if i > 0 else None
             children = [sorted_versions[i+1]] if i < len(sorted_versions) - 1 else []
             
-            # Find files for this version
-            files = [
-                tf.file_path 
-                for tf in self.graph.term_frequencies.values() 
-                if tf.version == version
-            ]
-            
             node = VersionNode(
                 version=version,
                 date=datetime.now(),  # Would need to extract from git history
-                files=files,
+                files=files_by_version[version],
                 parent_version=parent,
                 child_versions=children
             )
@@ -359,6 +496,51 @@ def validate_uniform_language(self) -> Dict[str, List[str]]:
         return issues
 
 
+def analyze_file(path: str) -> Dict[str, Any]:
+    """
+    Links, version and term counts of one file (runs in worker processes)
+    
+    Args:
+        path: File to read (.md, .py or .json)
+    
+    Returns:
+        JSON-serializable result, or {'error': message}
+    """
+    try:
+        raw = Path(path).read_bytes()
+        file_type = SCAN_SUFFIXES[os.path.splitext(path)[1]]
+        links = []
+        if file_type == 'json':
+            data = json.loads(raw)
+            version = None
+            if isinstance(data, dict):
+                metadata = data.get('metadata')
+                version = data.get('version') or (metadata.get('version') if isinstance(metadata, dict) else None)
+            version = str(version) if isinstance(version, (str, int, float)) else None
+        else:
+            content = raw.decode('utf-8')
+            version = LinkTracker._extract_version(content)
+            if file_type == 'markdown':
+                newlines = line_starts(content)
+                for match in re.finditer(LinkTracker.MARKDOWN_LINK_PATTERN, content, re.IGNORECASE):
+                    link_text = match.group(1)
+                    link_target = match.group(2)
+                    link_type = LinkTracker._classify_link(
+                        link_text, link_target, content[max(0, match.start()-100):match.end()+100])
+                    links.append((link_target, link_type, line_number(newlines, match.start()), link_text))
+        
+        token_counts = count_tokens(raw)
+        return {
+            'file_type': file_type,
+            'version': version,
+            'links': links,
+            'terms': [token.decode('ascii') for token in token_counts],
+            'counts': list(token_counts.values()),
+        }
+    except Exception as e:
+        return {'error': str(e)}
+
+
 def main():
     """Main entry point for link tracking"""
     import sys
@@ -378,7 +560,7 @@ def main():
     print(f"Detected versions: {', '.join(graph.version_lineage)}")
     
     # Generate report
-    output_path = root_dir / "link_tracker_report.json"
+    output_path = root_dir / REPORT_FILENAME
     tracker.generate_link_report(output_path)
     print(f"Report saved to: {output_path}")
     
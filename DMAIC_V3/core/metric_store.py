@@ -0,0 +1,451 @@
+"""
+DMAIC V3.3 - Columnar Metric Store
+Version: 3.3.0
+
+Array-backed time series of metric values, one set of columns per metric
+name (iteration, phase, timestamp, value). Aggregations run over the
+value column instead of walking PhaseMetrics objects: count/min/max/
+mean/sum/std, percentiles (p50/p95/p99 by default) and per-iteration
+series with rolling windows.
+
+NumPy is used for the aggregations when installed; the pure Python path
+gives the same results (percentiles use linear interpolation, like
+numpy.percentile's default).
+
+History is persisted as append-only segment files: each save writes only
+the rows added since the previous save, and loading concatenates the raw
+column buffers, so years of iterations load in one read per segment.
+Loaded rows go ahead of rows not saved yet, and a store skips segments it
+already holds. compact() merges the segments into one.
+"""
+
+import json
+import math
+import struct
+import sys
+from array import array
+from collections import deque
+from itertools import accumulate
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+SEGMENT_MAGIC = b"DMCS"
+SEGMENT_VERSION = 1
+SEGMENT_PATTERN = "segment_*.dmcs"
+
+# Column name -> array typecode; stored little-endian in segment files
+COLUMN_TYPES = {'iteration': 'q', 'phase': 'q', 'timestamp': 'd', 'value': 'd'}
+
+DEFAULT_PERCENTILES = (50, 95, 99)
+GROUP_STATS = ('mean', 'sum', 'min', 'max', 'count')
+ROLLING_STATS = ('mean', 'sum', 'min', 'max')
+
+
+class MetricColumns:
+    """Columns of one metric, one row per recorded value"""
+
+    def __init__(self):
+        self.columns: Dict[str, array] = {name: array(code) for name, code in COLUMN_TYPES.items()}
+        self.saved = 0  # rows already written to a segment
+
+    def __len__(self) -> int:
+        return len(self.columns['value'])
+
+    def append(self, iteration: int, phase: int, timestamp: float, value: float):
+        self.columns['iteration'].append(iteration)
+        self.columns['phase'].append(phase)
+        self.columns['timestamp'].append(timestamp)
+        self.columns['value'].append(value)
+
+
+def _percentile(ordered: Sequence[float], q: float) -> float:
+    """Percentile of sorted values with linear interpolation"""
+    position = (len(ordered) - 1) * q / 100.0
+    low = math.floor(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def _little_endian(column: array) -> array:
+    """Column with its bytes in little-endian order"""
+    if sys.byteorder == 'little':
+        return column
+    swapped = array(column.typecode, column)
+    swapped.byteswap()
+    return swapped
+
+
+class MetricColumnStore:
+    """
+    Columnar store of metric values across phases and iterations
+
+    Usage:
+        store = MetricColumnStore()
+        store.append_phase_metrics(phase_metrics)
+        stats = store.statistics("phase2_duration")        # incl. p50/p95/p99
+        trend = store.rolling("phase2_duration", window=5)
+        store.save_segment(history_dir)
+        store = MetricColumnStore.load(history_dir)
+    """
+
+    def __init__(self):
+        self.metrics: Dict[str, MetricColumns] = {}
+        self.phases: List[str] = []
+        self._phase_ids: Dict[str, int] = {}
+        # Segment files whose rows are in this store (saved or loaded)
+        self.segments: Set[Path] = set()
+
+    def _phase_id(self, phase_name: str) -> int:
+        phase_id = self._phase_ids.get(phase_name)
+        if phase_id is None:
+            phase_id = self._phase_ids[phase_name] = len(self.phases)
+            self.phases.append(phase_name)
+        return phase_id
+
+    def append(self, name: str, value: float, iteration: int, phase_name: str = "",
+               timestamp: float = 0.0):
+        """
+        Record one metric value
+
+        Args:
+            name: Metric name
+            value: Metric value
+            iteration: Pipeline iteration
+            phase_name: Phase that recorded the value
+            timestamp: Epoch seconds
+        """
+        columns = self.metrics.get(name)
+        if columns is None:
+            columns = self.metrics[name] = MetricColumns()
+        columns.append(iteration, self._phase_id(phase_name), timestamp, float(value))
+
+    def append_phase_metrics(self, phase_metrics) -> int:
+        """
+        Record every metric of a PhaseMetrics
+
+        Returns:
+            Number of values recorded
+        """
+        for metric in phase_metrics.metrics:
+            self.append(metric.name, metric.value, phase_metrics.iteration,
+                        phase_metrics.phase_name, metric.timestamp.timestamp())
+        return len(phase_metrics.metrics)
+
+    def names(self) -> List[str]:
+        """Metric names in first-recorded order"""
+        return list(self.metrics)
+
+    def count(self, name: Optional[str] = None) -> int:
+        """Rows for one metric, or for all metrics"""
+        if name is not None:
+            return len(self.metrics[name]) if name in self.metrics else 0
+        return sum(len(columns) for columns in self.metrics.values())
+
+    def _selected(self, name: str, phase_name: Optional[str]) -> Tuple[Sequence[float], Sequence[int]]:
+        """(values, iterations) of a metric, optionally for one phase"""
+        columns = self.metrics.get(name)
+        if columns is None or (phase_name is not None and phase_name not in self._phase_ids):
+            return [], []
+        values, iterations = columns.columns['value'], columns.columns['iteration']
+        if NUMPY_AVAILABLE:
+            values = np.frombuffer(values, dtype=np.float64)
+            iterations = np.frombuffer(iterations, dtype=np.int64)
+            if phase_name is not None:
+                mask = np.frombuffer(columns.columns['phase'], dtype=np.int64) == self._phase_ids[phase_name]
+                values, iterations = values[mask], iterations[mask]
+            return values, iterations
+        if phase_name is not None:
+            phase_id = self._phase_ids[phase_name]
+            rows = [i for i, p in enumerate(columns.columns['phase']) if p == phase_id]
+            return [values[i] for i in rows], [iterations[i] for i in rows]
+        return values, iterations
+
+    def values(self, name: str, phase_name: Optional[str] = None) -> List[float]:
+        """Recorded values of a metric in recording order"""
+        values, _ = self._selected(name, phase_name)
+        return values if isinstance(values, list) else values.tolist()
+
+    def percentiles(self, name: str, percentiles: Iterable[float] = DEFAULT_PERCENTILES,
+                    phase_name: Optional[str] = None) -> Dict[str, float]:
+        """
+        Percentiles of a metric
+
+        Args:
+            name: Metric name
+            percentiles: Percentiles in [0, 100]
+            phase_name: Only values recorded by this phase
+
+        Returns:
+            {"p50": ..., "p95": ...}; empty if there are no values
+        """
+        percentiles = list(percentiles)
+        values, _ = self._selected(name, phase_name)
+        if not len(values):
+            return {}
+        if NUMPY_AVAILABLE:
+            results = np.percentile(values, percentiles).tolist()
+        else:
+            ordered = sorted(values)
+            results = [_percentile(ordered, q) for q in percentiles]
+        return {f"p{q:g}": result for q, result in zip(percentiles, results)}
+
+    def statistics(self, name: str, phase_name: Optional[str] = None,
+                   percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[str, float]:
+        """
+        Summary statistics of a metric
+
+        Returns:
+            count, min, max, mean, sum, std (population) and percentiles;
+            empty if there are no values
+        """
+        values, _ = self._selected(name, phase_name)
+        count = len(values)
+        if not count:
+            return {}
+        if NUMPY_AVAILABLE:
+            stats = {
+                "count": count,
+                "min": float(values.min()),
+                "max": float(values.max()),
+                "mean": float(values.mean()),
+                "sum": float(values.sum()),
+                "std": float(values.std()),
+            }
+        else:
+            total = math.fsum(values)
+            mean = total / count
+            stats = {
+                "count": count,
+                "min": min(values),
+                "max": max(values),
+                "mean": mean,
+                "sum": total,
+                "std": math.sqrt(math.fsum((v - mean) ** 2 for v in values) / count),
+            }
+        stats.update(self.percentiles(name, percentiles, phase_name))
+        return stats
+
+    def per_iteration(self, name: str, stat: str = 'mean',
+                      phase_name: Optional[str] = None) -> List[Tuple[int, float]]:
+        """
+        One aggregate value per iteration
+
+        Args:
+            name: Metric name
+            stat: 'mean', 'sum', 'min', 'max' or 'count'
+            phase_name: Only values recorded by this phase
+
+        Returns:
+            [(iteration, value)] sorted by iteration
+        """
+        if stat not in GROUP_STATS:
+            raise ValueError(f"Unknown stat: {stat}")
+        values, iterations = self._selected(name, phase_name)
+        if not len(values):
+            return []
+
+        if NUMPY_AVAILABLE:
+            keys, groups = np.unique(iterations, return_inverse=True)
+            if stat in ('mean', 'sum', 'count'):
+                counts = np.bincount(groups)
+                sums = np.bincount(groups, weights=values)
+                result = {'mean': sums / counts, 'sum': sums, 'count': counts}[stat]
+            else:
+                order = np.argsort(groups, kind='stable')
+                starts = np.searchsorted(groups[order], np.arange(len(keys)))
+                reduce = np.minimum if stat == 'min' else np.maximum
+                result = reduce.reduceat(values[order], starts)
+            return list(zip(keys.tolist(), np.asarray(result, dtype=float).tolist()))
+
+        grouped: Dict[int, List[float]] = {}
+        for iteration, value in zip(iterations, values):
+            grouped.setdefault(iteration, []).append(value)
+        reducers = {
+            'mean': lambda vs: math.fsum(vs) / len(vs),
+            'sum': math.fsum,
+            'min': min,
+            'max': max,
+            'count': lambda vs: float(len(vs)),
+        }
+        return [(iteration, reducers[stat](grouped[iteration])) for iteration in sorted(grouped)]
+
+    def rolling(self, name: str, window: int, stat: str = 'mean', per_iteration: str = 'mean',
+                phase_name: Optional[str] = None) -> List[Tuple[int, float]]:
+        """
+        Rolling window over the per-iteration series of a metric
+
+        The first window - 1 iterations use the iterations available so far.
+
+        Args:
+            name: Metric name
+            window: Iterations per window
+            stat: Window aggregate: 'mean', 'sum', 'min' or 'max'
+            per_iteration: How values within one iteration are combined
+            phase_name: Only values recorded by this phase
+
+        Returns:
+            [(iteration, windowed value)] sorted by iteration
+        """
+        if window < 1:
+            raise ValueError("window must be >= 1")
+        if stat not in ROLLING_STATS:
+            raise ValueError(f"Unknown stat: {stat}")
+        series = self.per_iteration(name, per_iteration, phase_name)
+        keys = [iteration for iteration, _ in series]
+        values = [value for _, value in series]
+
+        if stat in ('mean', 'sum'):
+            totals = [0.0, *accumulate(values)]
+            result = []
+            for end in range(1, len(values) + 1):
+                start = max(0, end - window)
+                total = totals[end] - totals[start]
+                result.append(total / (end - start) if stat == 'mean' else total)
+            return list(zip(keys, result))
+
+        # Monotonic deque of candidate positions: O(n) sliding min/max
+        better = (lambda a, b: a <= b) if stat == 'min' else (lambda a, b: a >= b)
+        candidates: deque = deque()
+        result = []
+        for position, value in enumerate(values):
+            while candidates and better(value, values[candidates[-1]]):
+                candidates.pop()
+            candidates.append(position)
+            if candidates[0] <= position - window:
+                candidates.popleft()
+            result.append(values[candidates[0]])
+        return list(zip(keys, result))
+
+    def save_segment(self, directory: Path) -> Optional[Path]:
+        """
+        Write the rows added since the last save as a new segment
+
+        Args:
+            directory: History directory
+
+        Returns:
+            Segment path, or None if there was nothing new
+        """
+        pending = {name: columns for name, columns in self.metrics.items() if len(columns) > columns.saved}
+        if not pending:
+            return None
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        existing = sorted(directory.glob(SEGMENT_PATTERN))
+        number = int(existing[-1].stem.split('_')[1]) + 1 if existing else 1
+        path = directory / f"segment_{number:06d}.dmcs"
+
+        header = {'phases': self.phases, 'metrics': {}}
+        chunks = []
+        for name, columns in pending.items():
+            header['metrics'][name] = len(columns) - columns.saved
+            for column in COLUMN_TYPES:
+                chunks.append(_little_endian(columns.columns[column][columns.saved:]).tobytes())
+        header_bytes = json.dumps(header).encode('utf-8')
+
+        temp_path = path.with_suffix('.tmp')
+        with open(temp_path, 'wb') as f:
+            f.write(SEGMENT_MAGIC + struct.pack('<BI', SEGMENT_VERSION, len(header_bytes)))
+            f.write(header_bytes)
+            for chunk in chunks:
+                f.write(chunk)
+        temp_path.replace(path)
+
+        for columns in pending.values():
+            columns.saved = len(columns)
+        self.segments.add(path.resolve())
+        return path
+
+    def load_segment(self, path: Path) -> bool:
+        """
+        Add the rows of one segment file
+
+        The rows are inserted after the saved rows and before any rows not
+        saved yet, which stay pending for the next save_segment().
+
+        Returns:
+            False if the store already holds the segment
+
+        Raises:
+            ValueError: If the file is not a segment
+        """
+        resolved = Path(path).resolve()
+        if resolved in self.segments:
+            return False
+        data = Path(path).read_bytes()
+        prefix = len(SEGMENT_MAGIC) + struct.calcsize('<BI')
+        if data[:len(SEGMENT_MAGIC)] != SEGMENT_MAGIC:
+            raise ValueError(f"Not a metric segment: {path}")
+        version, header_len = struct.unpack('<BI', data[len(SEGMENT_MAGIC):prefix])
+        if version != SEGMENT_VERSION:
+            raise ValueError(f"Unsupported segment version {version}: {path}")
+        header = json.loads(data[prefix:prefix + header_len].decode('utf-8'))
+
+        # Segment phase ids refer to the segment's own phase list
+        phase_map = [self._phase_id(phase) for phase in header['phases']]
+        identity = phase_map == list(range(len(phase_map)))
+
+        offset = prefix + header_len
+        for name, rows in header['metrics'].items():
+            columns = self.metrics.get(name)
+            if columns is None:
+                columns = self.metrics[name] = MetricColumns()
+            for column, code in COLUMN_TYPES.items():
+                chunk = array(code)
+                size = rows * chunk.itemsize
+                chunk.frombytes(data[offset:offset + size])
+                offset += size
+                if sys.byteorder != 'little':
+                    chunk.byteswap()
+                if column == 'phase' and not identity:
+                    chunk = array(code, (phase_map[p] for p in chunk))
+                if columns.saved == len(columns):
+                    columns.columns[column].extend(chunk)
+                else:
+                    columns.columns[column][columns.saved:columns.saved] = chunk
+            columns.saved += rows
+        self.segments.add(resolved)
+        return True
+
+    def load_directory(self, directory: Path) -> int:
+        """
+        Add every segment of a history directory not already in the store
+
+        Returns:
+            Number of segments loaded
+        """
+        return sum(self.load_segment(path) for path in sorted(Path(directory).glob(SEGMENT_PATTERN)))
+
+    @classmethod
+    def load(cls, directory: Path) -> 'MetricColumnStore':
+        """Store holding every segment in a history directory"""
+        store = cls()
+        store.load_directory(directory)
+        return store
+
+    def compact(self, directory: Path) -> Optional[Path]:
+        """
+        Replace all segments in a directory with a single one
+
+        Call on a store loaded from (or saved to) that directory; the
+        store's full contents become the only segment.
+
+        Returns:
+            The new segment path
+        """
+        directory = Path(directory)
+        old_segments = sorted(directory.glob(SEGMENT_PATTERN))
+        for columns in self.metrics.values():
+            columns.saved = 0
+        path = self.save_segment(directory)
+        for old in old_segments:
+            if old != path:
+                old.unlink()
+                self.segments.discard(old.resolve())
+        return path
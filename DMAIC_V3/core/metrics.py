@@ -1,15 +1,19 @@
 """
 DMAIC V3.0 - Metrics Tracking and Aggregation
 Comprehensive metrics collection, aggregation, and export functionality
+
+Metric values are also kept in a columnar MetricColumnStore, so per-metric
+statistics, percentiles and rolling trends do not walk PhaseMetrics objects.
 """
 
 import json
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 from collections import defaultdict
 from dataclasses import asdict
 
+from .metric_store import DEFAULT_PERCENTILES, MetricColumnStore
 from .models import Metric, PhaseMetrics, MetricType, PhaseStatus
 
 
@@ -117,11 +121,13 @@ class MetricsAggregator:
     def __init__(self):
         self.phase_metrics: Dict[str, List[PhaseMetrics]] = defaultdict(list)
         self.iteration_metrics: Dict[int, List[PhaseMetrics]] = defaultdict(list)
+        self.store = MetricColumnStore()
     
     def add_phase_metrics(self, metrics: PhaseMetrics):
         """Add metrics from a phase execution"""
         self.phase_metrics[metrics.phase_name].append(metrics)
         self.iteration_metrics[metrics.iteration].append(metrics)
+        self.store.append_phase_metrics(metrics)
     
     def get_phase_history(self, phase_name: str) -> List[PhaseMetrics]:
         """Get all metrics for a specific phase"""
@@ -145,26 +151,37 @@ def calculate_iteration_total_duration(self, iteration: int) -> float:
         metrics = self.get_iteration_metrics(iteration)
         return sum(pm.duration_seconds for pm in metrics)
     
-    def get_metric_statistics(self, metric_name: str) -> Dict[str, float]:
-        """Calculate statistics for a specific metric across all phases"""
-        values = []
-        
-        for phase_list in self.phase_metrics.values():
-            for phase_metrics in phase_list:
-                for metric in phase_metrics.metrics:
-                    if metric.name == metric_name:
-                        values.append(metric.value)
+    def get_metric_statistics(self, metric_name: str, phase_name: Optional[str] = None) -> Dict[str, float]:
+        """Calculate statistics (incl. std, p50/p95/p99) for a metric across all phases"""
+        return self.store.statistics(metric_name, phase_name)
+    
+    def get_metric_percentiles(self, metric_name: str, percentiles=DEFAULT_PERCENTILES,
+                               phase_name: Optional[str] = None) -> Dict[str, float]:
+        """Percentiles of a metric, keyed "p50", "p95", ..."""
+        return self.store.percentiles(metric_name, percentiles, phase_name)
+    
+    def get_metric_trend(self, metric_name: str, window: int = 5, stat: str = 'mean',
+                         phase_name: Optional[str] = None) -> List[Tuple[int, float]]:
+        """Rolling window over the per-iteration mean of a metric"""
+        return self.store.rolling(metric_name, window, stat, phase_name=phase_name)
+    
+    def save_history(self, history_dir: Path) -> Optional[Path]:
+        """Append metric values recorded since the last save as a history segment"""
+        return self.store.save_segment(history_dir)
+    
+    def load_history(self, history_dir: Path) -> int:
+        """
+        Load metric history segments into the columnar store
         
-        if not values:
-            return {}
+        Metrics recorded in this process are kept (and still saved by the
+        next save_history); segments the store already holds are skipped.
+        Only the metric queries see loaded history; phase and iteration
+        summaries cover PhaseMetrics added in this process.
         
-        return {
-            "count": len(values),
-            "min": min(values),
-            "max": max(values),
-            "mean": sum(values) / len(values),
-            "sum": sum(values)
-        }
+        Returns:
+            Number of segments loaded
+        """
+        return self.store.load_directory(history_dir)
     
     def get_phase_success_rate(self, phase_name: str) -> float:
         """Calculate success rate for a phase"""
@@ -0,0 +1,382 @@
+"""
+DMAIC V3.3 - Content-Addressed Phase Cache
+Version: 3.3.0
+
+Caches phase results under a key derived from what actually determines
+them:
+- the phase's code version (hash of its source module)
+- its configuration and call arguments (address-free fingerprint)
+- a Merkle root over the input artifacts the phase reads
+
+Paths inside fingerprints and Merkle leaves are made relative to the
+workspace root, so keys are stable across runs and machines. An entry
+can record a digest of the phase's output artifacts; it is only served
+while the outputs on disk still match. Entries are evicted
+least-recently-used once the entry count or total size exceeds its
+bound.
+"""
+
+import dataclasses
+import hashlib
+import inspect
+import json
+import os
+import time
+from collections import OrderedDict
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .utils import compute_file_hash
+
+# Directories never descended into when an input artifact is a directory
+MERKLE_SKIP_DIRS = {'__pycache__', '.git', 'node_modules', '.pytest_cache', '.mypy_cache'}
+
+
+def merkle_root(leaves: List[str]) -> str:
+    """
+    Merkle root over hex leaf digests (order-sensitive)
+
+    Args:
+        leaves: Leaf digests
+
+    Returns:
+        Root digest (hash of the empty string for no leaves)
+    """
+    level = [bytes.fromhex(leaf) for leaf in leaves]
+    if not level:
+        return hashlib.sha256(b"").hexdigest()
+    while len(level) > 1:
+        if len(level) % 2:
+            level.append(level[-1])
+        level = [hashlib.sha256(level[i] + level[i + 1]).digest()
+                 for i in range(0, len(level), 2)]
+    return level[0].hex()
+
+
+def _relative(path: Union[str, Path], root: Optional[Path]) -> str:
+    """Path relative to root when inside it, with forward slashes"""
+    path = Path(path)
+    if root is not None:
+        try:
+            path = path.resolve().relative_to(root.resolve())
+        except ValueError:
+            pass
+    return path.as_posix()
+
+
+def artifact_digest(paths: Iterable[Union[str, Path]], root: Optional[Path] = None) -> str:
+    """
+    Merkle root over the contents of input artifacts
+
+    Directories are expanded recursively; each file contributes a leaf of
+    (relative path, content hash), and missing paths contribute a marker
+    leaf so their appearance changes the digest.
+
+    Args:
+        paths: Files or directories the phase reads
+        root: Workspace root used to relativize paths
+
+    Returns:
+        Hex digest
+    """
+    entries: Dict[str, str] = {}
+    for path in paths:
+        path = Path(path)
+        if path.is_file():
+            entries[_relative(path, root)] = compute_file_hash(path)
+        elif path.is_dir():
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames[:] = sorted(d for d in dirnames if d not in MERKLE_SKIP_DIRS)
+                for name in filenames:
+                    file_path = Path(dirpath) / name
+                    try:
+                        entries[_relative(file_path, root)] = compute_file_hash(file_path)
+                    except OSError:
+                        continue
+        else:
+            entries[_relative(path, root)] = "missing"
+
+    leaves = [
+        hashlib.sha256(f"{rel}\0{digest}".encode('utf-8')).hexdigest()
+        for rel, digest in sorted(entries.items())
+    ]
+    return merkle_root(leaves)
+
+
+def fingerprint(obj: Any, root: Optional[Path] = None) -> str:
+    """
+    Stable digest of configuration or call arguments
+
+    Dataclasses, enums and paths are normalized; objects without a stable
+    value representation contribute only their type name (never their
+    memory address). Strings under ``root`` are relativized.
+
+    Args:
+        obj: Value to fingerprint
+        root: Workspace root used to relativize paths
+
+    Returns:
+        Hex digest
+    """
+    root_str = str(root.resolve()) if root is not None else None
+
+    def normalize(value: Any) -> Any:
+        if isinstance(value, (bool, int, float)) or value is None:
+            return value
+        if isinstance(value, (str, Path)):
+            text = str(value)
+            if root_str and (text == root_str or text.startswith(root_str + os.sep)):
+                return "<workspace>" + Path(text[len(root_str):]).as_posix()
+            return text
+        if isinstance(value, Enum):
+            return normalize(value.value)
+        if isinstance(value, dict):
+            return {str(k): normalize(v) for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))}
+        if isinstance(value, (list, tuple, set, frozenset)):
+            items = [normalize(v) for v in value]
+            return sorted(items, key=repr) if isinstance(value, (set, frozenset)) else items
+        if hasattr(value, 'to_dict') and callable(value.to_dict):
+            return normalize(value.to_dict())
+        if dataclasses.is_dataclass(value) and not isinstance(value, type):
+            return normalize(dataclasses.asdict(value))
+        return f"<{type(value).__module__}.{type(value).__qualname__}>"
+
+    data = json.dumps(normalize(obj), sort_keys=True)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def code_version(func: Any) -> str:
+    """
+    Version of a callable's code: hash of its source module
+
+    Args:
+        func: Function or method
+
+    Returns:
+        Hex digest (falls back to the qualified name if no source exists)
+    """
+    try:
+        source_file = inspect.getsourcefile(inspect.unwrap(func))
+        if source_file:
+            return compute_file_hash(Path(source_file))
+    except (TypeError, OSError):
+        pass
+    name = f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', repr(func))}"
+    return hashlib.sha256(name.encode('utf-8')).hexdigest()
+
+
+def _encode(value: Any) -> Any:
+    """JSON-encode a result, preserving tuples"""
+    if isinstance(value, tuple):
+        return {'__tuple__': [_encode(v) for v in value]}
+    if isinstance(value, list):
+        return [_encode(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _encode(v) for k, v in value.items()}
+    return value
+
+
+def _decode(value: Any) -> Any:
+    """Inverse of _encode"""
+    if isinstance(value, dict):
+        if set(value) == {'__tuple__'}:
+            return tuple(_decode(v) for v in value['__tuple__'])
+        return {k: _decode(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_decode(v) for v in value]
+    return value
+
+
+class PhaseCache:
+    """
+    Size-bounded, LRU-evicted store of phase results keyed by content
+
+    Each entry is one JSON file ``<phase>-<key>.json``; its mtime is the
+    last access time used for eviction. The directory is listed once per
+    process; afterwards an in-memory LRU index with a running byte total
+    decides evictions without touching the file system.
+    """
+
+    def __init__(self, cache_dir: Path, max_entries: int = 256,
+                 max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize cache
+
+        Args:
+            cache_dir: Directory holding cache entries
+            max_entries: Maximum number of entries kept
+            max_bytes: Maximum total size of entries
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._index: Optional['OrderedDict[str, int]'] = None  # file name -> size, LRU first
+        self._total_bytes = 0
+
+    def _entries(self) -> 'OrderedDict[str, int]':
+        """LRU index of entry files, built from the directory on first use"""
+        if self._index is None:
+            entries = []
+            for entry_file in self.cache_dir.glob("*.json"):
+                try:
+                    stat = entry_file.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, entry_file.name, stat.st_size))
+            entries.sort()
+            self._index = OrderedDict((name, size) for _, name, size in entries)
+            self._total_bytes = sum(self._index.values())
+        return self._index
+
+    def _track(self, name: str, size: int):
+        """Record an entry as most recently used"""
+        index = self._entries()
+        self._total_bytes += size - index.pop(name, 0)
+        index[name] = size
+
+    def _forget(self, name: str):
+        self._total_bytes -= self._entries().pop(name, 0)
+
+    @staticmethod
+    def make_key(phase_name: str, code: str, config: str, inputs: str, call: str) -> str:
+        """Combine the key components into one digest"""
+        material = "\0".join([phase_name, code, config, inputs, call])
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def _entry_file(self, phase_name: str, key: str) -> Path:
+        return self.cache_dir / f"{phase_name}-{key}.json"
+
+    def get(self, phase_name: str, key: str, outputs: Optional[str] = None) -> Tuple[bool, Any]:
+        """
+        Look up a cached result
+
+        Args:
+            phase_name: Phase the entry belongs to
+            key: Content-addressed key
+            outputs: Current digest of the phase's output artifacts; an
+                entry stored with a different digest is a miss
+
+        Returns:
+            (hit, result)
+        """
+        entry_file = self._entry_file(phase_name, key)
+        try:
+            with open(entry_file, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return False, None
+        if outputs is not None and entry.get('outputs') != outputs:
+            self.misses += 1  # outputs deleted or modified since the run
+            return False, None
+
+        os.utime(entry_file)  # mark as recently used
+        index = self._entries()
+        if entry_file.name in index:
+            index.move_to_end(entry_file.name)
+        else:
+            self._track(entry_file.name, entry_file.stat().st_size)
+        self.hits += 1
+        return True, _decode(entry['result'])
+
+    def put(self, phase_name: str, key: str, result: Any, meta: Optional[Dict] = None,
+            outputs: Optional[str] = None) -> bool:
+        """
+        Store a result (skipped if it is not JSON-serializable)
+
+        Args:
+            phase_name: Phase the entry belongs to
+            key: Content-addressed key
+            result: Phase result
+            meta: Extra metadata (e.g. iteration)
+            outputs: Digest of the output artifacts the run produced
+
+        Returns:
+            True if stored
+        """
+        entry = {
+            'phase': phase_name,
+            'key': key,
+            'created': time.time(),
+            'meta': meta or {},
+            'outputs': outputs,
+            'result': _encode(result),
+        }
+        try:
+            data = json.dumps(entry)
+        except (TypeError, ValueError):
+            return False
+
+        entry_file = self._entry_file(phase_name, key)
+        temp_file = entry_file.with_suffix('.tmp')
+        encoded = data.encode('utf-8')
+        with open(temp_file, 'wb') as f:
+            f.write(encoded)
+        os.replace(temp_file, entry_file)
+        self._track(entry_file.name, len(encoded))
+        self.stores += 1
+        self.evict()
+        return True
+
+    def evict(self) -> int:
+        """
+        Drop least-recently-used entries until within bounds
+
+        Returns:
+            Number of entries removed
+        """
+        index = self._entries()
+        removed = 0
+        while index and (len(index) > self.max_entries or self._total_bytes > self.max_bytes):
+            name, _ = next(iter(index.items()))
+            self._forget(name)
+            try:
+                (self.cache_dir / name).unlink()
+            except OSError:
+                continue  # e.g. already removed by another process
+            removed += 1
+        self.evictions += removed
+        return removed
+
+    def clear(self, phase_name: Optional[str] = None, iteration: Optional[int] = None) -> int:
+        """
+        Remove entries
+
+        Args:
+            phase_name: Only entries of this phase (default: all)
+            iteration: Only entries stored for this iteration (default: all)
+
+        Returns:
+            Number of entries removed
+        """
+        pattern = f"{phase_name}-*.json" if phase_name else "*.json"
+        removed = 0
+        for entry_file in self.cache_dir.glob(pattern):
+            if iteration is not None:
+                try:
+                    with open(entry_file, 'r', encoding='utf-8') as f:
+                        if json.load(f).get('meta', {}).get('iteration') != iteration:
+                            continue
+                except (OSError, ValueError):
+                    pass
+            entry_file.unlink()
+            self._forget(entry_file.name)
+            removed += 1
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this process"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'stores': self.stores,
+            'evictions': self.evictions,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+        }
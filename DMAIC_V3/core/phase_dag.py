@@ -0,0 +1,223 @@
+"""
+DMAIC V3.3 - Phase Dependency Graph Executor
+Version: 3.3.0
+
+Declarative phase graph (inputs/outputs and dependencies per phase) and a
+scheduler that starts every phase as soon as its dependencies have
+finished, so independent phases run concurrently and an iteration takes
+roughly as long as its critical path.
+
+Failure semantics:
+- A failed *required* phase stops scheduling; phases already running
+  finish and the run is reported as failed.
+- A failed optional phase is logged and its dependents still run
+  (continue-on-failure), matching the sequential pipeline.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+@dataclass
+class PhaseNode:
+    """One phase in the pipeline graph"""
+    phase_id: str
+    name: str
+    factory: Callable[[], Any]
+    depends_on: Tuple[str, ...] = ()
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+    required: bool = True
+
+
+@dataclass
+class PhaseRun:
+    """Timing and outcome of one executed phase"""
+    phase_id: str
+    success: bool
+    start: float
+    end: float
+    results: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+class PhaseDAGExecutor:
+    """
+    Runs a phase graph with maximal concurrency
+
+    Usage:
+        executor = PhaseDAGExecutor(nodes, max_workers=4)
+        runs, ok = executor.run(lambda node: tracker(node.factory(), node.name))
+        report = executor.critical_path_report(runs)
+    """
+
+    def __init__(self, nodes: List[PhaseNode], max_workers: int = 4):
+        """
+        Initialize executor
+
+        Args:
+            nodes: Phase graph; dependencies must refer to nodes in the list
+            max_workers: Maximum phases running at once
+
+        Raises:
+            ValueError: On unknown dependencies, cycles, or inputs that no
+                upstream phase declares as an output
+        """
+        self.nodes = {node.phase_id: node for node in nodes}
+        self.order = [node.phase_id for node in nodes]
+        self.max_workers = max_workers
+        self._validate()
+
+    def _validate(self):
+        """Reject unknown dependencies, cycles and inputs without a producer"""
+        for node in self.nodes.values():
+            for dep in node.depends_on:
+                if dep not in self.nodes:
+                    raise ValueError(f"{node.phase_id} depends on unknown phase {dep}")
+        self.topological_order()
+
+        # An input must be written by a phase that is guaranteed to have
+        # finished first, i.e. a (transitive) dependency
+        for node in self.nodes.values():
+            produced = {output for pid in self.ancestors(node.phase_id)
+                        for output in self.nodes[pid].outputs}
+            for path in node.inputs:
+                if path not in produced:
+                    raise ValueError(f"{node.phase_id} reads {path} but no phase it "
+                                     f"depends on declares it as an output")
+
+    def ancestors(self, phase_id: str) -> List[str]:
+        """All phases that ``phase_id`` transitively depends on"""
+        seen: List[str] = []
+        stack = list(self.nodes[phase_id].depends_on)
+        while stack:
+            pid = stack.pop()
+            if pid not in seen:
+                seen.append(pid)
+                stack.extend(self.nodes[pid].depends_on)
+        return seen
+
+    def topological_order(self) -> List[str]:
+        """Phases in dependency order (declaration order breaks ties)"""
+        remaining = {pid: set(self.nodes[pid].depends_on) for pid in self.order}
+        ordered = []
+        while remaining:
+            ready = [pid for pid in self.order if pid in remaining and not remaining[pid]]
+            if not ready:
+                raise ValueError(f"Phase graph has a cycle among: {sorted(remaining)}")
+            for pid in ready:
+                ordered.append(pid)
+                del remaining[pid]
+                for deps in remaining.values():
+                    deps.discard(pid)
+        return ordered
+
+    def run(self, run_phase: Callable[[PhaseNode], Tuple[bool, Dict[str, Any]]]
+            ) -> Tuple[Dict[str, PhaseRun], bool]:
+        """
+        Execute the graph
+
+        Args:
+            run_phase: Runs one node and returns (success, results)
+
+        Returns:
+            (runs by phase id, overall success)
+        """
+        runs: Dict[str, PhaseRun] = {}
+        pending = {pid: set(self.nodes[pid].depends_on) for pid in self.order}
+        aborted = False
+
+        def execute(node: PhaseNode) -> PhaseRun:
+            start = time.perf_counter()
+            try:
+                success, results = run_phase(node)
+            except Exception as e:
+                success, results = False, {'error': str(e)}
+            return PhaseRun(node.phase_id, success, start, time.perf_counter(), results or {})
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            running = {}
+
+            def launch_ready():
+                for pid in self.order:
+                    if pid in pending and not pending[pid]:
+                        del pending[pid]
+                        running[pool.submit(execute, self.nodes[pid])] = pid
+
+            launch_ready()
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pid = running.pop(future)
+                    phase_run = future.result()
+                    runs[pid] = phase_run
+
+                    if not phase_run.success:
+                        if self.nodes[pid].required:
+                            aborted = True
+                        else:
+                            print(f"[WARNING] {self.nodes[pid].name} failed but continuing...")
+
+                    for deps in pending.values():
+                        deps.discard(pid)
+
+                if not aborted:
+                    launch_ready()
+
+        return runs, not aborted and not pending
+
+    def critical_path_report(self, runs: Dict[str, PhaseRun]) -> Dict[str, Any]:
+        """
+        Critical path over the measured phase durations
+
+        Args:
+            runs: Result of run()
+
+        Returns:
+            Report with per-phase timings, the critical path and the
+            wall-clock time vs. the sequential sum of durations
+        """
+        if not runs:
+            return {'phases': {}, 'critical_path': [], 'critical_path_seconds': 0.0,
+                    'wall_clock_seconds': 0.0, 'sequential_seconds': 0.0}
+
+        origin = min(run.start for run in runs.values())
+        finish: Dict[str, float] = {}
+        via: Dict[str, Optional[str]] = {}
+        for pid in self.topological_order():
+            if pid not in runs:
+                continue
+            deps = [dep for dep in self.nodes[pid].depends_on if dep in finish]
+            best = max(deps, key=lambda dep: finish[dep], default=None)
+            finish[pid] = (finish[best] if best else 0.0) + runs[pid].duration
+            via[pid] = best
+
+        path = []
+        cursor: Optional[str] = max(finish, key=finish.get)
+        while cursor:
+            path.append(cursor)
+            cursor = via[cursor]
+        path.reverse()
+
+        return {
+            'phases': {
+                pid: {
+                    'name': self.nodes[pid].name,
+                    'success': run.success,
+                    'start_offset_seconds': round(run.start - origin, 3),
+                    'end_offset_seconds': round(run.end - origin, 3),
+                    'duration_seconds': round(run.duration, 3),
+                    'depends_on': list(self.nodes[pid].depends_on),
+                }
+                for pid, run in runs.items()
+            },
+            'critical_path': path,
+            'critical_path_seconds': round(finish[path[-1]], 3),
+            'wall_clock_seconds': round(max(run.end for run in runs.values()) - origin, 3),
+            'sequential_seconds': round(sum(run.duration for run in runs.values()), 3),
+        }
@@ -9,12 +9,20 @@
 
 import json
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 
 class RankingCategory(Enum):
     """Categories for ranking"""
@@ -115,6 +123,10 @@ def __init__(self, workspace_root: Path, db_path: Optional[Path] = None):
         self.workspace_root = Path(workspace_root)
         self.db_path = db_path or (self.workspace_root / ".dmaic" / "rankings.db")
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # One long-lived connection shared by all methods (serialized by a lock)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
         
         self.version = "1.0.0"
         self.timestamp = datetime.now().isoformat()
@@ -133,10 +145,42 @@ def __init__(self, workspace_root: Path, db_path: Optional[Path] = None):
         
         self._init_database()
     
+    @contextmanager
+    def _connection(self):
+        """
+        Yield the engine's long-lived connection inside a transaction
+
+        The connection is opened lazily in WAL mode and reused by every
+        call; the block commits on success and rolls back on error.
+        """
+        with self._lock:
+            if self._conn is None:
+                self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+            with self._conn:
+                yield self._conn
+
+    def close(self):
+        """Close the shared connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     def _init_database(self) -> Any:
         """Initialize SQLite database schema"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._connection() as conn:
+            self._create_schema(conn.cursor())
+
+    def _create_schema(self, cursor: sqlite3.Cursor):
+        """Create tables and indexes"""
         
         # Global rankings table
         cursor.execute("""
@@ -202,10 +246,8 @@ def _init_database(self) -> Any:
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_rank_position ON global_rankings(rank_position)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_overall_score ON global_rankings(overall_score DESC)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_category ON category_scores(category)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_category_entity ON category_scores(entity_id)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_history_entity ON ranking_history(entity_id)")
-        
-        conn.commit()
-        conn.close()
     
     def calculate_self_ranking(self, entity_path: Path, 
                               metrics: Dict[str, Any]) -> SelfRanking:
@@ -310,112 +352,218 @@ def calculate_global_ranking(self, entity_path: Path,
         Returns:
             GlobalRanking object
         """
-        entity_id = self._generate_entity_id(entity_path)
         weights = custom_weights or self.default_weights
         
         # Calculate category scores
-        category_scores = {}
         weighted_sum = 0.0
         total_weight = 0.0
         
         for category, metrics in category_metrics.items():
-            score = metrics.get('score', 0.5)
-            confidence = metrics.get('confidence', 1.0)
-            evidence = metrics.get('evidence', {})
             weight = weights.get(category, 0.1)
-            
-            ranking_score = RankingScore(
-                category=category,
-                score=score,
-                weight=weight,
-                confidence=confidence,
-                evidence=evidence,
-                timestamp=datetime.now().isoformat(),
-                version=self.version
-            )
-            
-            category_scores[category] = ranking_score
-            weighted_sum += ranking_score.weighted_score()
+            confidence = metrics.get('confidence', 1.0)
+            weighted_sum += metrics.get('score', 0.5) * weight * confidence
             total_weight += weight * confidence
         
         # Calculate overall score
         overall_score = weighted_sum / total_weight if total_weight > 0 else 0.0
         
-        # Get rank position and percentile (will be updated after all entities are ranked)
-        rank_position = 0
-        percentile = 0.0
-        total_entities = 0
+        global_ranking = self._build_global_ranking(
+            entity_path, entity_type, category_metrics, weights,
+            overall_score, total_weight, datetime.now().isoformat()
+        )
         
-        global_ranking = GlobalRanking(
-            entity_id=entity_id,
+        self._save_global_ranking(global_ranking)
+        return global_ranking
+
+    def calculate_global_rankings(self, entities: List[Dict[str, Any]],
+                                  custom_weights: Optional[Dict[str, float]] = None,
+                                  update_positions: bool = True) -> List[GlobalRanking]:
+        """
+        Calculate and persist global rankings for many entities at once
+
+        Overall scores are computed as one weighted matrix reduction
+        (NumPy when available), all rankings are written in a single
+        transaction, and positions are updated once at the end.
+
+        Args:
+            entities: Dicts with 'entity_path', 'entity_type' and
+                'category_metrics' (same shape as calculate_global_ranking)
+            custom_weights: Optional custom weights for categories
+            update_positions: Recompute rank positions after writing
+
+        Returns:
+            List of GlobalRanking objects, in input order
+        """
+        if not entities:
+            return []
+
+        weights = custom_weights or self.default_weights
+        overall_scores, total_weights = self._score_batch(
+            [entity['category_metrics'] for entity in entities], weights
+        )
+
+        timestamp = datetime.now().isoformat()
+        rankings = [
+            self._build_global_ranking(
+                Path(entity['entity_path']), entity['entity_type'], entity['category_metrics'],
+                weights, overall, total_weight, timestamp
+            )
+            for entity, overall, total_weight in zip(entities, overall_scores, total_weights)
+        ]
+
+        with self._connection() as conn:
+            self._write_global_rankings(conn, rankings)
+
+        if update_positions:
+            self.update_rankings_for_all_entities()
+            positions = self._load_positions([r.entity_id for r in rankings])
+            for ranking in rankings:
+                if ranking.entity_id in positions:
+                    ranking.rank_position, ranking.percentile, ranking.total_entities = \
+                        positions[ranking.entity_id]
+
+        return rankings
+
+    def _score_batch(self, metrics_list: List[Dict[str, Dict[str, Any]]],
+                     weights: Dict[str, float]) -> Tuple[List[float], List[float]]:
+        """
+        Weighted overall scores for a batch of category metric dicts
+
+        Returns:
+            (overall_scores, total_weights), one entry per input
+        """
+        categories: Dict[str, int] = {}
+        for metrics in metrics_list:
+            for category in metrics:
+                categories.setdefault(category, len(categories))
+        weight_row = [weights.get(category, 0.1) for category in categories]
+
+        if not NUMPY_AVAILABLE:
+            overall_scores, total_weights = [], []
+            for metrics in metrics_list:
+                weighted_sum = total_weight = 0.0
+                for category, values in metrics.items():
+                    effective = weight_row[categories[category]] * values.get('confidence', 1.0)
+                    weighted_sum += values.get('score', 0.5) * effective
+                    total_weight += effective
+                overall_scores.append(weighted_sum / total_weight if total_weight > 0 else 0.0)
+                total_weights.append(total_weight)
+            return overall_scores, total_weights
+
+        # Absent categories get zero confidence, so they drop out of both sums
+        scores = np.zeros((len(metrics_list), len(categories)))
+        confidence = np.zeros_like(scores)
+        for row, metrics in enumerate(metrics_list):
+            for category, values in metrics.items():
+                col = categories[category]
+                scores[row, col] = values.get('score', 0.5)
+                confidence[row, col] = values.get('confidence', 1.0)
+
+        effective = confidence * np.asarray(weight_row)
+        total_weights = effective.sum(axis=1)
+        weighted_sums = (scores * effective).sum(axis=1)
+        overall_scores = np.divide(weighted_sums, total_weights,
+                                   out=np.zeros_like(weighted_sums), where=total_weights > 0)
+        return overall_scores.tolist(), total_weights.tolist()
+
+    def _build_global_ranking(self, entity_path: Path, entity_type: str,
+                              category_metrics: Dict[str, Dict[str, Any]],
+                              weights: Dict[str, float], overall_score: float,
+                              total_weight: float, timestamp: str) -> GlobalRanking:
+        """Assemble an unranked GlobalRanking (positions are set by update_rankings_for_all_entities)"""
+        category_scores = {
+            category: RankingScore(
+                category=category,
+                score=metrics.get('score', 0.5),
+                weight=weights.get(category, 0.1),
+                confidence=metrics.get('confidence', 1.0),
+                evidence=metrics.get('evidence', {}),
+                timestamp=timestamp,
+                version=self.version
+            )
+            for category, metrics in category_metrics.items()
+        }
+
+        return GlobalRanking(
+            entity_id=self._generate_entity_id(Path(entity_path)),
             entity_type=entity_type,
             entity_path=str(entity_path),
             overall_score=overall_score,
             category_scores=category_scores,
-            rank_position=rank_position,
-            percentile=percentile,
-            total_entities=total_entities,
-            timestamp=datetime.now().isoformat(),
+            rank_position=0,
+            percentile=0.0,
+            total_entities=0,
+            timestamp=timestamp,
             version=self.version,
             metadata={
                 'weights': weights,
                 'total_weight': total_weight
             }
         )
-        
-        self._save_global_ranking(global_ranking)
-        return global_ranking
+
+    def _load_positions(self, entity_ids: List[str]) -> Dict[str, Tuple[int, float, int]]:
+        """Current (rank_position, percentile, total_entities) for the given entities"""
+        with self._connection() as conn:
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS _position_ids (entity_id TEXT PRIMARY KEY)")
+            conn.execute("DELETE FROM _position_ids")
+            conn.executemany("INSERT OR IGNORE INTO _position_ids VALUES (?)",
+                             [(entity_id,) for entity_id in entity_ids])
+            rows = conn.execute("""
+                SELECT g.entity_id, g.rank_position, g.percentile, g.total_entities
+                FROM global_rankings AS g
+                JOIN _position_ids AS p ON p.entity_id = g.entity_id
+            """).fetchall()
+        return {row[0]: (row[1], row[2], row[3]) for row in rows}
     
-    def update_rankings_for_all_entities(self, entity_type -> Any: Optional[str] = None):
+    def update_rankings_for_all_entities(self, entity_type: Optional[str] = None) -> int:
         """
         Update rank positions and percentiles for all entities
-        
+
+        Ranks are recomputed set-based with RANK() OVER (entities with equal
+        scores share a position) and appended to the history in the same
+        transaction.
+
         Args:
             entity_type: Optional filter by entity type
+
+        Returns:
+            Number of entities ranked
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Build query
-        query = "SELECT entity_id, overall_score FROM global_rankings"
-        params = []
-        if entity_type:
-            query += " WHERE entity_type = ?"
-            params.append(entity_type)
-        query += " ORDER BY overall_score DESC"
-        
-        cursor.execute(query, params)
-        results = cursor.fetchall()
-        
-        total_entities = len(results)
-        
-        # Update rank positions and percentiles
-        for rank_position, (entity_id, overall_score) in enumerate(results, start=1):
-            percentile = ((total_entities - rank_position + 1) / total_entities) * 100.0
-            
-            cursor.execute("""
+        where = "WHERE entity_type = ?" if entity_type else ""
+        params = [entity_type] if entity_type else []
+
+        with self._connection() as conn:
+            conn.execute(f"""
+                WITH ranked AS (
+                    SELECT entity_id,
+                           RANK() OVER (ORDER BY overall_score DESC) AS position,
+                           COUNT(*) OVER () AS total
+                    FROM global_rankings
+                    {where}
+                )
                 UPDATE global_rankings
-                SET rank_position = ?, percentile = ?, total_entities = ?
-                WHERE entity_id = ?
-            """, (rank_position, percentile, total_entities, entity_id))
-            
-            # Add to history
-            cursor.execute("""
-                INSERT INTO ranking_history (entity_id,
-                    overall_score,
-                    rank_position,
-                    timestamp,
-                    version)
-                VALUES (?, ?, ?, ?, ?)
-            """, (entity_id, overall_score, rank_position, datetime.now().isoformat(), self.version))
-        
-        conn.commit()
-        conn.close()
+                SET rank_position = ranked.position,
+                    percentile = (ranked.total - ranked.position + 1) * 100.0 / ranked.total,
+                    total_entities = ranked.total
+                FROM ranked
+                WHERE global_rankings.entity_id = ranked.entity_id
+            """, params)
+
+            cursor = conn.execute(f"""
+                INSERT INTO ranking_history (entity_id, overall_score, rank_position, timestamp, version)
+                SELECT entity_id, overall_score, rank_position, ?, ?
+                FROM global_rankings
+                {where}
+            """, [datetime.now().isoformat(), self.version] + params)
+
+        return cursor.rowcount
     
     def get_top_ranked(self, entity_type: Optional[str] = None, 
                       limit: int = 10) -> List[GlobalRanking]:
         """
         Get top ranked entities
+
+        Entities and their category scores are fetched in a single join.
         
         Args:
             entity_type: Optional filter by entity type
@@ -424,40 +572,49 @@ def get_top_ranked(self, entity_type: Optional[str] = None,
         Returns:
             List of GlobalRanking objects
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        query = "SELECT * FROM global_rankings"
-        params = []
-        if entity_type:
-            query += " WHERE entity_type = ?"
-            params.append(entity_type)
-        query += " ORDER BY overall_score DESC LIMIT ?"
-        params.append(limit)
-        
-        cursor.execute(query, params)
-        results = cursor.fetchall()
-        conn.close()
+        where = "WHERE entity_type = ?" if entity_type else ""
+        params = ([entity_type] if entity_type else []) + [limit]
+
+        with self._connection() as conn:
+            results = conn.execute(f"""
+                SELECT g.entity_id, g.entity_type, g.entity_path, g.overall_score,
+                       g.rank_position, g.percentile, g.total_entities, g.timestamp,
+                       g.version, g.metadata,
+                       c.category, c.score, c.weight, c.confidence, c.evidence,
+                       c.timestamp, c.version
+                FROM (
+                    SELECT * FROM global_rankings
+                    {where}
+                    ORDER BY overall_score DESC
+                    LIMIT ?
+                ) AS g
+                LEFT JOIN category_scores AS c ON c.entity_id = g.entity_id
+                ORDER BY g.overall_score DESC, g.entity_id, c.id
+            """, params).fetchall()
         
         rankings = []
+        by_id: Dict[str, GlobalRanking] = {}
         for row in results:
-            # Load category scores
-            category_scores = self._load_category_scores(row[0])
-            
-            ranking = GlobalRanking(
-                entity_id=row[0],
-                entity_type=row[1],
-                entity_path=row[2],
-                overall_score=row[3],
-                category_scores=category_scores,
-                rank_position=row[4],
-                percentile=row[5],
-                total_entities=row[6],
-                timestamp=row[7],
-                version=row[8],
-                metadata=json.loads(row[9]) if row[9] else {}
-            )
-            rankings.append(ranking)
+            ranking = by_id.get(row[0])
+            if ranking is None:
+                ranking = GlobalRanking(
+                    entity_id=row[0],
+                    entity_type=row[1],
+                    entity_path=row[2],
+                    overall_score=row[3],
+                    category_scores={},
+                    rank_position=row[4],
+                    percentile=row[5],
+                    total_entities=row[6],
+                    timestamp=row[7],
+                    version=row[8],
+                    metadata=json.loads(row[9]) if row[9] else {}
+                )
+                by_id[row[0]] = ranking
+                rankings.append(ranking)
+
+            if row[10] is not None:
+                ranking.category_scores[row[10]] = self._row_to_score(row[10:])
         
         return rankings
     
@@ -473,19 +630,14 @@ def get_ranking_history(self, entity_id: str,
         Returns:
             List of historical ranking records
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT overall_score, rank_position, timestamp, version
-            FROM ranking_history
-            WHERE entity_id = ?
-            ORDER BY timestamp DESC
-            LIMIT ?
-        """, (entity_id, limit))
-        
-        results = cursor.fetchall()
-        conn.close()
+        with self._connection() as conn:
+            results = conn.execute("""
+                SELECT overall_score, rank_position, timestamp, version
+                FROM ranking_history
+                WHERE entity_id = ?
+                ORDER BY timestamp DESC
+                LIMIT ?
+            """, (entity_id, limit)).fetchall()
         
         history = []
         for row in results:
@@ -498,7 +650,7 @@ def get_ranking_history(self, entity_id: str,
         
         return history
     
-    def generate_ranking_report(self, output_path -> Any: Path, 
+    def generate_ranking_report(self, output_path: Path, 
                                entity_type: Optional[str] = None):
         """
         Generate comprehensive ranking report
@@ -550,117 +702,104 @@ def _generate_entity_id(self, entity_path: Path) -> str:
         rel_path = entity_path.relative_to(self.workspace_root) if entity_path.is_relative_to(self.workspace_root) else entity_path
         return str(rel_path).replace('\\', '/').replace('/', '__')
     
-    def _save_self_ranking(self, self_ranking -> Any: SelfRanking):
+    def _save_self_ranking(self, self_ranking: SelfRanking):
         """Save self ranking to database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            INSERT OR REPLACE INTO self_rankings
-            (entity_id, entity_path, self_score, improvement_areas, strengths, 
-             recommendations, confidence, timestamp, version)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            self_ranking.entity_id,
-            self_ranking.entity_path,
-            self_ranking.self_score,
-            json.dumps(self_ranking.improvement_areas),
-            json.dumps(self_ranking.strengths),
-            json.dumps(self_ranking.recommendations),
-            self_ranking.confidence,
-            self_ranking.timestamp,
-            self_ranking.version
-        ))
-        
-        conn.commit()
-        conn.close()
+        with self._connection() as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO self_rankings
+                (entity_id, entity_path, self_score, improvement_areas, strengths, 
+                 recommendations, confidence, timestamp, version)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                self_ranking.entity_id,
+                self_ranking.entity_path,
+                self_ranking.self_score,
+                json.dumps(self_ranking.improvement_areas),
+                json.dumps(self_ranking.strengths),
+                json.dumps(self_ranking.recommendations),
+                self_ranking.confidence,
+                self_ranking.timestamp,
+                self_ranking.version
+            ))
     
-    def _save_global_ranking(self, global_ranking -> Any: GlobalRanking):
+    def _save_global_ranking(self, global_ranking: GlobalRanking):
         """Save global ranking to database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Save global ranking
-        cursor.execute("""
+        with self._connection() as conn:
+            self._write_global_rankings(conn, [global_ranking])
+
+    def _write_global_rankings(self, conn: sqlite3.Connection, rankings: List[GlobalRanking]):
+        """Upsert rankings and replace their category scores (caller owns the transaction)"""
+        conn.executemany("""
             INSERT OR REPLACE INTO global_rankings
             (entity_id, entity_type, entity_path, overall_score, rank_position,
              percentile, total_entities, timestamp, version, metadata)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            global_ranking.entity_id,
-            global_ranking.entity_type,
-            global_ranking.entity_path,
-            global_ranking.overall_score,
-            global_ranking.rank_position,
-            global_ranking.percentile,
-            global_ranking.total_entities,
-            global_ranking.timestamp,
-            global_ranking.version,
-            json.dumps(global_ranking.metadata)
-        ))
-        
-        # Save category scores
-        for category, score in global_ranking.category_scores.items():
-            cursor.execute("""
-                INSERT INTO category_scores
-                (entity_id, category, score, weight, confidence, evidence, timestamp, version)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                global_ranking.entity_id,
-                category,
-                score.score,
-                score.weight,
-                score.confidence,
-                json.dumps(score.evidence),
-                score.timestamp,
-                score.version
-            ))
-        
-        conn.commit()
-        conn.close()
+        """, [(
+            ranking.entity_id,
+            ranking.entity_type,
+            ranking.entity_path,
+            ranking.overall_score,
+            ranking.rank_position,
+            ranking.percentile,
+            ranking.total_entities,
+            ranking.timestamp,
+            ranking.version,
+            json.dumps(ranking.metadata)
+        ) for ranking in rankings])
+
+        # Only the latest scores per entity are ever read back
+        conn.executemany("DELETE FROM category_scores WHERE entity_id = ?",
+                         [(ranking.entity_id,) for ranking in rankings])
+        conn.executemany("""
+            INSERT INTO category_scores
+            (entity_id, category, score, weight, confidence, evidence, timestamp, version)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, [(
+            ranking.entity_id,
+            category,
+            score.score,
+            score.weight,
+            score.confidence,
+            json.dumps(score.evidence),
+            score.timestamp,
+            score.version
+        ) for ranking in rankings for category, score in ranking.category_scores.items()])
+
+    @staticmethod
+    def _row_to_score(row: Tuple) -> RankingScore:
+        """Build a RankingScore from (category, score, weight, confidence, evidence, timestamp, version)"""
+        return RankingScore(
+            category=row[0],
+            score=row[1],
+            weight=row[2],
+            confidence=row[3],
+            evidence=json.loads(row[4]) if row[4] else {},
+            timestamp=row[5],
+            version=row[6]
+        )
     
     def _load_category_scores(self, entity_id: str) -> Dict[str, RankingScore]:
         """Load category scores for an entity"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT category, score, weight, confidence, evidence, timestamp, version
-            FROM category_scores
-            WHERE entity_id = ?
-        """, (entity_id,))
-        
-        results = cursor.fetchall()
-        conn.close()
-        
-        category_scores = {}
-        for row in results:
-            category_scores[row[0]] = RankingScore(
-                category=row[0],
-                score=row[1],
-                weight=row[2],
-                confidence=row[3],
-                evidence=json.loads(row[4]) if row[4] else {},
-                timestamp=row[5],
-                version=row[6]
-            )
+        with self._connection() as conn:
+            results = conn.execute("""
+                SELECT category, score, weight, confidence, evidence, timestamp, version
+                FROM category_scores
+                WHERE entity_id = ?
+                ORDER BY id
+            """, (entity_id,)).fetchall()
         
-        return category_scores
+        return {row[0]: self._row_to_score(row) for row in results}
     
     def _calculate_statistics(self, entity_type: Optional[str] = None) -> Dict[str, Any]:
         """Calculate ranking statistics"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         query = "SELECT overall_score FROM global_rankings"
         params = []
         if entity_type:
             query += " WHERE entity_type = ?"
             params.append(entity_type)
         
-        cursor.execute(query, params)
-        scores = [row[0] for row in cursor.fetchall()]
-        conn.close()
+        with self._connection() as conn:
+            scores = [row[0] for row in conn.execute(query, params).fetchall()]
         
         if not scores:
             return {}
@@ -0,0 +1,249 @@
+"""
+DMAIC V3.3 - Indexed Registry Store
+Version: 3.3.0
+
+SQLite-backed store for the global action and TODO registries.
+
+Each record is kept as its JSON document plus a few extracted columns
+(phase, agent, status, priority, type) that carry indexes, so lookups and
+statistics are indexed queries and registering a batch is one
+transaction instead of a read-modify-rewrite of a JSON file per item.
+Records are keyed by their id; registering an existing id updates it in
+place and keeps its original position.
+"""
+
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .utils import ensure_directory, safe_read_json, safe_write_json
+
+INDEXED_FIELDS = ('phase', 'agent', 'status', 'priority', 'type')
+
+
+class RegistryStore:
+    """
+    Indexed, id-keyed store of JSON records
+
+    Usage:
+        store = RegistryStore(db_path, id_field='todo_id')
+        store.upsert_many(todos)
+        pending = store.find(status='pending')
+        by_phase = store.count_by('phase')
+    """
+
+    def __init__(self, db_path: Path, id_field: str):
+        """
+        Initialize store
+
+        Args:
+            db_path: SQLite database file
+            id_field: Record key holding the record id
+        """
+        self.db_path = Path(db_path)
+        self.id_field = id_field
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+        ensure_directory(self.db_path.parent)
+        with self._connection() as conn:
+            columns = ", ".join(f"{field} TEXT" for field in INDEXED_FIELDS)
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS records (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    record_id TEXT NOT NULL UNIQUE,
+                    {columns},
+                    data TEXT NOT NULL
+                )
+            """)
+            for field in INDEXED_FIELDS:
+                conn.execute(f"CREATE INDEX IF NOT EXISTS idx_records_{field} ON records({field})")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)
+            """)
+            conn.execute("INSERT OR IGNORE INTO meta VALUES ('created_at', ?)",
+                         (datetime.now().isoformat(),))
+
+    @contextmanager
+    def _connection(self):
+        """Yield the store's long-lived connection inside a transaction"""
+        with self._lock:
+            if self._conn is None:
+                self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+            with self._conn:
+                yield self._conn
+
+    def close(self):
+        """Close the shared connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _row(self, record: Dict[str, Any]) -> tuple:
+        values = [record.get(field) for field in INDEXED_FIELDS]
+        return (record[self.id_field], *[None if v is None else str(v) for v in values],
+                json.dumps(record, default=str))
+
+    def upsert_many(self, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        Insert or update records in one transaction
+
+        Args:
+            records: Records carrying id_field
+
+        Returns:
+            Number of records written
+        """
+        rows = [self._row(record) for record in records]
+        if not rows:
+            return 0
+        updates = ", ".join(f"{field} = excluded.{field}" for field in INDEXED_FIELDS)
+        placeholders = ", ".join("?" * (len(INDEXED_FIELDS) + 2))
+        with self._connection() as conn:
+            conn.executemany(f"""
+                INSERT INTO records (record_id, {", ".join(INDEXED_FIELDS)}, data)
+                VALUES ({placeholders})
+                ON CONFLICT(record_id) DO UPDATE SET {updates}, data = excluded.data
+            """, rows)
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('last_updated', ?)",
+                         (datetime.now().isoformat(),))
+        return len(rows)
+
+    def get(self, record_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch one record by id"""
+        with self._connection() as conn:
+            row = conn.execute("SELECT data FROM records WHERE record_id = ?",
+                               (record_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    @staticmethod
+    def _where(filters: Dict[str, Any]) -> tuple:
+        """WHERE clause and parameters for equality filters on indexed fields"""
+        unknown = set(filters) - set(INDEXED_FIELDS)
+        if unknown:
+            raise ValueError(f"Not indexed: {sorted(unknown)}")
+        where = " AND ".join(f"{field} = ?" for field in filters) or "1"
+        return where, [str(v) for v in filters.values()]
+
+    def find(self, **filters: Any) -> List[Dict[str, Any]]:
+        """
+        Records matching all filters, in registration order
+
+        Args:
+            **filters: Indexed field values, e.g. phase='phase4'
+
+        Returns:
+            Matching records
+
+        Raises:
+            ValueError: If a filter is not an indexed field
+        """
+        where, params = self._where(filters)
+        with self._connection() as conn:
+            rows = conn.execute(f"SELECT data FROM records WHERE {where} ORDER BY seq",
+                                params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def count(self, **filters: Any) -> int:
+        """Number of records matching all filters"""
+        where, params = self._where(filters)
+        with self._connection() as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM records WHERE {where}", params).fetchone()[0]
+
+    def count_by(self, field: str) -> Dict[str, int]:
+        """Record counts grouped by an indexed field (missing values as 'unknown')"""
+        if field not in INDEXED_FIELDS:
+            raise ValueError(f"Not indexed: {field}")
+        with self._connection() as conn:
+            rows = conn.execute(f"""
+                SELECT COALESCE({field}, 'unknown'), COUNT(*) FROM records
+                GROUP BY 1 ORDER BY MIN(seq)
+            """).fetchall()
+        return dict(rows)
+
+    def update(self, record_id: str, **changes: Any) -> bool:
+        """
+        Update fields of one record
+
+        Returns:
+            True if the record exists
+        """
+        with self._connection() as conn:
+            row = conn.execute("SELECT data FROM records WHERE record_id = ?",
+                               (record_id,)).fetchone()
+            if row is None:
+                return False
+            record = json.loads(row[0])
+            record.update(changes)
+            conn.execute(f"""
+                UPDATE records SET {", ".join(f"{field} = ?" for field in INDEXED_FIELDS)}, data = ?
+                WHERE record_id = ?
+            """, (*self._row(record)[1:], record_id))
+        return True
+
+    def meta(self, key: str) -> Optional[str]:
+        """Store metadata value (created_at, last_updated)"""
+        with self._connection() as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def import_json(self, json_path: Path, list_key: str,
+                    rekey: Optional[Callable[[Dict[str, Any]], str]] = None) -> int:
+        """
+        One-time import of a legacy JSON registry into an empty store
+
+        Args:
+            json_path: Legacy registry file
+            list_key: Key holding the record list
+            rekey: Derives a new id for a record whose id repeats an earlier
+                one; without it, later duplicates overwrite earlier records
+
+        Returns:
+            Number of records imported
+        """
+        if self.count() or not Path(json_path).exists():
+            return 0
+        data = safe_read_json(Path(json_path)) or {}
+        records = [r for r in data.get(list_key, []) if isinstance(r, dict) and r.get(self.id_field)]
+        if rekey is not None:
+            seen = set()
+            for record in records:
+                if record[self.id_field] in seen:
+                    record[self.id_field] = rekey(record)
+                seen.add(record[self.id_field])
+        return self.upsert_many(records)
+
+    def export_json(self, json_path: Path, list_key: str, extra: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Write the registry as a JSON document (for tools reading the file)
+
+        Args:
+            json_path: Output file
+            list_key: Key holding the record list
+            extra: Additional top-level fields
+
+        Returns:
+            True on success
+        """
+        records = self.find()
+        document = {
+            list_key: records,
+            f"total_{list_key}": len(records),
+            'created_at': self.meta('created_at'),
+            'last_updated': self.meta('last_updated') or datetime.now().isoformat(),
+        }
+        document.update(extra or {})
+        return safe_write_json(document, Path(json_path))
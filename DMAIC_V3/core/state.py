@@ -1,10 +1,16 @@
 """
 DMAIC V3.0 - State Management for Idempotency
 Handles execution state, checkpoints, and resume capability
+
+State changes are appended as events to a write-ahead journal
+(execution_state.journal, one JSON object per line, fsync'd) and
+periodically compacted into the execution_state.json snapshot, so the
+cost of a state transition does not grow with the execution history.
 """
 
 import json
 import hashlib
+import os
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
@@ -69,41 +75,144 @@ class StateManager:
     - Verify idempotency
     """
     
-    def __init__(self, state_dir: Path, hash_algorithm: str = "sha256"):
+    def __init__(self, state_dir: Path, hash_algorithm: str = "sha256",
+                 compact_every: int = 256):
         """
         Initialize state manager
         
         Args:
             state_dir: Directory to store state files
             hash_algorithm: Hash algorithm for checksums (sha256, md5, etc.)
+            compact_every: Journal events between snapshot compactions
         """
         self.state_dir = Path(state_dir)
         self.state_dir.mkdir(parents=True, exist_ok=True)
         
         self.state_file = self.state_dir / "execution_state.json"
+        self.journal_file = self.state_dir / "execution_state.journal"
         self.hash_algorithm = hash_algorithm
+        self.compact_every = compact_every
         
         self.current_iteration: Optional[IterationState] = None
         self.execution_history: List[IterationState] = []
+
+        # Sequence number of the last journaled event and of the last one in the snapshot
+        self._seq = 0
+        self._snapshot_seq = 0
         
         self._load_state()
     
     def _load_state(self):
-        """Load state from disk"""
+        """Load the snapshot, then replay journal events written after it"""
         if self.state_file.exists():
             try:
                 with open(self.state_file, 'r') as f:
                     data = json.load(f)
                     self._deserialize_state(data)
+                self._snapshot_seq = self._seq = data.get("journal_seq", 0)
             except Exception as e:
                 print(f"[STATE] Warning: Could not load state: {e}")
+
+        if not self.journal_file.exists():
+            return
+
+        offset = 0
+        valid_bytes = 0  # end of the last well-formed event
+        last_seq = self._seq
+        replaying = True
+        with open(self.journal_file, 'rb') as f:
+            for line in f:
+                offset += len(line)
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    event = None
+                if not isinstance(event, dict) or not isinstance(event.get("seq"), int):
+                    # Torn append from a crash (or a foreign line): stop replaying
+                    if replaying:
+                        print("[STATE] Warning: Ignoring incomplete journal entry")
+                    replaying = False
+                    continue
+                valid_bytes = offset
+                last_seq = max(last_seq, event["seq"])
+                if not replaying or event["seq"] <= self._seq:
+                    continue  # after a bad entry, or already folded into the snapshot
+                try:
+                    self._apply_event(event)
+                except Exception as e:
+                    # Keep the journal intact; later events are not applied
+                    print(f"[STATE] Warning: Could not replay event {event['seq']}: {e}")
+                    replaying = False
+                    continue
+                self._seq = event["seq"]
+
+        # New events must never reuse a seq that is already in the journal
+        self._seq = last_seq
+
+        # Drop an unparsable tail so new events are not appended behind it;
+        # anything followed by well-formed events is left in place
+        if valid_bytes < self.journal_file.stat().st_size:
+            with open(self.journal_file, 'r+b') as f:
+                f.truncate(valid_bytes)
     
-    def _save_state(self):
-        """Save state to disk"""
+    def _append_event(self, op: str, **payload):
+        """
+        Durably append one state event to the journal
+
+        The event is written with a single append and fsync'd; every
+        ``compact_every`` events the journal is folded into the snapshot.
+        """
+        event = {"seq": self._seq + 1, "op": op, **payload}
+        try:
+            line = json.dumps(event, default=str) + "\n"
+            with open(self.journal_file, 'a', encoding='utf-8') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            self._seq = event["seq"]
+        except Exception as e:
+            print(f"[STATE] Error: Could not journal state: {e}")
+            return
+
+        if self._seq - self._snapshot_seq >= self.compact_every:
+            self.compact()
+
+    def _apply_event(self, event: Dict[str, Any]):
+        """Apply one journaled event to the in-memory state (replay)"""
+        op = event["op"]
+        if op == "start_iteration":
+            self.current_iteration = self._deserialize_iteration(event["iteration"])
+        elif op == "end_iteration":
+            self.current_iteration.end_time = event["end_time"]
+            self.current_iteration.status = event["status"]
+            self.execution_history.append(self.current_iteration)
+            self.current_iteration = None
+        elif op == "phase":
+            phase = self._deserialize_phase(event["phase"])
+            self.current_iteration.phases[phase.phase_id] = phase
+        elif op == "checkpoint":
+            self.current_iteration.phases[event["phase_id"]].checkpoint_data.update(event["data"])
+        elif op == "append_history":
+            self.execution_history.append(self._deserialize_iteration(event["iteration"]))
+        else:
+            raise ValueError(f"Unknown state event: {op}")
+
+    def compact(self):
+        """Fold the journal into a fresh snapshot and truncate it"""
         try:
             data = self._serialize_state()
-            with open(self.state_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            data["journal_seq"] = self._seq
+            temp_file = self.state_file.with_suffix('.tmp')
+            with open(temp_file, 'w') as f:
+                json.dump(data, f, indent=2, default=str)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self.state_file)
+            self._snapshot_seq = self._seq
+
+            # A crash before this point is harmless: replay skips seq <= journal_seq
+            with open(self.journal_file, 'w', encoding='utf-8'):
+                pass
         except Exception as e:
             print(f"[STATE] Error: Could not save state: {e}")
     
@@ -211,16 +320,18 @@ def start_iteration(self, iteration_number: int):
             start_time=datetime.now().isoformat(),
             status="running"
         )
-        self._save_state()
+        self._append_event("start_iteration",
+                           iteration=self._serialize_iteration(self.current_iteration))
     
     def end_iteration(self, status: str = "completed"):
         """End current iteration"""
         if self.current_iteration:
             self.current_iteration.end_time = datetime.now().isoformat()
             self.current_iteration.status = status
+            self._append_event("end_iteration", end_time=self.current_iteration.end_time,
+                               status=status)
             self.execution_history.append(self.current_iteration)
             self.current_iteration = None
-            self._save_state()
     
     def start_phase(self, phase_id: str, phase_number: int, input_data: Any = None):
         """Start phase execution"""
@@ -236,7 +347,7 @@ def start_phase(self, phase_id: str, phase_number: int, input_data: Any = None):
         )
         
         self.current_iteration.phases[phase_id] = phase_state
-        self._save_state()
+        self._append_event("phase", phase=self._serialize_phase(phase_state))
     
     def end_phase(self, phase_id: str, status: PhaseStatus, output_data: Any = None, 
                   error: Optional[str] = None, metrics: Optional[Dict] = None):
@@ -265,7 +376,7 @@ def end_phase(self, phase_id: str, status: PhaseStatus, output_data: Any = None,
         if metrics:
             phase.metrics = metrics
         
-        self._save_state()
+        self._append_event("phase", phase=self._serialize_phase(phase))
     
     def save_checkpoint(self, phase_id: str, checkpoint_data: Dict[str, Any]):
         """Save checkpoint data for a phase"""
@@ -277,7 +388,7 @@ def save_checkpoint(self, phase_id: str, checkpoint_data: Dict[str, Any]):
         
         phase = self.current_iteration.phases[phase_id]
         phase.checkpoint_data.update(checkpoint_data)
-        self._save_state()
+        self._append_event("checkpoint", phase_id=phase_id, data=checkpoint_data)
     
     def load_checkpoint(self, phase_id: str) -> Optional[Dict[str, Any]]:
         """Load checkpoint data for a phase"""
@@ -378,9 +489,9 @@ def add_iteration_result(self, result: 'IterationResult'):
             self.execution_history.append(iteration_state)
         except Exception:
             # If creating IterationState fails for any reason, we still persist raw result_data
-            pass
+            return
 
-        self._save_state()
+        self._append_event("append_history", iteration=self._serialize_iteration(iteration_state))
 
     def get_execution_summary(self) -> Dict[str, Any]:
         """Get summary of execution state"""
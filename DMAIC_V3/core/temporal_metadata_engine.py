@@ -13,14 +13,50 @@
 """
 
 import json
-import hashlib
+import os
 import sqlite3
+import time
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 
+from .ast_extractor import extract_file
+from .utils import compute_file_hash
+from .workspace_walker import DirListing, parallel_scan
+
+
+FILE_COLUMNS = (
+    'file_path', 'file_type', 'size_bytes', 'hash_sha256', 'created_at', 'modified_at',
+    'accessed_at', 'parent_folder', 'depth_level', 'is_main_entry', 'dependencies', 'imports',
+    'exports', 'functions', 'classes', 'linked_outputs', 'linked_inputs', 'execution_count',
+    'last_execution', 'quality_score', 'test_coverage'
+)
+
+FOLDER_COLUMNS = (
+    'folder_path', 'depth_level', 'file_count', 'subfolder_count', 'total_size_bytes',
+    'created_at', 'modified_at', 'purpose', 'is_venv', 'is_git', 'is_config', 'is_source',
+    'is_test', 'is_output', 'canonical_index'
+)
+
+
+def _upsert_sql(table: str, columns: Tuple[str, ...]) -> str:
+    """Build a reusable upsert statement keyed on the first column"""
+    updates = ", ".join(f"{col} = excluded.{col}" for col in columns[1:])
+    return (
+        f"INSERT INTO {table} ({', '.join(columns)}) "
+        f"VALUES ({', '.join('?' for _ in columns)}) "
+        f"ON CONFLICT({columns[0]}) DO UPDATE SET {updates}"
+    )
+
+
+FILE_UPSERT_SQL = _upsert_sql('file_metadata', FILE_COLUMNS)
+FOLDER_UPSERT_SQL = _upsert_sql('folder_metadata', FOLDER_COLUMNS)
+
+# Rows per transaction for bulk ingestion
+INGEST_BATCH_SIZE = 5000
+
 
 class FileType(Enum):
     """TODO: Add class description"""
@@ -148,19 +184,36 @@ class TemporalMetadataEngine:
     - CI/CD quality metrics
     """
     
-    def __init__(self, workspace_root: Path, db_path: Optional[Path] = None):
-        """TODO: Add function description"""
+    def __init__(self, workspace_root: Path, db_path: Optional[Path] = None,
+                 ingest_batch_size: int = INGEST_BATCH_SIZE):
+        """
+        Initialize engine
+
+        Args:
+            workspace_root: Workspace to track
+            db_path: SQLite database (default: <workspace>/.dmaic/temporal_metadata.db)
+            ingest_batch_size: Rows per transaction for bulk ingestion
+        """
 
         self.workspace_root = Path(workspace_root)
         self.db_path = db_path or (self.workspace_root / ".dmaic" / "temporal_metadata.db")
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ingest_batch_size = ingest_batch_size
+        self.last_ingest_stats: Dict[str, Any] = {}
         
         self._init_database()
         self.file_type_map = self._build_file_type_map()
         
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection in WAL mode (readers never block the writer)"""
+        conn = sqlite3.connect(str(self.db_path))
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
     def _init_database(self) -> Any:
         """Initialize SQLite database with comprehensive schema"""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -285,54 +338,79 @@ def _build_file_type_map(self) -> Dict[str, FileType]:
             '.bas': FileType.VBA,
         }
         
-    def scan_workspace(self) -> Tuple[List[FileMetadata], List[FolderMetadata]]:
+    SKIP_DIRS = {'__pycache__', '.git', 'node_modules', '.pytest_cache', '.mypy_cache',
+                 '.tox', 'dist', 'build'}
+    SKIP_FILES = {'.DS_Store'}
+    SKIP_SUFFIXES = ('.pyc',)
+
+    def scan_workspace(self, max_workers: Optional[int] = None) -> Tuple[List[FileMetadata], List[FolderMetadata]]:
         """
         Scan entire workspace and generate comprehensive metadata
-        
+
+        Directories are listed in parallel with os.scandir and pruned by
+        name before they are entered; file hashing and Python analysis run
+        in the same worker that listed the directory.
+
+        Args:
+            max_workers: Scanner thread count (default: ThreadPoolExecutor's)
+
         Returns:
             Tuple of (file_metadata_list, folder_metadata_list)
         """
         files = []
         folders = []
-        
-        for path in self.workspace_root.rglob('*'):
-            if self._should_skip(path):
-                continue
-                
-            if path.is_file():
-                file_meta = self._extract_file_metadata(path)
-                files.append(file_meta)
-                self._store_file_metadata(file_meta)
-            elif path.is_dir():
-                folder_meta = self._extract_folder_metadata(path)
-                folders.append(folder_meta)
-                self._store_folder_metadata(folder_meta)
-                
+
+        for listing, file_metas in parallel_scan(
+            self.workspace_root,
+            skip_dir=lambda name, path: name in self.SKIP_DIRS,
+            skip_file=self._skip_file_name,
+            process=self._extract_listing_files,
+            max_workers=max_workers,
+            include_top=True
+        ):
+            files.extend(file_metas)
+            if os.path.normpath(listing.path) != os.path.normpath(str(self.workspace_root)):
+                folders.append(self._folder_metadata_from_listing(listing))
+
+        files.sort(key=lambda m: m.file_path)
+        folders.sort(key=lambda m: m.folder_path)
+
+        self.last_ingest_stats = self.store_metadata_bulk(files, folders)
+
         return files, folders
-        
+
+    def _skip_file_name(self, name: str) -> bool:
+        """Determine if a file name should be skipped"""
+        return name in self.SKIP_FILES or name.endswith(self.SKIP_SUFFIXES)
+
     def _should_skip(self, path: Path) -> bool:
         """Determine if path should be skipped"""
-        skip_patterns = [
-            '__pycache__',
-            '.git',
-            'node_modules',
-            '.pytest_cache',
-            '.mypy_cache',
-            '.tox',
-            'dist',
-            'build',
-            '*.pyc',
-            '.DS_Store'
+        rel_parts = Path(path).relative_to(self.workspace_root).parts
+        if any(part in self.SKIP_DIRS for part in rel_parts):
+            return True
+        return self._skip_file_name(Path(path).name)
+
+    def _extract_listing_files(self, listing: DirListing) -> List[FileMetadata]:
+        """Worker-side metadata extraction for the files of one directory"""
+        return [
+            self._extract_file_metadata(Path(listing.path) / name, stat=file_stat)
+            for name, file_stat in listing.files
         ]
-        
-        for pattern in skip_patterns:
-            if pattern in str(path):
-                return True
-        return False
-        
-    def _extract_file_metadata(self, file_path: Path) -> FileMetadata:
-        """Extract comprehensive metadata from file"""
-        stat = file_path.stat()
+
+    def _folder_metadata_from_listing(self, listing: DirListing) -> FolderMetadata:
+        """Build folder metadata from a scanned listing without re-statting"""
+        return self._extract_folder_metadata(
+            Path(listing.path),
+            stat=listing.stat,
+            file_count=len(listing.files),
+            subfolder_count=len(listing.subdirs),
+            total_size=sum(file_stat.st_size for _, file_stat in listing.files)
+        )
+
+    def _extract_file_metadata(self, file_path: Path,
+                               stat: Optional[os.stat_result] = None) -> FileMetadata:
+        """Extract comprehensive metadata from file (stat reused when given)"""
+        stat = stat or file_path.stat()
         
         file_type = self._determine_file_type(file_path)
         hash_val = self._compute_file_hash(file_path)
@@ -342,15 +420,10 @@ def _extract_file_metadata(self, file_path: Path) -> FileMetadata:
         
         is_main = file_path.name in ['main.py', '__main__.py', 'app.py', 'run.py']
         
-        dependencies,
-            imports,
-            exports,
-            functions,
-            classes = self._analyze_python_file(file_path) if file_type == FileType.PYTHON else ([],
-            [],
-            [],
-            [],
-            [])
+        if file_type == FileType.PYTHON:
+            dependencies, imports, exports, functions, classes = self._analyze_python_file(file_path)
+        else:
+            dependencies, imports, exports, functions, classes = [], [], [], [], []
         
         return FileMetadata(
             file_path=str(file_path.relative_to(self.workspace_root)),
@@ -379,54 +452,43 @@ def _determine_file_type(self, file_path: Path) -> FileType:
         return self.file_type_map.get(suffix, FileType.OTHER)
         
     def _compute_file_hash(self, file_path: Path) -> str:
-        """Compute SHA256 hash of file"""
+        """Compute SHA256 hash of file, streamed in fixed-size blocks"""
         try:
-            with open(file_path, 'rb') as f:
-                return hashlib.sha256(f.read()).hexdigest()
-        except:
+            return compute_file_hash(file_path)
+        except OSError:
             return "error_computing_hash"
             
-    def _analyze_python_file(self,
-        file_path: Path) -> Tuple[List[str],
-        List[str],
-        List[str],
-        List[str],
-        List[str]]:
+    def _analyze_python_file(self, file_path: Path) -> Tuple[List[str], List[str], List[str],
+                                                             List[str], List[str]]:
         """Analyze Python file for dependencies, imports, exports, functions, classes"""
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            
-            imports = []
-            functions = []
-            classes = []
-            
-            for line in content.split('\n'):
-                line = line.strip()
-                if line.startswith('import ') or line.startswith('from '):
-                    imports.append(line)
-                elif line.startswith('def '):
-                    func_name = line.split('(')[0].replace('def ', '').strip()
-                    functions.append(func_name)
-                elif line.startswith('class '):
-                    class_name = line.split('(')[0].split(':')[0].replace('class ', '').strip()
-                    classes.append(class_name)
-                    
-            dependencies = [imp.split()[1].split('.')[0] for imp in imports if 'import' in imp]
-            exports = functions + classes
-            
-            return dependencies, imports, exports, functions, classes
-        except:
+            elements = extract_file(file_path)
+        except OSError:
             return [], [], [], [], []
+        if elements.syntax_error:
+            return [], [], [], [], []
+
+        imports = list(elements.module_imports)
+        functions = [f.name for f in elements.functions]
+        classes = [c.name for c in elements.classes]
+        dependencies = sorted({name.split('.')[0] for name in imports})
+        exports = functions + classes
+
+        return dependencies, imports, exports, functions, classes
             
-    def _extract_folder_metadata(self, folder_path: Path) -> FolderMetadata:
-        """Extract metadata from folder"""
-        stat = folder_path.stat()
-        
-        files = list(folder_path.glob('*'))
-        file_count = sum(1 for f in files if f.is_file())
-        subfolder_count = sum(1 for f in files if f.is_dir())
-        
-        total_size = sum(f.stat().st_size for f in files if f.is_file())
+    def _extract_folder_metadata(self, folder_path: Path,
+                                 stat: Optional[os.stat_result] = None,
+                                 file_count: Optional[int] = None,
+                                 subfolder_count: Optional[int] = None,
+                                 total_size: Optional[int] = None) -> FolderMetadata:
+        """Extract metadata from folder (precomputed counts reused when given)"""
+        stat = stat or folder_path.stat()
+
+        if file_count is None or subfolder_count is None or total_size is None:
+            files = list(folder_path.glob('*'))
+            file_count = sum(1 for f in files if f.is_file())
+            subfolder_count = sum(1 for f in files if f.is_dir())
+            total_size = sum(f.stat().st_size for f in files if f.is_file())
         
         depth = len(folder_path.relative_to(self.workspace_root).parts)
         
@@ -485,16 +547,10 @@ def _determine_folder_purpose(self, folder_path: Path) -> str:
         
         return purpose_map.get(name, 'General Purpose')
         
-    def _store_file_metadata(self, metadata: FileMetadata):
-        """Store file metadata in database"""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            INSERT OR REPLACE INTO file_metadata VALUES (
-                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
-            )
-        """, (
+    @staticmethod
+    def _file_row(metadata: FileMetadata) -> Tuple:
+        """Row tuple in FILE_COLUMNS order"""
+        return (
             metadata.file_path,
             metadata.file_type.value,
             metadata.size_bytes,
@@ -516,21 +572,12 @@ def _store_file_metadata(self, metadata: FileMetadata):
             metadata.last_execution,
             metadata.quality_score,
             metadata.test_coverage
-        ))
-        
-        conn.commit()
-        conn.close()
-        
-    def _store_folder_metadata(self, metadata: FolderMetadata):
-        """Store folder metadata in database"""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            INSERT OR REPLACE INTO folder_metadata VALUES (
-                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
-            )
-        """, (
+        )
+
+    @staticmethod
+    def _folder_row(metadata: FolderMetadata) -> Tuple:
+        """Row tuple in FOLDER_COLUMNS order"""
+        return (
             metadata.folder_path,
             metadata.depth_level,
             metadata.file_count,
@@ -546,14 +593,64 @@ def _store_folder_metadata(self, metadata: FolderMetadata):
             int(metadata.is_test),
             int(metadata.is_output),
             metadata.canonical_index
-        ))
-        
-        conn.commit()
+        )
+
+    def _store_file_metadata(self, metadata: FileMetadata):
+        """Store file metadata in database"""
+        conn = self._connect()
+        with conn:
+            conn.execute(FILE_UPSERT_SQL, self._file_row(metadata))
         conn.close()
-        
+
+    def _store_folder_metadata(self, metadata: FolderMetadata):
+        """Store folder metadata in database"""
+        conn = self._connect()
+        with conn:
+            conn.execute(FOLDER_UPSERT_SQL, self._folder_row(metadata))
+        conn.close()
+
+    def store_metadata_bulk(self, files: List[FileMetadata],
+                            folders: List[FolderMetadata]) -> Dict[str, Any]:
+        """
+        Upsert file and folder metadata over one connection
+
+        Rows are written with executemany, one transaction per
+        ``ingest_batch_size`` rows.
+
+        Args:
+            files: File metadata to store
+            folders: Folder metadata to store
+
+        Returns:
+            Ingestion stats (rows, batches, seconds, rows_per_second)
+        """
+        start = time.perf_counter()
+        batches = 0
+        conn = self._connect()
+        try:
+            for sql, rows in ((FILE_UPSERT_SQL, [self._file_row(m) for m in files]),
+                              (FOLDER_UPSERT_SQL, [self._folder_row(m) for m in folders])):
+                for offset in range(0, len(rows), self.ingest_batch_size):
+                    with conn:
+                        conn.executemany(sql, rows[offset:offset + self.ingest_batch_size])
+                    batches += 1
+        finally:
+            conn.close()
+
+        elapsed = time.perf_counter() - start
+        total_rows = len(files) + len(folders)
+        return {
+            'rows': total_rows,
+            'file_rows': len(files),
+            'folder_rows': len(folders),
+            'batches': batches,
+            'seconds': round(elapsed, 4),
+            'rows_per_second': round(total_rows / elapsed, 1) if elapsed > 0 else 0.0
+        }
+
     def record_execution(self, execution: ExecutionMetadata):
         """Record execution metadata"""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -614,7 +711,7 @@ def create_digital_twin(self) -> DigitalTwinState:
         
     def _store_digital_twin(self, twin: DigitalTwinState):
         """Store digital twin state in database"""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -651,6 +748,7 @@ def generate_hierarchy_report(self, output_path: Path):
                 'file_types': self._count_file_types(files),
                 'folder_purposes': self._count_folder_purposes(folders)
             },
+            'ingest_stats': self.last_ingest_stats,
             'files': [asdict(f) for f in files],
             'folders': [asdict(f) for f in folders],
             'main_entry_points': [f.file_path for f in files if f.is_main_entry],
@@ -4,12 +4,18 @@
 Maps DMAIC phases to 12 temporal clusters for parallel processing
 """
 
+import os
 import time
 import json
+import queue
+import threading
+import inspect
+import importlib
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Callable
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 
 try:
     import sys
@@ -40,6 +46,99 @@ def __init__(self, cluster_id: int, name: str, phase: str, priority: int = 5):
         self.tasks_failed = 0
 
 
+@dataclass
+class TaskDescriptor:
+    """
+    Picklable description of a cluster task
+
+    Process-pool workers cannot receive bound methods or lambdas, so tasks
+    are described by a dotted "package.module:function" target that each
+    worker resolves on its own side.
+    """
+    target: str
+    args: tuple = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    key: Optional[str] = None
+    weight: int = 0
+
+    @classmethod
+    def from_task(cls, task: Dict[str, Any]) -> Optional['TaskDescriptor']:
+        """Build a descriptor from a task dict, or None if it cannot be pickled"""
+        target = task.get("target")
+        if target is None:
+            func = task.get("func")
+            qualname = getattr(func, "__qualname__", "<")
+            if not callable(func) or inspect.ismethod(func) or "<" in qualname:
+                return None
+            target = f"{func.__module__}:{qualname}"
+
+        return cls(
+            target=target,
+            args=tuple(task.get("args", ())),
+            kwargs=dict(task.get("kwargs", {})),
+            key=task.get("key", task.get("file_path")),
+            weight=task_weight(task)
+        )
+
+
+def task_weight(task: Dict[str, Any]) -> int:
+    """
+    Relative cost of a task used for largest-first ordering
+
+    Uses an explicit "weight" entry when present, otherwise the size in
+    bytes of the task's "file_path".
+    """
+    weight = task.get("weight")
+    if weight is None and task.get("file_path"):
+        try:
+            weight = os.path.getsize(task["file_path"])
+        except OSError:
+            weight = 0
+    return weight or 0
+
+
+def resolve_target(target: str) -> Callable:
+    """Resolve a "package.module:function" target to a callable"""
+    module_name, _, attr_path = target.partition(":")
+    obj = importlib.import_module(module_name)
+    for part in attr_path.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+def interleave_batches(descriptors: List[TaskDescriptor], batch_size: int) -> List[List[TaskDescriptor]]:
+    """
+    Deal largest-first descriptors round-robin into batches
+
+    Contiguous slices would put all of the heaviest tasks into the first
+    batch (and onto one worker); dealing them out gives every batch a
+    similar mix of large and small tasks, each still largest first.
+    """
+    count = max(1, -(-len(descriptors) // max(1, batch_size)))
+    batches: List[List[TaskDescriptor]] = [[] for _ in range(count)]
+    for idx, descriptor in enumerate(descriptors):
+        batches[idx % count].append(descriptor)
+    return [batch for batch in batches if batch]
+
+
+def _run_task_batch(batch: List[TaskDescriptor]) -> List[Dict[str, Any]]:
+    """Execute a batch of descriptors inside a worker process"""
+    worker = os.getpid()
+    outcomes = []
+    for descriptor in batch:
+        task_start = time.time()
+        try:
+            result = resolve_target(descriptor.target)(*descriptor.args, **descriptor.kwargs)
+            outcome = {"key": descriptor.key, "success": True,
+                       "result": result, "error": None, "worker": worker}
+        except Exception as e:
+            outcome = {"key": descriptor.key, "success": False,
+                       "result": None, "error": str(e)[:200], "worker": worker}
+        outcome["duration"] = time.time() - task_start
+        outcomes.append(outcome)
+    return outcomes
+
+
 class TwelveClusterOrchestrator:
     """
     12-Cluster Parallel Execution Orchestrator
@@ -51,12 +150,27 @@ class TwelveClusterOrchestrator:
     - Cluster 7-8: Phase 5-6 (Control/Knowledge) - Quality gates & DOW
     - Cluster 9-10: Phase 7 (Action Tracking) - Feedback loops
     - Cluster 11-12: Phase 8 (TODO Management) - Task tracking
+
+    Backends:
+    - "thread": one thread per phase cluster (default, accepts any callable)
+    - "process": process pool sized by process_workers (defaults to CPU count),
+      for CPU-bound work; tasks must be expressible as TaskDescriptor
     """
+
+    BACKENDS = ("thread", "process")
     
-    def __init__(self, max_workers: int = 12, use_keb: bool = True, use_gbogeb: bool = True):
+    def __init__(self, max_workers: int = 12, use_keb: bool = True, use_gbogeb: bool = True,
+                 backend: str = "thread", process_workers: Optional[int] = None,
+                 batch_size: int = 32):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}', expected one of {self.BACKENDS}")
+
         self.max_workers = max_workers
         self.use_keb = use_keb and KEB_AVAILABLE
         self.use_gbogeb = use_gbogeb and GBOGEB_AVAILABLE
+        self.backend = backend
+        self.process_workers = process_workers or os.cpu_count() or 1
+        self.batch_size = max(1, batch_size)
         
         self.clusters = self._initialize_clusters()
         self.keb = None
@@ -70,7 +184,8 @@ def __init__(self, max_workers: int = 12, use_keb: bool = True, use_gbogeb: bool
             print("[12-CLUSTER] Initializing GBOGEB observability...")
             self.gbogeb = GBOGEB(workspace="DMAIC_V3_OUTPUT/12cluster_workspace")
         
-        print(f"[12-CLUSTER] Orchestrator initialized with {len(self.clusters)} clusters")
+        print(f"[12-CLUSTER] Orchestrator initialized with {len(self.clusters)} clusters "
+              f"({self.backend} backend)")
     
     def _initialize_clusters(self) -> Dict[int, ClusterConfig]:
         """Initialize 12 clusters with DMAIC phase mapping"""
@@ -96,17 +211,28 @@ def _initialize_clusters(self) -> Dict[int, ClusterConfig]:
         return clusters
     
     def execute_phase_parallel(self, phase: str, tasks: List[Dict[str, Any]], 
-                               iteration: int) -> Dict[str, Any]:
+                               iteration: int,
+                               on_result: Optional[Callable[[Dict[str, Any]], None]] = None
+                               ) -> Dict[str, Any]:
         """
         Execute a DMAIC phase across multiple clusters in parallel
         
         Args:
             phase: Phase name (e.g., "phase1", "phase2")
-            tasks: List of tasks to distribute across clusters
+            tasks: List of tasks to distribute across clusters. Each task is a dict
+                with either "func" (callable) or "target" ("module:function"),
+                plus optional "args", "kwargs", "key"/"file_path" and "weight"
+                (defaults to the size of "file_path"). Tasks are dispatched
+                largest first from a shared work queue, so idle clusters keep
+                pulling work until the queue is drained
             iteration: Current iteration number
+            on_result: Optional callback invoked with each task outcome as soon
+                as it is available (process backend streams per worker batch)
             
         Returns:
-            Execution results
+            Execution results, including "results_map" keyed by task key and
+            "cluster_stats" utilization (per cluster for the thread backend,
+            per worker process for the process backend)
         """
         print(f"\n[12-CLUSTER] Executing {phase} across clusters (iteration {iteration})")
         
@@ -117,11 +243,19 @@ def execute_phase_parallel(self, phase: str, tasks: List[Dict[str, Any]],
             print(f"[12-CLUSTER] No tasks to execute for {phase}")
             return {"success": True, "tasks_executed": 0, "clusters_used": 0}
         
-        chunk_size = max(1, len(tasks) // len(phase_clusters))
-        task_chunks = [tasks[i:i + chunk_size] for i in range(0, len(tasks), chunk_size)]
-        
+        # Largest tasks first so long-running files never start last
+        ordered_tasks = sorted(tasks, key=task_weight, reverse=True)
+
+        if self.backend == "process" and not (self.use_keb and self.keb):
+            descriptors = [TaskDescriptor.from_task(task) for task in ordered_tasks]
+            if all(d is not None for d in descriptors):
+                results = self._execute_process_pool(phase, phase_clusters, descriptors, on_result)
+                self._record_phase_metric(phase, iteration, phase_clusters, results)
+                return results
+            print("[12-CLUSTER] Tasks are not picklable, falling back to thread backend")
+
         print(f"[12-CLUSTER] Distributing {len(tasks)} tasks across {len(phase_clusters)} clusters")
-        print(f"[12-CLUSTER] Chunk size: ~{chunk_size} tasks per cluster")
+        print(f"[12-CLUSTER] Scheduling: shared work queue, largest tasks first")
         
         start_time = time.time()
         results = []
@@ -129,17 +263,16 @@ def execute_phase_parallel(self, phase: str, tasks: List[Dict[str, Any]],
         if self.use_keb and self.keb:
             self.keb.start()
             
-            for idx, (cluster, chunk) in enumerate(zip(phase_clusters, task_chunks)):
+            for task_idx, task in enumerate(ordered_tasks):
+                cluster = phase_clusters[task_idx % len(phase_clusters)]
                 cluster.status = "running"
-                
-                for task_idx, task in enumerate(chunk):
-                    task_id = f"{phase}_cluster{cluster.cluster_id}_task{task_idx}"
-                    self.keb.schedule_task(
-                        task_id=task_id,
-                        func=self._execute_task,
-                        priority=cluster.priority,
-                        args=(task, cluster)
-                    )
+                task_id = f"{phase}_cluster{cluster.cluster_id}_task{task_idx}"
+                self.keb.schedule_task(
+                    task_id=task_id,
+                    func=self._execute_task,
+                    priority=cluster.priority,
+                    args=(task, cluster)
+                )
             
             while not self.keb.task_queue.empty():
                 time.sleep(0.1)
@@ -160,39 +293,58 @@ def execute_phase_parallel(self, phase: str, tasks: List[Dict[str, Any]],
                 "execution_time": time.time() - start_time
             }
         else:
+            work_queue = queue.SimpleQueue()
+            for task in ordered_tasks:
+                work_queue.put(task)
+            result_lock = threading.Lock()
+
             with ThreadPoolExecutor(max_workers=len(phase_clusters)) as executor:
                 futures = {}
                 
-                for cluster, chunk in zip(phase_clusters, task_chunks):
+                for cluster in phase_clusters:
                     cluster.status = "running"
-                    future = executor.submit(self._execute_cluster_tasks, cluster, chunk)
+                    future = executor.submit(self._drain_work_queue, cluster, work_queue,
+                                             on_result, result_lock)
                     futures[future] = cluster
                 
-                cluster_results = []
+                cluster_results = {}
+                results_map = {}
                 for future in as_completed(futures):
                     cluster = futures[future]
                     try:
                         result = future.result()
-                        cluster_results.append(result)
-                        cluster.tasks_executed += result.get("tasks_executed", 0)
-                        cluster.tasks_failed += result.get("tasks_failed", 0)
+                        cluster_results[cluster.name] = result
+                        for outcome in result["outcomes"]:
+                            if outcome["key"] is not None:
+                                results_map[outcome["key"]] = outcome["result"]
+                        cluster.tasks_executed += result["tasks_executed"]
+                        cluster.tasks_failed += result["tasks_failed"]
                     except Exception as e:
                         print(f"[12-CLUSTER] Cluster {cluster.name} failed: {e}")
-                        cluster.tasks_failed += len(chunk)
                     finally:
                         cluster.status = "idle"
                 
-                total_executed = sum(r.get("tasks_executed", 0) for r in cluster_results)
-                total_failed = sum(r.get("tasks_failed", 0) for r in cluster_results)
-                
-                results = {
-                    "success": total_failed == 0,
-                    "tasks_executed": total_executed,
-                    "tasks_failed": total_failed,
-                    "clusters_used": len(phase_clusters),
-                    "execution_time": time.time() - start_time
-                }
+            wall_time = time.time() - start_time
+            total_executed = sum(r["tasks_executed"] for r in cluster_results.values())
+            total_failed = sum(r["tasks_failed"] for r in cluster_results.values())
+            
+            results = {
+                "success": total_failed == 0,
+                "tasks_executed": total_executed,
+                "tasks_failed": total_failed,
+                "clusters_used": len(phase_clusters),
+                "execution_time": wall_time,
+                "backend": "thread",
+                "cluster_stats": self._utilization_stats(cluster_results, wall_time),
+                "results_map": results_map
+            }
         
+        self._record_phase_metric(phase, iteration, phase_clusters, results)
+        return results
+
+    def _record_phase_metric(self, phase: str, iteration: int,
+                             phase_clusters: List[ClusterConfig], results: Dict[str, Any]):
+        """Report phase execution to GBOGEB and the console"""
         if self.use_gbogeb and self.gbogeb:
             self.gbogeb.collect_metric(
                 agent="12cluster_orchestrator",
@@ -203,29 +355,140 @@ def execute_phase_parallel(self, phase: str, tasks: List[Dict[str, Any]],
         
         print(f"[12-CLUSTER] {phase} complete: {results['tasks_executed']} executed, "
               f"{results['tasks_failed']} failed in {results['execution_time']:.2f}s")
-        
-        return results
+
+    def _execute_process_pool(self, phase: str, phase_clusters: List[ClusterConfig],
+                              descriptors: List[TaskDescriptor],
+                              on_result: Optional[Callable[[Dict[str, Any]], None]]
+                              ) -> Dict[str, Any]:
+        """Execute task descriptors on a process pool, streaming batch results"""
+        batches = interleave_batches(descriptors, self.batch_size)
+        workers = min(self.process_workers, len(batches))
+
+        print(f"[12-CLUSTER] Distributing {len(descriptors)} tasks in {len(batches)} batches "
+              f"across {workers} worker processes")
+
+        start_time = time.time()
+        results_map = {}
+        worker_stats: Dict[str, Dict[str, Any]] = {}
+        total_executed = 0
+        total_failed = 0
+
+        for cluster in phase_clusters:
+            cluster.status = "running"
+
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {}
+                for idx, batch in enumerate(batches):
+                    future = executor.submit(_run_task_batch, batch)
+                    futures[future] = (phase_clusters[idx % len(phase_clusters)], batch)
+
+                for future in as_completed(futures):
+                    cluster, batch = futures[future]
+                    try:
+                        outcomes = future.result()
+                    except Exception as e:
+                        print(f"[12-CLUSTER] Worker batch failed in {cluster.name}: {e}")
+                        outcomes = [{"key": d.key, "success": False, "result": None,
+                                     "error": str(e)[:200], "worker": None} for d in batch]
+
+                    for descriptor, outcome in zip(batch, outcomes):
+                        stats = worker_stats.setdefault(
+                            f"worker-{outcome['worker']}",
+                            {"tasks_executed": 0, "tasks_failed": 0, "busy_time": 0.0, "weight": 0})
+                        stats["busy_time"] += outcome.get("duration", 0.0)
+                        stats["weight"] += descriptor.weight
+                        if outcome["success"]:
+                            stats["tasks_executed"] += 1
+                            cluster.tasks_executed += 1
+                            total_executed += 1
+                        else:
+                            stats["tasks_failed"] += 1
+                            cluster.tasks_failed += 1
+                            total_failed += 1
+                        if outcome["key"] is not None:
+                            results_map[outcome["key"]] = outcome["result"]
+                        if on_result:
+                            on_result(outcome)
+        finally:
+            for cluster in phase_clusters:
+                cluster.status = "idle"
+
+        wall_time = time.time() - start_time
+        return {
+            "success": total_failed == 0,
+            "tasks_executed": total_executed,
+            "tasks_failed": total_failed,
+            "clusters_used": len(phase_clusters),
+            "execution_time": wall_time,
+            "backend": "process",
+            "workers": workers,
+            "worker_stats": worker_stats,
+            "cluster_stats": self._utilization_stats(worker_stats, wall_time),
+            "results_map": results_map
+        }
     
-    def _execute_cluster_tasks(self, cluster: ClusterConfig, tasks: List[Dict]) -> Dict:
-        """Execute tasks for a single cluster"""
+    def _drain_work_queue(self, cluster: ClusterConfig, work_queue: queue.SimpleQueue,
+                          on_result: Optional[Callable[[Dict[str, Any]], None]],
+                          result_lock: threading.Lock) -> Dict:
+        """Pull tasks from the shared queue until it is empty"""
         executed = 0
         failed = 0
+        busy_time = 0.0
+        weight = 0
+        outcomes = []
         
-        for task in tasks:
+        while True:
+            try:
+                task = work_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            key = task.get("key", task.get("file_path"))
+            task_start = time.time()
             try:
-                self._execute_task(task, cluster)
+                result = self._execute_task(task, cluster)
                 executed += 1
+                outcome = {"key": key, "success": True, "result": result,
+                           "error": None, "worker": cluster.name}
             except Exception as e:
                 print(f"[12-CLUSTER] Task failed in {cluster.name}: {e}")
                 failed += 1
+                outcome = {"key": key, "success": False, "result": None,
+                           "error": str(e)[:200], "worker": cluster.name}
+            busy_time += time.time() - task_start
+            weight += task_weight(task)
+            outcomes.append(outcome)
+
+            if on_result:
+                with result_lock:
+                    on_result(outcome)
         
-        return {"tasks_executed": executed, "tasks_failed": failed}
+        return {"tasks_executed": executed, "tasks_failed": failed, "outcomes": outcomes,
+                "busy_time": busy_time, "weight": weight}
+
+    @staticmethod
+    def _utilization_stats(cluster_results: Dict[str, Dict], wall_time: float) -> Dict[str, Any]:
+        """Per-cluster (or per-worker) load balance summary"""
+        stats = {}
+        for name, result in cluster_results.items():
+            stats[name] = {
+                "tasks_executed": result["tasks_executed"],
+                "tasks_failed": result["tasks_failed"],
+                "weight": result["weight"],
+                "busy_time": round(result["busy_time"], 4),
+                "utilization": round(result["busy_time"] / wall_time, 4) if wall_time > 0 else 0.0
+            }
+        return stats
     
     def _execute_task(self, task: Dict, cluster: ClusterConfig) -> Any:
         """Execute a single task"""
         task_func = task.get("func")
         task_args = task.get("args", ())
         task_kwargs = task.get("kwargs", {})
+
+        if task_func is None and task.get("target"):
+            task_func = resolve_target(task["target"])
         
         if callable(task_func):
             return task_func(*task_args, **task_kwargs)
@@ -257,6 +520,8 @@ def generate_report(self, output_path: Path):
             "timestamp": datetime.now().isoformat(),
             "orchestrator": "12-Cluster Parallel Execution",
             "status": status,
+            "backend": self.backend,
+            "process_workers": self.process_workers,
             "keb_enabled": self.use_keb,
             "gbogeb_enabled": self.use_gbogeb
         }
@@ -276,19 +541,26 @@ def main():
     parser.add_argument("--test", action="store_true", help="Run test")
     parser.add_argument("--phase", type=str, default="phase2", help="Phase to test")
     parser.add_argument("--tasks", type=int, default=100, help="Number of test tasks")
+    parser.add_argument("--backend", choices=TwelveClusterOrchestrator.BACKENDS,
+                        default="thread", help="Execution backend")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes for the process backend (default: CPU count)")
     
     args = parser.parse_args()
     
     if args.test:
-        orchestrator = TwelveClusterOrchestrator(max_workers=12, use_keb=False, use_gbogeb=True)
+        orchestrator = TwelveClusterOrchestrator(max_workers=12, use_keb=False, use_gbogeb=True,
+                                                 backend=args.backend,
+                                                 process_workers=args.workers)
         
         test_tasks = [
-            {"func": lambda x: x * 2, "args": (i,)}
+            {"target": "operator:mul", "args": (i, 2), "key": str(i)}
             for i in range(args.tasks)
         ]
         
         results = orchestrator.execute_phase_parallel(args.phase, test_tasks, iteration=1)
         
+        results.pop("results_map", None)
         print("\n[12-CLUSTER] Test Results:")
         print(json.dumps(results, indent=2))
         
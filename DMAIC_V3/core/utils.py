@@ -40,10 +40,13 @@ def compute_hash(data: Union[str, bytes, Dict, List]) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
-def compute_file_hash(file_path: Path) -> str:
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def compute_file_hash(file_path: Path, block_size: int = HASH_BLOCK_SIZE) -> str:
     sha256_hash = hashlib.sha256()
     with open(file_path, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
+        for byte_block in iter(lambda: f.read(block_size), b""):
             sha256_hash.update(byte_block)
     return sha256_hash.hexdigest()
 
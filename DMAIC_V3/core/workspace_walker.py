@@ -0,0 +1,207 @@
+"""
+DMAIC V3.3 - Resumable Workspace Walker
+Version: 3.3.0
+
+Deterministic, pruning directory walk whose position can be checkpointed
+as a tiny cursor and resumed exactly where it stopped.
+
+The walk is pre-order with entries sorted by name: a directory's files
+are yielded first, then its subdirectories are walked in name order.
+Because the order is fully determined by names, a cursor of
+(directory, last file) is enough to rebuild the pending directory stack
+on resume by listing only the directories on the cursor's path, i.e.
+O(depth) work instead of re-walking everything already scanned.
+
+parallel_scan() is the unordered counterpart for full scans: directories
+are listed with os.scandir on a thread pool, pruned by name before they
+are entered, and each listing carries the DirEntry stat results so
+callers never stat a file twice.
+"""
+
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+class ResumableWalker:
+    """
+    Sorted pre-order walker with O(depth) resume
+
+    Usage:
+        walker = ResumableWalker(root, skip_dir=lambda name, path: name == '.git')
+        for dirpath, filenames in walker.walk(resume=cursor):
+            for name in filenames:
+                ...
+                cursor = walker.cursor(dirpath, name)
+    """
+
+    def __init__(self, top: str, skip_dir: Optional[Callable[[str, str], bool]] = None):
+        """
+        Initialize walker
+
+        Args:
+            top: Root directory to walk
+            skip_dir: Predicate (name, path) returning True for directories
+                that must not be descended into
+        """
+        self.top = os.path.normpath(str(top))
+        self.skip_dir = skip_dir or (lambda name, path: False)
+        self.dirs_listed = 0
+
+    def _list(self, path: str) -> Tuple[List[str], List[str]]:
+        """Return sorted (subdirectories, files) of a directory"""
+        self.dirs_listed += 1
+        subdirs = []
+        files = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not self.skip_dir(entry.name, entry.path):
+                                subdirs.append(entry.name)
+                        elif not entry.is_dir():
+                            files.append(entry.name)
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        subdirs.sort()
+        files.sort()
+        return subdirs, files
+
+    def cursor(self, dirpath: str, filename: str) -> Dict[str, str]:
+        """
+        Build a resume cursor for the last fully processed file
+
+        Args:
+            dirpath: Directory yielded by walk()
+            filename: Last file processed in that directory
+
+        Returns:
+            JSON-serializable cursor
+        """
+        return {'dir': os.path.relpath(dirpath, self.top), 'file': filename}
+
+    def walk(self, resume: Optional[Dict[str, str]] = None) -> Iterator[Tuple[str, List[str]]]:
+        """
+        Walk the tree, optionally resuming after a cursor
+
+        Args:
+            resume: Cursor returned by cursor(); the walk continues with the
+                file after it
+
+        Yields:
+            (dirpath, filenames) for each directory, in sorted pre-order
+        """
+        stack: List[str] = []
+
+        if resume is None:
+            stack.append(self.top)
+        else:
+            rel_dir = os.path.normpath(resume['dir'])
+            parts = [] if rel_dir == os.curdir else rel_dir.split(os.sep)
+
+            # Siblings after each component of the cursor path are still pending;
+            # push shallow ones first so deeper ones are popped first.
+            parent = self.top
+            for part in parts:
+                siblings, _ = self._list(parent)
+                stack.extend(os.path.join(parent, name)
+                             for name in reversed(siblings) if name > part)
+                parent = os.path.join(parent, part)
+
+            subdirs, files = self._list(parent)
+            stack.extend(os.path.join(parent, name) for name in reversed(subdirs))
+            remaining = [name for name in files if name > resume['file']]
+            if remaining:
+                yield parent, remaining
+
+        while stack:
+            dirpath = stack.pop()
+            subdirs, files = self._list(dirpath)
+            stack.extend(os.path.join(dirpath, name) for name in reversed(subdirs))
+            if files:
+                yield dirpath, files
+
+
+@dataclass
+class DirListing:
+    """One directory as seen by parallel_scan()"""
+    path: str
+    stat: Optional[os.stat_result]
+    files: List[Tuple[str, os.stat_result]] = field(default_factory=list)
+    subdirs: List[str] = field(default_factory=list)
+
+
+def _scan_dir(path: str, skip_dir: Callable[[str, str], bool],
+              skip_file: Callable[[str], bool]) -> DirListing:
+    """List one directory, keeping the stat results from the scandir entries"""
+    try:
+        dir_stat = os.stat(path)
+    except OSError:
+        dir_stat = None
+    listing = DirListing(path=path, stat=dir_stat)
+
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not skip_dir(entry.name, entry.path):
+                            listing.subdirs.append(entry.name)
+                    elif entry.is_file() and not skip_file(entry.name):
+                        listing.files.append((entry.name, entry.stat()))
+                except OSError:
+                    continue
+    except OSError:
+        pass
+
+    listing.subdirs.sort()
+    listing.files.sort(key=lambda item: item[0])
+    return listing
+
+
+def parallel_scan(top: str,
+                  skip_dir: Optional[Callable[[str, str], bool]] = None,
+                  skip_file: Optional[Callable[[str], bool]] = None,
+                  process: Optional[Callable[[DirListing], Any]] = None,
+                  max_workers: Optional[int] = None,
+                  include_top: bool = False) -> Iterator[Tuple[DirListing, Any]]:
+    """
+    Walk a tree on a thread pool
+
+    Each worker lists one directory and, if given, runs ``process`` on the
+    listing in the same worker, so per-directory work (hashing, parsing)
+    runs concurrently with the walk. Skipped directories are never entered.
+
+    Args:
+        top: Root directory
+        skip_dir: Predicate (name, path) for directories to prune
+        skip_file: Predicate (name) for files to ignore
+        process: Optional per-directory callback run in the worker
+        max_workers: Thread count (default: min(32, cpu_count + 4))
+        include_top: Also yield the root directory itself
+
+    Yields:
+        (listing, process result) in completion order
+    """
+    top = os.path.normpath(str(top))
+    skip_dir = skip_dir or (lambda name, path: False)
+    skip_file = skip_file or (lambda name: False)
+
+    def work(path: str) -> Tuple[DirListing, Any]:
+        listing = _scan_dir(path, skip_dir, skip_file)
+        return listing, (process(listing) if process else None)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {executor.submit(work, top)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                listing, result = future.result()
+                for name in listing.subdirs:
+                    pending.add(executor.submit(work, os.path.join(listing.path, name)))
+                if include_top or listing.path != top:
+                    yield listing, result
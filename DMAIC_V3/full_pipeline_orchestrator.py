@@ -21,6 +21,7 @@
 
 import sys
 import json
+import threading
 import time
 from pathlib import Path
 from datetime import datetime
@@ -33,8 +34,10 @@
 from DMAIC_V3.config import DMAICConfig
 from DMAIC_V3.core.state import StateManager
 from DMAIC_V3.core.idempotency_wrapper import enable_idempotency, GLOBAL_IDEMPOTENCY
+from DMAIC_V3.core.phase_dag import PhaseDAGExecutor, PhaseNode
 from DMAIC_V3.core.planning_matrix_tracker import PlanningMatrixTracker
 from DMAIC_V3.convergence.background_change_detector import BackgroundChangeDetector
+from DMAIC_V3.convergence.change_detector import ChangeDetector
 from DMAIC_V3.phases.phase0_init import Phase0Init
 from DMAIC_V3.phases.phase1_define import Phase1Define
 from DMAIC_V3.phases.phase2_measure import Phase2Measure
@@ -54,6 +57,9 @@
 #
 # No local class definition is required here.
 
+# Longest wait for a burst of file events to settle before an iteration
+CHANGE_SETTLE_SECONDS = 2.0
+
 class Phase7AdvancedAnalytics:
     """Phase 7 STUB: Advanced Analytics (Future expansion) - DEPRECATED
 
@@ -113,7 +119,8 @@ def __init__(self,
                  enable_idempotency_flag: bool = True,
                  enable_git_commits: bool = True,
                  verbose: bool = True,
-                 debug_port: int = None):
+                 debug_port: int = None,
+                 max_parallel_phases: int = 3):
         """Initialize the Full Pipeline Orchestrator"""
 
         self.config = DMAICConfig()
@@ -124,8 +131,10 @@ def __init__(self,
         self.enable_git_commits = enable_git_commits
         self.verbose = verbose
         self.debug_port = debug_port
+        self.max_parallel_phases = max_parallel_phases
 
         self.execution_log: List[Dict] = []
+        self._stats_lock = threading.Lock()
 
         self.statistics = {
             'phases': {},
@@ -138,23 +147,93 @@ def __init__(self,
             }
         }
 
-        if self.enable_idempotency_flag:
-            enable_idempotency(enabled=True)
+        # Phase 0 keeps this setting; Phases 2-3 are skipped on a cache hit
+        enable_idempotency(enabled=self.enable_idempotency_flag)
 
-        # Integration Point 2: Initialize background change detector
+        # Integration Point 2: Initialize background change detector; it runs
+        # from the first iteration until close()
         state_dir = self.config.paths.output_root / "convergence_state"
         self.bg_change_detector = BackgroundChangeDetector(
             workspace_root=self.config.paths.workspace_root,
             state_dir=state_dir
         )
+        self.change_detector = ChangeDetector(self.config.paths.workspace_root, state_dir)
+        self.change_window = None
 
         if self.debug_port:
             print(f"[DEBUG] Debug port enabled: {self.debug_port}")
             self._setup_debug_monitoring()
     
+    def build_phase_graph(self) -> List[PhaseNode]:
+        """
+        Declarative phase graph: what each phase reads and writes
+
+        Paths are relative to DMAIC_V3_OUTPUT/iteration_N; every input must
+        be an output of a phase the node depends on. Phases 0-5 are
+        required; 6-9 keep the continue-on-failure behavior.
+        """
+        config, state = self.config, self.state_mgr
+        return [
+            PhaseNode('phase0_init', "Phase 0: Initialization",
+                      lambda: Phase0Init(config, state),
+                      outputs=('phase0_init/',)),
+            PhaseNode('phase1_define', "Phase 1: Define",
+                      lambda: Phase1Define(config, state),
+                      depends_on=('phase0_init',),
+                      outputs=('phase1_define/',)),
+            PhaseNode('phase2_measure', "Phase 2: Measure",
+                      lambda: Phase2Measure(config, state),
+                      depends_on=('phase1_define',),
+                      inputs=('phase1_define/',),
+                      outputs=('phase2_measure/', 'phase2_metrics.json')),
+            PhaseNode('phase3_analyze', "Phase 3: Analyze",
+                      lambda: Phase3Analyze(config, state),
+                      depends_on=('phase2_measure',),
+                      inputs=('phase2_metrics.json',), outputs=('phase3_analysis.json',)),
+            PhaseNode('phase4_improve', "Phase 4: Improve",
+                      lambda: Phase4Improve(config, state),
+                      depends_on=('phase3_analyze',),
+                      inputs=('phase3_analysis.json',),
+                      outputs=('phase4_improvements.json', 'phase4_improve/')),
+            PhaseNode('phase5_control', "Phase 5: Control",
+                      lambda: Phase5Control(config, state),
+                      depends_on=('phase4_improve',),
+                      inputs=('phase4_improve/',), outputs=('phase5_control/',)),
+            PhaseNode('phase6_knowledge', "Phase 6: Knowledge (Devour/Learn)",
+                      lambda: Phase6Knowledge(config, state),
+                      depends_on=('phase4_improve',),
+                      inputs=('phase4_improvements.json',),
+                      outputs=('../phase6_knowledge/',), required=False),
+            PhaseNode('phase7_action_tracking', "Phase 7: Action Tracking",
+                      lambda: Phase7ActionTracking(config, state),
+                      depends_on=('phase5_control',),
+                      inputs=('phase0_init/', 'phase1_define/', 'phase2_measure/',
+                              'phase4_improvements.json', 'phase4_improve/', 'phase5_control/'),
+                      outputs=('phase7_action_tracking/', '../global_action_registry.db'),
+                      required=False),
+            PhaseNode('phase8_todo_management', "Phase 8: TODO Management",
+                      lambda: Phase8TODOManagement(config, state),
+                      depends_on=('phase7_action_tracking',),
+                      inputs=('phase0_init/', 'phase1_define/', 'phase2_measure/',
+                              'phase4_improve/', 'phase5_control/', 'phase7_action_tracking/'),
+                      outputs=('phase8_todo_management/', '../global_todo_registry.db'),
+                      required=False),
+            PhaseNode('phase9_documentation_generation', "Phase 9: Documentation Generation",
+                      lambda: Phase9DocumentationGeneration(config, state),
+                      depends_on=('phase5_control', 'phase7_action_tracking',
+                                  'phase8_todo_management'),
+                      inputs=('phase1_define/', 'phase2_measure/', 'phase4_improve/',
+                              'phase5_control/', 'phase7_action_tracking/',
+                              'phase8_todo_management/'),
+                      outputs=('phase9_documentation_generation/',), required=False),
+        ]
+
     def execute_full_pipeline(self, iteration: int = 1) -> bool:
         """
         Execute full pipeline for one iteration
+
+        Phases run on a dependency graph: each starts as soon as the phases
+        it reads from are done, so independent phases overlap.
         
         Args:
             iteration: Iteration number
@@ -169,114 +248,30 @@ def execute_full_pipeline(self, iteration: int = 1) -> bool:
         print(f"Start Time: {datetime.now().isoformat()}")
         print(f"Idempotency: {'ENABLED' if self.enable_idempotency_flag else 'DISABLED'}")
         print(f"Git Commits: {'ENABLED' if self.enable_git_commits else 'DISABLED'}")
+        print(f"Parallel Phases: {self.max_parallel_phases}")
         print("="*80)
         
         start_time = datetime.now()
-        phases_executed = []
         
-        # Integration Point 3: Start background change detection
+        # Integration Point 3: Start background change detection (once)
         self.bg_change_detector.start()
         
         try:
-            # Phase 0: Initialization
-            success, results = self._execute_phase_with_tracking(
-                Phase0Init(self.config, self.state_mgr),
-                "Phase 0: Initialization",
-                iteration
-            )
-            if not success:
-                return False
-            phases_executed.append('phase0_init')
-            
-            # Phase 1: Define
-            success, results = self._execute_phase_with_tracking(
-                Phase1Define(self.config, self.state_mgr),
-                "Phase 1: Define",
-                iteration
-            )
-            if not success:
-                return False
-            phases_executed.append('phase1_define')
-            
-            # Phase 2: Measure
-            success, results = self._execute_phase_with_tracking(
-                Phase2Measure(self.config, self.state_mgr),
-                "Phase 2: Measure",
-                iteration
-            )
-            if not success:
-                return False
-            phases_executed.append('phase2_measure')
-            
-            # Phase 3: Analyze
-            success, results = self._execute_phase_with_tracking(
-                Phase3Analyze(self.config, self.state_mgr),
-                "Phase 3: Analyze",
-                iteration
-            )
-            if not success:
-                return False
-            phases_executed.append('phase3_analyze')
-            
-            # Phase 4: Improve
-            success, results = self._execute_phase_with_tracking(
-                Phase4Improve(self.config, self.state_mgr),
-                "Phase 4: Improve",
-                iteration
-            )
-            if not success:
-                return False
-            phases_executed.append('phase4_improve')
-            
-            # Phase 5: Control
-            success, results = self._execute_phase_with_tracking(
-                Phase5Control(self.config, self.state_mgr),
-                "Phase 5: Control",
-                iteration
+            self._collect_changes()
+
+            executor = PhaseDAGExecutor(self.build_phase_graph(),
+                                        max_workers=self.max_parallel_phases)
+            runs, success = executor.run(
+                lambda node: self._execute_phase_with_tracking(node.factory(), node.name, iteration)
             )
+            critical_path = executor.critical_path_report(runs)
+            self._save_critical_path_report(iteration, critical_path)
+
             if not success:
                 return False
-            phases_executed.append('phase5_control')
-            
-            # Phase 6: Knowledge (Devour/Learn)
-            success, results = self._execute_phase_with_tracking(
-                Phase6Knowledge(self.config, self.state_mgr),
-                "Phase 6: Knowledge (Devour/Learn)",
-                iteration
-            )
-            if not success:
-                print("[WARNING] Phase 6 failed but continuing...")
-            phases_executed.append('phase6_knowledge')
-            
-            # Phase 7: Action Tracking
-            success, results = self._execute_phase_with_tracking(
-                Phase7ActionTracking(self.config, self.state_mgr),
-                "Phase 7: Action Tracking",
-                iteration
-            )
-            if not success:
-                print("[WARNING] Phase 7 failed but continuing...")
-            phases_executed.append('phase7_action_tracking')
-
-            # Phase 8: TODO Management
-            success, results = self._execute_phase_with_tracking(
-                Phase8TODOManagement(self.config, self.state_mgr),
-                "Phase 8: TODO Management",
-                iteration
-            )
-            if not success:
-                print("[WARNING] Phase 8 failed but continuing...")
-            phases_executed.append('phase8_todo_management')
-
-            # Phase 9: Documentation Generation
-            success, results = self._execute_phase_with_tracking(
-                Phase9DocumentationGeneration(self.config, self.state_mgr),
-                "Phase 9: Documentation Generation",
-                iteration
-            )
-            if not success:
-                print("[WARNING] Phase 9 failed but continuing...")
-            phases_executed.append('phase9_documentation_generation')
+
+            # Declaration order, as in the sequential pipeline
+            phases_executed = [pid for pid in executor.order if pid in runs]
             
             # Update planning matrix
             print("\n[TRACKING] Updating planning matrix...")
@@ -293,7 +288,8 @@ def execute_full_pipeline(self, iteration: int = 1) -> bool:
                 iteration=iteration,
                 phases_executed=phases_executed,
                 duration=duration,
-                success=True
+                success=True,
+                critical_path=critical_path
             )
 
             self._save_statistics(iteration)
@@ -316,13 +312,10 @@ def execute_full_pipeline(self, iteration: int = 1) -> bool:
             traceback.print_exc()
             return False
         finally:
-            # Integration Point 4: Stop background change detection
-            self.bg_change_detector.stop()
-            
-            # Integration Point 5: Get and display final summary
+            # Integration Point 4: Display the summary (detection keeps running)
             change_summary = self.bg_change_detector.get_summary()
             print(f"\n{'='*80}")
-            print("[Background Change Detection] Final Summary:")
+            print("[Background Change Detection] Summary:")
             print(f"  Total changes detected: {change_summary.get('total', 0)}")
             print(f"  Files added: {change_summary.get('added', 0)}")
             print(f"  Files modified: {change_summary.get('modified', 0)}")
@@ -331,6 +324,26 @@ def execute_full_pipeline(self, iteration: int = 1) -> bool:
                 print(f"  Last snapshot: {change_summary.get('timestamp')}")
             print(f"{'='*80}")
     
+    def close(self):
+        """Stop background change detection at the end of the orchestrator's lifetime"""
+        self.bg_change_detector.stop()
+
+    def _collect_changes(self):
+        """
+        Drain the files changed since the previous iteration
+
+        The window is handed to the phases and lets the ChangeDetector
+        re-list only the dirty directories. Without one (first iteration,
+        polling mode, missed events) the whole workspace is rescanned.
+        """
+        self.change_window = self.bg_change_detector.take_window(timeout=CHANGE_SETTLE_SECONDS)
+        dirty_paths = None
+        if self.change_window is not None:
+            dirty_paths = self.change_window.paths
+            print(f"[Background Change Detection] {len(dirty_paths)} paths changed "
+                  f"since the last iteration")
+        self.change_detector.detect_changes(dirty_paths=dirty_paths)
+
     def _execute_phase_with_tracking(self,
                                      phase_obj: Any,
                                      phase_name: str,
@@ -342,6 +355,11 @@ def _execute_phase_with_tracking(self,
 
         start_time = datetime.now()
 
+        # Phases that can skip unchanged files get the live change feed
+        if hasattr(phase_obj, 'change_feed'):
+            phase_obj.change_feed = self.bg_change_detector
+            phase_obj.change_window = self.change_window
+
         try:
             result = phase_obj.execute(iteration=iteration)
             
@@ -356,39 +374,8 @@ def _execute_phase_with_tracking(self,
             end_time = datetime.now()
             duration = (end_time - start_time).total_seconds()
 
-            log_entry = {
-                'phase': phase_name,
-                'iteration': iteration,
-                'success': success,
-                'duration_seconds': duration,
-                'timestamp': end_time.isoformat()
-            }
-            self.execution_log.append(log_entry)
-
-            self.statistics['orchestration']['total_phases'] += 1
-            if success:
-                self.statistics['orchestration']['successful_phases'] += 1
-            else:
-                self.statistics['orchestration']['failed_phases'] += 1
-            self.statistics['orchestration']['total_duration_seconds'] += duration
-
-            if phase_name not in self.statistics['phases']:
-                self.statistics['phases'][phase_name] = {
-                    'executions': 0,
-                    'successes': 0,
-                    'failures': 0,
-                    'total_duration': 0,
-                    'avg_duration': 0
-                }
-
-            phase_stats = self.statistics['phases'][phase_name]
-            phase_stats['executions'] += 1
-            if success:
-                phase_stats['successes'] += 1
-            else:
-                phase_stats['failures'] += 1
-            phase_stats['total_duration'] += duration
-            phase_stats['avg_duration'] = phase_stats['total_duration'] / phase_stats['executions']
+            with self._stats_lock:
+                self._record_phase_statistics(phase_name, iteration, success, duration, end_time)
 
             if success:
                 print(f"\n[OK] {phase_name} completed in {duration:.2f}s")
@@ -402,16 +389,55 @@ def _execute_phase_with_tracking(self,
             import traceback
             traceback.print_exc()
 
-            self.statistics['orchestration']['total_phases'] += 1
-            self.statistics['orchestration']['failed_phases'] += 1
+            with self._stats_lock:
+                self.statistics['orchestration']['total_phases'] += 1
+                self.statistics['orchestration']['failed_phases'] += 1
 
             return False, {'error': str(e)}
+
+    def _record_phase_statistics(self, phase_name: str, iteration: int, success: bool,
+                                 duration: float, end_time: datetime):
+        """Update execution log and statistics for one phase (caller holds the lock)"""
+        log_entry = {
+            'phase': phase_name,
+            'iteration': iteration,
+            'success': success,
+            'duration_seconds': duration,
+            'timestamp': end_time.isoformat()
+        }
+        self.execution_log.append(log_entry)
+
+        self.statistics['orchestration']['total_phases'] += 1
+        if success:
+            self.statistics['orchestration']['successful_phases'] += 1
+        else:
+            self.statistics['orchestration']['failed_phases'] += 1
+        self.statistics['orchestration']['total_duration_seconds'] += duration
+
+        if phase_name not in self.statistics['phases']:
+            self.statistics['phases'][phase_name] = {
+                'executions': 0,
+                'successes': 0,
+                'failures': 0,
+                'total_duration': 0,
+                'avg_duration': 0
+            }
+
+        phase_stats = self.statistics['phases'][phase_name]
+        phase_stats['executions'] += 1
+        if success:
+            phase_stats['successes'] += 1
+        else:
+            phase_stats['failures'] += 1
+        phase_stats['total_duration'] += duration
+        phase_stats['avg_duration'] = phase_stats['total_duration'] / phase_stats['executions']
     
     def _generate_execution_summary(self, 
                                     iteration: int,
                                     phases_executed: List[str],
                                     duration: float,
-                                    success: bool):
+                                    success: bool,
+                                    critical_path: Optional[Dict[str, Any]] = None):
         """Generate execution summary"""
         summary_file = Path(f"DMAIC_V3_OUTPUT/iteration_{iteration}/EXECUTION_SUMMARY.md")
         summary_file.parent.mkdir(parents=True, exist_ok=True)
@@ -429,6 +455,13 @@ def _generate_execution_summary(self,
                 status = "[OK]" if log['success'] else "[FAIL]"
                 summary.append(f"{idx}. {status} {phase} ({log['duration_seconds']:.2f}s)")
         
+        if critical_path and critical_path['critical_path']:
+            summary.append("\n## Critical Path\n")
+            summary.append(" -> ".join(critical_path['critical_path']))
+            summary.append(f"\n- Critical path: {critical_path['critical_path_seconds']:.2f}s")
+            summary.append(f"- Wall clock: {critical_path['wall_clock_seconds']:.2f}s")
+            summary.append(f"- Sequential sum: {critical_path['sequential_seconds']:.2f}s")
+        
         summary.append("\n## Execution Log\n")
         summary.append("```json")
         summary.append(json.dumps(self.execution_log, indent=2))
@@ -503,6 +536,19 @@ def debug_server():
         except Exception as e:
             print(f"[WARNING] Failed to setup debug monitoring: {e}")
 
+    def _save_critical_path_report(self, iteration: int, report: Dict[str, Any]):
+        """Save per-phase timings and the critical path of the phase graph"""
+        report_file = Path(f"DMAIC_V3_OUTPUT/iteration_{iteration}/critical_path.json")
+        report_file.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(report_file, 'w') as f:
+            json.dump(report, f, indent=2)
+
+        print(f"\n[TRACKING] Critical path: {' -> '.join(report['critical_path'])}")
+        print(f"  Critical path: {report['critical_path_seconds']:.2f}s, "
+              f"wall clock: {report['wall_clock_seconds']:.2f}s, "
+              f"sequential: {report['sequential_seconds']:.2f}s")
+
     def _save_statistics(self, iteration: int):
         """Save orchestration statistics"""
         stats_file = Path(f"DMAIC_V3_OUTPUT/iteration_{iteration}/orchestration_statistics.json")
@@ -533,6 +579,8 @@ def main() -> Any:
                        help='Reduce output verbosity')
     parser.add_argument('--debug-port', type=int, default=None,
                        help='Enable debug monitoring on specified port')
+    parser.add_argument('--parallel-phases', type=int, default=3,
+                       help='Maximum phases running concurrently (default: 3, 1 = sequential)')
 
     args = parser.parse_args()
 
@@ -540,10 +588,14 @@ def main() -> Any:
         enable_idempotency_flag=not args.no_idempotency,
         enable_git_commits=not args.no_git,
         verbose=not args.quiet,
-        debug_port=args.debug_port
+        debug_port=args.debug_port,
+        max_parallel_phases=args.parallel_phases
     )
 
-    success = orchestrator.execute_full_pipeline(iteration=args.iteration)
+    try:
+        success = orchestrator.execute_full_pipeline(iteration=args.iteration)
+    finally:
+        orchestrator.close()
 
     sys.exit(0 if success else 1)
 
@@ -39,7 +39,12 @@ def cmd_execute(args):
     
     tracker = ExecutionTracker(
         output_dir=args.output_dir,
-        timeout=args.timeout
+        timeout=args.timeout,
+        max_workers=args.workers,
+        cpu_limit=args.cpu_seconds,
+        memory_limit_mb=args.memory_mb,
+        deadline=args.deadline,
+        use_cache=not args.no_cache
     )
     
     patterns = args.patterns if args.patterns else ['**/*.py', '**/*.bas']
@@ -181,6 +186,11 @@ def main():
     execute_parser.add_argument('--root', type=Path, default=Path.cwd(), help='Root directory to scan')
     execute_parser.add_argument('--output-dir', type=Path, default=Path('output/execution_reports'), help='Output directory for reports')
     execute_parser.add_argument('--timeout', type=int, default=30, help='Execution timeout in seconds')
+    execute_parser.add_argument('--workers', type=int, default=None, help='Scripts executed concurrently (default: CPU count)')
+    execute_parser.add_argument('--deadline', type=float, default=None, help='Global time budget for all scripts in seconds')
+    execute_parser.add_argument('--cpu-seconds', type=int, default=None, help='CPU time limit per script (default: timeout)')
+    execute_parser.add_argument('--memory-mb', type=int, default=None, help='Memory limit per script in MB (default: unlimited)')
+    execute_parser.add_argument('--no-cache', action='store_true', help='Re-execute scripts even if unchanged')
     execute_parser.add_argument('--patterns', nargs='+', help='File patterns to match (e.g., **/*.py **/*.bas)')
     execute_parser.add_argument('--export-json', action='store_true', default=True, help='Export JSON report')
     execute_parser.add_argument('--export-yaml', action='store_true', default=True, help='Export YAML report')
@@ -198,6 +208,11 @@ def main():
     full_parser.add_argument('--docs-dir', type=Path, default=Path('master_document_system'), help='Documentation directory')
     full_parser.add_argument('--output-dir', type=Path, default=Path('output/execution_reports'), help='Output directory for reports')
     full_parser.add_argument('--timeout', type=int, default=30, help='Execution timeout in seconds')
+    full_parser.add_argument('--workers', type=int, default=None, help='Scripts executed concurrently (default: CPU count)')
+    full_parser.add_argument('--deadline', type=float, default=None, help='Global time budget for all scripts in seconds')
+    full_parser.add_argument('--cpu-seconds', type=int, default=None, help='CPU time limit per script (default: timeout)')
+    full_parser.add_argument('--memory-mb', type=int, default=None, help='Memory limit per script in MB (default: unlimited)')
+    full_parser.add_argument('--no-cache', action='store_true', help='Re-execute scripts even if unchanged')
     full_parser.add_argument('--patterns', nargs='+', help='File patterns to match')
     full_parser.add_argument('--export-json', action='store_true', default=True, help='Export reports as JSON')
     full_parser.add_argument('--export-yaml', action='store_true', default=True, help='Export reports as YAML')
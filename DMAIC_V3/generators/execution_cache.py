@@ -0,0 +1,183 @@
+"""
+DMAIC V3.3 - Execution Result Cache
+Version: 3.3.0
+
+Persistent cache of script execution results for the execution tracker.
+
+A result is keyed on the script's content hash plus the content hashes of
+every intra-repo module it imports, followed transitively through the
+import graph. A script is re-executed only when it or one of its local
+dependencies changed (or the interpreter / resource limits did);
+third-party and standard library imports are not tracked, nor are data
+files a script reads.
+
+Per-file import lists are kept in a FileMetricsCache, so files unchanged
+since the last run cost one stat instead of a read and parse.
+"""
+
+import hashlib
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from DMAIC_V3.core.ast_extractor import extract_file
+from DMAIC_V3.core.file_metrics_cache import FileMetricsCache
+from DMAIC_V3.core.utils import ensure_directory, safe_read_json, safe_write_json
+
+CACHE_VERSION = "1"
+
+
+class ExecutionCache:
+    """
+    Script execution results keyed by script + dependency hash
+
+    Usage:
+        cache = ExecutionCache(cache_dir, search_paths=[repo_root])
+        key = cache.key_for(script)
+        result = cache.get(script, key)
+        if result is None:
+            result = run(script)
+            cache.put(script, key, result)
+        cache.save()
+    """
+
+    def __init__(self, cache_dir: Path, search_paths: Sequence[Path] = (), salt: str = ""):
+        """
+        Initialize cache
+
+        Args:
+            cache_dir: Directory holding the cache files
+            search_paths: Import roots searched after the script's own
+                directory and PYTHONPATH (e.g. the repository root)
+            salt: Extra key material, e.g. resource limits
+        """
+        self.cache_dir = ensure_directory(Path(cache_dir))
+        self.results_file = self.cache_dir / "execution_results.json"
+        self.imports = FileMetricsCache(self.cache_dir / "execution_imports.json", version=CACHE_VERSION)
+        self.salt = f"{sys.executable}\0{sys.version}\0{salt}"
+
+        pythonpath = [Path(p) for p in os.environ.get('PYTHONPATH', '').split(os.pathsep) if p]
+        self.search_paths = [p.resolve() for p in (*pythonpath, *search_paths)]
+
+        data = safe_read_json(self.results_file)
+        self.results: Dict[str, Dict[str, Any]] = (
+            data.get('results', {}) if data and data.get('version') == CACHE_VERSION else {}
+        )
+        self.hits = 0
+        self.misses = 0
+        self._deps: Dict[Tuple[Path, Tuple[Path, ...]], List[Path]] = {}
+
+    def _file_info(self, path: Path) -> Dict[str, Any]:
+        """Content hash and import targets of one file"""
+        info = self.imports.lookup(str(path))
+        if info is None:
+            elements = extract_file(path)
+            info = {'hash': elements.content_hash, 'targets': list(elements.import_targets)}
+            self.imports.store(str(path), info)
+        return info
+
+    @staticmethod
+    def _module_files(base: Path, parts: List[str]) -> List[Path]:
+        """Files executed when importing parts below base (packages included)"""
+        files = []
+        current = base
+        for part in parts:
+            current = current / part
+            if (current / "__init__.py").is_file():
+                files.append(current / "__init__.py")
+            elif current.with_suffix(".py").is_file():
+                files.append(current.with_suffix(".py"))
+                break
+            elif not current.is_dir():
+                break  # attribute of a module, or not a local module
+        return files
+
+    def _resolve(self, target: str, importer: Path, roots: Tuple[Path, ...]) -> List[Path]:
+        """Local files for one import target of importer"""
+        level = len(target) - len(target.lstrip('.'))
+        parts = [p for p in target[level:].split('.') if p]
+        if level:
+            base = importer.parent
+            for _ in range(level - 1):
+                base = base.parent
+            return self._module_files(base, parts)
+        for root in roots:
+            top = root / parts[0]
+            if top.is_dir() or top.with_suffix(".py").is_file():
+                return self._module_files(root, parts)
+        return []
+
+    def dependencies(self, script: Path) -> List[Path]:
+        """
+        Local modules a script imports, transitively
+
+        Args:
+            script: Python script
+
+        Returns:
+            Sorted dependency files, excluding the script itself
+        """
+        script = Path(script).resolve()
+        roots = (script.parent, *self.search_paths)
+        seen: Set[Path] = {script}
+        stack = [script]
+        while stack:
+            current = stack.pop()
+            memo = (current, roots)
+            if memo not in self._deps:
+                try:
+                    targets = self._file_info(current)['targets']
+                except OSError:
+                    targets = []
+                direct = set()
+                for target in targets:
+                    direct.update(p.resolve() for p in self._resolve(target, current, roots))
+                self._deps[memo] = sorted(direct)
+            for dep in self._deps[memo]:
+                if dep not in seen:
+                    seen.add(dep)
+                    stack.append(dep)
+        seen.discard(script)
+        return sorted(seen)
+
+    def key_for(self, script: Path) -> str:
+        """
+        Cache key of a script: its hash plus the hashes of its local imports
+
+        Raises:
+            OSError: If the script cannot be read
+        """
+        script = Path(script).resolve()
+        digest = hashlib.sha256(self.salt.encode('utf-8'))
+        digest.update(self._file_info(script)['hash'].encode('utf-8'))
+        for dep in self.dependencies(script):
+            try:
+                dep_hash = self._file_info(dep)['hash']
+            except OSError:
+                dep_hash = "missing"
+            digest.update(f"\0{dep}\0{dep_hash}".encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, script: Path, key: str) -> Optional[Dict[str, Any]]:
+        """Cached result dict for a script, or None if it must run"""
+        entry = self.results.get(str(Path(script).resolve()))
+        if entry and entry['key'] == key:
+            self.hits += 1
+            return entry['result']
+        self.misses += 1
+        return None
+
+    def put(self, script: Path, key: str, result: Dict[str, Any]):
+        """Remember the result of a script run under key"""
+        self.results[str(Path(script).resolve())] = {'key': key, 'result': result}
+
+    def save(self) -> bool:
+        """Persist results and import lists"""
+        self.imports.save()
+        return safe_write_json({'version': CACHE_VERSION, 'results': self.results},
+                               self.results_file, indent=None)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Executions avoided (hits) and performed (misses) in this run"""
+        return {'entries': len(self.results), 'hits': self.hits, 'misses': self.misses}
@@ -6,6 +6,9 @@
 
 Features:
 - Execute Python files and capture output/errors
+- Run scripts concurrently, each in its own temp working directory with
+  CPU/memory rlimits and an optional global deadline
+- Reuse results of scripts whose code and local imports are unchanged
 - Validate VBA files (.bas) for syntax
 - Classify error types (SyntaxError, ImportError, RuntimeError, etc.)
 - Track execution statistics per file
@@ -19,13 +22,18 @@
     - Exports to DMAIC_V3/output/ directory
 """
 
+import os
 import sys
+import signal
 import subprocess
+import tempfile
+import time
 import traceback
-import ast
 import re
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from datetime import datetime
 from dataclasses import dataclass, asdict
 from enum import Enum
@@ -34,6 +42,29 @@
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from DMAIC_V3.core.metrics import MetricsTracker, MetricType
+from DMAIC_V3.core.ast_extractor import extract_file
+from DMAIC_V3.generators.execution_cache import ExecutionCache
+
+try:
+    import resource
+    RLIMITS_AVAILABLE = True
+except ImportError:
+    RLIMITS_AVAILABLE = False
+
+# Runs inside the child interpreter: set the rlimits, then run the script
+# as __main__. Limits are in place before any script code executes
+# (preexec_fn is not safe with the worker threads).
+# argv: script path, CPU seconds, address-space bytes (0: unlimited)
+RLIMIT_BOOTSTRAP = """
+import os, resource, runpy, sys
+path, cpu, memory = sys.argv[1], int(sys.argv[2]), int(sys.argv[3])
+resource.setrlimit(resource.RLIMIT_CPU, (cpu, cpu + 1))
+if memory:
+    resource.setrlimit(resource.RLIMIT_AS, (memory, memory))
+sys.argv = [path]
+sys.path[0] = os.path.dirname(path)
+runpy.run_path(path, run_name='__main__')
+"""
 
 
 class ErrorType(Enum):
@@ -53,6 +84,15 @@ class ErrorType(Enum):
     UNKNOWN_ERROR = "UnknownError"
 
 
+# Failures that depend on the environment (installed packages, data files)
+# rather than on the script; the cache key covers neither, so never cached
+ENVIRONMENT_ERRORS = {ErrorType.IMPORT_ERROR, ErrorType.FILE_NOT_FOUND}
+
+CACHE_SCOPE_NOTE = ("Cached results are keyed on each script and its local imports only; "
+                    "installed packages and data files a script reads are not tracked. "
+                    "Import and missing-file failures are always re-run.")
+
+
 class ExecutionStatus(Enum):
     """Execution status"""
     SUCCESS = "SUCCESS"
@@ -79,6 +119,7 @@ class ExecutionResult:
     classes_count: int = 0
     imports_count: int = 0
     timestamp: str = ""
+    cached: bool = False
     
     def __post_init__(self):
         """TODO: Add function description"""
@@ -93,6 +134,15 @@ def to_dict(self) -> Dict[str, Any]:
         if self.error_type:
             result['error_type'] = self.error_type.value
         return result
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ExecutionResult':
+        """Rebuild a result from to_dict() output"""
+        data = dict(data)
+        data['status'] = ExecutionStatus(data['status'])
+        if data.get('error_type'):
+            data['error_type'] = ErrorType(data['error_type'])
+        return cls(**data)
 
 
 @dataclass
@@ -107,6 +157,9 @@ class ExecutionStatistics:
     timeout_executions: int = 0
     total_execution_time: float = 0.0
     average_execution_time: float = 0.0
+    wall_clock_time: float = 0.0
+    cached_executions: int = 0
+    time_saved: float = 0.0
     total_lines_of_code: int = 0
     total_functions: int = 0
     total_classes: int = 0
@@ -140,85 +193,155 @@ class ExecutionTracker:
     """
     
     def __init__(
-        """TODO: Add function description"""
-
         self,
         output_dir: Path,
         metrics_tracker: Optional[MetricsTracker] = None,
-        timeout: int = 30
+        timeout: int = 30,
+        max_workers: Optional[int] = None,
+        cpu_limit: Optional[int] = None,
+        memory_limit_mb: Optional[int] = None,
+        deadline: Optional[float] = None,
+        use_cache: bool = True
     ):
+        """
+        Initialize execution tracker
+
+        Args:
+            output_dir: Directory for reports
+            metrics_tracker: Optional MetricsTracker
+            timeout: Wall-clock timeout per script (seconds)
+            max_workers: Scripts executed concurrently (default: CPU count)
+            cpu_limit: CPU-seconds rlimit per script (default: timeout)
+            memory_limit_mb: Address-space rlimit per script (None: unlimited)
+            deadline: Wall-clock budget for a whole scan (seconds); scripts
+                not finished by then are killed or skipped
+            use_cache: Skip scripts whose code and local imports are
+                unchanged since a completed run, reusing that result
+        """
+
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
         self.metrics = metrics_tracker
         self.timeout = timeout
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.cpu_limit = cpu_limit or timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.deadline = deadline
 
         self.execution_results: List[ExecutionResult] = []
         self.statistics = ExecutionStatistics()
 
         self.start_time = datetime.now()
-        # Keep a reference to the process/root working directory to avoid path resolution issues
-        # when executing Python files. Use the current working directory (project root) as the
-        # default cwd for subprocess execution instead of the file's parent directory.
+        # Scripts run from a throwaway temp directory, so resolve their paths against
+        # the directory the tracker was started from.
         self.root_dir = Path.cwd().resolve()
+        
+        self.cache = ExecutionCache(
+            self.output_dir / "execution_cache",
+            search_paths=[self.root_dir],
+            salt=f"cpu={self.cpu_limit};mem={self.memory_limit_mb}"
+        ) if use_cache else None
 
-    def execute_python_file(self, file_path: Path) -> ExecutionResult:
-        """Execute a Python file and capture results"""
-        start_time = datetime.now()
+    def _command(self, file_path: Path) -> List[str]:
+        """Interpreter command running a script under the CPU and memory rlimits"""
+        if not RLIMITS_AVAILABLE:
+            return [sys.executable, str(file_path)]
+        memory = (self.memory_limit_mb or 0) * 1024 * 1024
+        return [sys.executable, "-c", RLIMIT_BOOTSTRAP, str(file_path),
+                str(self.cpu_limit), str(memory)]
 
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
+    def _run_sandboxed(self, file_path: Path, timeout: float) -> Tuple[int, str, str]:
+        """
+        Run a script in a fresh temp working directory with rlimits
 
-            tree = ast.parse(content)
+        The script runs in its own session so a timeout kills everything
+        it spawned.
 
-            functions = [node.name for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)]
-            classes = [node.name for node in ast.walk(tree) if isinstance(node, ast.ClassDef)]
-            imports = []
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    imports.extend([alias.name for alias in node.names])
-                elif isinstance(node, ast.ImportFrom):
-                    imports.append(node.module if node.module else '')
-            
-            lines_of_code = len([l for l in content.split('\n') if l.strip() and not l.strip().startswith('#')])
-            
-            result = subprocess.run(
-                [sys.executable, str(file_path)],
-                capture_output=True,
+        Returns:
+            (exit code, stdout, stderr)
+
+        Raises:
+            subprocess.TimeoutExpired: If the script exceeds timeout
+        """
+        with tempfile.TemporaryDirectory(prefix="dmaic_exec_") as work_dir:
+            process = subprocess.Popen(
+                self._command(file_path),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                stdin=subprocess.DEVNULL,
                 text=True,
-                timeout=self.timeout,
-                cwd=file_path.parent
+                cwd=work_dir,
+                start_new_session=True
             )
+            try:
+                stdout, stderr = process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                try:
+                    os.killpg(process.pid, signal.SIGKILL)
+                except OSError:
+                    process.kill()
+                process.communicate()
+                raise
+            return process.returncode, stdout, stderr
+
+    def execute_python_file(self, file_path: Path, timeout: Optional[float] = None) -> ExecutionResult:
+        """
+        Execute a Python file in a sandboxed working directory and capture results
+
+        Args:
+            file_path: Script to run
+            timeout: Wall-clock limit (default: self.timeout)
+        """
+        start_time = datetime.now()
+        file_path = (self.root_dir / file_path).resolve()
+        timeout = self.timeout if timeout is None else timeout
+
+        try:
+            elements = extract_file(file_path)
+            if elements.syntax_error:
+                raise SyntaxError(elements.syntax_error)
+
+            functions = elements.sync_functions
+            classes = elements.classes
+            imports = elements.imports
+            lines_of_code = elements.lines_of_code
+            
+            returncode, stdout, stderr = self._run_sandboxed(file_path, timeout)
             
             execution_time = (datetime.now() - start_time).total_seconds()
             
-            if result.returncode == 0:
+            if returncode == 0:
                 exec_result = ExecutionResult(
                     file_path=str(file_path),
                     file_type='python',
                     status=ExecutionStatus.SUCCESS,
                     execution_time=execution_time,
-                    stdout=result.stdout,
-                    stderr=result.stderr,
-                    exit_code=result.returncode,
+                    stdout=stdout,
+                    stderr=stderr,
+                    exit_code=returncode,
                     lines_of_code=lines_of_code,
                     functions_count=len(functions),
                     classes_count=len(classes),
                     imports_count=len(set(imports))
                 )
             else:
-                error_type = self._classify_error(result.stderr)
+                error_type = self._classify_error(stderr)
+                if returncode in (-signal.SIGXCPU, -signal.SIGKILL) and not stderr:
+                    stderr = f"Killed by signal {-returncode} (CPU limit {self.cpu_limit}s)"
+                    error_type = ErrorType.TIMEOUT_ERROR
+                elif 'memoryerror' in stderr.lower():
+                    error_type = ErrorType.RUNTIME_ERROR
                 exec_result = ExecutionResult(
                     file_path=str(file_path),
                     file_type='python',
                     status=ExecutionStatus.FAILED,
                     execution_time=execution_time,
                     error_type=error_type,
-                    error_message=result.stderr[:500],
-                    stdout=result.stdout,
-                    stderr=result.stderr,
-                    exit_code=result.returncode,
+                    error_message=stderr[:500],
+                    stdout=stdout,
+                    stderr=stderr,
+                    exit_code=returncode,
                     lines_of_code=lines_of_code,
                     functions_count=len(functions),
                     classes_count=len(classes),
@@ -240,7 +363,7 @@ def execute_python_file(self, file_path: Path) -> ExecutionResult:
                 status=ExecutionStatus.TIMEOUT,
                 execution_time=execution_time,
                 error_type=ErrorType.TIMEOUT_ERROR,
-                error_message=f"Execution timeout after {self.timeout} seconds"
+                error_message=f"Execution timeout after {timeout:.0f} seconds"
             )
         
         except SyntaxError as e:
@@ -355,8 +478,108 @@ def _classify_error(self, error_message: str) -> ErrorType:
         else:
             return ErrorType.UNKNOWN_ERROR
     
+    def _execute_one(self, file_path: Path, stop_at: Optional[float]) -> Optional[ExecutionResult]:
+        """Execute or validate one file, honoring the global deadline"""
+        if file_path.suffix == '.bas':
+            return self.validate_vba_file(file_path)
+        if file_path.suffix != '.py':
+            return None
+
+        timeout = self.timeout
+        if stop_at is not None:
+            remaining = stop_at - time.monotonic()
+            if remaining <= 0:
+                return ExecutionResult(
+                    file_path=str(file_path),
+                    file_type='python',
+                    status=ExecutionStatus.SKIPPED,
+                    execution_time=0.0,
+                    error_message="Global deadline reached before execution"
+                )
+            timeout = min(timeout, remaining)
+        return self.execute_python_file(file_path, timeout=timeout)
+
+    def _cached_result(self, file_path: Path, keys: Dict[Path, str]) -> Optional[ExecutionResult]:
+        """Reuse a previous result if the script and its local imports are unchanged"""
+        if self.cache is None or file_path.suffix != '.py':
+            return None
+        try:
+            key = self.cache.key_for(file_path)
+        except OSError:
+            return None
+        data = self.cache.get(file_path, key)
+        if data is None:
+            keys[file_path] = key
+            return None
+        result = ExecutionResult.from_dict(data)
+        result.cached = True
+        return result
+
+    @staticmethod
+    def _cacheable(result: ExecutionResult) -> bool:
+        """True if a result depends only on what the cache key covers"""
+        if result.status == ExecutionStatus.SUCCESS:
+            return True
+        return result.status == ExecutionStatus.FAILED and result.error_type not in ENVIRONMENT_ERRORS
+
+    def iter_execute(self, files: List[Path]) -> Iterator[ExecutionResult]:
+        """
+        Execute files concurrently, yielding results as they finish
+
+        At most max_workers scripts run at once. With a deadline, scripts
+        still running when it passes are killed (TIMEOUT) and scripts not
+        yet started are reported as SKIPPED. Cached results are yielded
+        without running the script; timeouts, skips and failures caused by
+        the environment (ENVIRONMENT_ERRORS) are never cached.
+
+        Args:
+            files: Python (.py) and VBA (.bas) files
+
+        Yields:
+            ExecutionResult per file, in completion order
+        """
+        stop_at = time.monotonic() + self.deadline if self.deadline else None
+        pending = iter(files)
+        ready = deque()
+        keys: Dict[Path, str] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            running = {}
+
+            def submit_next() -> bool:
+                for file_path in pending:
+                    cached = self._cached_result(file_path, keys)
+                    if cached is not None:
+                        ready.append(cached)
+                        continue
+                    running[pool.submit(self._execute_one, file_path, stop_at)] = file_path
+                    return True
+                return False
+
+            for _ in range(self.max_workers):
+                if not submit_next():
+                    break
+            while running or ready:
+                while ready:
+                    yield ready.popleft()
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    file_path = running.pop(future)
+                    submit_next()
+                    result = future.result()
+                    if result is None:
+                        continue
+                    if file_path in keys and self._cacheable(result):
+                        self.cache.put(file_path, keys[file_path], result.to_dict())
+                    yield result
+
+        if self.cache is not None:
+            self.cache.save()
+
     def scan_and_execute(self, root_dir: Path, patterns: List[str] = None) -> ExecutionStatistics:
-        """Scan directory and execute all Python/VBA files"""
+        """Scan directory and execute all Python/VBA files concurrently"""
         if patterns is None:
             patterns = ['**/*.py', '**/*.bas']
         
@@ -372,36 +595,41 @@ def scan_and_execute(self, root_dir: Path, patterns: List[str] = None) -> Execut
         print(f"EXECUTION TRACKER - Scanning {root_dir}")
         print(f"{'='*80}")
         print(f"Found {len(files_to_execute)} files to execute")
+        print(f"Workers: {self.max_workers}, timeout: {self.timeout}s per script"
+              + (f", deadline: {self.deadline}s" if self.deadline else "")
+              + (", result cache on" if self.cache is not None else ""))
         print(f"{'='*80}\n")
         
-        for file_path in files_to_execute:
-            print(f"Executing: {file_path.name}...", end=' ')
-            
-            if file_path.suffix == '.py':
-                result = self.execute_python_file(file_path)
-                self.statistics.python_files += 1
-            elif file_path.suffix == '.bas':
-                result = self.validate_vba_file(file_path)
+        scan_start = time.monotonic()
+        for result in self.iter_execute(files_to_execute):
+            name = Path(result.file_path).name
+            if result.file_type == 'vba':
                 self.statistics.vba_files += 1
             else:
-                continue
+                self.statistics.python_files += 1
             
             self.execution_results.append(result)
             
+            if result.cached:
+                self.statistics.cached_executions += 1
+                self.statistics.time_saved += result.execution_time
+            else:
+                self.statistics.total_execution_time += result.execution_time
+            tag = "[CACHE] " if result.cached else ""
+            
             if result.status == ExecutionStatus.SUCCESS:
                 self.statistics.successful_executions += 1
-                print("[OK] SUCCESS")
+                print(f"{tag}[OK] SUCCESS  {name} ({result.execution_time:.2f}s)")
             elif result.status == ExecutionStatus.FAILED:
                 self.statistics.failed_executions += 1
-                print(f"[FAIL] FAILED ({result.error_type.value if result.error_type else 'Unknown'})")
+                print(f"{tag}[FAIL] FAILED ({result.error_type.value if result.error_type else 'Unknown'})  {name}")
             elif result.status == ExecutionStatus.TIMEOUT:
                 self.statistics.timeout_executions += 1
-                print("[TIME] TIMEOUT")
+                print(f"[TIME] TIMEOUT  {name}")
             else:
                 self.statistics.skipped_executions += 1
-                print("o SKIPPED")
+                print(f"o SKIPPED  {name}")
             
-            self.statistics.total_execution_time += result.execution_time
             self.statistics.total_lines_of_code += result.lines_of_code
             self.statistics.total_functions += result.functions_count
             self.statistics.total_classes += result.classes_count
@@ -411,13 +639,19 @@ def scan_and_execute(self, root_dir: Path, patterns: List[str] = None) -> Execut
                 self.statistics.error_breakdown[error_name] = self.statistics.error_breakdown.get(error_name,
                     0) + 1
         
-        if self.statistics.total_files > 0:
-            self.statistics.average_execution_time = self.statistics.total_execution_time / self.statistics.total_files
+        self.statistics.wall_clock_time = time.monotonic() - scan_start
+        executed = self.statistics.total_files - self.statistics.cached_executions
+        if executed > 0:
+            self.statistics.average_execution_time = self.statistics.total_execution_time / executed
         
         self.statistics.victory_conditions_met = self._check_victory_conditions()
         
         return self.statistics
     
+    def slowest(self, count: int = 10) -> List[ExecutionResult]:
+        """Worst offenders by wall time"""
+        return sorted(self.execution_results, key=lambda r: r.execution_time, reverse=True)[:count]
+    
     def _check_victory_conditions(self) -> Dict[str, bool]:
         """Check if victory conditions are met"""
         return {
@@ -442,10 +676,15 @@ def export_json(self, filename: str = "execution_report.json") -> Path:
                 'dmaic_version': 'V3',
                 'generated_at': datetime.now().isoformat(),
                 'execution_start': self.start_time.isoformat(),
-                'execution_duration': (datetime.now() - self.start_time).total_seconds()
+                'execution_duration': (datetime.now() - self.start_time).total_seconds(),
+                'cache_scope': CACHE_SCOPE_NOTE if self.cache is not None else None
             },
             'statistics': self.statistics.to_dict(),
             'execution_results': [r.to_dict() for r in self.execution_results],
+            'slowest_files': [
+                {'file_path': r.file_path, 'status': r.status.value, 'execution_time': r.execution_time}
+                for r in self.slowest()
+            ],
             'victory_conditions': self.statistics.victory_conditions_met
         }
         
@@ -514,15 +753,25 @@ def export_markdown(self, filename: str = "EXECUTION_REPORT.md") -> Path:
             f.write(f"- **Average Execution Time**: {self.statistics.average_execution_time:.4f} seconds\n")
             f.write(f"- **Total Lines of Code**: {self.statistics.total_lines_of_code:,}\n")
             f.write(f"- **Total Functions**: {self.statistics.total_functions}\n")
-            f.write(f"- **Total Classes**: {self.statistics.total_classes}\n\n")
+            f.write(f"- **Total Classes**: {self.statistics.total_classes}\n")
+            f.write(f"- **Wall Clock Time**: {self.statistics.wall_clock_time:.2f} seconds\n")
+            f.write(f"- **Cached (not re-executed)**: {self.statistics.cached_executions} "
+                    f"({self.statistics.time_saved:.2f} seconds saved)\n\n")
+            if self.cache is not None:
+                f.write(f"> {CACHE_SCOPE_NOTE}\n\n")
+            
+            if self.execution_results:
+                f.write("---\n\n")
+                f.write("## Slowest Files\n\n")
+                for result in self.slowest():
+                    f.write(f"- `{result.file_path}`: {result.execution_time:.2f}s ({result.status.value})\n")
+                f.write("\n")
             
             if self.statistics.error_breakdown:
                 f.write("---\n\n")
                 f.write("## Error Breakdown\n\n")
-                for error_type,
-                    count in sorted(self.statistics.error_breakdown.items(),
-                    key=lambda x: x[1],
-                    reverse=True):
+                for error_type, count in sorted(self.statistics.error_breakdown.items(),
+                                                key=lambda x: x[1], reverse=True):
                     f.write(f"- **{error_type}**: {count}\n")
                 f.write("\n")
             
@@ -570,8 +819,16 @@ def print_summary(self):
         print(f"Success Rate:       {(self.statistics.successful_executions / self.statistics.total_files * 100) if self.statistics.total_files > 0 else 0:.1f}%")
         print(f"Total Exec Time:    {self.statistics.total_execution_time:.2f}s")
         print(f"Average Exec Time:  {self.statistics.average_execution_time:.4f}s")
+        print(f"Wall Clock Time:    {self.statistics.wall_clock_time:.2f}s")
+        print(f"Cached (skipped):   {self.statistics.cached_executions} ({self.statistics.time_saved:.2f}s saved)")
         print(f"{'='*80}\n")
         
+        if self.execution_results:
+            print("Slowest Files:")
+            for result in self.slowest(5):
+                print(f"  {result.execution_time:8.2f}s  {result.status.value:<8} {result.file_path}")
+            print(f"{'='*80}\n")
+        
         print("Victory Conditions:")
         for condition, met in self.statistics.victory_conditions_met.items():
             status = "[OK] MET" if met else "[FAIL] NOT MET"
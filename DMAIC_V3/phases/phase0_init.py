@@ -97,7 +97,6 @@
 
 from ..core.state import StateManager
 from ..core.utils import ensure_directory, safe_write_json
-from ..core.idempotency_wrapper import GLOBAL_IDEMPOTENCY
 from ..core.agent_manager import AgentManager
 from ..config import DMAICConfig
 
@@ -148,7 +147,7 @@ def __init__(self, config: DMAICConfig, state_manager: StateManager):
             'knowledge': ['context_manager', 'dependency_graph'],
             'monitoring': ['health_checker', 'performance_tracker']
         }
-    
+
     def _check_environment(self) -> Dict[str, Any]:
         """[0.1] Environment Check"""
         print("\n[0.1] Checking environment...")
@@ -259,11 +258,13 @@ def _detect_changes(self) -> Dict[str, Any]:
             print(f"  Warning: Git diff failed - {e}")
             return {'git_available': True, 'error': str(e), 'modified_files': [], 'modified_phases': []}
     
-    def _configure_idempotency(self, enable: bool = True) -> Dict:
-        """[0.5] Idempotency Configuration"""
+    def _configure_idempotency(self, enable: Optional[bool] = None) -> Dict:
+        """[0.5] Idempotency Configuration (None keeps the current setting)"""
+        from ..core.idempotency_wrapper import GLOBAL_IDEMPOTENCY, enable_idempotency
+        if enable is None:
+            enable = GLOBAL_IDEMPOTENCY.config.enabled
         print(f"\n[0.5] Configuring idempotency... {'ENABLED' if enable else 'DISABLED'}")
         
-        from ..core.idempotency_wrapper import enable_idempotency
         enable_idempotency(enabled=enable, cache_dir=self.config.paths.state_dir / "cache")
         
         return {
@@ -367,14 +368,16 @@ def _validate_output_structure(self, iteration: int = 1) -> Dict:
             'all_created': True
         }
     
-    @GLOBAL_IDEMPOTENCY.idempotent(phase_name="phase0_init")
-    def execute(self, iteration: int = 1, enable_idempotency: bool = True) -> Tuple[bool, Dict[str, Any]]:
+    # Not cached: Phase 0 reads git state, creates the output tree, writes
+    # phase0_init.json and configures idempotency for the later phases
+    def execute(self, iteration: int = 1, enable_idempotency: Optional[bool] = None) -> Tuple[bool, Dict[str, Any]]:
         """
         Execute Phase 0: Initialization & Setup
         
         Args:
             iteration: Iteration number
-            enable_idempotency: Enable idempotent caching
+            enable_idempotency: Enable idempotent caching (default: keep the
+                setting chosen by the orchestrator)
             
         Returns:
             Tuple of (success: bool, results: dict)
@@ -13,7 +13,7 @@
 import os
 import json
 from pathlib import Path
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, List, Tuple, Any, Optional, Iterator
 from datetime import datetime
 from collections import defaultdict
 
@@ -21,12 +21,33 @@
 from ..config import DMAICConfig
 from ..core.state import StateManager
 from ..core.utils import ensure_directory, safe_write_json
+from ..core.workspace_walker import ResumableWalker
 # from ..utils.file_utils import (  # DISABLED - utils module doesn't exist
 #     read_file_safe,
 #     categorize_file,
 #     extract_metadata
 # )
 
+# Streaming mode: per-chunk NDJSON segments next to phase1_define.json
+STREAM_DIR_NAME = "phase1_files"
+
+
+def iter_file_records(stream_dir: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yield file records from a streamed Phase 1 scan
+
+    Args:
+        stream_dir: Directory holding the segment_*.ndjson files
+
+    Yields:
+        Dicts with "path", "type" and "folder" keys, in scan order
+    """
+    for segment in sorted(Path(stream_dir).glob("segment_*.ndjson")):
+        with open(segment, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
 
 class Phase1Define:
     """
@@ -36,16 +57,20 @@ class Phase1Define:
     categorize them, and detect relationships between files.
     """
 
-    def __init__(self, config: DMAICConfig, state_manager: StateManager):
+    def __init__(self, config: DMAICConfig, state_manager: StateManager,
+                 streaming: bool = False):
         """
         Initialize Phase 1: Define
 
         Args:
             config: DMAICConfig instance
             state_manager: StateManager instance
+            streaming: Stream file records to NDJSON segments instead of
+                keeping every path in memory and in phase1_define.json
         """
         self.config = config
         self.state_manager = state_manager
+        self.streaming = streaming
         self.workspace_root = config.paths.workspace_root
         self.max_files_per_chunk = 49000
         self.max_total_files = 130000
@@ -97,17 +122,20 @@ def __init__(self, config: DMAICConfig, state_manager: StateManager):
 
         # Scan progress tracking
         self.scan_progress_file = state_dir / "scan_progress.json"
+        self.stream_cursor_file = state_dir / "scan_cursor.json"
 
     def get_file_type(self, file_path: Path) -> str:
         """Get file type category"""
         suffix = file_path.suffix.lower()
         return self.file_type_map.get(suffix, 'unknown')
 
-    def save_scan_progress(self, chunk_num: int, last_path: str, accumulated_data: Dict):
+    def save_scan_progress(self, chunk_num: int, last_path: str, accumulated_data: Dict,
+                           walk_cursor: Optional[Dict[str, str]] = None):
         """Save scan progress for resumption"""
         progress = {
             'chunk_num': chunk_num,
             'last_path': last_path,
+            'walk_cursor': walk_cursor,
             'timestamp': datetime.now().isoformat(),
             'accumulated_data': accumulated_data
         }
@@ -127,6 +155,31 @@ def clear_scan_progress(self):
         if self.scan_progress_file.exists():
             self.scan_progress_file.unlink()
 
+    def _make_walker(self) -> ResumableWalker:
+        """Pruning, resumable walker over the workspace (skips our own output)"""
+        skip_paths = set()
+        try:
+            output_root = self.config.paths.output_root.resolve()
+            rel_output = output_root.relative_to(Path(self.workspace_root).resolve())
+            skip_paths.add(os.path.normpath(os.path.join(str(self.workspace_root), str(rel_output))))
+        except ValueError:
+            pass
+
+        return ResumableWalker(
+            self.workspace_root,
+            skip_dir=lambda name, path: name in self.skip_dirs or path in skip_paths
+        )
+
+    def _resume_cursor(self, progress: Dict) -> Optional[Dict[str, str]]:
+        """Walk cursor from saved progress (derived from last_path for older files)"""
+        if progress.get('walk_cursor'):
+            return progress['walk_cursor']
+        if progress.get('last_path'):
+            last_path = Path(progress['last_path'])
+            return {'dir': os.path.relpath(str(last_path.parent), str(self.workspace_root)),
+                    'file': last_path.name}
+        return None
+
     def scan_files_chunked(self) -> Tuple[List[str], List[Path], Dict, Dict, List, List, List]:
         """
         Scan files in chunks to handle large codebases
@@ -152,7 +205,7 @@ def scan_files_chunked(self) -> Tuple[List[str], List[Path], Dict, Dict, List, L
             python_files = accumulated['python_files']
             notebook_files = accumulated['notebook_files']
             chunk_num = progress['chunk_num'] + 1
-            resume_from = progress['last_path']
+            resume_cursor = self._resume_cursor(progress)
         else:
             all_files = []
             all_file_paths = []
@@ -162,30 +215,20 @@ def scan_files_chunked(self) -> Tuple[List[str], List[Path], Dict, Dict, List, L
             python_files = []
             notebook_files = []
             chunk_num = 1
-            resume_from = None
+            resume_cursor = None
 
         file_count = len(all_files)
         chunk_file_count = 0
         total_scanned = file_count
-        should_resume = resume_from is not None
 
         # Scan files directly without collecting all paths first (memory optimization)
         print(f"  [i] Scanning up to {self.max_total_files} files...")
 
-        for root, dirs, files in os.walk(self.workspace_root):
-            # Filter out skip directories
-            dirs[:] = [d for d in dirs if d not in self.skip_dirs]
-
+        walker = self._make_walker()
+        for root, files in walker.walk(resume=resume_cursor):
             for file in files:
                 file_path = Path(root) / file
 
-                # Skip until we reach resume point
-                if should_resume:
-                    if str(file_path) == resume_from:
-                        should_resume = False
-                        print(f"  [i] Resumed at: {file_path}")
-                    continue
-
                 chunk_file_count += 1
                 total_scanned += 1
 
@@ -197,29 +240,6 @@ def scan_files_chunked(self) -> Tuple[List[str], List[Path], Dict, Dict, List, L
                     print(f"\n  [!] Reached total file limit ({self.max_total_files}). Stopping scan.")
                     break
 
-                # Check if chunk limit reached
-                if chunk_file_count >= self.max_files_per_chunk:
-                    print(f"\n  [i] Chunk {chunk_num} complete ({chunk_file_count} files)")
-                    print(f"  [i] Saving progress and preparing next chunk...")
-
-                    # Save progress
-                    accumulated_data = {
-                        'all_files': all_files,
-                        'all_file_paths': [str(p) for p in all_file_paths],
-                        'categorized': dict(categorized),
-                        'folder_structure': folder_structure,
-                        'markdown_files': markdown_files,
-                        'python_files': python_files,
-                        'notebook_files': notebook_files
-                    }
-                    self.save_scan_progress(chunk_num, str(file_path), accumulated_data)
-
-                    # Reset chunk counter
-                    chunk_file_count = 0
-                    chunk_num += 1
-
-                    print(f"  [i] Starting chunk {chunk_num}...")
-
                 # Process file
                 rel_path = str(file_path.relative_to(self.workspace_root))
                 file_type = self.get_file_type(file_path)
@@ -242,6 +262,30 @@ def scan_files_chunked(self) -> Tuple[List[str], List[Path], Dict, Dict, List, L
                 elif file_type == 'notebooks':
                     notebook_files.append(rel_path)
 
+                # Check if chunk limit reached (after the file is recorded)
+                if chunk_file_count >= self.max_files_per_chunk:
+                    print(f"\n  [i] Chunk {chunk_num} complete ({chunk_file_count} files)")
+                    print(f"  [i] Saving progress and preparing next chunk...")
+
+                    # Save progress
+                    accumulated_data = {
+                        'all_files': all_files,
+                        'all_file_paths': [str(p) for p in all_file_paths],
+                        'categorized': dict(categorized),
+                        'folder_structure': folder_structure,
+                        'markdown_files': markdown_files,
+                        'python_files': python_files,
+                        'notebook_files': notebook_files
+                    }
+                    self.save_scan_progress(chunk_num, str(file_path), accumulated_data,
+                                            walker.cursor(root, file))
+
+                    # Reset chunk counter
+                    chunk_file_count = 0
+                    chunk_num += 1
+
+                    print(f"  [i] Starting chunk {chunk_num}...")
+
             # Break outer loop if limit reached
             if total_scanned >= self.max_total_files:
                 break
@@ -259,6 +303,205 @@ def scan_files_chunked(self) -> Tuple[List[str], List[Path], Dict, Dict, List, L
 
         return all_files, all_file_paths, dict(categorized), folder_structure, markdown_files, python_files, notebook_files
 
+    def save_stream_cursor(self, cursor: Dict):
+        """Checkpoint the streaming scan cursor (constant size)"""
+        cursor['timestamp'] = datetime.now().isoformat()
+        safe_write_json(cursor, self.stream_cursor_file, indent=None)
+
+    def load_stream_cursor(self) -> Optional[Dict]:
+        """Load the streaming scan cursor, if a scan was interrupted"""
+        if self.stream_cursor_file.exists():
+            with open(self.stream_cursor_file, 'r') as f:
+                return json.load(f)
+        return None
+
+    def clear_stream_cursor(self):
+        """Clear streaming cursor after completion"""
+        if self.stream_cursor_file.exists():
+            self.stream_cursor_file.unlink()
+
+    def _detect_relationships(self, markdown_files: List[str], py_by_dir: Dict[str, List[str]],
+                              nb_by_dir: Dict[str, List[str]], limit: int) -> List[Dict]:
+        """Match markdown files to same-directory code/notebooks with similar names"""
+        file_relationships = []
+
+        for md_file in markdown_files:
+            if len(file_relationships) >= limit:
+                break
+
+            md_dir = str(Path(md_file).parent)
+            md_base = Path(md_file).stem.lower()
+
+            for py_file in py_by_dir.get(md_dir, []):
+                py_base = Path(py_file).stem.lower()
+                if md_base in py_base or py_base in md_base:
+                    file_relationships.append({
+                        'markdown': md_file,
+                        'code': py_file,
+                        'relationship': 'documentation',
+                        'confidence': 'high'
+                    })
+                    if len(file_relationships) >= limit:
+                        break
+
+            if len(file_relationships) < limit:
+                for nb_file in nb_by_dir.get(md_dir, []):
+                    nb_base = Path(nb_file).stem.lower()
+                    if md_base in nb_base or nb_base in md_base:
+                        file_relationships.append({
+                            'markdown': md_file,
+                            'notebook': nb_file,
+                            'relationship': 'documentation',
+                            'confidence': 'high'
+                        })
+                        if len(file_relationships) >= limit:
+                            break
+
+        return file_relationships
+
+    def scan_files_streaming(self, stream_dir: Path, max_relationships: int = 1000) -> Dict[str, Any]:
+        """
+        Scan files, appending one NDJSON record per file to chunk segments
+
+        Only counters and a small cursor are kept in memory; the cursor is
+        checkpointed at every chunk boundary, so checkpoint cost does not
+        grow with the number of files scanned. File relationships are
+        detected per directory while walking.
+
+        Args:
+            stream_dir: Directory receiving segment_NNNN.ndjson files
+            max_relationships: Cap on detected file relationships
+
+        Returns:
+            Scan summary (counts, segments, relationships)
+        """
+        print("[1.1] Scanning codebase (streaming mode)...")
+        print(f"  Root: {self.workspace_root}")
+        print(f"  Stream: {stream_dir}")
+
+        stream_dir.mkdir(parents=True, exist_ok=True)
+        cursor = self.load_stream_cursor()
+        if cursor:
+            print(f"  [i] Resuming after chunk {cursor['chunk_num']}")
+            resume_cursor = self._resume_cursor(cursor)
+        else:
+            cursor = {
+                'chunk_num': 0,
+                'last_path': None,
+                'walk_cursor': None,
+                'files_written': 0,
+                'categorized': {},
+                'folders_scanned': 0,
+                'markdown_count': 0,
+                'python_count': 0,
+                'notebook_count': 0,
+                'file_relationships': []
+            }
+            resume_cursor = None
+
+        # Drop segments written after the last checkpoint (or by an older scan)
+        for segment in stream_dir.glob("segment_*.ndjson"):
+            if int(segment.stem.split('_')[1]) > cursor['chunk_num']:
+                segment.unlink()
+
+        categorized = defaultdict(int, cursor['categorized'])
+        file_relationships = cursor['file_relationships']
+        chunk_num = cursor['chunk_num'] + 1
+        total_scanned = cursor['files_written']
+        chunk_file_count = 0
+        limit_reached = False
+
+        # The cursor directory was already counted before the interruption
+        counted_dir = None
+        if resume_cursor:
+            counted_dir = os.path.normpath(os.path.join(str(self.workspace_root), resume_cursor['dir']))
+
+        def open_segment(num: int):
+            return open(stream_dir / f"segment_{num:04d}.ndjson", 'w', encoding='utf-8')
+
+        walker = self._make_walker()
+        segment = open_segment(chunk_num)
+        try:
+            for root, files in walker.walk(resume=resume_cursor):
+                folder = str(Path(root).relative_to(self.workspace_root))
+                dir_markdown, dir_python, dir_notebooks = [], [], []
+                folder_counted = root == counted_dir
+
+                for file in files:
+                    file_path = Path(root) / file
+
+                    if total_scanned >= self.max_total_files:
+                        print(f"\n  [!] Reached total file limit ({self.max_total_files}). Stopping scan.")
+                        limit_reached = True
+                        break
+
+                    rel_path = str(file_path.relative_to(self.workspace_root))
+                    file_type = self.get_file_type(file_path)
+                    segment.write(json.dumps({'path': rel_path, 'type': file_type,
+                                              'folder': folder}) + "\n")
+
+                    total_scanned += 1
+                    chunk_file_count += 1
+                    categorized[file_type] += 1
+                    if not folder_counted:
+                        cursor['folders_scanned'] += 1
+                        folder_counted = True
+
+                    if file_type == 'docs' and file.endswith('.md'):
+                        dir_markdown.append(rel_path)
+                        cursor['markdown_count'] += 1
+                    elif file_type == 'code' and file.endswith('.py'):
+                        dir_python.append(rel_path)
+                        cursor['python_count'] += 1
+                    elif file_type == 'notebooks':
+                        dir_notebooks.append(rel_path)
+                        cursor['notebook_count'] += 1
+
+                    if chunk_file_count >= self.max_files_per_chunk:
+                        segment.close()
+                        cursor.update({
+                            'chunk_num': chunk_num,
+                            'last_path': str(file_path),
+                            'walk_cursor': walker.cursor(root, file),
+                            'files_written': total_scanned,
+                            'categorized': dict(categorized),
+                        })
+                        self.save_stream_cursor(cursor)
+                        print(f"  [i] Chunk {chunk_num} complete ({chunk_file_count} files, "
+                              f"total {total_scanned})", flush=True)
+
+                        chunk_file_count = 0
+                        chunk_num += 1
+                        segment = open_segment(chunk_num)
+
+                remaining = max_relationships - len(file_relationships)
+                if dir_markdown and remaining > 0:
+                    file_relationships.extend(self._detect_relationships(
+                        dir_markdown, {folder: dir_python}, {folder: dir_notebooks}, remaining))
+
+                if limit_reached:
+                    break
+        finally:
+            segment.close()
+
+        self.clear_stream_cursor()
+        segments = sorted(p.name for p in stream_dir.glob("segment_*.ndjson"))
+
+        print(f"\n  [OK] Scan complete!")
+        print(f"     Total files scanned: {total_scanned}")
+        print(f"     Segments: {len(segments)}")
+
+        return {
+            'total_files': total_scanned,
+            'categorized': dict(categorized),
+            'folders_scanned': cursor['folders_scanned'],
+            'markdown_count': cursor['markdown_count'],
+            'python_count': cursor['python_count'],
+            'notebook_count': cursor['notebook_count'],
+            'file_relationships': file_relationships,
+            'segments': segments
+        }
+
     def calculate_artifact_ranking(self, iteration: int) -> Optional[Dict]:
         """Calculate artifact rankings if available"""
         try:
@@ -388,6 +631,12 @@ def execute(self, iteration: int) -> Tuple[bool, Dict]:
             else:
                 print(f"  No feedback from previous iteration (this is normal for iteration 1)")
 
+            output_dir = self.config.paths.output_root / f"iteration_{iteration}" / "phase1_define"
+            ensure_directory(output_dir)
+
+            if self.streaming:
+                return self._execute_streaming(iteration, start_time, output_dir)
+
             # Step 1: Scan all files using chunked scanning
             all_files, all_file_paths, categorized, folder_structure, markdown_files, python_files, notebook_files = self.scan_files_chunked()
 
@@ -396,7 +645,6 @@ def execute(self, iteration: int) -> Tuple[bool, Dict]:
             change_summary = {'added': 0, 'modified': 0, 'deleted': 0, 'total': 0}
 
             print(f"  [i] Change detection disabled for large workspace")
-            file_relationships = []
 
             py_by_dir = defaultdict(list)
             for py_file in python_files:
@@ -408,43 +656,12 @@ def execute(self, iteration: int) -> Tuple[bool, Dict]:
                 nb_dir = str(Path(nb_file).parent)
                 nb_by_dir[nb_dir].append(nb_file)
 
-            relationship_count = 0
             max_relationships = 1000
-
-            for md_file in markdown_files:
-                if relationship_count >= max_relationships:
-                    print(f"  [!] Reached relationship limit ({max_relationships})")
-                    break
-
-                md_dir = str(Path(md_file).parent)
-                md_base = Path(md_file).stem.lower()
-
-                for py_file in py_by_dir.get(md_dir, []):
-                    py_base = Path(py_file).stem.lower()
-                    if md_base in py_base or py_base in md_base:
-                        file_relationships.append({
-                            'markdown': md_file,
-                            'code': py_file,
-                            'relationship': 'documentation',
-                            'confidence': 'high'
-                        })
-                        relationship_count += 1
-                        if relationship_count >= max_relationships:
-                            break
-
-                if relationship_count < max_relationships:
-                    for nb_file in nb_by_dir.get(md_dir, []):
-                        nb_base = Path(nb_file).stem.lower()
-                        if md_base in nb_base or nb_base in md_base:
-                            file_relationships.append({
-                                'markdown': md_file,
-                                'notebook': nb_file,
-                                'relationship': 'documentation',
-                                'confidence': 'high'
-                            })
-                            relationship_count += 1
-                            if relationship_count >= max_relationships:
-                                break
+            file_relationships = self._detect_relationships(
+                markdown_files, py_by_dir, nb_by_dir, max_relationships)
+            relationship_count = len(file_relationships)
+            if relationship_count >= max_relationships:
+                print(f"  [!] Reached relationship limit ({max_relationships})")
 
             print(f"  [OK] Found {relationship_count} file relationships")
 
@@ -488,10 +705,6 @@ def execute(self, iteration: int) -> Tuple[bool, Dict]:
 
             print("\n[1.5] Saving results...")
 
-            # Save results
-            output_dir = self.config.paths.output_root / f"iteration_{iteration}" / "phase1_define"
-            ensure_directory(output_dir)
-
             # Save JSON
             output_file = output_dir / "phase1_define.json"
             safe_write_json(results, output_file)
@@ -533,7 +746,7 @@ def execute(self, iteration: int) -> Tuple[bool, Dict]:
             traceback.print_exc()
             end_time = datetime.now()
             duration = (end_time - start_time).total_seconds()
-            return {
+            return False, {
                 'phase': 'DEFINE',
                 'iteration': iteration,
                 'timestamp': end_time.isoformat(),
@@ -555,19 +768,66 @@ def execute(self, iteration: int) -> Tuple[bool, Dict]:
                 'duration': 0.0
             }
 
-    def execute(self, iteration: int) -> Tuple[bool, Dict[str, Any]]:
-        """
-        Execute the phase and return (success, result_dict) as expected by orchestrator/tests.
-        
-        Args:
-            iteration: Current iteration number
-            
-        Returns:
-            Tuple of (success, result_dict)
-        """
-        result = self.run(iteration)
-        success = 'error' not in result
-        return (success, result)
+    def _execute_streaming(self, iteration: int, start_time: datetime,
+                           output_dir: Path) -> Tuple[bool, Dict]:
+        """Streaming variant of execute(): file lists live in NDJSON segments"""
+        summary = self.scan_files_streaming(output_dir / STREAM_DIR_NAME)
+
+        print("\n[1.2] Detecting changes... SKIPPED (performance optimization)")
+        print(f"  [OK] Found {len(summary['file_relationships'])} file relationships")
+
+        print("\n[1.4] Calculating artifact rankings (if available)...")
+        artifact_rankings = self.calculate_artifact_ranking(iteration)
+
+        end_time = datetime.now()
+        categorized = summary['categorized']
+        results = {
+            'phase': 'DEFINE',
+            'iteration': iteration,
+            'timestamp': end_time.isoformat(),
+            'duration': (end_time - start_time).total_seconds(),
+            'streaming': True,
+            'files_stream': STREAM_DIR_NAME,
+            'segments': summary['segments'],
+            'total_files': summary['total_files'],
+            'categorized': categorized,
+            'code_files': categorized.get('code', 0),
+            'documentation_files': categorized.get('docs', 0),
+            'markdown_file_count': summary['markdown_count'],
+            'python_file_count': summary['python_count'],
+            'notebook_file_count': summary['notebook_count'],
+            'file_relationships': summary['file_relationships'],
+            'folders_scanned': summary['folders_scanned'],
+            'artifact_rankings': artifact_rankings,
+            'changes': {'added': 0, 'modified': 0, 'deleted': 0, 'total': 0},
+        }
+
+        print("\n[1.5] Saving results...")
+        output_file = output_dir / "phase1_define.json"
+        safe_write_json(results, output_file)
+
+        print("\n[1.6] Generating comprehensive outputs...")
+        self._generate_define_book(results, output_dir, iteration)
+        self._generate_ranking_yaml(results, output_dir, iteration)
+        self._generate_analysis_report(results, output_dir, iteration)
+
+        print()
+        print("="*80)
+        print("PHASE 1 SUMMARY")
+        print("="*80)
+        print(f"[OK] Streamed {results['total_files']} files across "
+              f"{results['folders_scanned']} folders")
+        for cat, count in categorized.items():
+            print(f"  {cat}: {count}")
+        print(f"  Python files: {results['python_file_count']}")
+        print(f"  - JSON: {output_file}")
+        print(f"  - Records: {output_dir / STREAM_DIR_NAME}")
+        print()
+        print("[OK] PHASE 1 PASSED")
+        print("="*80)
+        print()
+
+        return True, results
 
     def _load_previous_feedback(self, iteration: int) -> Optional[Dict[str, Any]]:
         """
@@ -12,14 +12,17 @@
 
 import os
 import json
-import ast
 from pathlib import Path
-from typing import Dict, List, Tuple, Any
+from typing import Dict, Iterable, List, Set, Tuple, Any, Optional
 from datetime import datetime
 from collections import defaultdict
 
 from ..core.state import StateManager
 from ..core.utils import ensure_directory, safe_write_json
+from ..core.idempotency_wrapper import GLOBAL_IDEMPOTENCY
+from ..core.file_metrics_cache import FileMetricsCache
+from ..core.ast_extractor import extract_file
+from .phase1_define import iter_file_records
 from ..config import DMAICConfig
 
 try:
@@ -39,6 +42,80 @@
     print("Warning: 12-Cluster orchestrator not available")
 
 
+def analyze_python_file(file_path: str) -> dict:
+    """
+    Analyze a single Python file statically
+
+    Module-level so the 12-cluster process backend can pickle it as a
+    TaskDescriptor target.
+
+    Args:
+        file_path: Path to Python file
+
+    Returns:
+        Dictionary with analysis results
+    """
+    try:
+        elements = extract_file(file_path)
+    except Exception as e:
+        return {
+            'success': False,
+            'error': str(e)[:200]
+        }
+
+    if elements.syntax_error:
+        return {
+            'success': False,
+            'metrics': {
+                'total_lines': elements.total_lines,
+                'lines_of_code': elements.lines_of_code,
+                'comment_lines': elements.comment_lines,
+            },
+            'error': f'Syntax error: {elements.syntax_error[:100]}'
+        }
+
+    functions = elements.sync_functions
+
+    # Calculate complexity score
+    complexity = (
+        elements.lines_of_code +
+        len(functions) * 2 +
+        len(elements.classes) * 3 +
+        len(elements.imports)
+    )
+
+    return {
+        'success': True,
+        'metrics': {
+            'total_lines': elements.total_lines,
+            'lines_of_code': elements.lines_of_code,
+            'comment_lines': elements.comment_lines,
+            'functions': len(functions),
+            'async_functions': len(elements.async_functions),
+            'classes': len(elements.classes),
+            'imports': len(elements.imports),
+            'complexity_score': complexity,
+            'cyclomatic_complexity': elements.cyclomatic_complexity,
+            'docstring_coverage': elements.docstring_coverage,
+        },
+        'details': {
+            'functions': [
+                {'name': f.name, 'line': f.line, 'args': f.args}
+                for f in functions[:10]  # Limit to first 10
+            ],
+            'classes': [{'name': c.name, 'line': c.line} for c in elements.classes[:10]],
+            'imports': list(set(elements.imports))[:20]  # Unique, limit 20
+        },
+        'error': None
+    }
+
+
+ANALYZE_TARGET = f"{__name__}:analyze_python_file"
+
+# Bump when analyze_python_file output changes to invalidate cached metrics
+ANALYZER_VERSION = "2.2"
+
+
 class Phase2Measure:
     """
     Phase 2: Measure - Code metrics and static analysis
@@ -48,7 +125,9 @@ class Phase2Measure:
     """
 
     def __init__(self, config: DMAICConfig, state_manager: StateManager,
-                 use_keb: bool = False, use_12cluster: bool = True):
+                 use_keb: bool = False, use_12cluster: bool = True,
+                 cluster_backend: str = "process", cluster_workers: Optional[int] = None,
+                 use_cache: bool = True):
         """
         Initialize Phase 2: Measure
 
@@ -57,6 +136,9 @@ def __init__(self, config: DMAICConfig, state_manager: StateManager,
             state_manager: StateManager instance
             use_keb: Enable KEB parallel processing (default: False to avoid memory issues)
             use_12cluster: Enable 12-cluster parallel processing (default: True)
+            cluster_backend: 12-cluster backend, "process" (default) or "thread"
+            cluster_workers: Worker processes for the process backend (default: CPU count)
+            use_cache: Reuse metrics of unchanged files from previous runs (default: True)
         """
         self.config = config
         self.state_manager = state_manager
@@ -66,6 +148,12 @@ def __init__(self, config: DMAICConfig, state_manager: StateManager,
         self.use_12cluster = use_12cluster and CLUSTER_AVAILABLE
         self.keb = None
         self.cluster_orchestrator = None
+        self.use_cache = use_cache
+        self.cache_file = config.paths.output_root / "cache" / "phase2_file_metrics.json"
+        # Optional BackgroundChangeDetector and the ChangeWindow drained at
+        # the start of the iteration, both set by the orchestrator
+        self.change_feed = None
+        self.change_window = None
 
         if self.use_keb:
             print("[KEB] Initializing parallel analysis engine...")
@@ -76,7 +164,9 @@ def __init__(self, config: DMAICConfig, state_manager: StateManager,
             self.cluster_orchestrator = TwelveClusterOrchestrator(
                 max_workers=2,
                 use_keb=False,
-                use_gbogeb=True
+                use_gbogeb=True,
+                backend=cluster_backend,
+                process_workers=cluster_workers
             )
 
     def analyze_python_file(self, file_path: str) -> dict:
@@ -89,86 +179,57 @@ def analyze_python_file(self, file_path: str) -> dict:
         Returns:
             Dictionary with analysis results
         """
+        return analyze_python_file(file_path)
+
+    def _phase1_file(self, iteration: int) -> Path:
+        return self.config.paths.output_root / f"iteration_{iteration}" / "phase1_define" / "phase1_define.json"
+
+    @staticmethod
+    def _listed_files(phase1_file: Path, phase1_data: dict) -> Iterable[str]:
+        """File paths recorded by Phase 1 (streamed lazily in streaming mode)"""
+        if phase1_data.get('files_stream'):
+            stream_dir = phase1_file.parent / phase1_data['files_stream']
+            return (record['path'] for record in iter_file_records(stream_dir))
+        return phase1_data.get('files', [])
+
+    def input_artifacts(self, iteration: int) -> List[Path]:
+        """Files Phase 2 reads (its idempotency cache key): Phase 1 output and the listed Python files"""
+        phase1_file = self._phase1_file(iteration)
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-
-            # Basic metrics
-            lines = content.split('\n')
-            loc = len([l for l in lines if l.strip() and not l.strip().startswith('#')])
-            total_lines = len(lines)
-            comment_lines = len([l for l in lines if l.strip().startswith('#')])
-
-            # AST analysis
-            try:
-                tree = ast.parse(content)
-                functions = []
-                classes = []
-                imports = []
-
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.FunctionDef):
-                        functions.append({
-                            'name': node.name,
-                            'line': node.lineno,
-                            'args': len(node.args.args)
-                        })
-                    elif isinstance(node, ast.ClassDef):
-                        classes.append({
-                            'name': node.name,
-                            'line': node.lineno
-                        })
-                    elif isinstance(node, (ast.Import, ast.ImportFrom)):
-                        if isinstance(node, ast.Import):
-                            for alias in node.names:
-                                imports.append(alias.name)
-                        else:
-                            imports.append(node.module if node.module else '')
-
-                # Calculate complexity score
-                complexity = (
-                    loc +
-                    len(functions) * 2 +
-                    len(classes) * 3 +
-                    len(imports)
-                )
+            with open(phase1_file, 'r', encoding='utf-8') as f:
+                phase1_data = json.load(f)
+        except (OSError, ValueError):
+            return [phase1_file]
+        python_files = [Path(f) for f in self._listed_files(phase1_file, phase1_data) if f.endswith('.py')]
+        return [phase1_file.parent] + python_files
 
-                return {
-                    'success': True,
-                    'metrics': {
-                        'total_lines': total_lines,
-                        'lines_of_code': loc,
-                        'comment_lines': comment_lines,
-                        'functions': len(functions),
-                        'classes': len(classes),
-                        'imports': len(imports),
-                        'complexity_score': complexity,
-                    },
-                    'details': {
-                        'functions': functions[:10],  # Limit to first 10
-                        'classes': classes[:10],
-                        'imports': list(set(imports))[:20]  # Unique, limit 20
-                    },
-                    'error': None
-                }
-
-            except SyntaxError as e:
-                return {
-                    'success': False,
-                    'metrics': {
-                        'total_lines': total_lines,
-                        'lines_of_code': loc,
-                        'comment_lines': comment_lines,
-                    },
-                    'error': f'Syntax error: {str(e)[:100]}'
-                }
+    def output_artifacts(self, iteration: int) -> List[Path]:
+        """Files Phase 2 writes; a cached result is only reused while they are intact"""
+        iteration_dir = self.config.paths.output_root / f"iteration_{iteration}"
+        return [iteration_dir / "phase2_measure", iteration_dir / "phase2_metrics.json"]
 
-        except Exception as e:
-            return {
-                'success': False,
-                'error': str(e)[:200]
-            }
+    def _dirty_paths(self, snapshot_time: Optional[float]) -> Optional[Set[str]]:
+        """
+        Files changed since the metrics cache was written
+
+        Args:
+            snapshot_time: When the metrics cache was saved
 
+        Returns:
+            Absolute paths, or None if the change feed cannot vouch for the
+            whole interval (every file is then stat'ed)
+        """
+        window = self.change_window
+        if (self.change_feed is None or window is None or snapshot_time is None
+                or snapshot_time < window.start):
+            return None
+        # Files touched after the orchestrator drained the window count too
+        late = self.change_feed.dirty_since(window.end)
+        if late is None:
+            return None
+        return set(window.paths) | late
+
+    @GLOBAL_IDEMPOTENCY.idempotent(phase_name="phase2_measure")
     def execute(self, iteration: int) -> Tuple[bool, dict]:
         """
         Execute Phase 2: Measure
@@ -187,7 +248,7 @@ def execute(self, iteration: int) -> Tuple[bool, dict]:
             print()
 
             # Load Phase 1 results
-            phase1_file = self.config.paths.output_root / f"iteration_{iteration}" / "phase1_define" / "phase1_define.json"
+            phase1_file = self._phase1_file(iteration)
 
             if not phase1_file.exists():
                 raise FileNotFoundError(f"Phase 1 results not found: {phase1_file}")
@@ -196,14 +257,38 @@ def execute(self, iteration: int) -> Tuple[bool, dict]:
             with open(phase1_file, 'r', encoding='utf-8') as f:
                 phase1_data = json.load(f)
 
-            all_files = phase1_data.get('files', [])
-            print(f"  Found {len(all_files)} files from Phase 1")
+            all_files = self._listed_files(phase1_file, phase1_data)
+            if phase1_data.get('files_stream'):
+                # Streaming Phase 1: NDJSON records are read lazily
+                print(f"  Streaming {phase1_data.get('total_files', 0)} file records from "
+                      f"{phase1_file.parent / phase1_data['files_stream']}")
+            else:
+                print(f"  Found {len(all_files)} files from Phase 1")
             print()
 
             # Filter Python files
             print("[2.2] Filtering Python files...")
-            python_files = [f for f in all_files if f.endswith('.py')]
-            print(f"  Python files to analyze: {len(python_files)}")
+            all_python_files = [f for f in all_files if f.endswith('.py')]
+            print(f"  Python files to analyze: {len(all_python_files)}")
+
+            # Reuse metrics of files unchanged since the last run
+            cache = None
+            cached_results = {}
+            python_files = all_python_files
+            if self.use_cache:
+                cache = FileMetricsCache(self.cache_file, version=ANALYZER_VERSION)
+                dirty = self._dirty_paths(cache.snapshot_time)
+                if dirty is not None:
+                    print(f"  [CACHE] File events since last run: {len(dirty)} dirty paths")
+                for file_path in all_python_files:
+                    unchanged = (dirty is not None and self.change_feed.covers(file_path)
+                                 and os.path.abspath(file_path) not in dirty)
+                    cached = cache.lookup(file_path, assume_unchanged=unchanged)
+                    if cached is not None:
+                        cached_results[file_path] = cached
+                python_files = [f for f in all_python_files if f not in cached_results]
+                print(f"  [CACHE] {len(cached_results)} unchanged files reused, "
+                      f"{len(python_files)} new or modified")
             print()
 
             # Analyze files with chunking
@@ -221,19 +306,22 @@ def execute(self, iteration: int) -> Tuple[bool, dict]:
             print(f"  Number of chunks: {num_chunks}")
 
             if self.use_12cluster:
-                print(f"  [12-CLUSTER] Distributed analysis ENABLED (2 clusters)")
+                print(f"  [12-CLUSTER] Distributed analysis ENABLED "
+                      f"({self.cluster_orchestrator.backend} backend)")
             elif self.use_keb:
                 print(f"  [KEB] Parallel analysis ENABLED (2 workers)")
             else:
                 print(f"  Sequential analysis mode")
             print()
 
-            if self.use_12cluster and self.cluster_orchestrator:
+            if not python_files:
+                print(f"  Nothing to analyze")
+            elif self.use_12cluster and self.cluster_orchestrator:
                 print(f"  [12-CLUSTER] Distributing analysis across clusters...")
 
                 tasks = [
                     {
-                        "func": self.analyze_python_file,
+                        "target": ANALYZE_TARGET,
                         "args": (file_path,),
                         "file_path": file_path
                     }
@@ -336,6 +424,29 @@ def execute(self, iteration: int) -> Tuple[bool, dict]:
                     print(f"  Chunk {chunk_idx + 1} complete: {analyzed_count} successful, {error_count} errors so far")
             print()
 
+            # Merge freshly analyzed files with cached results, in Phase 1 order
+            if cache is not None:
+                fresh_results = {m['file_path']: m['analysis'] for m in measurements}
+                for file_path, result in fresh_results.items():
+                    if 'metrics' in result:
+                        cache.store(file_path, result)
+                cache.prune(all_python_files)
+                cache.save()
+
+                for result in cached_results.values():
+                    if result.get('success'):
+                        analyzed_count += 1
+                    else:
+                        error_count += 1
+
+                measurements = [
+                    {
+                        'file_path': file_path,
+                        'analysis': cached_results.get(file_path) or fresh_results[file_path]
+                    }
+                    for file_path in all_python_files
+                ]
+
             # Calculate aggregate statistics
             print("[2.4] Calculating statistics...")
             total_loc = sum(m['analysis'].get('metrics', {}).get('lines_of_code', 0)
@@ -357,9 +468,11 @@ def execute(self, iteration: int) -> Tuple[bool, dict]:
                 'timestamp': datetime.now().isoformat(),
                 'input_source': str(phase1_file),
                 'statistics': {
-                    'total_files': len(python_files),
+                    'total_files': len(all_python_files),
                     'analyzed_successfully': analyzed_count,
                     'analysis_errors': error_count,
+                    'cache_hits': len(cached_results),
+                    'files_reanalyzed': len(python_files),
                     'total_lines_of_code': total_loc,
                     'total_functions': total_functions,
                     'total_classes': total_classes,
@@ -413,17 +526,3 @@ def execute(self, iteration: int) -> Tuple[bool, dict]:
                 'file_metrics': {},
                 'measurements': []
             }
-
-    def execute(self, iteration: int) -> Tuple[bool, dict]:
-        """
-        Execute the phase and return (success, result_dict) as expected by orchestrator/tests.
-        
-        Args:
-            iteration: Current iteration number
-            
-        Returns:
-            Tuple of (success, result_dict)
-        """
-        result = self.run(iteration)
-        success = 'error' not in result
-        return (success, result)
@@ -20,6 +20,7 @@
 
 from ..core.state import StateManager
 from ..core.utils import ensure_directory, safe_write_json
+from ..core.idempotency_wrapper import GLOBAL_IDEMPOTENCY
 from ..config import DMAICConfig
 
 
@@ -227,6 +228,15 @@ def generate_root_causes(self, analysis: Dict) -> List[Dict]:
 
         return root_causes
 
+    def input_artifacts(self, iteration: int) -> List[Path]:
+        """Files Phase 3 reads (its idempotency cache key)"""
+        return [self.config.paths.output_root / f"iteration_{iteration}" / "phase2_metrics.json"]
+
+    def output_artifacts(self, iteration: int) -> List[Path]:
+        """Files Phase 3 writes; a cached result is only reused while they are intact"""
+        return [self.config.paths.output_root / f"iteration_{iteration}" / "phase3_analysis.json"]
+
+    @GLOBAL_IDEMPOTENCY.idempotent(phase_name="phase3_analyze")
     def execute(self, iteration: int) -> Tuple[bool, Dict[str, Any]]:
         """
         Execute Phase 3: Analyze
@@ -20,10 +20,23 @@
 import hashlib
 
 from ..core.state import StateManager
+from ..core.registry_store import RegistryStore
 from ..core.utils import ensure_directory, safe_write_json
 from ..config import DMAICConfig
 
 
+# Fields that identify an action; two actions differing in any of them are
+# separate registry rows
+ACTION_KEY_FIELDS = ('phase', 'agent', 'type', 'category', 'description',
+                     'file', 'source_file', 'timestamp')
+
+
+def action_key(action: Dict[str, Any]) -> str:
+    """Content-derived action ID"""
+    content = json.dumps([action.get(field) for field in ACTION_KEY_FIELDS], default=str)
+    return hashlib.md5(content.encode()).hexdigest()[:12]
+
+
 class ActionTracker:
     """Tracks actions at local and global scope"""
     
@@ -31,78 +44,53 @@ def __init__(self, workspace_root: Path):
         self.workspace_root = workspace_root
         self.local_actions = []
         self.global_registry_path = workspace_root / "DMAIC_V3_OUTPUT" / "global_action_registry.json"
+        # Indexed store; the JSON file is an export for external readers
+        self.store = RegistryStore(self.global_registry_path.with_suffix('.db'), id_field='action_id')
+        # Legacy registries appended actions whose phase/agent/timestamp IDs collided
+        self.store.import_json(self.global_registry_path, 'actions', rekey=action_key)
         
-    def register_action(self, action: Dict[str, Any]) -> str:
-        """Register a new action and return its ID"""
-        action_id = hashlib.md5(
-            f"{action.get('phase', '')}_{action.get('agent', '')}_{action.get('timestamp', '')}".encode()
-        ).hexdigest()[:12]
-        
-        action['action_id'] = action_id
+    def _prepare(self, action: Dict[str, Any]) -> Dict[str, Any]:
+        """Assign the action ID and registration time"""
+        action['action_id'] = action_key(action)
         action['registered_at'] = datetime.now().isoformat()
+        return action
         
-        self.local_actions.append(action)
-        self._update_global_registry(action)
-        
-        return action_id
+    def register_action(self, action: Dict[str, Any]) -> str:
+        """Register a new action and return its ID"""
+        return self.register_many([action])[0]
     
-    def _update_global_registry(self, action: Dict[str, Any]):
-        """Update the global action registry"""
-        registry = self._load_global_registry()
-        registry['actions'].append(action)
-        registry['total_actions'] = len(registry['actions'])
-        registry['last_updated'] = datetime.now().isoformat()
+    def register_many(self, actions: List[Dict[str, Any]]) -> List[str]:
+        """
+        Register a batch of actions in one transaction and return their IDs
         
-        ensure_directory(self.global_registry_path.parent)
-        safe_write_json(registry, self.global_registry_path)
-    
-    def _load_global_registry(self) -> Dict[str, Any]:
-        """Load the global action registry"""
-        if self.global_registry_path.exists():
-            with open(self.global_registry_path, 'r') as f:
-                return json.load(f)
-        return {
-            'actions': [],
-            'total_actions': 0,
-            'created_at': datetime.now().isoformat(),
-            'last_updated': datetime.now().isoformat()
-        }
+        Re-registering an identical action updates it, not duplicates it.
+        """
+        prepared = [self._prepare(action) for action in actions]
+        self.local_actions.extend(prepared)
+        self.store.upsert_many(prepared)
+        return [action['action_id'] for action in prepared]
     
     def get_actions_by_phase(self, phase: str) -> List[Dict[str, Any]]:
         """Get all actions for a specific phase"""
-        registry = self._load_global_registry()
-        return [a for a in registry['actions'] if a.get('phase') == phase]
+        return self.store.find(phase=phase)
     
     def get_actions_by_agent(self, agent: str) -> List[Dict[str, Any]]:
         """Get all actions for a specific agent"""
-        registry = self._load_global_registry()
-        return [a for a in registry['actions'] if a.get('agent') == agent]
+        return self.store.find(agent=agent)
     
     def get_action_statistics(self) -> Dict[str, Any]:
         """Get statistics about actions"""
-        registry = self._load_global_registry()
-        actions = registry['actions']
-        
-        stats = {
-            'total_actions': len(actions),
-            'by_phase': {},
-            'by_agent': {},
-            'by_status': {},
-            'by_type': {}
+        return {
+            'total_actions': self.store.count(),
+            'by_phase': self.store.count_by('phase'),
+            'by_agent': self.store.count_by('agent'),
+            'by_status': self.store.count_by('status'),
+            'by_type': self.store.count_by('type')
         }
-        
-        for action in actions:
-            phase = action.get('phase', 'unknown')
-            agent = action.get('agent', 'unknown')
-            status = action.get('status', 'unknown')
-            action_type = action.get('type', 'unknown')
-            
-            stats['by_phase'][phase] = stats['by_phase'].get(phase, 0) + 1
-            stats['by_agent'][agent] = stats['by_agent'].get(agent, 0) + 1
-            stats['by_status'][status] = stats['by_status'].get(status, 0) + 1
-            stats['by_type'][action_type] = stats['by_type'].get(action_type, 0) + 1
-        
-        return stats
+    
+    def export_registry(self) -> bool:
+        """Write the global registry JSON file from the store"""
+        return self.store.export_json(self.global_registry_path, 'actions')
 
 
 class Phase7ActionTracking:
@@ -146,14 +134,15 @@ def execute(self, iteration: int) -> Tuple[bool, Dict[str, Any]]:
             
             # [7.2] Register actions in global registry
             print("\n[7.2] Registering actions in global registry...")
-            for action in phase_actions:
-                action_id = self.tracker.register_action(action)
+            action_ids = self.tracker.register_many(phase_actions)
+            for action_id, action in zip(action_ids, phase_actions):
                 print(f"  Registered: {action_id} - {action.get('description', 'N/A')}")
             
             # [7.3] Generate action statistics
             print("\n[7.3] Generating action statistics...")
             stats = self.tracker.get_action_statistics()
             results['global_statistics'] = stats
+            self.tracker.export_registry()
             print(f"  Total actions: {stats['total_actions']}")
             print(f"  By phase: {len(stats['by_phase'])} phases")
             print(f"  By agent: {len(stats['by_agent'])} agents")
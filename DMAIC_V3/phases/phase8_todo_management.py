@@ -23,6 +23,7 @@
 import re
 
 from ..core.state import StateManager
+from ..core.registry_store import RegistryStore
 from ..core.utils import ensure_directory, safe_write_json
 from ..config import DMAICConfig
 
@@ -34,120 +35,72 @@ def __init__(self, workspace_root: Path):
         self.workspace_root = workspace_root
         self.local_todos = []
         self.global_registry_path = workspace_root / "DMAIC_V3_OUTPUT" / "global_todo_registry.json"
+        # Indexed store; the JSON file is an export for external readers
+        self.store = RegistryStore(self.global_registry_path.with_suffix('.db'), id_field='todo_id')
+        self.store.import_json(self.global_registry_path, 'todos')
         
-    def register_todo(self, todo: Dict[str, Any]) -> str:
-        """Register a new TODO and return its ID"""
-        todo_id = hashlib.md5(
+    def _prepare(self, todo: Dict[str, Any]) -> Dict[str, Any]:
+        """Assign the TODO ID, registration time and defaults"""
+        todo['todo_id'] = hashlib.md5(
             f"{todo.get('phase', '')}_{todo.get('description', '')}_{todo.get('timestamp', '')}".encode()
         ).hexdigest()[:12]
-        
-        todo['todo_id'] = todo_id
         todo['registered_at'] = datetime.now().isoformat()
         
         if 'status' not in todo:
             todo['status'] = 'pending'
         if 'priority' not in todo:
             todo['priority'] = 'medium'
+        return todo
         
-        self.local_todos.append(todo)
-        self._update_global_registry(todo)
-        
-        return todo_id
+    def register_todo(self, todo: Dict[str, Any]) -> str:
+        """Register a new TODO and return its ID"""
+        return self.register_many([todo])[0]
     
-    def _update_global_registry(self, todo: Dict[str, Any]):
-        """Update the global TODO registry"""
-        registry = self._load_global_registry()
-        
-        # Check if TODO already exists (update instead of duplicate)
-        existing_idx = next(
-            (i for i, t in enumerate(registry['todos']) if t.get('todo_id') == todo.get('todo_id')),
-            None
-        )
-        
-        if existing_idx is not None:
-            registry['todos'][existing_idx] = todo
-        else:
-            registry['todos'].append(todo)
-        
-        registry['total_todos'] = len(registry['todos'])
-        registry['last_updated'] = datetime.now().isoformat()
-        
-        # Calculate statistics
-        registry['statistics'] = self._calculate_statistics(registry['todos'])
+    def register_many(self, todos: List[Dict[str, Any]]) -> List[str]:
+        """
+        Register a batch of TODOs in one transaction and return their IDs
         
-        ensure_directory(self.global_registry_path.parent)
-        safe_write_json(registry, self.global_registry_path)
-    
-    def _load_global_registry(self) -> Dict[str, Any]:
-        """Load the global TODO registry"""
-        if self.global_registry_path.exists():
-            with open(self.global_registry_path, 'r') as f:
-                return json.load(f)
-        return {
-            'todos': [],
-            'total_todos': 0,
-            'created_at': datetime.now().isoformat(),
-            'last_updated': datetime.now().isoformat(),
-            'statistics': {}
-        }
+        A TODO whose ID is already registered is updated, not duplicated.
+        """
+        prepared = [self._prepare(todo) for todo in todos]
+        self.local_todos.extend(prepared)
+        self.store.upsert_many(prepared)
+        return [todo['todo_id'] for todo in prepared]
     
-    def _calculate_statistics(self, todos: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def get_statistics(self) -> Dict[str, Any]:
         """Calculate statistics about TODOs"""
-        stats = {
-            'total': len(todos),
-            'by_status': {},
-            'by_priority': {},
-            'by_phase': {},
-            'by_agent': {},
-            'completion_rate': 0.0
+        total = self.store.count()
+        by_status = self.store.count_by('status')
+        completed = by_status.get('completed', 0) + by_status.get('done', 0)
+        return {
+            'total': total,
+            'by_status': by_status,
+            'by_priority': self.store.count_by('priority'),
+            'by_phase': self.store.count_by('phase'),
+            'by_agent': self.store.count_by('agent'),
+            'completion_rate': (completed / total) * 100 if total else 0.0
         }
-        
-        completed = 0
-        for todo in todos:
-            status = todo.get('status', 'unknown')
-            priority = todo.get('priority', 'unknown')
-            phase = todo.get('phase', 'unknown')
-            agent = todo.get('agent', 'unknown')
-            
-            stats['by_status'][status] = stats['by_status'].get(status, 0) + 1
-            stats['by_priority'][priority] = stats['by_priority'].get(priority, 0) + 1
-            stats['by_phase'][phase] = stats['by_phase'].get(phase, 0) + 1
-            stats['by_agent'][agent] = stats['by_agent'].get(agent, 0) + 1
-            
-            if status in ['completed', 'done']:
-                completed += 1
-        
-        if len(todos) > 0:
-            stats['completion_rate'] = (completed / len(todos)) * 100
-        
-        return stats
     
     def get_todos_by_status(self, status: str) -> List[Dict[str, Any]]:
         """Get all TODOs with a specific status"""
-        registry = self._load_global_registry()
-        return [t for t in registry['todos'] if t.get('status') == status]
+        return self.store.find(status=status)
     
     def get_todos_by_priority(self, priority: str) -> List[Dict[str, Any]]:
         """Get all TODOs with a specific priority"""
-        registry = self._load_global_registry()
-        return [t for t in registry['todos'] if t.get('priority') == priority]
+        return self.store.find(priority=priority)
     
     def get_todos_by_phase(self, phase: str) -> List[Dict[str, Any]]:
         """Get all TODOs for a specific phase"""
-        registry = self._load_global_registry()
-        return [t for t in registry['todos'] if t.get('phase') == phase]
+        return self.store.find(phase=phase)
     
     def update_todo_status(self, todo_id: str, status: str):
         """Update the status of a TODO"""
-        registry = self._load_global_registry()
-        for todo in registry['todos']:
-            if todo.get('todo_id') == todo_id:
-                todo['status'] = status
-                todo['updated_at'] = datetime.now().isoformat()
-                break
-        
-        registry['statistics'] = self._calculate_statistics(registry['todos'])
-        safe_write_json(registry, self.global_registry_path)
+        self.store.update(todo_id, status=status, updated_at=datetime.now().isoformat())
+    
+    def export_registry(self) -> bool:
+        """Write the global registry JSON file (with statistics) from the store"""
+        return self.store.export_json(self.global_registry_path, 'todos',
+                                      {'statistics': self.get_statistics()})
 
 
 class Phase8TODOManagement:
@@ -199,14 +152,13 @@ def execute(self, iteration: int) -> Tuple[bool, Dict[str, Any]]:
             # [8.3] Register TODOs in global registry
             print("\n[8.3] Registering TODOs in global registry...")
             all_todos = results['local_todos']
-            for todo in all_todos:
-                todo_id = self.tracker.register_todo(todo)
+            todo_ids = self.tracker.register_many(all_todos)
+            for todo_id, todo in zip(todo_ids, all_todos):
                 print(f"  Registered: {todo_id} - {todo.get('description', 'N/A')[:50]}")
             
             # [8.4] Generate TODO statistics
             print("\n[8.4] Generating TODO statistics...")
-            registry = self.tracker._load_global_registry()
-            stats = registry.get('statistics', {})
+            stats = self.tracker.get_statistics()
             results['global_statistics'] = stats
             print(f"  Total TODOs: {stats.get('total', 0)}")
             print(f"  Pending: {stats.get('by_status', {}).get('pending', 0)}")
@@ -255,6 +207,7 @@ def execute(self, iteration: int) -> Tuple[bool, Dict[str, Any]]:
             results['todo_executions'] = execution_results
             executed_count = len([r for r in execution_results if r.get('success')])
             print(f"  Executed: {executed_count}/{len(high_priority_todos)} high-priority TODOs")
+            self.tracker.export_registry()
 
             print("\n" + "="*80)
             print("PHASE 8 SUMMARY")
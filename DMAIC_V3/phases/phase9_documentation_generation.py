@@ -194,7 +194,8 @@ def _detect_discrepancies(self, iteration: int) -> List[Dict]:
                 })
             
             # Check Python files
-            actual_python = len(phase1_data.get('python_files', []))
+            actual_python = phase1_data.get('python_file_count',
+                                            len(phase1_data.get('python_files', [])))
             canonical_python = 12000  # From canonical docs
             
             if abs(actual_python - canonical_python) > canonical_python * 0.1:  # >10% difference
@@ -88,7 +88,9 @@ def run_3_iterations():
                 'error': str(e),
                 'timestamp': datetime.now().isoformat()
             })
-    
+
+    orchestrator.close()
+
     # Final summary
     print("\n" + "="*80)
     print("3-ITERATION RUN COMPLETE")
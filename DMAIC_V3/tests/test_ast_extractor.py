@@ -0,0 +1,83 @@
+"""
+DMAIC V3 Test Suite - Shared AST Extractor Tests
+Version: 3.3.0
+"""
+
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from DMAIC_V3.core import ast_extractor
+from DMAIC_V3.core.ast_extractor import extract_source
+
+
+SAMPLE = '''"""Module docstring"""
+import os, sys
+from pathlib import Path
+from . import sibling
+
+
+class Worker:
+    """Documented class"""
+
+    def run(self, items):
+        for item in items:
+            if item and item.ready or item.forced:
+                yield item
+
+    async def fetch(self, url, timeout):
+        try:
+            return await self.client.get(url)
+        except TimeoutError:
+            return None
+
+
+def helper(x):
+    return [y for y in x if y]
+'''
+
+
+class TestAstExtractor(unittest.TestCase):
+    def setUp(self):
+        ast_extractor.clear_cache()
+
+    def test_elements(self):
+        elements = extract_source(SAMPLE)
+        self.assertIsNone(elements.syntax_error)
+        self.assertEqual([f.name for f in elements.sync_functions], ['run', 'helper'])
+        self.assertEqual([f.name for f in elements.async_functions], ['fetch'])
+        self.assertEqual([c.name for c in elements.classes], ['Worker'])
+        self.assertEqual(elements.imports, ('os', 'sys', 'pathlib', ''))
+        self.assertEqual(elements.module_imports, ('os', 'sys', 'pathlib'))
+
+    def test_cyclomatic_complexity(self):
+        # for, if, and/or (2), except, comprehension (1 + 1 if)
+        self.assertEqual(extract_source(SAMPLE).cyclomatic_complexity, 1 + 7)
+        self.assertEqual(extract_source("x = 1\n").cyclomatic_complexity, 1)
+
+    def test_docstring_coverage(self):
+        # module + class documented; run, fetch, helper are not
+        self.assertEqual(extract_source(SAMPLE).docstring_coverage, round(2 / 5, 4))
+
+    def test_line_metrics(self):
+        elements = extract_source("# comment\n\nx = 1\n")
+        self.assertEqual(elements.total_lines, 4)
+        self.assertEqual(elements.lines_of_code, 1)
+        self.assertEqual(elements.comment_lines, 1)
+
+    def test_syntax_error(self):
+        elements = extract_source("def broken(:\n    pass")
+        self.assertIsNotNone(elements.syntax_error)
+        self.assertEqual(elements.functions, ())
+        self.assertEqual(elements.lines_of_code, 2)
+
+    def test_cached_by_content_hash(self):
+        first = extract_source(SAMPLE)
+        self.assertIs(extract_source(SAMPLE.encode('utf-8')), first)
+        self.assertIsNot(extract_source(SAMPLE + "\n"), first)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+DMAIC V3 Test Suite - Background Change Detector Tests
+Version: 3.3.0
+"""
+
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from DMAIC_V3.convergence.background_change_detector import (
+    BackgroundChangeDetector, WATCHDOG_AVAILABLE
+)
+from DMAIC_V3.core.file_metrics_cache import FileMetricsCache
+
+
+class TestBackgroundChangeDetector(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.workspace = Path(self.temp_dir.name).resolve()
+        (self.workspace / "src").mkdir()
+        self.existing = self.workspace / "src" / "mod.py"
+        self.existing.write_text("x = 1")
+        self.state_dir = self.workspace / "state"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _wait_for(self, detector, count, timeout=5.0):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if detector.get_summary()['total'] >= count:
+                return
+            time.sleep(0.05)
+
+    def test_merge_rules(self):
+        detector = BackgroundChangeDetector(self.workspace, self.state_dir, debounce=0)
+        new_file = str(self.workspace / "src" / "new.py")
+        detector._mark(new_file, 'added')
+        detector._mark(new_file, 'modified')
+        detector._mark(str(self.existing), 'deleted')
+        detector._mark(str(self.existing), 'added')
+        detector._mark(str(self.state_dir / "background_changes.json"), 'modified')
+        detector._mark(str(self.workspace / "src" / "mod.pyc"), 'added')
+
+        self.assertEqual(detector.take_dirty(), {new_file: 'added', str(self.existing): 'modified'})
+        self.assertEqual(detector.take_dirty(), {})
+
+        detector._mark(new_file, 'deleted')
+        self.assertEqual(detector.get_summary()['total'], 1)  # created and removed again
+
+    def test_polling_fallback(self):
+        detector = BackgroundChangeDetector(self.workspace, self.state_dir, use_events=False)
+        tree = detector._poll(None)
+        self.assertEqual(detector.take_dirty(), {})
+
+        self.existing.write_text("x = 22")
+        (self.workspace / "src" / "new.py").write_text("y = 2")
+        detector._poll(tree)
+
+        self.assertEqual(detector.take_dirty(), {
+            str(self.existing): 'modified',
+            str(self.workspace / "src" / "new.py"): 'added',
+        })
+        self.assertIsNone(detector.dirty_since(0))
+
+    @unittest.skipUnless(WATCHDOG_AVAILABLE, "watchdog not installed")
+    def test_events_feed_metrics_cache(self):
+        cache = FileMetricsCache(self.workspace / "cache.json")
+        cache.store(str(self.existing), {'lines': 1})
+        cache.save()
+        cache = FileMetricsCache(self.workspace / "cache.json")
+
+        detector = BackgroundChangeDetector(self.workspace, self.state_dir, debounce=0.1)
+        detector.start()
+        detector._watch_start = 0  # pretend the watch predates the cache
+        try:
+            self.assertEqual(detector.mode, 'events')
+            self.assertEqual(detector.dirty_since(cache.snapshot_time), set())
+
+            other = self.workspace / "src" / "other.py"
+            other.write_text("z = 3")
+            self._wait_for(detector, 1)
+            dirty = detector.take_dirty(timeout=2)
+        finally:
+            detector.stop()
+
+        self.assertEqual(dirty, {str(other): 'added'})
+        self.assertIsNone(detector.dirty_since(cache.snapshot_time))  # watch stopped
+
+        # A clean file is served from the cache without a stat
+        os.utime(self.existing, (1, 1))
+        self.assertEqual(cache.lookup(str(self.existing), assume_unchanged=True), {'lines': 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
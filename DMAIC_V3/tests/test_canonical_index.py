@@ -0,0 +1,126 @@
+"""
+DMAIC V3 Test Suite - Canonical Index Tests
+Version: 3.3.0
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from DMAIC_V3.core.canonical_index import (
+    ArtifactType, CanonicalIndexSystem, CanonicalVersion, VersionStatus
+)
+
+
+class TestCanonicalIndex(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.workspace = Path(self.temp_dir.name)
+        self.artifact = self.workspace / "engine.py"
+        self.artifact.write_text("x = 1")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _register(self, system, name, version="1.0.0", artifact_type=ArtifactType.MODULE, tags=()):
+        return system.register_artifact(
+            self.artifact, name, name.title(), artifact_type,
+            version=CanonicalVersion.from_string(version), tags=list(tags)
+        ).canonical_id
+
+    def _populate(self, system):
+        ids = {
+            'engine1': self._register(system, "engine", "1.0.0", tags=["core", "python"]),
+            'engine2': self._register(system, "engine", "1.10.0", tags=["core"]),
+            'engine_rc': self._register(system, "engine", "1.10.0-rc1", tags=["core"]),
+            'report': self._register(system, "report", artifact_type=ArtifactType.REPORT, tags=["python"]),
+            'config': self._register(system, "config", artifact_type=ArtifactType.CONFIG),
+        }
+        for key, score in (('engine1', 0.5), ('engine2', 0.9), ('report', 0.7), ('config', 0.2)):
+            system.update_artifact(ids[key], quality_score=score)
+        return ids
+
+    def test_queries_use_indexes(self):
+        system = CanonicalIndexSystem(self.workspace)
+        ids = self._populate(system)
+
+        self.assertEqual([e.version for e in system.get_version_history("engine")],
+                         ["1.10.0", "1.10.0-rc1", "1.0.0"])
+        self.assertEqual([e.canonical_id for e in system.search_artifacts(tags=["python", "missing"])],
+                         [ids['engine1'], ids['report']])
+        self.assertEqual([e.canonical_id for e in system.query(tags_all=["core", "python"])],
+                         [ids['engine1']])
+        self.assertEqual([e.canonical_id for e in system.query(top_k=2)], [ids['engine2'], ids['report']])
+        self.assertEqual([e.canonical_id for e in system.query(tags_any=["python"], top_k=1)],
+                         [ids['report']])
+        self.assertEqual([e.canonical_id for e in system.search_artifacts(
+            artifact_type=ArtifactType.MODULE, min_quality_score=0.5)], [ids['engine1'], ids['engine2']])
+
+        # Updates move entries between index buckets
+        system.update_artifact(ids['report'], status=VersionStatus.DEPRECATED, quality_score=0.1)
+        self.assertEqual([e.canonical_id for e in system.query(status="deprecated")], [ids['report']])
+        self.assertEqual(len(system.query(status=VersionStatus.ACTIVE)), 4)
+        self.assertEqual([e.canonical_id for e in system.query(top_k=1, tags_any=["python"])],
+                         [ids['engine1']])
+
+    def test_indexes_rebuilt_on_load(self):
+        ids = self._populate(CanonicalIndexSystem(self.workspace))
+        system = CanonicalIndexSystem(self.workspace)
+        self.assertEqual([e.canonical_id for e in system.query(min_quality_score=0.6)],
+                         [ids['engine2'], ids['report']])
+        self.assertEqual(len(system.get_version_history("engine")), 3)
+
+        # Re-registering an id replaces its index entries
+        self._register(system, "config", tags=["core"])
+        self.assertEqual(len(system.query(tags_all=["core"])), 4)
+        self.assertEqual(len(system.query(artifact_type=ArtifactType.CONFIG)), 0)
+
+    def test_batch_defers_and_rolls_back(self):
+        system = CanonicalIndexSystem(self.workspace)
+        with system.batch():
+            for i in range(20):
+                self._register(system, f"artifact_{i}")
+            self.assertEqual(system.store.count(), 0)
+        self.assertEqual(system.store.count(), 20)
+
+        with system.batch(flush=False):
+            system.update_artifact("artifact_0__v1.0.0", quality_score=0.8)
+        self.assertEqual(system.store.get("artifact_0__v1.0.0")['metadata']['quality_score'], 0.0)
+
+        with self.assertRaises(ValueError):
+            with system.batch():
+                self._register(system, "doomed")
+                system.update_artifact("artifact_1__v1.0.0", status=VersionStatus.ARCHIVED)
+                system.update_artifact("missing__v1.0.0", quality_score=1.0)
+        self.assertIsNone(system.get_artifact("doomed__v1.0.0"))
+        self.assertEqual(system.get_artifact("artifact_1__v1.0.0").status, "active")
+        self.assertEqual(system.query(status="archived"), [])
+
+        system.close()
+        reloaded = CanonicalIndexSystem(self.workspace)
+        self.assertEqual(len(reloaded.index), 20)
+        self.assertEqual([e.canonical_id for e in reloaded.query(top_k=1)], ["artifact_0__v1.0.0"])
+        self.assertFalse(reloaded.master_index_json.exists())
+
+        out = self.workspace / "export" / "index.yaml"
+        reloaded.export_to_yaml(out)
+        self.assertIn("artifact_19", out.read_text())
+
+    def test_legacy_json_import(self):
+        legacy = CanonicalIndexSystem(self.workspace)
+        self._register(legacy, "engine", tags=["core"])
+        legacy_json = legacy.master_index_json
+        legacy_json.write_text(json.dumps({'entries': [e.to_dict() for e in legacy.index.values()]}))
+        legacy.close()
+        legacy.master_index_db.unlink()
+
+        system = CanonicalIndexSystem(self.workspace)
+        self.assertEqual([e.canonical_id for e in system.query(tags_all=["core"])], ["engine__v1.0.0"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+DMAIC V3 Test Suite - Merkle Change Detector Tests
+Version: 3.3.0
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from DMAIC_V3.convergence.change_detector import ChangeDetector
+from DMAIC_V3.convergence.merkle_tree import dump_tree, load_tree, scan_tree
+
+
+class TestChangeDetector(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.workspace = Path(self.temp_dir.name)
+        for folder in ("docs", "src/pkg", "src/other"):
+            (self.workspace / folder).mkdir(parents=True)
+        (self.workspace / "docs" / "a.md").write_text("alpha")
+        (self.workspace / "src" / "pkg" / "mod.py").write_text("x = 1")
+        (self.workspace / "src" / "other" / "b.py").write_text("y = 2")
+        self.state_dir = self.workspace / "state"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _edit(self):
+        (self.workspace / "src" / "pkg" / "mod.py").write_text("x = 2")
+        (self.workspace / "src" / "pkg" / "new.py").write_text("z = 3")
+        (self.workspace / "docs" / "a.md").unlink()
+        return [self.workspace / "src" / "pkg" / "mod.py",
+                self.workspace / "src" / "pkg" / "new.py",
+                self.workspace / "docs" / "a.md"]
+
+    @staticmethod
+    def _summary(changes):
+        return sorted((c.path, c.change_type) for c in changes)
+
+    def test_detect_changes(self):
+        detector = ChangeDetector(self.workspace, self.state_dir)
+        first = detector.detect_changes()
+        self.assertEqual(len(first), 3)  # state dir itself is never tracked
+        self.assertEqual(detector.detect_changes(), [])
+
+        self._edit()
+        changes = detector.detect_changes()
+        self.assertEqual(self._summary(changes), [
+            ("docs/a.md", "deleted"),
+            ("src/pkg/mod.py", "modified"),
+            ("src/pkg/new.py", "added"),
+        ])
+        self.assertEqual(detector.get_change_summary()["total"], 3)
+        self.assertEqual(detector.get_changed_files({".py"}), ["src/pkg/mod.py", "src/pkg/new.py"])
+
+    def test_changed_since_with_dirty_paths(self):
+        detector = ChangeDetector(self.workspace, self.state_dir)
+        detector.detect_changes()
+        snapshot_id = detector.latest_snapshot_id()
+        old_tree = detector.tree
+        unchanged_subtree = old_tree.dirs["src"].dirs["other"]
+
+        dirty = self._edit()
+        hinted = detector.changed_since(snapshot_id, dirty_paths=dirty)
+        full = ChangeDetector(self.workspace, self.state_dir).changed_since(snapshot_id)
+
+        self.assertEqual(self._summary(hinted), self._summary(full))
+        self.assertEqual(detector.tree.digest, scan_tree(self.workspace, skip_dir=detector._skip_dir).digest)
+        # The stored snapshot is untouched and unchanged subtrees are shared
+        self.assertIs(detector.load_snapshot(snapshot_id), old_tree)
+        self.assertIs(detector.tree.dirs["src"].dirs["other"], unchanged_subtree)
+
+    def test_snapshot_round_trip(self):
+        tree = scan_tree(self.workspace)
+        loaded = load_tree(dump_tree(tree))
+        self.assertEqual(loaded.digest, tree.digest)
+        self.assertEqual([path for path, _ in loaded.iter_files()],
+                         [path for path, _ in tree.iter_files()])
+        with self.assertRaises(ValueError):
+            load_tree(b"not a tree")
+
+        detector = ChangeDetector(self.workspace, self.state_dir)
+        self.assertEqual(len(detector.changed_since("unknown")), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+DMAIC V3 Test Suite - Execution Tracker Tests
+Version: 3.3.0
+"""
+
+import tempfile
+import time
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from DMAIC_V3.generators.execution_tracker import (
+    ExecutionStatus, ExecutionTracker, RLIMITS_AVAILABLE
+)
+
+
+class TestExecutionTracker(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.workspace = Path(self.temp_dir.name)
+        self.scripts = self.workspace / "scripts"
+        self.scripts.mkdir()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _script(self, name, body):
+        path = self.scripts / name
+        path.write_text(body)
+        return path
+
+    def _tracker(self, **kwargs):
+        return ExecutionTracker(self.workspace / "out", **kwargs)
+
+    def test_parallel_scan_in_temp_dirs(self):
+        for i in range(4):
+            self._script(f"sleep{i}.py",
+                         "import os, time\ntime.sleep(0.5)\nopen('out.txt', 'w').write('x')\nprint(os.getcwd())\n")
+
+        tracker = self._tracker(max_workers=4)
+        stats = tracker.scan_and_execute(self.scripts)
+
+        self.assertEqual(stats.successful_executions, 4)
+        self.assertLess(stats.wall_clock_time, stats.total_execution_time)
+        # Every script ran in its own throwaway directory, not next to the script
+        work_dirs = {r.stdout.strip() for r in tracker.execution_results}
+        self.assertEqual(len(work_dirs), 4)
+        self.assertFalse(any(Path(d).exists() for d in work_dirs))
+        self.assertEqual(list(self.scripts.glob("out.txt")), [])
+
+    def test_timeout_deadline_and_slowest(self):
+        self._script("fast.py", "print('ok')\n")
+        self._script("hang.py", "import time\ntime.sleep(30)\n")
+        self._script("late.py", "print('never started')\n")
+
+        tracker = self._tracker(max_workers=2, timeout=10, deadline=1.0)
+        files = [self.scripts / "hang.py", self.scripts / "fast.py", self.scripts / "late.py"]
+        start = time.monotonic()
+        results = {Path(r.file_path).name: r for r in tracker.iter_execute(files)}
+        self.assertLess(time.monotonic() - start, 5)
+
+        self.assertEqual(results["fast.py"].status, ExecutionStatus.SUCCESS)
+        self.assertEqual(results["hang.py"].status, ExecutionStatus.TIMEOUT)
+        self.assertIn(results["late.py"].status, (ExecutionStatus.SUCCESS, ExecutionStatus.SKIPPED))
+
+        tracker.execution_results = list(results.values())
+        self.assertEqual(Path(tracker.slowest(1)[0].file_path).name, "hang.py")
+
+    def test_result_cache_follows_local_imports(self):
+        (self.scripts / "pkg").mkdir()
+        self._script("pkg/__init__.py", "from . import helper\n")
+        self._script("pkg/helper.py", "from .deep import VALUE\n")
+        self._script("pkg/deep.py", "VALUE = 1\n")
+        uses_pkg = self._script("uses_pkg.py", "import json\nfrom pkg.helper import VALUE\nprint(VALUE)\n")
+        standalone = self._script("standalone.py", "print('alone')\n")
+        files = [uses_pkg, standalone]
+
+        tracker = self._tracker()
+        self.assertEqual([p.name for p in tracker.cache.dependencies(uses_pkg)],
+                         ["__init__.py", "deep.py", "helper.py"])
+        self.assertFalse(any(r.cached for r in tracker.iter_execute(files)))
+
+        tracker = self._tracker()
+        results = list(tracker.iter_execute(files))
+        self.assertTrue(all(r.cached for r in results))
+        self.assertEqual(tracker.cache.get_stats()['hits'], 2)
+
+        # A change deep in the import graph re-runs only the dependent script
+        self._script("pkg/deep.py", "VALUE = 2\n")
+        tracker = self._tracker()
+        results = {Path(r.file_path).name: r for r in tracker.iter_execute(files)}
+        self.assertFalse(results["uses_pkg.py"].cached)
+        self.assertEqual(results["uses_pkg.py"].stdout.strip(), "2")
+        self.assertTrue(results["standalone.py"].cached)
+
+        stats = self._tracker().scan_and_execute(self.scripts, patterns=["*.py"])
+        self.assertEqual(stats.cached_executions, 2)
+
+    def test_environment_failures_are_not_cached(self):
+        missing = self._script("missing_dep.py", "import dmaic_not_installed_yet\n")
+        broken = self._script("broken.py", "raise ValueError('bad')\n")
+        files = [missing, broken]
+        list(self._tracker().iter_execute(files))
+
+        # Installing the package must not be hidden by a cached ImportError
+        tracker = self._tracker()
+        results = {Path(r.file_path).name: r for r in tracker.iter_execute(files)}
+        self.assertFalse(results["missing_dep.py"].cached)
+        self.assertEqual(results["missing_dep.py"].error_type.value, "ImportError")
+        self.assertTrue(results["broken.py"].cached)
+
+        tracker.execution_results = list(results.values())
+        self.assertIn("data files a script reads are not tracked",
+                      tracker.export_markdown().read_text())
+
+    @unittest.skipUnless(RLIMITS_AVAILABLE, "rlimits not available")
+    def test_memory_limit(self):
+        # Limits are set before the script starts, so even an immediate allocation fails
+        script = self._script("hog.py", "blob = bytearray(512 * 1024 * 1024)\n")
+        result = self._tracker(memory_limit_mb=256).execute_python_file(script)
+        self.assertEqual(result.status, ExecutionStatus.FAILED)
+        self.assertIn("MemoryError", result.stderr)
+
+    def test_script_runs_as_main(self):
+        script = self._script("main.py", "import sys\nprint(__name__, sys.argv[0] == __file__)\n")
+        result = self._tracker().execute_python_file(script)
+        self.assertEqual(result.status, ExecutionStatus.SUCCESS)
+        self.assertEqual(result.stdout.strip(), "__main__ True")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+DMAIC V3 Test Suite - File Hash History Tests
+Version: 3.3.0
+"""
+
+import hashlib
+import json
+import random
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from DMAIC_V3.convergence.change_detector import ChangeDetector
+from DMAIC_V3.convergence.hash_history import FileHashHistory, scan_file_stability
+
+
+class TestFileHashHistory(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.history_dir = self.root / "out" / "file_hash_history"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_matches_full_snapshot_history(self):
+        rng = random.Random(7)
+        history = FileHashHistory(self.history_dir, keep=4)
+        snapshots = []
+        files = {f"f{i}.py": "0" for i in range(30)}
+        for iteration in range(1, 21):
+            previous = dict(files)
+            for _ in range(rng.randint(0, 5)):
+                path = f"f{rng.randint(0, 34)}.py"
+                if rng.random() < 0.2:
+                    files.pop(path, None)
+                else:
+                    files[path] = str(rng.randint(0, 2))
+            removed = [p for p in previous if p not in files]
+            self.assertEqual(history.record(dict(files), removed), iteration)
+            snapshots.append(dict(files))
+
+            # Old behaviour: compare against the full map from 3 iterations back
+            expected = 0
+            if len(snapshots) >= 4:
+                old = snapshots[-4]
+                expected = sum(1 for p, h in files.items() if old.get(p) == h)
+            self.assertEqual(history.stable_count(3), expected)
+            self.assertEqual(history.current, files)
+            self.assertLessEqual(history.snapshot_count(), 8)
+
+            streak = 0
+            for snapshot in reversed(snapshots[-history.snapshot_count():]):
+                if snapshot.get("f1.py") != files.get("f1.py"):
+                    break
+                streak += 1
+            self.assertEqual(history.stable_iterations("f1.py"),
+                             streak if "f1.py" in files and len(snapshots) > 1 else 0)
+
+        reloaded = FileHashHistory(self.history_dir, keep=4)
+        self.assertEqual((reloaded.iteration, reloaded.current), (20, files))
+        self.assertEqual(reloaded.stable_count(3), history.stable_count(3))
+
+    def test_legacy_import(self):
+        legacy = self.root / "out" / ".file_hashes.json"
+        legacy.parent.mkdir()
+        entries = [{"iteration": i, "timestamp": "t", "hashes": {"a.py": "1", "b.py": str(i)}}
+                   for i in range(1, 11)]
+        legacy.write_text(json.dumps(entries))
+
+        history = FileHashHistory.for_output_dir(legacy.parent, keep=4)
+        self.assertFalse(legacy.exists())
+        self.assertEqual((history.iteration, history.snapshot_count()), (10, 4))
+        self.assertEqual(history.stable_count(3), 1)
+        self.assertEqual(history.stable_iterations("a.py"), 4)
+        self.assertEqual(FileHashHistory.for_output_dir(legacy.parent).current, {"a.py": "1", "b.py": "10"})
+
+    def test_scan_uses_change_detector_snapshot(self):
+        workspace = self.root / "ws"
+        (workspace / "pkg").mkdir(parents=True)
+        for name in ("a.py", "b.py", "notes.md"):
+            (workspace / "pkg" / name).write_text(name)
+        (workspace / ".venv" / "lib").mkdir(parents=True)
+        (workspace / ".venv" / "lib" / "dep.py").write_text("dep")
+        output_dir = workspace / "DMAIC_V3_OUTPUT"
+        output_dir.mkdir()
+        (output_dir / "report.py").write_text("report")
+
+        def scan():
+            history = FileHashHistory.for_output_dir(output_dir)
+            detector = ChangeDetector(workspace, output_dir / "convergence_state")
+            scan.detector = detector
+            return scan_file_stability(history, detector, lambda p: p.endswith(".py"), lag=1), history
+
+        self.assertEqual(scan()[0], (2, 0))
+        # Output and venv trees are pruned; untracked files get stat-only leaves
+        tree = scan.detector.tree
+        self.assertEqual(set(tree.dirs), {"pkg"})
+        files = tree.dirs["pkg"].files
+        self.assertEqual(files["a.py"].digest, hashlib.sha256(b"a.py").digest())
+        self.assertNotEqual(files["notes.md"].digest, hashlib.sha256(b"notes.md").digest())
+
+        (workspace / "pkg" / "b.py").write_text("changed")
+        (workspace / "pkg" / "c.py").write_text("new")
+        stats, history = scan()
+        self.assertEqual(stats, (3, 1))
+        self.assertEqual(history.deltas[-1]["changed"].keys(), {"pkg/b.py", "pkg/c.py"})
+
+        (workspace / "pkg" / "a.py").unlink()
+        stats, history = scan()
+        self.assertEqual(stats, (2, 2))
+        self.assertEqual(history.deltas[-1]["removed"], ["pkg/a.py"])
+        self.assertEqual(history.deltas[-1]["changed"], {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+DMAIC V3 Test Suite - Link Tracker Tests
+Version: 3.3.0
+"""
+
+import io
+import json
+import re
+import tempfile
+import unittest
+from collections import Counter
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from DMAIC_V3.core.link_tracker import LinkTracker, count_tokens, line_number, line_starts
+
+
+class TestLinkTracker(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        (self.root / "docs").mkdir()
+        (self.root / "docs" / "guide.md").write_text(
+            "# Guide\n\nSee [the engine](engine.py) for the pipeline.\n" + "filler " * 20 +
+            "\nParent version: [V1.1 notes](old.md)\nPhase phase phase\nVersion: 1.2\n"
+        )
+        (self.root / "engine.py").write_text('"""Engine\nVersion: 1.2"""\nphase = "measure"\n')
+        (self.root / "meta.json").write_text(json.dumps({"version": "1.1", "phase": "control"}))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_streaming_tokenizer_matches_whole_text(self):
+        text = "Alpha_beta gamma9 9delta DMAIC-phase x_1\n" * 50 + "tail_word"
+        expected = Counter(re.findall(r'\b[a-z_][a-z0-9_]*\b', text.lower()))
+        for chunk_size in (1, 7, 64, 1 << 20):
+            counts = count_tokens(io.BytesIO(text.encode()), chunk_size=chunk_size)
+            self.assertEqual({t.decode(): c for t, c in counts.items()}, expected)
+
+        content = "a\nb [x](y)\n\nc [z](w)"
+        newlines = line_starts(content)
+        self.assertEqual([line_number(newlines, content.index(ch)) for ch in "ab[c"], [1, 2, 2, 4])
+
+    def test_scan_shares_vocabulary(self):
+        tracker = LinkTracker(self.root)
+        graph = tracker.scan_project()
+
+        self.assertEqual([(l.target_file, l.line_number, l.link_type) for l in graph.links],
+                         [("engine.py", 3, "code_link"), ("old.md", 5, "recursive_hook")])
+        guide = graph.term_frequencies[str(Path("docs") / "guide.md")]
+        self.assertEqual(guide.technical_terms, {"pipeline": 1, "phase": 3})
+        self.assertEqual(guide.top_terms[:2], [("filler", 20), ("phase", 3)])
+        self.assertEqual(guide.term_counts["engine"], 2)  # link text and target
+
+        engine = graph.term_frequencies["engine.py"]
+        meta = graph.term_frequencies["meta.json"]
+        self.assertEqual(meta.version, "1.1")
+        self.assertEqual(meta.technical_terms, {"phase": 1, "control": 1})
+        # One id per term across all files
+        phase_id = graph.vocabulary.ids["phase"]
+        for tf in (guide, engine, meta):
+            self.assertIn(phase_id, tf.term_ids)
+        self.assertEqual(len(set(graph.vocabulary.terms)), len(graph.vocabulary))
+
+        report = self.root / "report.json"
+        tracker.generate_link_report(report)
+        data = json.loads(report.read_text())
+        self.assertEqual(data["link_graph"]["term_frequencies"]["engine.py"]["term_counts"]["phase"], 1)
+        self.assertEqual(data["metadata"]["versions_detected"], ["1.1", "1.2"])
+
+    def test_incremental_rescan_and_cache(self):
+        (self.root / "build").mkdir()
+        (self.root / "build" / "copy.md").write_text("[x](engine.py)\n")
+        (self.root / "phase.json").write_text(json.dumps({"version": "v032"}))
+        tracker = LinkTracker(self.root)
+        tracker.scan_project()
+        self.assertEqual(tracker.last_scan_stats['analyzed'], 4)  # build/ is pruned
+        self.assertEqual(tracker.graph.version_lineage, ["1.1", "1.2", "v032"])
+
+        # Only the edited file is re-analyzed; deleted files leave the graph
+        guide = self.root / "docs" / "guide.md"
+        guide.write_text("Version: 2.0\nSee [notes](notes.md)\n")
+        (self.root / "meta.json").unlink()
+        graph = tracker.scan_project()
+        self.assertEqual(tracker.last_scan_stats,
+                         {'files': 3, 'unchanged': 2, 'cached': 0, 'analyzed': 1, 'removed': 1})
+        self.assertEqual([l.target_file for l in graph.links], ["notes.md"])
+        self.assertNotIn("meta.json", graph.term_frequencies)
+        self.assertEqual(graph.version_lineage, ["1.2", "2.0", "v032"])
+        self.assertEqual(graph.nodes["2.0"].files, [str(Path("docs") / "guide.md")])
+
+        # A fresh tracker is served from the on-disk cache
+        fresh = LinkTracker(self.root)
+        fresh_graph = fresh.scan_project()
+        self.assertEqual(fresh.last_scan_stats['cached'], 3)
+        self.assertEqual(fresh.last_scan_stats['analyzed'], 0)
+        self.assertEqual([l.line_number for l in fresh_graph.links], [2])
+        self.assertEqual(fresh_graph.term_frequencies["engine.py"].term_counts["phase"], 1)
+
+    def test_failed_files_are_retried(self):
+        broken = self.root / "broken.json"
+        broken.write_text("{not json")
+        tracker = LinkTracker(self.root)
+        tracker.scan_project()
+        self.assertEqual(tracker.last_scan_stats['analyzed'], 4)
+        self.assertNotIn("broken.json", tracker.graph.term_frequencies)
+
+        # The failure is neither cached on disk nor remembered in-process
+        tracker.scan_project()
+        self.assertEqual(tracker.last_scan_stats['analyzed'], 1)
+        fresh = LinkTracker(self.root)
+        fresh.scan_project()
+        self.assertEqual((fresh.last_scan_stats['cached'], fresh.last_scan_stats['analyzed']), (3, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
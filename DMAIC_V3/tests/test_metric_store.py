@@ -0,0 +1,109 @@
+"""
+DMAIC V3 Test Suite - Columnar Metric Store Tests
+Version: 3.3.0
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from DMAIC_V3.core.metric_store import MetricColumnStore
+from DMAIC_V3.core.metrics import MetricsAggregator, MetricsTracker
+
+
+class TestMetricColumnStore(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.history = Path(self.temp_dir.name) / "history"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _store(self):
+        store = MetricColumnStore()
+        for iteration in range(1, 6):
+            store.append("duration", iteration * 10.0, iteration, "phase1")
+            store.append("duration", iteration * 10.0 + 2, iteration, "phase2")
+            store.append("files", iteration, iteration, "phase2")
+        return store
+
+    def test_aggregator_statistics_and_percentiles(self):
+        aggregator = MetricsAggregator()
+        for iteration in range(1, 11):
+            tracker = MetricsTracker("phase2", iteration)
+            tracker.record_gauge("loc", iteration * 100, "lines")
+            aggregator.add_phase_metrics(tracker.get_metrics())
+
+        stats = aggregator.get_metric_statistics("loc")
+        self.assertEqual(stats["count"], 10)
+        self.assertEqual((stats["min"], stats["max"], stats["sum"]), (100, 1000, 5500))
+        self.assertAlmostEqual(stats["mean"], 550)
+        self.assertAlmostEqual(stats["p50"], 550)
+        self.assertAlmostEqual(stats["p95"], 955)
+        self.assertAlmostEqual(stats["p99"], 991)
+        self.assertEqual(aggregator.get_metric_percentiles("loc", [0, 100]), {"p0": 100, "p100": 1000})
+        self.assertEqual(aggregator.get_metric_statistics("missing"), {})
+        self.assertEqual(aggregator.get_metric_statistics("loc", phase_name="phase9"), {})
+
+    def test_per_iteration_and_rolling(self):
+        store = self._store()
+        self.assertEqual(store.per_iteration("duration")[:2], [(1, 11.0), (2, 21.0)])
+        self.assertEqual(store.per_iteration("duration", 'max', phase_name="phase1")[-1], (5, 50.0))
+        self.assertEqual(store.rolling("duration", 2), [(1, 11.0), (2, 16.0), (3, 26.0), (4, 36.0), (5, 46.0)])
+        self.assertEqual([v for _, v in store.rolling("files", 3, 'min')], [1, 1, 1, 2, 3])
+        self.assertEqual([v for _, v in store.rolling("files", 2, 'max')], [1, 2, 3, 4, 5])
+        with self.assertRaises(ValueError):
+            store.rolling("files", 0)
+
+    def test_segments_round_trip(self):
+        store = self._store()
+        first = store.save_segment(self.history)
+        self.assertIsNone(store.save_segment(self.history))  # nothing new
+
+        store.append("duration", 99.0, 6, "phase3")
+        store.save_segment(self.history)
+        self.assertEqual(len(list(self.history.glob("segment_*.dmcs"))), 2)
+
+        loaded = MetricColumnStore.load(self.history)
+        self.assertEqual(loaded.count(), store.count())
+        self.assertEqual(loaded.values("duration"), store.values("duration"))
+        self.assertEqual(loaded.values("duration", phase_name="phase3"), [99.0])
+        self.assertEqual(loaded.statistics("files"), store.statistics("files"))
+
+        merged = loaded.compact(self.history)
+        self.assertEqual(list(self.history.glob("segment_*.dmcs")), [merged])
+        self.assertNotEqual(merged, first)
+        self.assertEqual(MetricColumnStore.load(self.history).values("duration"), store.values("duration"))
+
+        first.write_bytes(b"junk")
+        with self.assertRaises(ValueError):
+            MetricColumnStore().load_segment(first)
+
+    def test_load_history_keeps_unsaved_metrics(self):
+        self._store().save_segment(self.history)
+
+        aggregator = MetricsAggregator()
+        tracker = MetricsTracker("phase2", 6)
+        tracker.record_counter("files", 6)
+        aggregator.add_phase_metrics(tracker.get_metrics())
+        aggregator.save_history(self.history)
+        tracker = MetricsTracker("phase2", 7)
+        tracker.record_counter("files", 7)
+        aggregator.add_phase_metrics(tracker.get_metrics())
+
+        # Loads the other segment only; the iteration 7 value stays pending
+        self.assertEqual(aggregator.load_history(self.history), 1)
+        self.assertEqual(aggregator.load_history(self.history), 0)
+        self.assertEqual(sorted(aggregator.store.values("files")), [1, 2, 3, 4, 5, 6, 7])
+        self.assertEqual(aggregator.store.per_iteration("files")[-2:], [(6, 6.0), (7, 7.0)])
+
+        aggregator.save_history(self.history)
+        self.assertEqual(sorted(MetricColumnStore.load(self.history).values("files")),
+                         [1, 2, 3, 4, 5, 6, 7])
+
+
+if __name__ == '__main__':
+    unittest.main()
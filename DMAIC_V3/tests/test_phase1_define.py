@@ -2,7 +2,8 @@
 from pathlib import Path
 import tempfile
 import shutil
-from DMAIC_V3.phases.phase1_define import Phase1Define
+from DMAIC_V3.phases.phase1_define import Phase1Define, STREAM_DIR_NAME, iter_file_records
+from DMAIC_V3.phases.phase2_measure import Phase2Measure
 from DMAIC_V3.config import DMAICConfig
 from DMAIC_V3.core.state import StateManager
 
@@ -118,3 +119,78 @@ def test_file_categorization(self, phase1, temp_workspace):
         assert result['total_files'] >= 4
         assert result['categorized']['code'] >= 1
         assert result['categorized']['docs'] >= 1
+
+
+@pytest.mark.phase1
+@pytest.mark.unit
+class TestPhase1Streaming:
+
+    @pytest.fixture
+    def streaming_phase1(self, config, state_manager):
+        phase1 = Phase1Define(config, state_manager, streaming=True)
+        phase1.max_files_per_chunk = 3
+        return phase1
+
+    @pytest.fixture
+    def populated_workspace(self, temp_workspace):
+        for folder in ("pkg", "pkg/sub", "docs"):
+            (temp_workspace / folder).mkdir(parents=True, exist_ok=True)
+        for i in range(4):
+            (temp_workspace / "pkg" / f"mod{i}.py").write_text(f"x = {i}")
+        (temp_workspace / "pkg" / "sub" / "deep.py").write_text("y = 1")
+        (temp_workspace / "pkg" / "mod0.md").write_text("# mod0")
+        (temp_workspace / "docs" / "guide.md").write_text("# Guide")
+        return temp_workspace
+
+    def _records(self, config):
+        stream_dir = config.paths.output_root / "iteration_1" / "phase1_define" / STREAM_DIR_NAME
+        return list(iter_file_records(stream_dir))
+
+    def test_streams_records_to_segments(self, streaming_phase1, populated_workspace, config):
+        success, result = streaming_phase1.execute(iteration=1)
+        assert success is True
+        assert result['streaming'] is True
+        assert 'files' not in result
+        assert result['total_files'] == 7
+        assert result['python_file_count'] == 5
+        assert len(result['segments']) == 3
+
+        records = self._records(config)
+        assert len(records) == 7
+        assert len({r['path'] for r in records}) == 7
+        assert {'path', 'type', 'folder'} <= set(records[0])
+        assert any(rel['markdown'].endswith('mod0.md') for rel in result['file_relationships'])
+        assert not streaming_phase1.stream_cursor_file.exists()
+
+    def test_resume_after_interruption(self, streaming_phase1, populated_workspace, config):
+        original = streaming_phase1.get_file_type
+        calls = {'n': 0}
+
+        def flaky_get_file_type(path):
+            calls['n'] += 1
+            if calls['n'] == 5:
+                raise RuntimeError("simulated crash")
+            return original(path)
+
+        streaming_phase1.get_file_type = flaky_get_file_type
+        success, _ = streaming_phase1.execute(iteration=1)
+        assert success is False
+        cursor = streaming_phase1.load_stream_cursor()
+        assert cursor['chunk_num'] == 1
+        assert cursor['files_written'] == 3
+
+        streaming_phase1.get_file_type = original
+        success, result = streaming_phase1.execute(iteration=1)
+        assert success is True
+        assert result['total_files'] == 7
+        records = self._records(config)
+        assert sorted(r['path'] for r in records) == sorted({r['path'] for r in records})
+        assert len(records) == 7
+
+    def test_phase2_consumes_stream(self, streaming_phase1, populated_workspace, config,
+                                    state_manager):
+        streaming_phase1.execute(iteration=1)
+        phase2 = Phase2Measure(config, state_manager, use_12cluster=False)
+        success, result = phase2.execute(iteration=1)
+        assert success is True
+        assert result['statistics']['total_files'] == 5
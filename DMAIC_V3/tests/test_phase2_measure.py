@@ -6,6 +6,9 @@
 from DMAIC_V3.phases.phase2_measure import Phase2Measure
 from DMAIC_V3.config import DMAICConfig
 from DMAIC_V3.core.state import StateManager
+from DMAIC_V3.core.idempotency_wrapper import GLOBAL_IDEMPOTENCY, IdempotencyConfig
+from DMAIC_V3.core.phase_dag import PhaseNode
+from DMAIC_V3.convergence.background_change_detector import WATCHDOG_AVAILABLE
 
 
 @pytest.fixture
@@ -29,6 +32,15 @@ def state_manager(config):
     return StateManager(state_dir)
 
 
+@pytest.fixture(autouse=True)
+def phase_cache(temp_workspace):
+    """Phase-level idempotency cache in the temp workspace (not the repo's)"""
+    previous = GLOBAL_IDEMPOTENCY.config
+    GLOBAL_IDEMPOTENCY.configure(IdempotencyConfig(cache_dir=temp_workspace / "phase_cache"))
+    yield GLOBAL_IDEMPOTENCY
+    GLOBAL_IDEMPOTENCY.configure(previous)
+
+
 @pytest.fixture
 def phase2(config, state_manager):
     return Phase2Measure(config, state_manager)
@@ -197,3 +209,106 @@ def test_dual_output_locations(self, phase2, temp_workspace, config):
             data2 = json.load(f2)
             assert data1['phase'] == data2['phase']
             assert data1['iteration'] == data2['iteration']
+    
+    def test_incremental_reuses_unchanged_files(self, phase2, temp_workspace, config, phase_cache):
+        # Per-file metrics cache only; whole-phase reuse is tested below
+        phase_cache.config.enabled = False
+        phase1_dir = config.paths.output_root / "iteration_1" / "phase1_define"
+        phase1_dir.mkdir(parents=True, exist_ok=True)
+        
+        stable_file = temp_workspace / "stable.py"
+        changing_file = temp_workspace / "changing.py"
+        stable_file.write_text("def stable():\n    return 1\n")
+        changing_file.write_text("x = 1\n")
+        
+        phase1_output = {
+            'phase': 'DEFINE',
+            'iteration': 1,
+            'files': [str(stable_file), str(changing_file)],
+            'total_files': 2
+        }
+        (phase1_dir / "phase1_define.json").write_text(json.dumps(phase1_output))
+        
+        success, first = phase2.execute(iteration=1)
+        assert success is True
+        assert first['statistics']['cache_hits'] == 0
+        assert first['statistics']['files_reanalyzed'] == 2
+        
+        success, second = phase2.execute(iteration=1)
+        assert second['statistics']['cache_hits'] == 2
+        assert second['statistics']['files_reanalyzed'] == 0
+        assert second['file_metrics'] == first['file_metrics']
+        
+        changing_file.write_text("def changed():\n    pass\n\nclass C:\n    pass\n")
+        success, third = phase2.execute(iteration=1)
+        assert third['statistics']['cache_hits'] == 1
+        assert third['statistics']['files_reanalyzed'] == 1
+        assert third['file_metrics'][str(changing_file)]['metrics']['classes'] == 1
+        assert [m['file_path'] for m in third['measurements']] == phase1_output['files']
+
+    def test_unchanged_run_is_skipped_until_outputs_are_lost(self, phase2, temp_workspace, config,
+                                                              phase_cache):
+        phase1_dir = config.paths.output_root / "iteration_1" / "phase1_define"
+        phase1_dir.mkdir(parents=True, exist_ok=True)
+        source = temp_workspace / "module.py"
+        source.write_text("def f():\n    return 1\n")
+        (phase1_dir / "phase1_define.json").write_text(json.dumps({'files': [str(source)]}))
+
+        success, first = phase2.execute(iteration=1)
+        assert success is True
+        assert phase2.execute(1) == (True, first)
+        assert phase_cache.cache.get_stats()['hits'] == 1
+
+        # Missing outputs (deleted iteration dir, other machine) re-run the phase
+        metrics_file = config.paths.output_root / "iteration_1" / "phase2_metrics.json"
+        metrics_file.unlink()
+        success, rerun = phase2.execute(iteration=1)
+        assert metrics_file.exists()
+        assert rerun['timestamp'] != first['timestamp']
+
+        # So does a change to a measured file
+        source.write_text("class C:\n    pass\n")
+        success, changed = phase2.execute(iteration=1)
+        assert changed['statistics']['total_classes'] == 1
+
+    @pytest.mark.skipif(not WATCHDOG_AVAILABLE, reason="watchdog not installed")
+    def test_orchestrator_feeds_dirty_set_to_next_iteration(self, phase2, temp_workspace, config,
+                                                            phase_cache, monkeypatch):
+        from DMAIC_V3 import full_pipeline_orchestrator as pipeline
+
+        monkeypatch.chdir(temp_workspace)
+        monkeypatch.setattr(pipeline, 'DMAICConfig', lambda: config)
+        orchestrator = pipeline.FullPipelineOrchestrator(enable_idempotency_flag=False,
+                                                         enable_git_commits=False)
+        orchestrator.build_phase_graph = lambda: [
+            PhaseNode('phase2_measure', "Phase 2: Measure", lambda: phase2)
+        ]
+
+        stable_file = temp_workspace / "stable.py"
+        changing_file = temp_workspace / "changing.py"
+        stable_file.write_text("def stable():\n    return 1\n")
+        changing_file.write_text("x = 1\n")
+        for iteration in (1, 2):
+            phase1_dir = config.paths.output_root / f"iteration_{iteration}" / "phase1_define"
+            phase1_dir.mkdir(parents=True, exist_ok=True)
+            (phase1_dir / "phase1_define.json").write_text(
+                json.dumps({'files': [str(stable_file), str(changing_file)]}))
+
+        seen = []
+        dirty_paths = phase2._dirty_paths
+        monkeypatch.setattr(phase2, '_dirty_paths', lambda t: seen.append(dirty_paths(t)) or seen[-1])
+        try:
+            assert orchestrator.execute_full_pipeline(iteration=1) is True
+            changing_file.write_text("class C:\n    pass\n")
+            assert orchestrator.execute_full_pipeline(iteration=2) is True
+        finally:
+            orchestrator.close()
+
+        # The watcher kept running between iterations, so the second run gets a dirty set
+        assert seen[0] is None
+        assert seen[1] is not None
+        assert str(changing_file) in seen[1]
+        assert str(stable_file) not in seen[1]
+        metrics = json.loads((config.paths.output_root / "iteration_2" / "phase2_metrics.json").read_text())
+        assert metrics['statistics']['cache_hits'] == 1
+        assert metrics['statistics']['total_classes'] == 1
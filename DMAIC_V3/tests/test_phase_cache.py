@@ -0,0 +1,165 @@
+"""
+DMAIC V3 Test Suite - Content-Addressed Phase Cache Tests
+Version: 3.3.0
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from DMAIC_V3.core.phase_cache import PhaseCache, artifact_digest, fingerprint
+from DMAIC_V3.core.idempotency_wrapper import IdempotencyConfig, IdempotentPhaseWrapper
+
+
+class FakeConfig:
+    def __init__(self, mode):
+        self.mode = mode
+
+    def to_dict(self):
+        return {"mode": self.mode}
+
+
+class TestPhaseCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.workspace = self.root / "workspace"
+        (self.workspace / "docs").mkdir(parents=True)
+        (self.workspace / "docs" / "a.md").write_text("alpha")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _phase_class(self, wrapper, calls):
+        workspace = self.workspace
+
+        class Phase:
+            def __init__(self, mode="fast"):
+                self.config = FakeConfig(mode)
+                self.workspace_root = workspace
+
+            def input_artifacts(self):
+                return [self.workspace_root / "docs"]
+
+            @wrapper.idempotent(phase_name="phase_test")
+            def execute(self, iteration=1):
+                calls.append(iteration)
+                return True, {"files": len(calls)}
+
+        return Phase
+
+    def test_hits_across_instances_and_tracks_inputs(self):
+        wrapper = IdempotentPhaseWrapper(IdempotencyConfig(cache_dir=self.root / "cache"))
+        calls = []
+        Phase = self._phase_class(wrapper, calls)
+
+        first = Phase().execute(iteration=1)
+        self.assertEqual(first, (True, {"files": 1}))
+        # A new object (different address) with the same inputs hits, tuple intact
+        self.assertEqual(Phase().execute(iteration=1), (True, {"files": 1}))
+        self.assertEqual(len(calls), 1)
+
+        (self.workspace / "docs" / "a.md").write_text("changed")
+        Phase().execute(iteration=1)
+        Phase(mode="slow").execute(iteration=1)
+        Phase().execute(iteration=2)
+        self.assertEqual(len(calls), 4)
+
+        stats = wrapper.cache.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 4))
+
+    def test_failures_are_not_cached(self):
+        wrapper = IdempotentPhaseWrapper(IdempotencyConfig(cache_dir=self.root / "cache"))
+        outcomes = [(False, {"error": "disk full"}), (True, {"files": 2})]
+
+        @wrapper.idempotent(phase_name="phase_flaky", inputs=[])
+        def execute(iteration=1):
+            return outcomes.pop(0)
+
+        self.assertEqual(execute(iteration=1), (False, {"error": "disk full"}))
+        self.assertEqual(execute(iteration=1), (True, {"files": 2}))
+        self.assertEqual(execute(iteration=1), (True, {"files": 2}))  # served from cache
+        self.assertEqual(wrapper.cache.get_stats()["stores"], 1)
+
+    def test_missing_outputs_force_a_rerun(self):
+        wrapper = IdempotentPhaseWrapper(IdempotencyConfig(cache_dir=self.root / "cache"))
+        calls = []
+        workspace = self.workspace
+
+        class Phase:
+            def __init__(self):
+                self.config = FakeConfig("fast")
+                self.workspace_root = workspace
+
+            def input_artifacts(self, iteration):
+                return [self.workspace_root / "docs"]
+
+            def output_artifacts(self, iteration):
+                return [self.workspace_root / f"iteration_{iteration}" / "out.json"]
+
+            @wrapper.idempotent(phase_name="phase_out")
+            def execute(self, iteration):
+                calls.append(iteration)
+                out = self.output_artifacts(iteration)[0]
+                out.parent.mkdir(exist_ok=True)
+                out.write_text(str(len(calls)))
+                return True, {"run": len(calls)}
+
+        self.assertEqual(Phase().execute(1), (True, {"run": 1}))
+        self.assertEqual(Phase().execute(iteration=1), (True, {"run": 1}))
+        self.assertEqual(len(calls), 1)
+
+        # Deleted (e.g. fresh checkout) or edited outputs are a miss
+        (self.workspace / "iteration_1" / "out.json").unlink()
+        self.assertEqual(Phase().execute(1), (True, {"run": 2}))
+        (self.workspace / "iteration_1" / "out.json").write_text("edited")
+        self.assertEqual(Phase().execute(1), (True, {"run": 3}))
+        self.assertEqual(Phase().execute(1), (True, {"run": 3}))
+
+        # Reconfiguring applies to methods decorated earlier
+        wrapper.configure(IdempotencyConfig(enabled=False, cache_dir=self.root / "cache"))
+        Phase().execute(1)
+        self.assertEqual(len(calls), 4)
+
+    def test_relative_cache_dir_is_anchored(self):
+        config = IdempotencyConfig(cache_dir=Path("DMAIC_V3_OUTPUT") / "state" / "cache")
+        self.assertTrue(config.cache_dir.is_absolute())
+        self.assertEqual(IdempotencyConfig().cache_dir, config.cache_dir)
+
+    def test_lru_eviction(self):
+        cache = PhaseCache(self.root / "cache", max_entries=2)
+        cache.put("p", "k1", {"v": 1})
+        cache.put("p", "k2", {"v": 2})
+        os.utime(cache.cache_dir / "p-k1.json", (1, 1))
+        os.utime(cache.cache_dir / "p-k2.json", (2, 2))
+        self.assertTrue(cache.get("p", "k1")[0])  # k1 becomes most recent
+        cache.put("p", "k3", {"v": 3})
+
+        self.assertEqual(cache.get("p", "k2"), (False, None))
+        self.assertEqual(cache.get("p", "k1"), (True, {"v": 1}))
+        self.assertEqual(cache.get_stats()["evictions"], 1)
+
+        # A new process rebuilds the index from disk and keeps the byte bound
+        sized = PhaseCache(self.root / "cache", max_entries=10, max_bytes=cache._total_bytes + 10)
+        sized.put("p", "k4", {"v": 4})
+        self.assertEqual(sized.get("p", "k1"), (False, None))
+        self.assertEqual(len(list(sized.cache_dir.glob("*.json"))), 2)
+
+    def test_keys_are_machine_independent(self):
+        other = self.root / "elsewhere"
+        (other / "docs").mkdir(parents=True)
+        (other / "docs" / "a.md").write_text("alpha")
+
+        self.assertEqual(artifact_digest([self.workspace / "docs"], self.workspace),
+                         artifact_digest([other / "docs"], other))
+        self.assertEqual(fingerprint({"out": self.workspace / "out"}, self.workspace),
+                         fingerprint({"out": other / "out"}, other))
+        self.assertEqual(fingerprint(object()), fingerprint(object()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+DMAIC V3 Test Suite - Phase DAG Executor Tests
+Version: 3.3.0
+"""
+
+import time
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from DMAIC_V3.core.phase_dag import PhaseDAGExecutor, PhaseNode
+
+
+def node(phase_id, depends_on=(), required=True):
+    return PhaseNode(phase_id, phase_id, factory=lambda: None,
+                     depends_on=tuple(depends_on), required=required)
+
+
+class TestPhaseDAGExecutor(unittest.TestCase):
+    def _runner(self, durations, failing=(), calls=None):
+        def run_phase(phase):
+            if calls is not None:
+                calls.append(phase.phase_id)
+            time.sleep(durations.get(phase.phase_id, 0.0))
+            return phase.phase_id not in failing, {}
+        return run_phase
+
+    def test_independent_phases_overlap(self):
+        nodes = [node('a'), node('b', ['a']), node('c', ['a']), node('d', ['b', 'c'])]
+        durations = {'a': 0.05, 'b': 0.2, 'c': 0.1, 'd': 0.05}
+        executor = PhaseDAGExecutor(nodes, max_workers=4)
+
+        runs, ok = executor.run(self._runner(durations))
+        report = executor.critical_path_report(runs)
+
+        self.assertTrue(ok)
+        self.assertEqual(report['critical_path'], ['a', 'b', 'd'])
+        self.assertLess(report['wall_clock_seconds'], report['sequential_seconds'] - 0.05)
+        self.assertGreaterEqual(runs['d'].start, runs['b'].end)
+
+    def test_required_failure_stops_dependents(self):
+        calls = []
+        executor = PhaseDAGExecutor([node('a'), node('b', ['a']), node('c', ['b'])])
+
+        runs, ok = executor.run(self._runner({}, failing={'b'}, calls=calls))
+
+        self.assertFalse(ok)
+        self.assertEqual(calls, ['a', 'b'])
+        self.assertFalse(runs['b'].success)
+
+    def test_optional_failure_continues(self):
+        nodes = [node('a'), node('b', ['a'], required=False), node('c', ['b'], required=False)]
+        executor = PhaseDAGExecutor(nodes)
+
+        runs, ok = executor.run(self._runner({}, failing={'b'}))
+
+        self.assertTrue(ok)
+        self.assertEqual(set(runs), {'a', 'b', 'c'})
+        self.assertTrue(runs['c'].success)
+
+    def test_invalid_graphs_rejected(self):
+        with self.assertRaises(ValueError):
+            PhaseDAGExecutor([node('a', ['b']), node('b', ['a'])])
+        with self.assertRaises(ValueError):
+            PhaseDAGExecutor([node('a', ['missing'])])
+
+    def test_inputs_must_come_from_dependencies(self):
+        producer = PhaseNode('a', 'a', factory=lambda: None, outputs=('a.json',))
+        middle = PhaseNode('b', 'b', factory=lambda: None, depends_on=('a',))
+        reader = PhaseNode('c', 'c', factory=lambda: None, depends_on=('b',), inputs=('a.json',))
+        PhaseDAGExecutor([producer, middle, reader])
+
+        unordered = PhaseNode('c', 'c', factory=lambda: None, inputs=('a.json',))
+        with self.assertRaises(ValueError):
+            PhaseDAGExecutor([producer, unordered])
+
+    def test_pipeline_graph_declares_phase_reads(self):
+        from DMAIC_V3.full_pipeline_orchestrator import FullPipelineOrchestrator
+
+        owner = SimpleNamespace(config=None, state_mgr=None)
+        executor = PhaseDAGExecutor(FullPipelineOrchestrator.build_phase_graph(owner))
+
+        # Phase 9 summarizes every phase directory, including phase 8's
+        self.assertIn('phase8_todo_management', executor.ancestors('phase9_documentation_generation'))
+        self.assertIn('phase8_todo_management/',
+                      executor.nodes['phase9_documentation_generation'].inputs)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+DMAIC V3 Test Suite - Ranking Engine Tests
+Version: 3.3.0
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from DMAIC_V3.core.ranking_engine import RankingEngine
+
+
+class TestRankingEngine(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.engine = RankingEngine(self.root)
+
+    def tearDown(self):
+        self.engine.close()
+        self.temp_dir.cleanup()
+
+    def _rank(self, name, quality, coverage=0.5, entity_type="file"):
+        return self.engine.calculate_global_ranking(
+            self.root / name, entity_type,
+            {"quality": {"score": quality}, "coverage": {"score": coverage}}
+        )
+
+    def test_set_based_rank_update(self):
+        self._rank("a.py", 0.9, 0.9)
+        self._rank("b.py", 0.5, 0.5)
+        self._rank("c.py", 0.5, 0.5)
+        self._rank("d.py", 0.1, 0.1)
+        self._rank("pkg", 1.0, 1.0, entity_type="package")
+
+        self.assertEqual(self.engine.update_rankings_for_all_entities("file"), 4)
+
+        top = self.engine.get_top_ranked(entity_type="file", limit=10)
+        self.assertEqual([r.entity_id for r in top][0], "a.py")
+        # Equal scores share a position
+        self.assertEqual([r.rank_position for r in top], [1, 2, 2, 4])
+        self.assertEqual(top[0].percentile, 100.0)
+        self.assertEqual(top[-1].percentile, 25.0)
+        self.assertEqual(top[0].total_entities, 4)
+        self.assertEqual(len(self.engine.get_ranking_history("a.py")), 1)
+
+    def test_top_ranked_joins_category_scores(self):
+        self._rank("a.py", 0.2)
+        self._rank("a.py", 0.8)  # re-ranking replaces the category scores
+        self._rank("b.py", 0.4)
+        self.engine.update_rankings_for_all_entities()
+
+        top = self.engine.get_top_ranked(limit=1)
+        self.assertEqual(len(top), 1)
+        self.assertEqual(set(top[0].category_scores), {"quality", "coverage"})
+        self.assertEqual(top[0].category_scores["quality"].score, 0.8)
+        self.assertEqual(self.engine._load_category_scores("a.py")["quality"].score, 0.8)
+
+    def test_batch_matches_single_entity_scoring(self):
+        metrics = [
+            {"quality": {"score": 0.9, "confidence": 0.5}, "security": {"score": 0.2}},
+            {"coverage": {"score": 0.7}, "custom": {"score": 0.4, "confidence": 0.8}},
+            {},
+        ]
+        entities = [{"entity_path": self.root / f"m{i}.py", "entity_type": "file",
+                     "category_metrics": m} for i, m in enumerate(metrics)]
+
+        batch = self.engine.calculate_global_rankings(entities)
+        self.assertEqual([r.entity_id for r in batch], ["m0.py", "m1.py", "m2.py"])
+        self.assertEqual(sorted(r.rank_position for r in batch), [1, 2, 3])
+        self.assertTrue(all(r.total_entities == 3 for r in batch))
+
+        for ranking, entity in zip(batch, entities):
+            single = self.engine.calculate_global_ranking(
+                entity["entity_path"], "file", entity["category_metrics"])
+            self.assertAlmostEqual(ranking.overall_score, single.overall_score)
+            self.assertAlmostEqual(ranking.metadata["total_weight"], single.metadata["total_weight"])
+
+        stored = {r.entity_id: r for r in self.engine.get_top_ranked(limit=10)}
+        self.assertEqual(set(stored["m1.py"].category_scores), {"coverage", "custom"})
+
+
+if __name__ == '__main__':
+    unittest.main()
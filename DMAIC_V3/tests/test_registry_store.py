@@ -0,0 +1,99 @@
+"""
+DMAIC V3 Test Suite - Action/TODO Registry Store Tests
+Version: 3.3.0
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from DMAIC_V3.phases.phase7_action_tracking import ActionTracker
+from DMAIC_V3.phases.phase8_todo_management import TODOTracker
+
+
+class TestRegistries(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.workspace = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _todos(self):
+        return [
+            {'phase': 'phase4', 'agent': 'CodeImprover', 'description': 'fix a', 'timestamp': 't1',
+             'priority': 'high'},
+            {'phase': 'phase4', 'agent': 'CodeImprover', 'description': 'fix b', 'timestamp': 't1'},
+            {'phase': 'phase5', 'agent': 'Controller', 'description': 'check', 'timestamp': 't1',
+             'status': 'completed'},
+        ]
+
+    def test_todo_batch_and_queries(self):
+        tracker = TODOTracker(self.workspace)
+        ids = tracker.register_many(self._todos())
+        self.assertEqual(len(set(ids)), 3)
+
+        # Re-registering the same TODOs updates them instead of duplicating
+        tracker.register_many(self._todos())
+        stats = tracker.get_statistics()
+        self.assertEqual(stats['total'], 3)
+        self.assertEqual(stats['by_priority'], {'high': 1, 'medium': 2})
+        self.assertAlmostEqual(stats['completion_rate'], 100 / 3)
+
+        self.assertEqual([t['description'] for t in tracker.get_todos_by_phase('phase4')],
+                         ['fix a', 'fix b'])
+        tracker.update_todo_status(ids[1], 'in_progress')
+        self.assertEqual([t['todo_id'] for t in tracker.get_todos_by_status('in_progress')], [ids[1]])
+        self.assertEqual(len(tracker.get_todos_by_status('pending')), 1)
+
+        tracker.export_registry()
+        exported = json.loads(tracker.global_registry_path.read_text())
+        self.assertEqual(exported['total_todos'], 3)
+        self.assertEqual(exported['statistics']['by_status']['in_progress'], 1)
+
+    def test_actions_and_legacy_import(self):
+        legacy = self.workspace / "DMAIC_V3_OUTPUT" / "global_action_registry.json"
+        legacy.parent.mkdir(parents=True)
+        legacy.write_text(json.dumps({'actions': [
+            {'action_id': 'old1', 'phase': 'phase2', 'agent': 'Measurer', 'status': 'completed'},
+        ]}))
+
+        tracker = ActionTracker(self.workspace)
+        tracker.register_action({'phase': 'phase4', 'agent': 'CodeImprover', 'timestamp': 'a'})
+        tracker.register_many([{'phase': 'phase4', 'agent': 'Reviewer', 'timestamp': 'b'}])
+
+        stats = tracker.get_action_statistics()
+        self.assertEqual(stats['total_actions'], 3)
+        self.assertEqual(stats['by_phase'], {'phase2': 1, 'phase4': 2})
+        self.assertEqual([a['agent'] for a in tracker.get_actions_by_phase('phase4')],
+                         ['CodeImprover', 'Reviewer'])
+        self.assertEqual(tracker.get_actions_by_agent('Measurer')[0]['action_id'], 'old1')
+
+    def test_actions_with_same_phase_agent_and_timestamp_are_kept(self):
+        legacy = self.workspace / "DMAIC_V3_OUTPUT" / "global_action_registry.json"
+        legacy.parent.mkdir(parents=True)
+        legacy.write_text(json.dumps({'actions': [
+            {'action_id': 'dup', 'phase': 'phase4', 'agent': 'CodeImprover', 'file': 'a.py'},
+            {'action_id': 'dup', 'phase': 'phase4', 'agent': 'CodeImprover', 'file': 'b.py'},
+        ]}))
+        tracker = ActionTracker(self.workspace)
+        self.assertEqual(tracker.get_action_statistics()['total_actions'], 2)
+
+        actions = [{'phase': 'phase4', 'agent': 'CodeImprover', 'timestamp': 't1',
+                    'category': 'docstrings_added', 'description': f"Docstrings Added: {name}",
+                    'file': name} for name in ('c.py', 'd.py')]
+        ids = tracker.register_many([dict(action) for action in actions])
+        self.assertEqual(len(set(ids)), 2)
+        self.assertEqual(tracker.get_action_statistics()['total_actions'], 4)
+
+        # Identical content maps to the same row
+        self.assertEqual(tracker.register_many([dict(action) for action in actions]), ids)
+        self.assertEqual(tracker.get_action_statistics()['total_actions'], 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
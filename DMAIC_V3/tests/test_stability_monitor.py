@@ -5,13 +5,17 @@
 Updated: 2025-11-12T05:00:00Z
 """
 
+import random
+import statistics
+import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from DMAIC_V3.convergence.stability_monitor import StabilityMonitor
+from DMAIC_V3.convergence.stability_monitor import RollingWindow, StabilityMonitor
 
 
 class TestStabilityMonitor(unittest.TestCase):
@@ -51,6 +55,70 @@ def test_generate_report(self):
         self.assertGreaterEqual(report.overall_stability, 0)
         self.assertLessEqual(report.overall_stability, 100)
 
+    def test_rolling_window_matches_full_recompute(self):
+        rng = random.Random(3)
+        window = RollingWindow(5)
+        values = []
+        for _ in range(200):
+            value = rng.uniform(-50, 1000)
+            window.append(value)
+            values.append(value)
+            recent = values[-5:]
+            self.assertEqual(list(window), recent)
+            self.assertAlmostEqual(window.mean, statistics.fmean(recent), places=6)
+            self.assertAlmostEqual(window.variance, statistics.pvariance(recent), places=4)
+            self.assertAlmostEqual(window.recent_mean(3), statistics.fmean(recent[-3:]), places=6)
+
+    def test_metric_and_test_history(self):
+        monitor = StabilityMonitor(self.workspace, window_size=4, max_alerts=3)
+        for value in (10, 10, 10, 20):
+            monitor.record_metric("latency", value)
+        for value in (5, 5.1, 5, 5, 4.9):
+            monitor.record_metric("loc", value)
+        self.assertEqual([a.alert_type for a in monitor.alerts], ["metric_variance"])
+        self.assertEqual(monitor.get_metric_statistics("latency")["mean"], 12.5)
+        self.assertEqual(monitor.get_metric_statistics("loc")["count"], 4)
+        self.assertEqual(monitor.calculate_metric_stability(), 50.0)
+
+        for status in ("PASSED", "FAILED", "PASSED", "PASSED", "FAILED"):
+            monitor.record_test_result("test_flaky", status, 0.1)
+        for _ in range(6):
+            monitor.record_test_result("test_ok", "PASSED", 0.1)
+        self.assertEqual(monitor.calculate_test_stability(), 50.0)
+        for status in ("PASSED",) * 4:
+            monitor.record_test_result("test_flaky", status, 0.1)
+        self.assertEqual(monitor.calculate_test_stability(), 100.0)
+
+        # Alerts are bounded but still counted
+        self.assertEqual(len(monitor.alerts), 3)
+        self.assertEqual(monitor.alert_counts["HIGH"], 2)
+        self.assertIn("Address 2 high-severity alerts", monitor.generate_recommendations())
+
+    def test_file_hash_reused_until_stat_changes(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "module.py"
+            path.write_text("x = 1\n")
+            monitor = StabilityMonitor(Path(temp_dir), window_size=3)
+            events = []
+            monitor.register_change_hook(lambda kind, snapshot: events.append((kind, snapshot.hash)))
+
+            self.assertFalse(monitor.track_file(path))
+            with mock.patch.object(monitor, "_calculate_file_hash", wraps=monitor._calculate_file_hash) as hasher:
+                self.assertFalse(monitor.track_file(path))
+                self.assertEqual(monitor.snapshot_file(path).hash, monitor.file_states[str(path)].hash)
+                hasher.assert_not_called()
+
+                path.write_text("x = 22\n")
+                self.assertTrue(monitor.track_file(path))
+                self.assertEqual(hasher.call_count, 1)
+            self.assertEqual(events, [("file", monitor.file_states[str(path)].hash)])
+            self.assertEqual(monitor.calculate_file_stability(), 0.0)
+
+            monitor.track_file(path)
+            self.assertEqual(monitor.calculate_file_stability(), 0.0)
+            monitor.track_file(path)  # the old hash has left the window
+            self.assertEqual(monitor.calculate_file_stability(), 100.0)
+
 
 if __name__ == '__main__':
     unittest.main()
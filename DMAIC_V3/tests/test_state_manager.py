@@ -0,0 +1,116 @@
+"""
+DMAIC V3 Test Suite - State Manager Journal Tests
+Version: 3.3.0
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from DMAIC_V3.core.state import StateManager, PhaseStatus
+
+
+class TestStateJournal(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.state_dir = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _run_iteration(self, manager, number):
+        manager.start_iteration(number)
+        manager.start_phase("phase1_define", 1, {"input": number})
+        manager.save_checkpoint("phase1_define", {"step": 1})
+        manager.save_checkpoint("phase1_define", {"files": number})
+        manager.end_phase("phase1_define", PhaseStatus.COMPLETED, {"out": number},
+                          metrics={"files": number})
+        manager.end_iteration("completed")
+
+    def _journal_lines(self):
+        return self.state_dir.joinpath("execution_state.journal").read_text().splitlines()
+
+    def test_replay_restores_state(self):
+        manager = StateManager(self.state_dir, compact_every=1000)
+        self._run_iteration(manager, 1)
+        manager.start_iteration(2)
+        manager.start_phase("phase2_measure", 2)
+        manager.save_checkpoint("phase2_measure", {"chunk": 3})
+
+        self.assertFalse(manager.state_file.exists())
+        self.assertEqual(len(self._journal_lines()), 9)
+
+        reloaded = StateManager(self.state_dir)
+        self.assertEqual(reloaded._serialize_state()["execution_history"],
+                         manager._serialize_state()["execution_history"])
+        self.assertEqual(reloaded.load_checkpoint("phase2_measure"), {"chunk": 3})
+        self.assertEqual(reloaded.execution_history[0].phases["phase1_define"].checkpoint_data,
+                         {"step": 1, "files": 1})
+        self.assertEqual(reloaded.get_resume_point(), 2)
+
+    def test_compaction_truncates_journal(self):
+        manager = StateManager(self.state_dir, compact_every=4)
+        for number in range(1, 4):
+            self._run_iteration(manager, number)
+
+        # 18 events: compacted at 4, 8, 12 and 16, leaving two in the journal
+        self.assertEqual(len(self._journal_lines()), 2)
+        snapshot = json.loads(manager.state_file.read_text())
+        self.assertEqual(snapshot["journal_seq"], 16)
+
+        reloaded = StateManager(self.state_dir)
+        self.assertEqual(len(reloaded.execution_history), 3)
+        self.assertIsNone(reloaded.current_iteration)
+
+    def test_crash_recovery(self):
+        manager = StateManager(self.state_dir, compact_every=1000)
+        self._run_iteration(manager, 1)
+        journal = self._journal_lines()
+
+        # Snapshot written but journal not yet truncated, plus a torn append
+        manager.compact()
+        self.state_dir.joinpath("execution_state.journal").write_text(
+            "\n".join(journal) + "\n" + '{"seq": 7, "op": "start_iter')
+
+        reloaded = StateManager(self.state_dir)
+        self.assertEqual(len(reloaded.execution_history), 1)
+        self.assertIsNone(reloaded.current_iteration)
+
+        # The torn tail is dropped, so later events replay normally
+        reloaded.start_iteration(2)
+        self.assertEqual(StateManager(self.state_dir).current_iteration.iteration_number, 2)
+
+    def test_corrupt_snapshot_keeps_journal_and_seq(self):
+        manager = StateManager(self.state_dir, compact_every=3)
+        manager.start_iteration(1)
+        for number in range(1, 5):
+            manager.start_phase(f"phase{number}", number)
+        # Compacted at seq 3; seq 4 and 5 are in the journal
+        self.assertEqual(len(self._journal_lines()), 2)
+        manager.state_file.write_text("{corrupt")
+
+        # Phase events cannot replay without the snapshot's iteration
+        reloaded = StateManager(self.state_dir, compact_every=100)
+        self.assertEqual(len(self._journal_lines()), 2)
+        self.assertEqual(reloaded._seq, 5)
+        reloaded.start_iteration(2)
+        self.assertEqual(json.loads(self._journal_lines()[-1])["seq"], 6)
+
+    def test_malformed_lines_are_not_applied(self):
+        manager = StateManager(self.state_dir, compact_every=1000)
+        manager.start_iteration(1)
+        journal = self.state_dir.joinpath("execution_state.journal")
+        journal.write_text(journal.read_text() + "[1, 2]\n" + '{"op": "end_iteration"}\n')
+
+        reloaded = StateManager(self.state_dir)
+        self.assertEqual(reloaded.current_iteration.iteration_number, 1)
+        self.assertEqual(len(self._journal_lines()), 1)  # trailing junk dropped
+        self.assertEqual(reloaded._seq, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+DMAIC V3 Test Suite - Temporal Metadata Engine Tests
+Version: 3.3.0
+"""
+
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from DMAIC_V3.core.temporal_metadata_engine import TemporalMetadataEngine
+
+
+class TestTemporalMetadataIngest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        for i in range(5):
+            path = self.root / f"pkg{i % 2}" / f"mod{i}.py"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(f"def f{i}():\n    return {i}\n")
+        self.db_path = self.root / ".dmaic" / "meta.db"
+        self.engine = TemporalMetadataEngine(self.root, db_path=self.db_path, ingest_batch_size=2)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _count(self, table):
+        conn = sqlite3.connect(str(self.db_path))
+        try:
+            return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        finally:
+            conn.close()
+
+    def test_bulk_ingest_stats(self):
+        files, folders = self.engine.scan_workspace()
+        stats = self.engine.last_ingest_stats
+        self.assertEqual(stats['file_rows'], len(files))
+        self.assertEqual(stats['folder_rows'], len(folders))
+        # 5 file rows and 3 folder rows (pkg0, pkg1, .dmaic) in batches of 2
+        self.assertEqual(stats['batches'], 5)
+        self.assertGreater(stats['rows_per_second'], 0)
+        self.assertEqual(self._count('file_metadata'), len(files))
+
+    def test_rescan_upserts(self):
+        self.engine.scan_workspace()
+        (self.root / "pkg0" / "mod0.py").write_text("x = 2\n")
+        files, _ = self.engine.scan_workspace()
+        self.assertEqual(self._count('file_metadata'), len(files))
+        conn = sqlite3.connect(str(self.db_path))
+        try:
+            functions = conn.execute("SELECT functions FROM file_metadata WHERE file_path = ?",
+                                     (str(Path("pkg0", "mod0.py")),)).fetchone()[0]
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        finally:
+            conn.close()
+        self.assertEqual(functions, "[]")
+        self.assertEqual(mode, "wal")
+
+
+if __name__ == '__main__':
+    unittest.main()
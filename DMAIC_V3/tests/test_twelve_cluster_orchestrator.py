@@ -0,0 +1,105 @@
+"""
+DMAIC V3 Test Suite - 12-Cluster Orchestrator Tests
+Version: 3.3.0
+"""
+
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from DMAIC_V3.core.twelve_cluster_orchestrator import (
+    TwelveClusterOrchestrator,
+    TaskDescriptor,
+    interleave_batches,
+    resolve_target,
+)
+
+
+class TestTwelveClusterOrchestrator(unittest.TestCase):
+    def _tasks(self, count):
+        return [{"target": "operator:mul", "args": (i, 2), "key": str(i)} for i in range(count)]
+
+    def test_resolve_target(self):
+        self.assertEqual(resolve_target("os.path:join")("a", "b"), "a/b")
+
+    def test_descriptor_rejects_unpicklable_callables(self):
+        self.assertIsNone(TaskDescriptor.from_task({"func": lambda x: x}))
+        self.assertIsNone(TaskDescriptor.from_task({"func": self.setUp}))
+        descriptor = TaskDescriptor.from_task({"func": resolve_target, "args": ("os:getcwd",)})
+        self.assertEqual(descriptor.target,
+                         "DMAIC_V3.core.twelve_cluster_orchestrator:resolve_target")
+
+    def test_thread_backend_results_map(self):
+        orchestrator = TwelveClusterOrchestrator(use_keb=False, use_gbogeb=False)
+        results = orchestrator.execute_phase_parallel("phase2", self._tasks(10), iteration=1)
+        self.assertEqual(results["backend"], "thread")
+        self.assertEqual(results["results_map"]["3"], 6)
+
+    def test_process_backend_streams_results(self):
+        orchestrator = TwelveClusterOrchestrator(use_keb=False, use_gbogeb=False,
+                                                 backend="process", process_workers=2,
+                                                 batch_size=4)
+        streamed = []
+        results = orchestrator.execute_phase_parallel("phase2", self._tasks(20), iteration=1,
+                                                      on_result=streamed.append)
+        self.assertEqual(results["backend"], "process")
+        self.assertEqual(results["tasks_executed"], 20)
+        self.assertEqual(len(streamed), 20)
+        self.assertEqual(results["results_map"]["7"], 14)
+        self.assertEqual(sum(s["tasks_executed"] for s in results["worker_stats"].values()), 20)
+        stats = results["cluster_stats"]
+        self.assertEqual(sum(s["tasks_executed"] for s in stats.values()), 20)
+        for worker_stats in stats.values():
+            self.assertGreaterEqual(worker_stats["utilization"], 0.0)
+
+    def test_interleaved_batches_spread_large_tasks(self):
+        descriptors = [TaskDescriptor(target="operator:mul", key=str(w), weight=w)
+                       for w in range(100, 0, -1)]
+        batches = interleave_batches(descriptors, batch_size=25)
+        self.assertEqual([len(b) for b in batches], [25, 25, 25, 25])
+        self.assertEqual([b[0].weight for b in batches], [100, 99, 98, 97])
+        weights = [sum(d.weight for d in b) for b in batches]
+        self.assertLess(max(weights) - min(weights), 100)
+        self.assertEqual(interleave_batches(descriptors[:3], batch_size=32), [descriptors[:3]])
+
+    def test_process_backend_falls_back_for_lambdas(self):
+        orchestrator = TwelveClusterOrchestrator(use_keb=False, use_gbogeb=False,
+                                                 backend="process", process_workers=2)
+        tasks = [{"func": lambda x: x + 1, "args": (i,), "key": str(i)} for i in range(4)]
+        results = orchestrator.execute_phase_parallel("phase2", tasks, iteration=1)
+        self.assertEqual(results["backend"], "thread")
+        self.assertEqual(results["results_map"]["2"], 3)
+
+    def test_work_queue_runs_every_task(self):
+        # 7 tasks over 2 clusters used to leave a third chunk unscheduled
+        orchestrator = TwelveClusterOrchestrator(use_keb=False, use_gbogeb=False)
+        results = orchestrator.execute_phase_parallel("phase2", self._tasks(7), iteration=1)
+        self.assertEqual(results["tasks_executed"], 7)
+        self.assertEqual(len(results["results_map"]), 7)
+        stats = results["cluster_stats"]
+        self.assertEqual(set(stats), {"Measure-Analyzer-1", "Measure-Analyzer-2"})
+        self.assertEqual(sum(s["tasks_executed"] for s in stats.values()), 7)
+        for cluster_stats in stats.values():
+            self.assertGreaterEqual(cluster_stats["utilization"], 0.0)
+
+    def test_largest_tasks_dispatched_first(self):
+        orchestrator = TwelveClusterOrchestrator(use_keb=False, use_gbogeb=False)
+        orchestrator.clusters = {
+            cid: c for cid, c in orchestrator.clusters.items() if cid == 3
+        }
+        tasks = [{"target": "operator:mul", "args": (w, 1), "key": str(w), "weight": w}
+                 for w in (1, 50, 5, 100)]
+        order = []
+        orchestrator.execute_phase_parallel("phase2", tasks, iteration=1,
+                                            on_result=lambda o: order.append(o["key"]))
+        self.assertEqual(order, ["100", "50", "5", "1"])
+
+    def test_invalid_backend(self):
+        with self.assertRaises(ValueError):
+            TwelveClusterOrchestrator(use_keb=False, use_gbogeb=False, backend="gpu")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+DMAIC V3 Test Suite - Resumable Workspace Walker Tests
+Version: 3.3.0
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from DMAIC_V3.core.workspace_walker import ResumableWalker, parallel_scan
+from DMAIC_V3.core.temporal_metadata_engine import TemporalMetadataEngine
+
+
+class TestResumableWalker(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = self.temp_dir.name
+        for rel in ["top.md", "a/one.py", "a/two.py", "a/x/deep.py", "a/x/y/deeper.py",
+                    "b/three.py", "b/.git/config", "c/z/last.txt"]:
+            path = Path(self.root, rel)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.touch()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _walker(self):
+        return ResumableWalker(self.root, skip_dir=lambda name, path: name == '.git')
+
+    def _flatten(self, walker, resume=None):
+        return [(d, f) for d, files in walker.walk(resume=resume) for f in files]
+
+    def test_walk_is_sorted_and_pruned(self):
+        files = [os.path.relpath(os.path.join(d, f), self.root)
+                 for d, f in self._flatten(self._walker())]
+        self.assertEqual(files, ["top.md", "a/one.py", "a/two.py", "a/x/deep.py",
+                                 "a/x/y/deeper.py", "b/three.py", "c/z/last.txt"])
+
+    def test_resume_from_every_cursor(self):
+        walker = self._walker()
+        full = self._flatten(walker)
+        for i, (dirpath, name) in enumerate(full):
+            cursor = walker.cursor(dirpath, name)
+            self.assertEqual(self._flatten(self._walker(), resume=cursor), full[i + 1:])
+
+    def test_resume_lists_only_cursor_path(self):
+        walker = self._walker()
+        cursor = walker.cursor(os.path.join(self.root, "b"), "three.py")
+        resumed = self._walker()
+        remaining = self._flatten(resumed, resume=cursor)
+        self.assertEqual([f for _, f in remaining], ["last.txt"])
+        # root + b for the stack, then c and c/z for the remaining files
+        self.assertEqual(resumed.dirs_listed, 4)
+
+
+class TestParallelScan(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = self.temp_dir.name
+        for rel in ["main.py", "src/builder.py", "src/pkg/mod.py", "src/pkg/mod.pyc",
+                    "node_modules/dep/index.js", ".git/objects/ab", "docs/readme.md"]:
+            path = Path(self.root, rel)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("x = 1\n")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_prunes_and_reuses_stat(self):
+        seen = []
+        listings = list(parallel_scan(
+            self.root,
+            skip_dir=lambda name, path: name in {'.git', 'node_modules'},
+            skip_file=lambda name: name.endswith('.pyc'),
+            process=lambda listing: seen.append(listing.path) or len(listing.files),
+            max_workers=4
+        ))
+        dirs = sorted(os.path.relpath(l.path, self.root) for l, _ in listings)
+        self.assertEqual(dirs, ["docs", "src", "src/pkg"])
+        self.assertEqual(len(seen), 4)  # root is processed but not yielded
+        pkg = next(l for l, _ in listings if l.path.endswith("pkg"))
+        self.assertEqual([name for name, _ in pkg.files], ["mod.py"])
+        self.assertEqual(pkg.files[0][1].st_size, 6)
+
+    def test_temporal_engine_scan(self):
+        engine = TemporalMetadataEngine(Path(self.root), db_path=Path(self.root, ".git", "meta.db"))
+        files, folders = engine.scan_workspace(max_workers=2)
+        paths = [f.file_path for f in files]
+        # 'builder.py' used to be dropped by the substring match on 'build'
+        self.assertEqual(paths, ["docs/readme.md", "main.py", "src/builder.py", "src/pkg/mod.py"])
+        self.assertEqual([f.folder_path for f in folders], ["docs", "src", "src/pkg"])
+        self.assertEqual(next(f for f in folders if f.folder_path == "src").subfolder_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
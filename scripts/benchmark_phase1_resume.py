@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+DMAIC V3 - Phase 1 Resume Benchmark
+Compares a fresh workspace walk against resuming from a late cursor,
+for both the old skip-until-found resume and the ResumableWalker cursor.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from DMAIC_V3.core.workspace_walker import ResumableWalker
+
+SKIP_DIRS = {'.git', '__pycache__', 'node_modules', '.venv', 'venv'}
+
+
+def build_tree(root: Path, dirs: int, files_per_dir: int, depth: int):
+    """Create a synthetic tree of dirs x files_per_dir empty files"""
+    for d in range(dirs):
+        parts = [f"d{(d >> (4 * level)) % 16:02d}" for level in range(depth)]
+        folder = root.joinpath(*parts, f"leaf{d:05d}")
+        folder.mkdir(parents=True, exist_ok=True)
+        for f in range(files_per_dir):
+            (folder / f"file{f:04d}.py").touch()
+
+
+def fresh_walk(root: str):
+    """Full walk; returns (file count, walker, last (dirpath, name))"""
+    walker = ResumableWalker(root, skip_dir=lambda name, path: name in SKIP_DIRS)
+    count = 0
+    last = None
+    for dirpath, files in walker.walk():
+        for name in files:
+            count += 1
+            last = (dirpath, name)
+    return count, walker, last
+
+
+def legacy_resume(root: str, resume_from: str):
+    """Old strategy: os.walk from the top and skip until resume_from is seen
+
+    Entries are sorted so the walk order matches the cursor walker.
+    """
+    count = 0
+    should_resume = True
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+        for name in sorted(filenames):
+            path = os.path.join(dirpath, name)
+            if should_resume:
+                if path == resume_from:
+                    should_resume = False
+                continue
+            count += 1
+    return count
+
+
+def cursor_resume(root: str, cursor):
+    """New strategy: rebuild the walk stack from the cursor"""
+    walker = ResumableWalker(root, skip_dir=lambda name, path: name in SKIP_DIRS)
+    count = sum(len(files) for _, files in walker.walk(resume=cursor))
+    return count, walker.dirs_listed
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Phase 1 scan resume")
+    parser.add_argument("--root", help="Existing tree to walk (default: synthetic tree)")
+    parser.add_argument("--dirs", type=int, default=2000, help="Synthetic leaf directories")
+    parser.add_argument("--files-per-dir", type=int, default=10, help="Files per leaf directory")
+    parser.add_argument("--depth", type=int, default=3, help="Synthetic nesting depth")
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of-N timing")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = args.root
+        if root is None:
+            root = tmp
+            print(f"[i] Building synthetic tree: {args.dirs} dirs x {args.files_per_dir} files")
+            build_tree(Path(root), args.dirs, args.files_per_dir, args.depth)
+        root = os.path.normpath(root)
+
+        fresh_times = []
+        for _ in range(args.repeat):
+            (total, walker, last), elapsed = timed(fresh_walk, root)
+            fresh_times.append(elapsed)
+        fresh_dirs = walker.dirs_listed
+
+        if last is None:
+            print("[!] Tree contains no files")
+            return 1
+
+        # Resume close to the end, e.g. after chunk 9 of 10
+        target = max(1, int(total * 0.9))
+        seen = 0
+        walker = ResumableWalker(root, skip_dir=lambda name, path: name in SKIP_DIRS)
+        cursor = resume_path = None
+        for dirpath, files in walker.walk():
+            for name in files:
+                seen += 1
+                if seen == target:
+                    cursor = walker.cursor(dirpath, name)
+                    resume_path = os.path.join(dirpath, name)
+                    break
+            if cursor:
+                break
+
+        legacy_times = []
+        for _ in range(args.repeat):
+            legacy_count, elapsed = timed(legacy_resume, root, resume_path)
+            legacy_times.append(elapsed)
+
+        cursor_times = []
+        for _ in range(args.repeat):
+            (cursor_count, resume_dirs), elapsed = timed(cursor_resume, root, cursor)
+            cursor_times.append(elapsed)
+
+        print(f"\nFiles: {total}  (resuming after file {target})")
+        print(f"  Fresh walk:     {min(fresh_times) * 1000:8.1f} ms  ({fresh_dirs} dirs listed)")
+        print(f"  Legacy resume:  {min(legacy_times) * 1000:8.1f} ms  ({legacy_count} files remaining)")
+        print(f"  Cursor resume:  {min(cursor_times) * 1000:8.1f} ms  ({cursor_count} files remaining, "
+              f"{resume_dirs} dirs listed)")
+
+        if legacy_count != cursor_count:
+            print("[!] Legacy and cursor resume disagree on remaining files")
+            return 1
+
+        speedup = min(legacy_times) / max(min(cursor_times), 1e-9)
+        print(f"\n[OK] Cursor resume is {speedup:.1f}x faster than the legacy resume")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
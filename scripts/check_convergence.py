@@ -5,15 +5,19 @@ Analyzes workspace stability and calculates convergence score
 """
 
 import os
+import sys
 import json
 import yaml
-import hashlib
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Tuple
 from dataclasses import dataclass, asdict
 
 ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+from DMAIC_V3.convergence.change_detector import ChangeDetector
+from DMAIC_V3.convergence.hash_history import CHANGE_STATE_DIRNAME, FileHashHistory, scan_file_stability
+
 REPORTS = ROOT / "DMAIC_V3_OUTPUT" / "reports"
 
 @dataclass
@@ -68,18 +72,6 @@ def load_config() -> Dict:
         return yaml.safe_load(f)
 
 
-def calculate_file_hash(file_path: Path) -> str:
-    """Calculate SHA256 hash of file"""
-    sha256 = hashlib.sha256()
-    try:
-        with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b''):
-                sha256.update(chunk)
-        return sha256.hexdigest()
-    except Exception as e:
-        return f"ERROR:{str(e)}"
-
-
 def scan_workspace_files() -> Tuple[int, int]:
     """
     Scan workspace files and determine stability
@@ -98,61 +90,15 @@ def scan_workspace_files() -> Tuple[int, int]:
         '.git'
     ]
     
-    workspace = Path('.')
-    all_files = []
-    
-    for file in workspace.rglob('*.py'):
-        # Check if file should be excluded
-        if any(pattern in str(file) for pattern in exclude_patterns):
-            continue
-        if file.is_file():
-            all_files.append(file)
-    
-    total_files = len(all_files)
-    
-    # Load previous hashes if available
-    hash_file = Path('DMAIC_V3_OUTPUT/.file_hashes.json')
-    previous_hashes = {}
-    if hash_file.exists():
-        try:
-            with open(hash_file, 'r') as f:
-                history = json.load(f)
-                # Get hashes from 3 iterations ago
-                if len(history) >= 3:
-                    previous_hashes = history[-3].get('hashes', {})
-        except Exception as e:
-            print(f"Warning: Could not load previous hashes: {e}")
-    
-    # Calculate current hashes and compare
-    current_hashes = {}
-    stable_files = 0
-    
-    for file in all_files:
-        file_hash = calculate_file_hash(file)
-        file_str = str(file.relative_to(workspace))
-        current_hashes[file_str] = file_hash
-        
-        # File is stable if it existed 3 iterations ago and hash matches
-        if file_str in previous_hashes and previous_hashes[file_str] == file_hash:
-            stable_files += 1
-    
-    # Save current hashes
-    hash_file.parent.mkdir(parents=True, exist_ok=True)
-    history = []
-    if hash_file.exists():
-        with open(hash_file, 'r') as f:
-            history = json.load(f)
-    
-    history.append({
-        'timestamp': datetime.now().isoformat(),
-        'iteration': len(history) + 1,
-        'hashes': current_hashes
-    })
-    
-    with open(hash_file, 'w') as f:
-        json.dump(history, f, indent=2)
+    def is_tracked(path: str) -> bool:
+        return path.endswith('.py') and not any(pattern in path for pattern in exclude_patterns)
     
-    return total_files, stable_files
+    # A file is stable if it existed 3 iterations ago with the same hash;
+    # hashes come from the shared change-detection snapshot
+    output_dir = Path('DMAIC_V3_OUTPUT')
+    history = FileHashHistory.for_output_dir(output_dir)
+    detector = ChangeDetector(Path('.'), output_dir / CHANGE_STATE_DIRNAME)
+    return scan_file_stability(history, detector, is_tracked, lag=3)
 
 
 def check_test_stability() -> Tuple[int, int]:
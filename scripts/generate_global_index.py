@@ -12,7 +12,11 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
-import ast
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from DMAIC_V3.core.ast_extractor import extract_file
+from DMAIC_V3.convergence.hash_history import FileHashHistory
 
 
 @dataclass
@@ -55,6 +59,7 @@ class GlobalIndexGenerator:
         ]
         
         self.maturity_mapping = self._load_maturity_mapping()
+        self.hash_history: Optional[FileHashHistory] = None
     
     def _load_maturity_mapping(self) -> Dict[str, int]:
         mapping = {
@@ -89,36 +94,9 @@ class GlobalIndexGenerator:
         return 0
     
     def get_stable_iterations(self, file_path: str) -> int:
-        hash_file = self.output_dir / '.file_hashes.json'
-        if not hash_file.exists():
-            return 0
-        
-        try:
-            with open(hash_file, 'r') as f:
-                history = json.load(f)
-                
-                if len(history) < 2:
-                    return 0
-                
-                current_hash = None
-                stable_count = 0
-                
-                for entry in reversed(history):
-                    file_hash = entry['hashes'].get(file_path)
-                    if file_hash is None:
-                        break
-                    
-                    if current_hash is None:
-                        current_hash = file_hash
-                        stable_count = 1
-                    elif file_hash == current_hash:
-                        stable_count += 1
-                    else:
-                        break
-                
-                return stable_count
-        except Exception:
-            return 0
+        if self.hash_history is None:
+            self.hash_history = FileHashHistory.for_output_dir(self.output_dir)
+        return self.hash_history.stable_iterations(file_path)
     
     def extract_code_elements(self, file_path: Path) -> Dict[str, List[str]]:
         result = {
@@ -128,22 +106,14 @@ class GlobalIndexGenerator:
         }
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                tree = ast.parse(f.read())
-                
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.FunctionDef):
-                        result['functions'].append(node.name)
-                    elif isinstance(node, ast.ClassDef):
-                        result['classes'].append(node.name)
-                    elif isinstance(node, ast.Import):
-                        for alias in node.names:
-                            result['imports'].append(alias.name)
-                    elif isinstance(node, ast.ImportFrom):
-                        if node.module:
-                            result['imports'].append(node.module)
-        except Exception:
-            pass
+            elements = extract_file(file_path)
+        except OSError:
+            return result
+        
+        if not elements.syntax_error:
+            result['functions'] = [f.name for f in elements.sync_functions]
+            result['classes'] = [c.name for c in elements.classes]
+            result['imports'] = list(elements.module_imports)
         
         return result
     